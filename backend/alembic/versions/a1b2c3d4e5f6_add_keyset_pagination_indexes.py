@@ -0,0 +1,54 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: a1b2c3d4e5f6
+Revises: f12345678901
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1b2c3d4e5f6'
+down_revision: Union[str, Sequence[str], None] = 'f12345678901'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add (user_id, created_at, id) indexes backing keyset pagination."""
+    op.create_index(
+        'idx_application_user_created_id',
+        'job_applications',
+        ['user_id', 'created_at', 'id'],
+        unique=False
+    )
+    op.create_index(
+        'idx_resume_user_created_id',
+        'resumes',
+        ['user_id', 'created_at', 'id'],
+        unique=False
+    )
+    op.create_index(
+        'idx_cover_letter_user_created_id',
+        'cover_letters',
+        ['user_id', 'created_at', 'id'],
+        unique=False
+    )
+    op.create_index(
+        'idx_file_metadata_user_uploaded_id',
+        'file_metadata',
+        ['user_id', 'uploaded_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop keyset pagination indexes."""
+    op.drop_index('idx_file_metadata_user_uploaded_id', table_name='file_metadata')
+    op.drop_index('idx_cover_letter_user_created_id', table_name='cover_letters')
+    op.drop_index('idx_resume_user_created_id', table_name='resumes')
+    op.drop_index('idx_application_user_created_id', table_name='job_applications')
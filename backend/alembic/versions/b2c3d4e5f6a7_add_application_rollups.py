@@ -0,0 +1,39 @@
+"""add_application_rollups
+
+Revision ID: b2c3d4e5f6a7
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2c3d4e5f6a7'
+down_revision: Union[str, Sequence[str], None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the per-user application rollup counters.
+
+    Rows are built per user on first analytics read, so no backfill is needed.
+    """
+    op.create_table('application_rollups',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('bucket', sa.String(length=255), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'kind', 'bucket', 'status')
+    )
+
+
+def downgrade() -> None:
+    """Drop the application rollup counters."""
+    op.drop_table('application_rollups')
@@ -0,0 +1,59 @@
+"""add_job_catalog
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: Union[str, Sequence[str], None] = 'b2c3d4e5f6a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the job catalog keyed by canonical posting URL.
+
+    The catalog fills up as searches run, so no backfill is needed.
+    """
+    op.create_table('job_catalog',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('canonical_url', sa.String(length=2048), nullable=False),
+    sa.Column('url', sa.String(length=2048), nullable=False),
+    sa.Column('portal', sa.String(length=50), nullable=False),
+    sa.Column('title', sa.String(length=500), nullable=False),
+    sa.Column('company', sa.String(length=255), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('salary', sa.String(length=255), nullable=True),
+    sa.Column('posted_date', sa.String(length=100), nullable=True),
+    sa.Column('experience_level', sa.String(length=50), nullable=True),
+    sa.Column('job_type', sa.String(length=50), nullable=True),
+    sa.Column('requirements', sa.Text(), nullable=True),
+    sa.Column('benefits', sa.Text(), nullable=True),
+    sa.Column('skills', sa.Text(), nullable=True),
+    sa.Column('application_method', sa.String(length=50), nullable=False),
+    sa.Column('apply_url', sa.String(length=2048), nullable=True),
+    sa.Column('contact_email', sa.String(length=255), nullable=True),
+    sa.Column('contact_phone', sa.String(length=100), nullable=True),
+    sa.Column('external_application', sa.Boolean(), nullable=False),
+    sa.Column('application_deadline', sa.String(length=100), nullable=True),
+    sa.Column('first_seen_at', sa.DateTime(), nullable=False),
+    sa.Column('last_seen_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('canonical_url')
+    )
+    op.create_index('idx_job_catalog_last_seen_at', 'job_catalog', ['last_seen_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the job catalog."""
+    op.drop_index('idx_job_catalog_last_seen_at', table_name='job_catalog')
+    op.drop_table('job_catalog')
@@ -0,0 +1,41 @@
+"""add_fulltext_search_indexes
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.database.search import SEARCH_INDEXES
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the full-text search indexes and index existing rows.
+
+    SQLite gets FTS5 tables with sync triggers, PostgreSQL GIN indexes over
+    ``to_tsvector``; other dialects keep substring search.
+    """
+    dialect_name = op.get_bind().dialect.name
+    for index in SEARCH_INDEXES:
+        for statement in index.create_statements(dialect_name):
+            op.execute(statement)
+        for statement in index.rebuild_statements(dialect_name):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop the full-text search indexes."""
+    dialect_name = op.get_bind().dialect.name
+    for index in SEARCH_INDEXES:
+        for statement in index.drop_statements(dialect_name):
+            op.execute(statement)
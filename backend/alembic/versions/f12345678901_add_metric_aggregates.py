@@ -0,0 +1,38 @@
+"""add_metric_aggregates
+
+Revision ID: f12345678901
+Revises: c939700876c3
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f12345678901'
+down_revision: Union[str, Sequence[str], None] = 'c939700876c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add window summary columns to performance metrics."""
+    with op.batch_alter_table('performance_metrics') as batch_op:
+        batch_op.add_column(sa.Column('sample_count', sa.Integer(), nullable=False, server_default='1'))
+        batch_op.add_column(sa.Column('value_sum', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('value_min', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('value_max', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('histogram', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop window summary columns from performance metrics."""
+    with op.batch_alter_table('performance_metrics') as batch_op:
+        batch_op.drop_column('histogram')
+        batch_op.drop_column('value_max')
+        batch_op.drop_column('value_min')
+        batch_op.drop_column('value_sum')
+        batch_op.drop_column('sample_count')
@@ -3,7 +3,7 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.security import HTTPBearer
 from typing import List, Dict, Any, Optional
 import logging
@@ -22,6 +22,7 @@ from src.services.service_registry import service_registry
 from src.middleware.response_middleware import add_response_wrapper_middleware
 from src.middleware.query_performance import setup_query_performance_monitoring
 from src.database.config import database_config
+from src.core.metrics import mark_process_dead, render_latest
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -77,6 +78,12 @@ def create_app() -> FastAPI:
 
     app.add_middleware(SecurityLoggingMiddleware)
 
+    # Request metrics (Prometheus + persisted samples); registered here because
+    # middleware cannot be added once the app has started.
+    from src.middleware.metrics_middleware import MetricsMiddleware
+
+    app.add_middleware(MetricsMiddleware)
+
     # Response wrapper middleware disabled - using manual wrapping in endpoints
     # add_response_wrapper_middleware(app)
 
@@ -177,6 +184,13 @@ def create_app() -> FastAPI:
             "environment": config.ENVIRONMENT,
         }
 
+    # Prometheus exposition
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics():
+        """Serve in-process metrics in the Prometheus text format."""
+        body, content_type = render_latest()
+        return Response(content=body, media_type=content_type)
+
     # Startup event
     @app.on_event("startup")
     async def startup_event():
@@ -238,23 +252,6 @@ def create_app() -> FastAPI:
                     logger.debug(f"Query performance monitoring not available: {e}")
                     # Don't fail startup if monitoring setup fails
 
-            # Add metrics middleware (optional - don't fail if it doesn't work)
-            try:
-                from src.middleware.metrics_middleware import MetricsMiddleware
-
-                try:
-                    monitoring_service = service_registry.get_monitoring_service_sync()
-                    app.add_middleware(
-                        MetricsMiddleware, monitoring_service=monitoring_service
-                    )
-                    logger.debug("Metrics middleware added")
-                except (KeyError, AttributeError) as e:
-                    logger.debug(f"Metrics middleware not available: {e}")
-                    # Continue without metrics middleware
-            except Exception as e:
-                logger.debug(f"Metrics middleware setup skipped: {e}")
-                # Don't fail startup if middleware setup fails
-
             # Start background tasks for metrics aggregation and cleanup
             try:
                 import asyncio
@@ -294,6 +291,9 @@ def create_app() -> FastAPI:
             await service_registry.shutdown()
             logger.info("[OK] Services shut down")
 
+            # Release this worker's live gauges in multiprocess mode
+            mark_process_dead()
+
             logger.info("[DONE] AI Job Application Assistant shut down complete")
         except Exception as e:
             logger.error(f"[ERROR] Error during shutdown: {e}", exc_info=True)
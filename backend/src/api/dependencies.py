@@ -38,19 +38,13 @@ async def get_current_user(
         token = credentials.credentials
         auth_service = await service_registry.get_auth_service()
         
-        user_id = await auth_service.verify_token(token)
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        user_profile = await auth_service.get_user_profile(user_id)
+        # Decoded claims and the profile are cached by the auth service, so
+        # steady-state requests resolve identity without a database query.
+        user_profile = await auth_service.get_principal(token)
         if not user_profile:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
+                detail="Invalid or expired token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
@@ -86,12 +80,7 @@ async def get_optional_user(
         token = credentials.credentials
         auth_service = await service_registry.get_auth_service()
         
-        user_id = await auth_service.verify_token(token)
-        if not user_id:
-            return None
-        
-        user_profile = await auth_service.get_user_profile(user_id)
-        return user_profile
+        return await auth_service.get_principal(token)
     except Exception:
         return None
 
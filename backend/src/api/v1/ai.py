@@ -1,16 +1,19 @@
 """AI service API endpoints for the AI Job Application Assistant."""
 
 from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any, Optional
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from src.models.resume import Resume, ResumeOptimizationRequest, ResumeOptimizationResponse
 from src.models.cover_letter import CoverLetterRequest, CoverLetter
 from src.models.career_insights import CareerInsightsRequest, CareerInsightsResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from src.models.user import UserProfile
 from src.api.dependencies import get_current_user
 from src.utils.logger import get_logger
+from src.utils.response_wrapper import sse_response
 from src.services.service_registry import service_registry
+from src.services.job_match_service import job_match_service
 
 logger = get_logger(__name__)
 
@@ -48,6 +51,29 @@ async def optimize_resume(
         raise HTTPException(status_code=500, detail=f"Resume optimization failed: {str(e)}")
 
 
+@router.post("/optimize-resume/stream")
+async def stream_optimize_resume(
+    request: ResumeOptimizationRequest,
+    current_user: UserProfile = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Optimize resume for a specific job, streamed as Server-Sent Events.
+    
+    Sends ``delta`` events with raw model output and ``field`` events as
+    each part of the result parses; the final ``done`` event carries the
+    same payload as ``/optimize-resume``.
+    
+    Args:
+        request: Resume optimization request
+        
+    Returns:
+        ``text/event-stream`` response
+    """
+    logger.info(f"Streaming resume optimization for {request.target_role} at {request.company_name}")
+    ai_service = await service_registry.get_ai_service()
+    return sse_response(ai_service.stream_resume_optimization(request))
+
+
 @router.post("/generate-cover-letter", response_model=CoverLetter)
 async def generate_cover_letter(
     request: CoverLetterRequest,
@@ -79,6 +105,28 @@ async def generate_cover_letter(
         raise HTTPException(status_code=500, detail=f"Cover letter generation failed: {str(e)}")
 
 
+@router.post("/generate-cover-letter/stream")
+async def stream_cover_letter(
+    request: CoverLetterRequest,
+    current_user: UserProfile = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Generate a personalized cover letter, streamed as Server-Sent Events.
+    
+    The letter text arrives as ``delta`` events; the final ``done`` event
+    carries the same payload as ``/generate-cover-letter``.
+    
+    Args:
+        request: Cover letter generation request
+        
+    Returns:
+        ``text/event-stream`` response
+    """
+    logger.info(f"Streaming cover letter for {request.job_title} at {request.company_name}")
+    ai_service = await service_registry.get_ai_service()
+    return sse_response(ai_service.stream_cover_letter(request))
+
+
 @router.post("/analyze-job-match")
 async def analyze_job_match(
     resume_content: str,
@@ -112,6 +160,65 @@ async def analyze_job_match(
         raise HTTPException(status_code=500, detail=f"Job match analysis failed: {str(e)}")
 
 
+class RankJobCandidate(BaseModel):
+    """A job to rank against a resume."""
+    id: Optional[str] = None
+    title: str = ""
+    description: str = ""
+    skills: List[str] = Field(default_factory=list)
+
+
+class RankJobsRequest(BaseModel):
+    """Request model for local batch job ranking."""
+    resume_content: str
+    resume_skills: Optional[List[str]] = None
+    jobs: List[RankJobCandidate] = Field(..., max_length=1000)
+    top_k: Optional[int] = Field(None, ge=1)
+    min_score: float = Field(0.0, ge=0.0, le=1.0)
+
+
+@router.post("/rank-jobs")
+async def rank_jobs(
+    request: RankJobsRequest,
+    current_user: UserProfile = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Rank many jobs against a resume locally, without calling an AI provider.
+    
+    Uses BM25 text relevance plus skill overlap, so it is cheap enough to
+    shortlist jobs before requesting a detailed AI match analysis.
+    
+    Args:
+        request: Resume content and the candidate jobs
+        
+    Returns:
+        Jobs ordered by match score, best first
+    """
+    try:
+        logger.info(f"Local job ranking request for {len(request.jobs)} jobs")
+        
+        scores = job_match_service.rank_texts(
+            request.resume_content,
+            [job_match_service.job_text(job.model_dump()) for job in request.jobs],
+            resume_skills=request.resume_skills,
+            top_k=request.top_k,
+            min_score=request.min_score,
+        )
+        
+        return {
+            "rankings": [
+                {"job_id": request.jobs[score.index].id, **score.to_dict()}
+                for score in scores
+            ],
+            "total_jobs": len(request.jobs),
+            "returned": len(scores),
+        }
+        
+    except Exception as e:
+        logger.error(f"Error ranking jobs: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Job ranking failed: {str(e)}")
+
+
 @router.post("/extract-skills")
 async def extract_resume_skills(
     resume_content: str,
@@ -270,6 +377,34 @@ async def prepare_interview(
         raise HTTPException(status_code=500, detail=f"Interview preparation failed: {str(e)}")
 
 
+@router.post("/interview-prep/stream")
+async def stream_interview_prep(
+    request: InterviewPrepRequest,
+    current_user: UserProfile = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Prepare for an interview, streamed as Server-Sent Events.
+    
+    Each question, tip and topic is sent as an ``item`` event as soon as it
+    parses; the final ``done`` event carries the same payload as
+    ``/interview-prep``.
+    
+    Args:
+        request: Interview preparation request with job description and resume
+        
+    Returns:
+        ``text/event-stream`` response
+    """
+    logger.info(f"Streaming interview preparation for {request.job_title} at {request.company_name}")
+    ai_service = await service_registry.get_ai_service()
+    return sse_response(ai_service.stream_interview_prep(
+        job_description=request.job_description,
+        resume_content=request.resume_content,
+        company_name=request.company_name,
+        job_title=request.job_title
+    ))
+
+
 @router.get("/health")
 async def ai_service_health() -> Dict[str, Any]:
     """
@@ -294,6 +429,7 @@ async def ai_service_health() -> Dict[str, Any]:
                 "resume_optimization",
                 "cover_letter_generation", 
                 "job_match_analysis",
+                "job_ranking",
                 "skills_extraction",
                 "resume_improvement",
                 "career_insights",
@@ -1,20 +1,20 @@
 """Analytics API endpoints for advanced reporting and insights."""
 
-import asyncio
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 from loguru import logger
 
 from src.api.dependencies import get_current_user
+from src.database.aggregation import AnalyticsAggregator
 from src.database.config import database_config
-from src.database.models import DBJobApplication
 from src.database.repositories.application_repository import ApplicationRepository
+from src.database.repositories.application_rollup_repository import ApplicationRollupRepository
+from src.database.rollups import ApplicationRollups
 from src.models.user import User
 from src.services.analytics_service import AnalyticsService
 from src.services.cache_service import analytics_cache_service
 from src.services.service_registry import service_registry
-from sqlalchemy import func, select
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -38,18 +38,35 @@ async def _get_user_applications(user_id: str):
         return await repository.get_all(user_id=user_id)
 
 
+async def _get_user_rollups(user_id: str) -> ApplicationRollups:
+    async with database_config.get_session() as session:
+        return await ApplicationRollupRepository(session).get(user_id)
+
+
+async def _compute_metric(
+    metric: Callable[..., Awaitable[Dict[str, Any]]],
+    user_id: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Run an ``AnalyticsService`` metric from the rollup counters when no date
+    range is given, else as aggregate SQL over the range."""
+    if start_date or end_date:
+        async with database_config.get_session() as session:
+            service = AnalyticsService(aggregator=AnalyticsAggregator(session))
+            return await metric(
+                service, user_id=user_id, start_date=start_date, end_date=end_date
+            )
+    rollups = await _get_user_rollups(user_id)
+    return await metric(AnalyticsService(), user_id=user_id, rollups=rollups)
+
+
 async def _get_applications_cache_buster(user_id: str) -> str:
     """Return a cheap "version" that changes when applications change."""
 
     async with database_config.get_session() as session:
-        stmt = select(
-            func.count(DBJobApplication.id),
-            func.max(DBJobApplication.updated_at),
-        ).where(DBJobApplication.user_id == user_id)
-        result = await session.execute(stmt)
-        count, max_updated_at = result.one()
-        max_updated_str = max_updated_at.isoformat() if max_updated_at else "none"
-        return f"{count}:{max_updated_str}"
+        version = await ApplicationRollupRepository(session).get_version(user_id)
+        return str(version)
 
 
 @router.get("/metrics/success-rate")
@@ -78,13 +95,8 @@ async def get_success_rate_metrics(
         if cached is not None:
             return {"data": cached}
 
-        applications = await _get_user_applications(current_user.id)
-        analytics_service = AnalyticsService()
-        metrics = await analytics_service.get_application_success_rate(
-            user_id=current_user.id,
-            applications=applications,
-            start_date=start_date,
-            end_date=end_date,
+        metrics = await _compute_metric(
+            AnalyticsService.get_application_success_rate, current_user.id, start_date, end_date
         )
 
         await analytics_cache_service.set(
@@ -126,13 +138,8 @@ async def get_response_time_metrics(
         if cached is not None:
             return {"data": cached}
 
-        applications = await _get_user_applications(current_user.id)
-        analytics_service = AnalyticsService()
-        metrics = await analytics_service.get_response_time_analysis(
-            user_id=current_user.id,
-            applications=applications,
-            start_date=start_date,
-            end_date=end_date,
+        metrics = await _compute_metric(
+            AnalyticsService.get_response_time_analysis, current_user.id, start_date, end_date
         )
         await analytics_cache_service.set(
             cache_key, metrics, ttl_seconds=RESPONSE_TIME_TTL_SECONDS
@@ -173,13 +180,8 @@ async def get_interview_performance_metrics(
         if cached is not None:
             return {"data": cached}
 
-        applications = await _get_user_applications(current_user.id)
-        analytics_service = AnalyticsService()
-        metrics = await analytics_service.get_interview_performance(
-            user_id=current_user.id,
-            applications=applications,
-            start_date=start_date,
-            end_date=end_date,
+        metrics = await _compute_metric(
+            AnalyticsService.get_interview_performance, current_user.id, start_date, end_date
         )
         await analytics_cache_service.set(
             cache_key, metrics, ttl_seconds=INTERVIEW_PERFORMANCE_TTL_SECONDS
@@ -212,10 +214,10 @@ async def get_trend_analysis(
         if cached is not None:
             return {"data": cached}
 
-        applications = await _get_user_applications(current_user.id)
+        rollups = await _get_user_rollups(current_user.id)
         analytics_service = AnalyticsService()
         trends = await analytics_service.get_trend_analysis(
-            user_id=current_user.id, days=days, applications=applications
+            user_id=current_user.id, days=days, rollups=rollups
         )
         await analytics_cache_service.set(cache_key, trends, ttl_seconds=TRENDS_TTL_SECONDS)
         return {"data": trends}
@@ -279,10 +281,10 @@ async def get_company_analysis(current_user: User = Depends(get_current_user)):
         if cached is not None:
             return {"data": cached}
 
-        applications = await _get_user_applications(current_user.id)
+        rollups = await _get_user_rollups(current_user.id)
         analytics_service = AnalyticsService()
         analysis = await analytics_service.get_company_analysis(
-            user_id=current_user.id, applications=applications
+            user_id=current_user.id, rollups=rollups
         )
         await analytics_cache_service.set(
             cache_key, analysis, ttl_seconds=COMPANIES_TTL_SECONDS
@@ -300,81 +302,75 @@ async def get_company_analysis(current_user: User = Depends(get_current_user)):
 @router.get("/dashboard")
 async def get_analytics_dashboard(
     days: int = Query(30, description="Number of days for trends"),
+    start_date: Optional[datetime] = Query(None, description="Start date for analysis"),
+    end_date: Optional[datetime] = Query(None, description="End date for analysis"),
     current_user: User = Depends(get_current_user),
 ):
     """
     Get comprehensive analytics dashboard data with AI-powered insights.
 
-    Returns all analytics in one call for dashboard display.
+    Returns all analytics in one call for dashboard display. Without a date
+    range the metrics come from the user's rollup counters; with one, they
+    are aggregated in SQL.
     """
     try:
         buster = await _get_applications_cache_buster(current_user.id)
         dashboard_cache_key = _analytics_cache_key(
-            current_user.id, f"dashboard:{days}:v{buster}"
+            current_user.id,
+            (
+                f"dashboard:{days}:"
+                f"{start_date.isoformat() if start_date else 'none'}:"
+                f"{end_date.isoformat() if end_date else 'none'}:v{buster}"
+            ),
         )
         cached = await analytics_cache_service.get(dashboard_cache_key)
         if cached is not None:
             return {"data": cached}
 
         ai_service = await service_registry.get_ai_service()
-        applications = await _get_user_applications(current_user.id)
         analytics_service = AnalyticsService(ai_service=ai_service)
 
-        success_rate_coro = analytics_service.get_application_success_rate(
-            user_id=current_user.id, applications=applications
-        )
-        response_time_coro = analytics_service.get_response_time_analysis(
-            user_id=current_user.id, applications=applications
-        )
-        interview_perf_coro = analytics_service.get_interview_performance(
-            user_id=current_user.id, applications=applications
-        )
-        trends_coro = analytics_service.get_trend_analysis(
-            user_id=current_user.id, days=days, applications=applications
-        )
+        if start_date or end_date:
+            async with database_config.get_session() as session:
+                metrics = await AnalyticsService(
+                    aggregator=AnalyticsAggregator(session)
+                ).get_dashboard_metrics(
+                    user_id=current_user.id,
+                    days=days,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+        else:
+            rollups = await _get_user_rollups(current_user.id)
+            metrics = {
+                "success_metrics": await analytics_service.get_application_success_rate(
+                    user_id=current_user.id, rollups=rollups
+                ),
+                "response_time_metrics": await analytics_service.get_response_time_analysis(
+                    user_id=current_user.id, rollups=rollups
+                ),
+                "interview_metrics": await analytics_service.get_interview_performance(
+                    user_id=current_user.id, rollups=rollups
+                ),
+                "trends": await analytics_service.get_trend_analysis(
+                    user_id=current_user.id, days=days, rollups=rollups
+                ),
+                "companies": await analytics_service.get_company_analysis(
+                    user_id=current_user.id, rollups=rollups
+                ),
+            }
 
         skills_gap_cache_key = _analytics_cache_key(current_user.id, f"skills_gap:v{buster}")
-        companies_cache_key = _analytics_cache_key(current_user.id, f"companies:v{buster}")
-
-        async def skills_gap_task():
-            cached_skills = await analytics_cache_service.get(skills_gap_cache_key)
-            if cached_skills is not None:
-                return cached_skills
-            result = await analytics_service.get_skills_gap_analysis(
-                user_id=current_user.id, applications=applications
+        skills_gap = await analytics_cache_service.get(skills_gap_cache_key)
+        if skills_gap is None:
+            # Skills are extracted from job text, which is not aggregated.
+            skills_gap = await analytics_service.get_skills_gap_analysis(
+                user_id=current_user.id,
+                applications=await _get_user_applications(current_user.id),
             )
             await analytics_cache_service.set(
-                skills_gap_cache_key, result, ttl_seconds=SKILLS_GAP_TTL_SECONDS
+                skills_gap_cache_key, skills_gap, ttl_seconds=SKILLS_GAP_TTL_SECONDS
             )
-            return result
-
-        async def companies_task():
-            cached_companies = await analytics_cache_service.get(companies_cache_key)
-            if cached_companies is not None:
-                return cached_companies
-            result = await analytics_service.get_company_analysis(
-                user_id=current_user.id, applications=applications
-            )
-            await analytics_cache_service.set(
-                companies_cache_key, result, ttl_seconds=COMPANIES_TTL_SECONDS
-            )
-            return result
-
-        (
-            success_rate,
-            response_time,
-            interview_perf,
-            trends,
-            skills_gap,
-            companies,
-        ) = await asyncio.gather(
-            success_rate_coro,
-            response_time_coro,
-            interview_perf_coro,
-            trends_coro,
-            skills_gap_task(),
-            companies_task(),
-        )
 
         ai_powered = (
             bool(skills_gap.get("ai_powered", False))
@@ -383,12 +379,8 @@ async def get_analytics_dashboard(
         )
 
         dashboard_data: Dict[str, Any] = {
-            "success_metrics": success_rate,
-            "response_time_metrics": response_time,
-            "interview_metrics": interview_perf,
-            "trends": trends,
+            **metrics,
             "skills_gap": skills_gap,
-            "companies": companies,
             "ai_powered": ai_powered,
         }
 
@@ -12,6 +12,7 @@ from src.models.application import (
     BulkExportRequest
 )
 from src.models.user import UserProfile
+from src.database.pagination import InvalidCursorError
 from src.services.service_registry import service_registry
 from src.utils.response_wrapper import success_response, error_response, paginated_response
 from src.api.dependencies import get_current_user
@@ -166,15 +167,21 @@ async def get_all_applications(
     status: Optional[ApplicationStatus] = None,
     page: Optional[int] = 1,
     limit: Optional[int] = 10,
+    cursor: Optional[str] = None,
     current_user: UserProfile = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """
     Get all applications with optional status filter and pagination.
     
+    The first page, and any request with a ``cursor``, is served by keyset
+    pagination; follow ``pagination.next_cursor`` to walk further. ``page``
+    without a cursor keeps the older offset behaviour.
+    
     Args:
         status: Optional status filter
         page: Page number (default: 1)
         limit: Items per page (default: 10)
+        cursor: Opaque cursor from the previous page's ``next_cursor``
         
     Returns:
         Consistent API response with list of applications
@@ -183,6 +190,20 @@ async def get_all_applications(
         # Get application service from registry
         application_service = await service_registry.get_application_service()
         
+        if cursor or page == 1:
+            result = await application_service.get_applications_page(
+                user_id=current_user.id, limit=limit, cursor=cursor, status=status
+            )
+            total = await application_service.count_applications(user_id=current_user.id, status=status)
+            return paginated_response(
+                data=[app.dict() for app in result.items],
+                total=total,
+                page=page,
+                limit=limit,
+                message=f"Retrieved {len(result.items)} applications",
+                next_cursor=result.next_cursor
+            ).dict()
+        
         # Use the application service with user_id
         if status:
             applications = await application_service.get_applications_by_status(status, user_id=current_user.id)
@@ -203,6 +224,8 @@ async def get_all_applications(
             message=f"Retrieved {len(paginated_applications)} applications"
         ).dict()
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting applications: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to get applications: {str(e)}")
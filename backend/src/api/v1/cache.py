@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import Dict, Any
 from src.core.cache import cache_region
+from src.core.cache_manager import cache_manager
 from src.config import config
 from src.api.dependencies import get_current_user
 from src.models.user import User
@@ -20,6 +21,7 @@ async def get_cache_stats(current_user: User = Depends(get_current_user)):
     - Cache backend type
     - Cache configuration
     - Basic usage statistics (if available)
+    - Per-namespace L1 hit/miss/eviction counters
     """
     try:
         stats = {
@@ -64,6 +66,8 @@ async def get_cache_stats(current_user: User = Depends(get_current_user)):
             logger.warning(f"Could not fetch backend stats: {e}")
             stats['backend_stats'] = "unavailable"
         
+        stats['tiered_cache'] = cache_manager.stats()
+        
         logger.info(f"Cache stats retrieved by user {current_user.email}")
         return {"data": stats}
         
@@ -85,6 +89,7 @@ async def invalidate_cache(current_user: User = Depends(get_current_user)):
     """
     try:
         cache_region.invalidate()
+        await cache_manager.clear()
         logger.warning(f"Cache invalidated by user {current_user.email}")
         return {
             "data": {
@@ -1,13 +1,15 @@
 """Cover Letters API endpoints for the AI Job Application Assistant."""
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Any, Optional
 from src.models.cover_letter import CoverLetter, CoverLetterCreate, CoverLetterUpdate, BulkDeleteRequest, CoverLetterRequest
 from src.models.user import UserProfile
+from src.database.pagination import InvalidCursorError
 from src.api.dependencies import get_current_user
 from src.utils.logger import get_logger
 from src.services.service_registry import service_registry
-from src.utils.response_wrapper import success_response, error_response
+from src.utils.response_wrapper import success_response, error_response, sse_response
 
 logger = get_logger(__name__)
 
@@ -35,11 +37,17 @@ async def bulk_delete_cover_letters(
 @router.get("", response_model=List[CoverLetter])
 @router.get("/", response_model=List[CoverLetter])
 async def get_all_cover_letters(
+    response: Response,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
     current_user: UserProfile = Depends(get_current_user)
 ) -> List[CoverLetter]:
     """
     Get all cover letters.
     
+    With ``limit`` or ``cursor`` a single keyset page is returned and the
+    cursor for the next page is sent in the ``X-Next-Cursor`` header.
+    
     Returns:
         List of cover letters
     """
@@ -47,10 +55,20 @@ async def get_all_cover_letters(
         # Get cover letter service from unified registry
         cover_letter_service = await service_registry.get_cover_letter_service()
         
+        if limit or cursor:
+            page = await cover_letter_service.get_cover_letters_page(
+                user_id=current_user.id, limit=limit, cursor=cursor
+            )
+            if page.next_cursor:
+                response.headers["X-Next-Cursor"] = page.next_cursor
+            return page.items
+        
         # Get all cover letters with user_id
         cover_letters = await cover_letter_service.get_all_cover_letters(user_id=current_user.id)
         return cover_letters
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting cover letters: {e}", exc_info=True)
         # Return empty list instead of throwing error for better UX
@@ -225,3 +243,31 @@ async def generate_cover_letter_with_ai(
     except Exception as e:
         logger.error(f"Error generating cover letter with AI: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to generate cover letter: {str(e)}")
+
+
+@router.post("/generate/stream")
+async def stream_cover_letter_with_ai(
+    cover_letter_request: CoverLetterRequest,
+    current_user: UserProfile = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Generate a cover letter using AI, streamed as Server-Sent Events.
+    
+    The letter text arrives as ``delta`` events. When it is complete the
+    cover letter is saved, and the ``done`` event carries the saved object.
+    
+    Args:
+        cover_letter_request: Cover letter generation request
+        
+    Returns:
+        ``text/event-stream`` response
+    """
+    cover_letter_service = await service_registry.get_cover_letter_service()
+    return sse_response(cover_letter_service.stream_cover_letter(
+        job_title=cover_letter_request.job_title,
+        company_name=cover_letter_request.company_name,
+        job_description=cover_letter_request.job_description,
+        resume_summary=cover_letter_request.resume_summary,
+        tone=cover_letter_request.tone,
+        user_id=current_user.id
+    ))
@@ -50,42 +50,66 @@ async def export_applications(
         # Get application service
         application_service = await service_registry.get_application_service()
         
-        # Get applications
+        def in_date_range(app) -> bool:
+            app_date = app.applied_date or app.created_at
+            if app_date:
+                if request.date_from and app_date < request.date_from:
+                    return False
+                if request.date_to and app_date > request.date_to:
+                    return False
+            return True
+        
+        # Get export service
+        export_service = await service_registry.get_export_service()
+        format_lower = request.format.lower()
+        
+        async def all_applications():
+            async for app in application_service.iter_applications(user_id=current_user.id):
+                if in_date_range(app):
+                    yield app.dict()
+        
+        # A CSV of all applications is written page by page as it is read,
+        # so memory stays bounded however many applications there are.
+        if format_lower == "csv" and not request.application_ids and hasattr(
+            export_service, "stream_applications_csv"
+        ):
+            rows = all_applications()
+            first = await anext(rows, None)
+            if first is None:
+                raise HTTPException(status_code=404, detail="No applications found to export")
+            
+            async def with_first():
+                yield first
+                async for row in rows:
+                    yield row
+            
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            logger.info(f"Streaming application export to csv for user {current_user.id}")
+            return StreamingResponse(
+                export_service.stream_applications_csv(with_first()),
+                media_type="text/csv",
+                headers={
+                    "Content-Disposition": f"attachment; filename=applications_export_{timestamp}.csv"
+                }
+            )
+        
+        # Get the current user's applications, filtering by date as they arrive
+        applications = []
         if request.application_ids:
-            applications = []
             for app_id in request.application_ids:
-                app = await application_service.get_application(app_id)
-                if app:
-                    applications.append(app)
+                app = await application_service.get_application(app_id, user_id=current_user.id)
+                if app and in_date_range(app):
+                    applications.append(app.dict())
         else:
-            all_apps = await application_service.get_all_applications()
-            applications = all_apps
-        
-        # Filter by date if provided
-        if request.date_from or request.date_to:
-            filtered_apps = []
-            for app in applications:
-                app_date = app.applied_date or app.created_at
-                if app_date:
-                    if request.date_from and app_date < request.date_from:
-                        continue
-                    if request.date_to and app_date > request.date_to:
-                        continue
-                filtered_apps.append(app)
-            applications = filtered_apps
+            # PDF and Excel documents are built whole, so they need every row.
+            applications = [app async for app in all_applications()]
         
         if not applications:
             raise HTTPException(status_code=404, detail="No applications found to export")
         
-        # Convert to dictionaries
-        apps_dict = [app.dict() if hasattr(app, 'dict') else app for app in applications]
-        
-        # Get export service
-        export_service = await service_registry.get_export_service()
-        
         # Generate export
         file_data = await export_service.export_applications(
-            apps_dict,
+            applications,
             format=request.format,
             user_id=current_user.id
         )
@@ -105,7 +129,6 @@ async def export_applications(
             "xlsx": "xlsx"
         }
         
-        format_lower = request.format.lower()
         content_type = content_type_map.get(format_lower, "application/octet-stream")
         extension = extension_map.get(format_lower, "bin")
         
@@ -343,7 +366,6 @@ async def export_analytics(
             "xlsx": "xlsx"
         }
         
-        format_lower = request.format.lower()
         content_type = content_type_map.get(format_lower, "application/octet-stream")
         extension = extension_map.get(format_lower, "bin")
         
@@ -1,10 +1,12 @@
 """Jobs API endpoints for the AI Job Application Assistant."""
 
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Any, Optional
 from src.models.job import JobSearchRequest, JobSearchResponse, Job
 from src.utils.logger import get_logger
+from src.utils.response_wrapper import ndjson_response, sse_response
 from src.services.service_registry import service_registry
 
 logger = get_logger(__name__)
@@ -78,6 +80,36 @@ async def search_jobs(request: JobSearchRequest) -> JobSearchResponse:
         )
 
 
+@router.post("/search/stream")
+async def stream_search_jobs(
+    request: JobSearchRequest,
+    accept: Optional[str] = Header(None),
+) -> StreamingResponse:
+    """
+    Search for jobs across multiple portals, streaming each site's jobs as it finishes.
+    
+    Each ``site`` event carries one site's status and jobs; the final ``done``
+    event carries ``total_jobs`` and ``search_metadata`` as in ``/search``.
+    Sent as Server-Sent Events, or as NDJSON when the client accepts
+    ``application/x-ndjson``.
+    
+    Args:
+        request: Job search request parameters
+        
+    Returns:
+        Streaming response of search events
+    """
+    logger.info(
+        f"Streaming job search request received: keywords={request.keywords}, "
+        f"location={request.location}, experience={request.experience_level}"
+    )
+    job_search_service = await service_registry.get_job_search_service()
+    events = job_search_service.stream_search(request)
+    if accept and "application/x-ndjson" in accept:
+        return ndjson_response(events)
+    return sse_response(events)
+
+
 @router.get("/sites", response_model=List[str])
 async def get_available_sites() -> List[str]:
     """
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, Query, Depends
 from pydantic import BaseModel, Field
 
+from src.database.config import database_config
 from src.services.monitoring_service import DatabaseMonitoringService
 from src.services.service_registry import ServiceRegistry
 from src.api.dependencies import get_service_registry
@@ -123,6 +124,18 @@ async def get_current_metrics(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/metrics/pipeline")
+async def get_metrics_pipeline_stats(
+    monitoring_service: DatabaseMonitoringService = Depends(get_monitoring_service)
+):
+    """Get metrics pipeline queue depth and drop counters."""
+    try:
+        return monitoring_service.get_pipeline_stats()
+    except Exception as e:
+        logger.error(f"Error getting metrics pipeline stats: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/errors", response_model=List[ErrorLogResponse])
 async def get_error_logs(
     error_type: Optional[str] = Query(None, description="Filter by error type"),
@@ -290,7 +303,8 @@ async def get_detailed_health(
         # Get database health
         database_health = {
             "status": "healthy" if await monitoring_service.is_available() else "unhealthy",
-            "available": await monitoring_service.is_available()
+            "available": await monitoring_service.is_available(),
+            "pool": database_config.get_pool_stats(),
         }
         
         # Overall health
@@ -1,9 +1,10 @@
 """Resumes API endpoints for the AI Job Application Assistant."""
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, Depends
+from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, Response
 from typing import List, Optional, Dict, Any
 from src.models.resume import Resume, ResumeOptimizationRequest, ResumeOptimizationResponse, BulkDeleteRequest
 from src.models.user import UserProfile
+from src.database.pagination import InvalidCursorError
 from src.utils.logger import get_logger
 from src.utils.validators import validate_file_type, validate_file_size
 from src.services.service_registry import service_registry
@@ -124,11 +125,17 @@ async def bulk_delete_resumes(
 
 @router.get("", response_model=Dict[str, Any])
 async def get_all_resumes(
+    response: Response,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
     current_user: UserProfile = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """
     Get all available resumes.
     
+    With ``limit`` or ``cursor`` a single keyset page is returned and the
+    cursor for the next page is sent in the ``X-Next-Cursor`` header.
+    
     Returns:
         List of all resumes
     """
@@ -136,13 +143,21 @@ async def get_all_resumes(
         # Get resume service from unified registry
         resume_service = await service_registry.get_resume_service()
         
-        # Use the real resume service (filtered by user)
-        resumes = await resume_service.get_all_resumes(user_id=current_user.id)
+        if limit or cursor:
+            page = await resume_service.get_resumes_page(user_id=current_user.id, limit=limit, cursor=cursor)
+            if page.next_cursor:
+                response.headers["X-Next-Cursor"] = page.next_cursor
+            resumes = page.items
+        else:
+            # Use the real resume service (filtered by user)
+            resumes = await resume_service.get_all_resumes(user_id=current_user.id)
         logger.info(f"Successfully retrieved {len(resumes)} resumes")
         
         # Return empty list if no resumes (this is normal)
         return create_api_response([resume.model_dump() for resume in resumes], True, f"Retrieved {len(resumes)} resumes")
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting resumes: {e}", exc_info=True)
         # Return empty list instead of throwing error for better UX
@@ -1,7 +1,7 @@
 """Configuration management for the AI Job Application Assistant."""
 
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from src.core.ai_provider import AIProviderConfig
@@ -24,6 +24,20 @@ class Settings(BaseSettings):
     database_url: str = Field(
         default="sqlite:///./job_applications.db", env="DATABASE_URL"
     )
+    db_pool_size: int = Field(default=10, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=30.0, env="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=3600, env="DB_POOL_RECYCLE")  # seconds
+    sqlite_pool_size: int = Field(default=5, env="SQLITE_POOL_SIZE")
+    sqlite_max_overflow: int = Field(default=10, env="SQLITE_MAX_OVERFLOW")
+    sqlite_journal_mode: str = Field(default="WAL", env="SQLITE_JOURNAL_MODE")
+    sqlite_synchronous: str = Field(default="NORMAL", env="SQLITE_SYNCHRONOUS")
+    sqlite_mmap_size: int = Field(
+        default=256 * 1024 * 1024, env="SQLITE_MMAP_SIZE"
+    )  # bytes
+    sqlite_cache_size: int = Field(
+        default=-64000, env="SQLITE_CACHE_SIZE"
+    )  # negative = KiB, i.e. ~64MB page cache per connection
 
     # AI Providers Configuration
     ai_providers: List[AIProviderConfig] = Field(default_factory=list)
@@ -63,6 +77,27 @@ class Settings(BaseSettings):
 
     # AI Provider Selection
     ai_provider: str = Field(default="auto", env="AI_PROVIDER")
+    ai_routing_strategy: str = Field(
+        default="sequential", env="AI_ROUTING_STRATEGY"
+    )  # sequential, hedged (opt-in; may call two providers) or race
+    ai_hedge_delay: float = Field(
+        default=5.0, env="AI_HEDGE_DELAY"
+    )  # seconds; used until a provider has enough samples for its own p90
+    ai_breaker_failure_threshold: int = Field(
+        default=5, env="AI_BREAKER_FAILURE_THRESHOLD"
+    )  # consecutive failures before a provider's circuit opens
+    ai_breaker_cooldown: float = Field(
+        default=10.0, env="AI_BREAKER_COOLDOWN"
+    )  # seconds; doubles on every failed trial
+    ai_breaker_max_cooldown: float = Field(
+        default=300.0, env="AI_BREAKER_MAX_COOLDOWN"
+    )
+    ai_prompt_input_tokens: int = Field(
+        default=3000, env="AI_PROMPT_INPUT_TOKENS"
+    )  # resume + job description tokens per prompt
+    ai_prompt_input_tokens_by_model: Dict[str, int] = Field(
+        default_factory=dict, env="AI_PROMPT_INPUT_TOKENS_BY_MODEL"
+    )  # JSON, e.g. {"gpt-4": 6000}
 
     # File Storage
     upload_dir: str = Field(default="./uploads", env="UPLOAD_DIR")
@@ -97,6 +132,12 @@ class Settings(BaseSettings):
     jwt_refresh_token_expire_days: int = Field(
         default=7, env="JWT_REFRESH_TOKEN_EXPIRE_DAYS"
     )
+    auth_principal_cache_ttl: int = Field(
+        default=60, env="AUTH_PRINCIPAL_CACHE_TTL"
+    )  # seconds; 0 disables the cache
+    auth_principal_cache_max_bytes: int = Field(
+        default=4 * 1024 * 1024, env="AUTH_PRINCIPAL_CACHE_MAX_BYTES"
+    )
 
     # Email settings
     smtp_host: str = Field(default="localhost", env="SMTP_HOST")
@@ -104,6 +145,13 @@ class Settings(BaseSettings):
     smtp_user: Optional[str] = Field(default=None, env="SMTP_USER")
     smtp_password: Optional[str] = Field(default=None, env="SMTP_PASSWORD")
     smtp_tls: bool = Field(default=False, env="SMTP_TLS")
+    smtp_pool_size: int = Field(default=4, env="SMTP_POOL_SIZE")
+    smtp_rate_limit: float = Field(
+        default=10.0, env="SMTP_RATE_LIMIT"
+    )  # messages per second; 0 disables shaping
+    email_delivery_workers: int = Field(default=4, env="EMAIL_DELIVERY_WORKERS")
+    email_queue_max_size: int = Field(default=1000, env="EMAIL_QUEUE_MAX_SIZE")
+    email_max_retries: int = Field(default=2, env="EMAIL_MAX_RETRIES")
     emails_from_email: str = Field(
         default="noreply@example.com", env="EMAILS_FROM_EMAIL"
     )
@@ -122,10 +170,55 @@ class Settings(BaseSettings):
         default="AI Job Application Assistant", env="MAILGUN_FROM_NAME"
     )
 
+    # Skill matching
+    skill_taxonomy_path: Optional[str] = Field(
+        default=None, env="SKILL_TAXONOMY_PATH"
+    )  # JSON/YAML mapping of canonical skill -> aliases
+
+    # Job search
+    job_search_workers: int = Field(
+        default=4, env="JOB_SEARCH_WORKERS"
+    )  # threads running site scrapes concurrently (at least one per site)
+    job_search_site_timeout: float = Field(
+        default=20.0, env="JOB_SEARCH_SITE_TIMEOUT"
+    )  # seconds per site, retries included; late sites are left out
+    job_search_site_retries: int = Field(default=2, env="JOB_SEARCH_SITE_RETRIES")
+
+    # Job catalog
+    job_catalog_refresh_after: int = Field(
+        default=24 * 3600, env="JOB_CATALOG_REFRESH_AFTER"
+    )  # seconds before a cataloged job is re-scraped in the background
+
+    # Saved-search prefetch
+    search_prefetch_enabled: bool = Field(default=True, env="SEARCH_PREFETCH_ENABLED")
+    search_prefetch_interval: int = Field(
+        default=10 * 60, env="SEARCH_PREFETCH_INTERVAL"
+    )  # seconds between rounds; keep under the 15 minute search cache lifetime
+    search_prefetch_stagger: float = Field(
+        default=5.0, env="SEARCH_PREFETCH_STAGGER"
+    )  # seconds between two prefetch scrapes of the same site
+    search_prefetch_site_budget: int = Field(
+        default=20, env="SEARCH_PREFETCH_SITE_BUDGET"
+    )  # most prefetch scrapes per site per round
+
     # Logging
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_file: str = Field(default="./logs/app.log", env="LOG_FILE")
 
+    # Performance metrics pipeline
+    metrics_persist_samples: bool = Field(
+        default=True, env="METRICS_PERSIST_SAMPLES"
+    )  # also store samples in performance_metrics; /metrics works either way
+    metrics_buffer_size: int = Field(default=10000, env="METRICS_BUFFER_SIZE")
+    metrics_window_seconds: int = Field(default=10, env="METRICS_WINDOW_SECONDS")
+    metrics_overflow_policy: str = Field(
+        default="drop_oldest", env="METRICS_OVERFLOW_POLICY"
+    )  # drop_oldest, drop_newest or sample
+    metrics_sample_every: int = Field(default=10, env="METRICS_SAMPLE_EVERY")
+    metrics_flush_interval: float = Field(
+        default=5.0, env="METRICS_FLUSH_INTERVAL"
+    )  # seconds
+
     # Caching
     cache_enabled: bool = Field(default=True, env="CACHE_ENABLED")
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
@@ -133,6 +226,24 @@ class Settings(BaseSettings):
     cache_expiration_time: int = Field(
         default=3600, env="CACHE_EXPIRATION_TIME"
     )  # 1 hour
+    cache_l1_namespace_max_bytes: int = Field(
+        default=16 * 1024 * 1024, env="CACHE_L1_NAMESPACE_MAX_BYTES"
+    )  # in-process budget per cache namespace
+    cache_l2_enabled: bool = Field(default=True, env="CACHE_L2_ENABLED")
+    cache_generation_refresh: float = Field(
+        default=1.0, env="CACHE_GENERATION_REFRESH"
+    )  # seconds a worker reuses invalidation tokens read from L2
+    ai_cache_enabled: bool = Field(default=True, env="AI_CACHE_ENABLED")
+    ai_cache_path: str = Field(
+        default="./data/ai_cache.sqlite3", env="AI_CACHE_PATH"
+    )
+    ai_cache_ttl: int = Field(default=7 * 24 * 3600, env="AI_CACHE_TTL")  # seconds
+    ai_cache_disabled_operations: List[str] = Field(
+        default=[], env="AI_CACHE_DISABLED_OPERATIONS"
+    )  # e.g. ["generate_cover_letter"] for output that should vary per call
+    ai_cache_near_duplicate_threshold: float = Field(
+        default=0.9, env="AI_CACHE_NEAR_DUPLICATE_THRESHOLD"
+    )  # MinHash similarity of job descriptions; 0 disables near-duplicate reuse
 
     # Legacy fields for backward compatibility
     DEBUG: bool = Field(default=False, env="DEBUG")
@@ -1,7 +1,7 @@
 """Abstract base class for AI providers."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List
 from pydantic import BaseModel
 
 class AIProviderConfig(BaseModel):
@@ -44,6 +44,14 @@ class AIProvider(ABC):
         """Generate text using the AI provider."""
         pass
     
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Generate text as a stream of deltas.
+        
+        Providers without a streaming API yield the whole completion at once.
+        """
+        response = await self.generate_text(prompt, **kwargs)
+        yield response.content
+    
     @abstractmethod
     async def optimize_resume(self, resume_content: str, job_description: str) -> AIResponse:
         """Optimize resume for a specific job."""
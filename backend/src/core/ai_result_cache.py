@@ -0,0 +1,395 @@
+"""
+Content-addressed cache of AI operation results.
+
+A result is keyed by a hash of the operation, the provider, model and
+temperature that serve it, and the normalized inputs. The same resume/job
+pair submitted again (as auto-apply does every cycle) is answered without a
+provider call. Entries live in a SQLite file, so they survive restarts.
+
+Reposted jobs rarely have byte-identical descriptions. For operations that
+take a job description, a MinHash signature of the description is indexed in
+LSH bands next to the entry. A later request whose other inputs match exactly
+and whose description is a near duplicate reuses the stored result.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from src.core import metrics
+
+# Largest prime below 2**32: a * h + b stays inside uint64 for 32-bit a, h, b.
+_PRIME = np.uint64(4294967291)
+_WHITESPACE = re.compile(r"\s+")
+_WORD = re.compile(r"\w+")
+# Expired rows are purged once every this many writes.
+_PURGE_EVERY = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ai_results (
+    key TEXT PRIMARY KEY,
+    operation TEXT NOT NULL,
+    value TEXT NOT NULL,
+    signature BLOB,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_ai_results_expires_at ON ai_results (expires_at);
+CREATE TABLE IF NOT EXISTS ai_near_duplicates (
+    scope TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (scope, bucket, key)
+);
+"""
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Unicode-normalize ``text``, trim it and collapse runs of whitespace."""
+    if not text:
+        return ""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return normalize_text(value)
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def _digest(payload: Any) -> str:
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class AIRoute:
+    """The provider, model and temperature an operation is served by."""
+
+    provider: str
+    model: str
+    temperature: float
+
+
+# Per operation: the route whose provider actually answered, and whether the
+# result came from a mock or fallback builder. Providers are awaited directly,
+# so both are visible to the caller once the provider returns.
+_answered_by: ContextVar[Optional[AIRoute]] = ContextVar("ai_answered_by", default=None)
+_degraded: ContextVar[bool] = ContextVar("ai_degraded", default=False)
+
+
+def record_route(route: AIRoute) -> None:
+    """Note that ``route`` answered the current operation."""
+    _answered_by.set(route)
+
+
+def answered_route() -> Optional[AIRoute]:
+    """The route last recorded in this context, if any."""
+    return _answered_by.get()
+
+
+def mark_degraded() -> None:
+    """Note that the current operation answers with a mock or fallback result."""
+    _degraded.set(True)
+
+
+def degraded_result(method):
+    """Mark results of a mock/fallback builder as uncacheable."""
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        mark_degraded()
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+class AnswerScope:
+    """What answered the operation running inside ``answer_scope``."""
+
+    @property
+    def route(self) -> Optional[AIRoute]:
+        return _answered_by.get()
+
+    @property
+    def degraded(self) -> bool:
+        return _degraded.get()
+
+    @property
+    def cacheable_route(self) -> Optional[AIRoute]:
+        """The route to cache the result under; None if it must not be cached."""
+        return None if self.degraded else self.route
+
+
+@contextmanager
+def answer_scope() -> Iterator[AnswerScope]:
+    """Track which route answers, and whether it degraded, for one operation."""
+    route_token = _answered_by.set(None)
+    degraded_token = _degraded.set(False)
+    try:
+        yield AnswerScope()
+    finally:
+        _degraded.reset(degraded_token)
+        _answered_by.reset(route_token)
+
+
+class MinHasher:
+    """MinHash signatures over lowercased word shingles."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 8, shingle_size: int = 5, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+
+    def signature(self, text: Optional[str]) -> Optional[np.ndarray]:
+        """Signature of ``text``, or None when it has no words."""
+        words = _WORD.findall(normalize_text(text).lower())
+        if not words:
+            return None
+        n = self.shingle_size
+        shingles = {" ".join(words[i : i + n]) for i in range(max(1, len(words) - n + 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % _PRIME
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def buckets(self, signature: np.ndarray) -> List[str]:
+        """LSH bucket ids, one per band of ``signature``."""
+        rows = self.num_perm // self.bands
+        return [
+            f"{band}:{hashlib.blake2b(signature[band * rows:(band + 1) * rows].tobytes(), digest_size=8).hexdigest()}"
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def similarity(left: np.ndarray, right: np.ndarray) -> float:
+        """Estimated Jaccard similarity of the two shingle sets."""
+        return float(np.mean(left == right))
+
+
+class AIResultCache:
+    """SQLite-backed AI result cache with a near-duplicate layer.
+
+    Blocking SQLite calls run in a worker thread; a lock serializes them on
+    the single shared connection.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: int = 7 * 24 * 3600,
+        disabled_operations: Iterable[str] = (),
+        near_duplicate_threshold: float = 0.9,
+        hasher: Optional[MinHasher] = None,
+    ):
+        """
+        Args:
+            path: SQLite file, or ``:memory:``
+            ttl: Seconds an entry stays valid
+            disabled_operations: Operations that are never cached
+            near_duplicate_threshold: Minimum estimated similarity of job
+                descriptions for a near-duplicate hit; 0 disables the layer
+        """
+        self.path = path
+        self.ttl = ttl
+        self.disabled_operations = frozenset(disabled_operations)
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.hasher = hasher or MinHasher()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._stats = {"hits": 0, "near_hits": 0, "misses": 0, "writes": 0}
+
+    def enabled_for(self, operation: str) -> bool:
+        return self.ttl > 0 and operation not in self.disabled_operations
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _scope(operation: str, route: AIRoute, inputs: Dict[str, Any]) -> str:
+        return _digest(
+            {
+                "operation": operation,
+                "provider": route.provider,
+                "model": route.model,
+                "temperature": route.temperature,
+                "inputs": _normalize(inputs),
+            }
+        )
+
+    def key(
+        self,
+        operation: str,
+        route: AIRoute,
+        inputs: Dict[str, Any],
+        document: Optional[str] = None,
+    ) -> str:
+        """Exact cache key; ``document`` is the job description, if any."""
+        return _digest([self._scope(operation, route, inputs), normalize_text(document)])
+
+    async def get(
+        self,
+        operation: str,
+        route: AIRoute,
+        inputs: Dict[str, Any],
+        document: Optional[str] = None,
+    ) -> Optional[Any]:
+        """Cached result for an exact or near-duplicate request, else None."""
+        try:
+            return await asyncio.to_thread(self._get, operation, route, inputs, document)
+        except Exception as e:
+            logger.warning(f"AI result cache read failed: {e}")
+            return None
+
+    async def set(
+        self,
+        operation: str,
+        route: AIRoute,
+        inputs: Dict[str, Any],
+        value: Any,
+        document: Optional[str] = None,
+    ) -> None:
+        """Store a JSON-serializable result."""
+        try:
+            await asyncio.to_thread(self._set, operation, route, inputs, value, document)
+        except Exception as e:
+            logger.warning(f"AI result cache write failed: {e}")
+
+    def _get(
+        self, operation: str, route: AIRoute, inputs: Dict[str, Any], document: Optional[str]
+    ) -> Optional[Any]:
+        scope = self._scope(operation, route, inputs)
+        key = _digest([scope, normalize_text(document)])
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value FROM ai_results WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is not None:
+                return self._hit("hits", row[0])
+
+            signature = self._signature(document)
+            if signature is not None:
+                buckets = self.hasher.buckets(signature)
+                candidates = conn.execute(
+                    "SELECT DISTINCT r.signature, r.value FROM ai_near_duplicates d "
+                    "JOIN ai_results r ON r.key = d.key "
+                    f"WHERE d.scope = ? AND d.bucket IN ({', '.join('?' * len(buckets))}) "
+                    "AND r.expires_at > ?",
+                    (scope, *buckets, now),
+                ).fetchall()
+                best, best_value = self.near_duplicate_threshold, None
+                for stored, value in candidates:
+                    similarity = self.hasher.similarity(signature, np.frombuffer(stored, dtype=np.uint32))
+                    if similarity >= best:
+                        best, best_value = similarity, value
+                if best_value is not None:
+                    return self._hit("near_hits", best_value)
+
+            self._stats["misses"] += 1
+        metrics.cache_requests_total.labels("ai_results", "miss").inc()
+        return None
+
+    def _hit(self, kind: str, value: str) -> Any:
+        self._stats[kind] += 1
+        metrics.cache_requests_total.labels("ai_results", "hit" if kind == "hits" else "near_hit").inc()
+        return json.loads(value)
+
+    def _signature(self, document: Optional[str]) -> Optional[np.ndarray]:
+        if not document or self.near_duplicate_threshold <= 0:
+            return None
+        return self.hasher.signature(document)
+
+    def _set(
+        self,
+        operation: str,
+        route: AIRoute,
+        inputs: Dict[str, Any],
+        value: Any,
+        document: Optional[str],
+    ) -> None:
+        scope = self._scope(operation, route, inputs)
+        key = _digest([scope, normalize_text(document)])
+        signature = self._signature(document)
+        payload = json.dumps(value, default=str)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ai_results (key, operation, value, signature, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        operation,
+                        payload,
+                        signature.tobytes() if signature is not None else None,
+                        time.time() + self.ttl,
+                    ),
+                )
+                if signature is not None:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO ai_near_duplicates (scope, bucket, key) VALUES (?, ?, ?)",
+                        [(scope, bucket, key) for bucket in self.hasher.buckets(signature)],
+                    )
+            self._stats["writes"] += 1
+            self._writes += 1
+            if self._writes % _PURGE_EVERY == 0:
+                self._purge(conn)
+
+    def _purge(self, conn: sqlite3.Connection) -> None:
+        with conn:
+            conn.execute("DELETE FROM ai_results WHERE expires_at <= ?", (time.time(),))
+            conn.execute(
+                "DELETE FROM ai_near_duplicates WHERE key NOT IN (SELECT key FROM ai_results)"
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM ai_results")
+                conn.execute("DELETE FROM ai_near_duplicates")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "ttl": self.ttl, "disabled_operations": sorted(self.disabled_operations)}
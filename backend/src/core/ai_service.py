@@ -1,7 +1,8 @@
 """AI service interface for job application assistance."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
+from src.core.ai_stream import AIStreamEvent
 from src.models.resume import ResumeOptimizationRequest, ResumeOptimizationResponse
 from src.models.cover_letter import CoverLetterRequest, CoverLetter
 
@@ -53,4 +54,22 @@ class AIService(ABC):
         Returns:
             Dictionary with interview questions, answers, tips, and preparation guidance
         """
-        pass
\ No newline at end of file
+        pass
+    
+    # Streaming variants. Services that cannot stream inherit these, which
+    # compute the artifact in full and send it as the single ``done`` event.
+    
+    async def stream_resume_optimization(self, request: ResumeOptimizationRequest) -> AsyncIterator[AIStreamEvent]:
+        """Optimize a resume, streaming progress as ``AIStreamEvent``s."""
+        response = await self.optimize_resume(request)
+        yield AIStreamEvent("done", response.model_dump(mode="json"))
+    
+    async def stream_cover_letter(self, request: CoverLetterRequest) -> AsyncIterator[AIStreamEvent]:
+        """Generate a cover letter, streaming its text as ``AIStreamEvent``s."""
+        letter = await self.generate_cover_letter(request)
+        yield AIStreamEvent("done", letter.model_dump(mode="json"))
+    
+    async def stream_interview_prep(self, job_description: str, resume_content: str, company_name: Optional[str] = None, job_title: Optional[str] = None) -> AsyncIterator[AIStreamEvent]:
+        """Prepare for an interview, streaming questions as they are parsed."""
+        prep = await self.prepare_interview(job_description, resume_content, company_name, job_title)
+        yield AIStreamEvent("done", prep)
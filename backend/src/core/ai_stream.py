@@ -0,0 +1,125 @@
+"""
+Streaming AI output.
+
+Providers stream completions as text deltas. ``AIStreamEvent`` is what the
+AI services hand to the API layer, which writes it as a Server-Sent Event:
+
+- ``delta``: the next piece of raw model output (``{"text": ...}``)
+- ``field``: a top-level field of a JSON answer finished parsing
+  (``{"key": ..., "value": ...}``)
+- ``item``: one more element of a top-level JSON array finished parsing
+  (``{"key": ..., "value": ...}``), so e.g. interview questions show up one
+  at a time
+- ``done``: the final artifact, exactly what the non-streaming endpoint
+  returns
+- ``error``: the stream failed (``{"detail": ...}``)
+
+``IncrementalJSONParser`` produces the ``field``/``item`` events while the
+answer is still arriving.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.streaming import StreamEvent
+
+
+class AIStreamEvent(StreamEvent):
+    """One event of a streamed AI operation."""
+
+
+class IncrementalJSONParser:
+    """Parse a JSON object answer as its text streams in.
+
+    Text before the opening brace (a Markdown fence, a sentence of preamble)
+    is skipped. Each top-level member is decoded as soon as the ``,`` or
+    ``}`` after it arrives, and each element of a top-level array as soon as
+    the ``,`` or ``]`` after it arrives, so work is proportional to the
+    answer's length rather than re-parsing the whole buffer per chunk.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._member_start = 0
+        self._item_start = 0
+        self._array_key: Optional[str] = None
+        self.result: Dict[str, Any] = {}
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Optional[str], Any]]:
+        """Consume ``chunk``; returns ``(event, key, value)`` for what completed."""
+        self._buffer += chunk
+        events: List[Tuple[str, Optional[str], Any]] = []
+        buffer = self._buffer
+        while self._pos < len(buffer) and not self.done:
+            i = self._pos
+            ch = buffer[i]
+            self._pos += 1
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+            if not self._stack:
+                if ch == "{":
+                    self._stack.append(ch)
+                    self._member_start = i + 1
+                continue
+
+            depth = len(self._stack)
+            if ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._stack.append(ch)
+                if depth == 1 and ch == "[":
+                    self._array_key = self._key(buffer[self._member_start:i])
+                    self._item_start = i + 1
+            elif ch in "}]":
+                if depth == 2 and ch == "]" and self._stack[-1] == "[":
+                    self._end_item(buffer[self._item_start:i], events)
+                self._stack.pop()
+                if depth == 1:
+                    self._end_member(buffer[self._member_start:i], events)
+                    self.done = True
+            elif ch == ",":
+                if depth == 1:
+                    self._end_member(buffer[self._member_start:i], events)
+                    self._member_start = i + 1
+                elif depth == 2 and self._stack[-1] == "[":
+                    self._end_item(buffer[self._item_start:i], events)
+                    self._item_start = i + 1
+        return events
+
+    @staticmethod
+    def _key(prefix: str) -> Optional[str]:
+        try:
+            return json.loads(prefix.strip().rstrip(":").strip())
+        except ValueError:
+            return None
+
+    def _end_member(self, segment: str, events: List[Tuple[str, Optional[str], Any]]) -> None:
+        if not segment.strip():
+            return
+        try:
+            member = json.loads("{" + segment + "}")
+        except ValueError:
+            return
+        for key, value in member.items():
+            self.result[key] = value
+            if not isinstance(value, list):
+                events.append(("field", key, value))
+
+    def _end_item(self, segment: str, events: List[Tuple[str, Optional[str], Any]]) -> None:
+        if not segment.strip():
+            return
+        try:
+            events.append(("item", self._array_key, json.loads(segment)))
+        except ValueError:
+            pass
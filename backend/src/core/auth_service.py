@@ -144,6 +144,24 @@ class AuthService(ABC):
         """
         pass
 
+    async def get_principal(self, token: str) -> Optional[UserProfile]:
+        """
+        Resolve an access token to the authenticated user's profile.
+
+        Implementations may cache the result; the default verifies the token
+        and loads the profile on every call.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            User profile if the token is valid and the user exists, None otherwise
+        """
+        user_id = await self.verify_token(token)
+        if not user_id:
+            return None
+        return await self.get_user_profile(user_id)
+
     @abstractmethod
     async def delete_user(self, user_id: str, password: str) -> bool:
         """
@@ -0,0 +1,532 @@
+"""
+Unified multi-tier cache.
+
+L1 is a bounded, per-namespace LRU held in process memory. Each namespace has
+its own byte budget, so one noisy consumer (for example analytics dashboards)
+cannot push everything else out or grow a worker without bound.
+
+L2 is the shared dogpile region from ``src.core.cache`` (Redis in production).
+It is optional: when the region is backed by process memory, when
+``CACHE_L2_ENABLED`` is off, or when Redis is unreachable, the manager serves
+from L1 only.
+
+Invalidation never scans keys. Every namespace (and every scope inside a
+namespace, typically a user id) carries a generation token that is part of the
+physical key. Invalidating bumps the token; stale entries simply become
+unreachable and age out through LRU eviction or TTL. With L2 the tokens are
+shared; each worker reuses the tokens it read for ``CACHE_GENERATION_REFRESH``
+seconds, so an L1 hit does not cost an L2 round trip.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import pickle
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from src.config import config
+from src.core import metrics
+from src.core.cache import cache_region
+from src.core.cache_performance import CachePerformanceMonitor, performance_monitor
+
+
+# How long L2 stays bypassed after a backend error before it is retried.
+L2_RETRY_AFTER_SECONDS = 30.0
+
+# Most L2 generation tokens a worker keeps between refreshes.
+GENERATION_CACHE_MAX_KEYS = 10_000
+
+_MISSING = object()
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory footprint of a cached value in bytes."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    size: int
+
+    def is_expired(self, now: float) -> bool:
+        return now >= self.expires_at
+
+
+@dataclass
+class CacheStats:
+    """Counters for a single cache namespace."""
+
+    hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    deletes: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return (self.hits / total * 100) if total > 0 else 0.0
+
+
+class LRUStore:
+    """Thread-safe, byte-bounded LRU map with per-entry TTL.
+
+    Operations are O(1) and never block on I/O, so the store is safe to use
+    from both synchronous code and the event loop.
+    """
+
+    def __init__(self, max_bytes: int, default_ttl: int = 300) -> None:
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value, or ``default`` if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return default
+            if entry.is_expired(now):
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        size: Optional[int] = None,
+    ) -> int:
+        """Store a value and return how many entries were evicted to fit it."""
+        ttl = self.default_ttl if ttl is None else ttl
+        size = estimate_size(value) if size is None else size
+        entry = _CacheEntry(
+            value=value, expires_at=time.monotonic() + max(ttl, 0), size=size
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self.stats.sets += 1
+            if size > self.max_bytes:
+                # Larger than the whole budget: caching it would flush everything.
+                return 0
+            self._entries[key] = entry
+            self._bytes += size
+            evicted = 0
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                evicted += 1
+            self.stats.evictions += evicted
+            return evicted
+
+    def record_l2_hit(self) -> None:
+        """Reclassify the last L1 miss as a hit served by L2."""
+        with self._lock:
+            self.stats.misses -= 1
+            self.stats.hits += 1
+            self.stats.l2_hits += 1
+
+    def delete(self, key: str) -> bool:
+        """Remove a key; return True if it was present."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            self.stats.deletes += 1
+            return True
+
+    def clear(self) -> int:
+        """Drop every entry and return how many were removed."""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return removed
+
+    def cleanup(self) -> int:
+        """Remove expired entries and return how many were removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, v in self._entries.items() if v.is_expired(now)]
+            for key in expired:
+                self._remove(key)
+            self.stats.expirations += len(expired)
+            return len(expired)
+
+    def count_expired(self) -> int:
+        """Count expired entries without removing them."""
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for v in self._entries.values() if v.is_expired(now))
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+@dataclass
+class _Namespace:
+    name: str
+    store: LRUStore
+    generation: int = 0
+    scope_generations: Dict[str, int] = field(default_factory=dict)
+
+
+class CacheManager:
+    """Single async entry point for L1 + optional L2 caching."""
+
+    def __init__(
+        self,
+        region: Any = None,
+        default_max_bytes: Optional[int] = None,
+        default_ttl: Optional[int] = None,
+        monitor: Optional[CachePerformanceMonitor] = None,
+        l2_enabled: Optional[bool] = None,
+        generation_refresh: Optional[float] = None,
+    ) -> None:
+        self._region = region
+        self._default_max_bytes = (
+            default_max_bytes
+            if default_max_bytes is not None
+            else config.cache_l1_namespace_max_bytes
+        )
+        self._default_ttl = (
+            default_ttl if default_ttl is not None else config.cache_expiration_time
+        )
+        self._monitor = monitor
+        self._l2_enabled = (
+            config.cache_enabled and config.cache_l2_enabled
+            if l2_enabled is None
+            else l2_enabled
+        )
+        self._l2_disabled_until = 0.0
+        self._generation_refresh = (
+            config.cache_generation_refresh
+            if generation_refresh is None
+            else generation_refresh
+        )
+        # Generation key -> (monotonic time to re-read it, token), LRU order.
+        self._generations: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Namespace management
+    # ------------------------------------------------------------------
+
+    def register_namespace(
+        self,
+        name: str,
+        max_bytes: Optional[int] = None,
+        default_ttl: Optional[int] = None,
+    ) -> None:
+        """Declare a namespace with its own L1 byte budget and default TTL.
+
+        Re-registering an existing namespace only updates its limits.
+        """
+        with self._lock:
+            ns = self._namespaces.get(name)
+            if ns is None:
+                store = LRUStore(
+                    max_bytes=max_bytes or self._default_max_bytes,
+                    default_ttl=(
+                        default_ttl if default_ttl is not None else self._default_ttl
+                    ),
+                )
+                self._namespaces[name] = _Namespace(name=name, store=store)
+                return
+            if max_bytes is not None:
+                ns.store.max_bytes = max_bytes
+            if default_ttl is not None:
+                ns.store.default_ttl = default_ttl
+
+    def _namespace(self, name: str) -> _Namespace:
+        ns = self._namespaces.get(name)
+        if ns is None:
+            self.register_namespace(name)
+            ns = self._namespaces[name]
+        return ns
+
+    # ------------------------------------------------------------------
+    # Public async API
+    # ------------------------------------------------------------------
+
+    async def get(
+        self, namespace: str, key: str, scope: Optional[str] = None
+    ) -> Optional[Any]:
+        """Return a cached value, checking L1 then L2, or None on miss."""
+        start = time.perf_counter()
+        ns = self._namespace(namespace)
+        physical_key = await self._physical_key(ns, key, scope)
+
+        value = ns.store.get(physical_key, _MISSING)
+        if value is not _MISSING:
+            self._record("hit", time.perf_counter() - start)
+            metrics.cache_requests_total.labels(namespace, "hit").inc()
+            return value
+
+        if self._use_l2():
+            cached = await self._l2_call(self._region.get, physical_key)
+            if cached is not None and self._is_live_l2_value(cached):
+                expires_at, value = cached
+                # Promote to L1 for the remaining lifetime of the L2 entry.
+                ttl = max(int(expires_at - time.time()), 0)
+                self._record_evictions(ns.store.set(physical_key, value, ttl=ttl))
+                ns.store.record_l2_hit()
+                self._record("hit", time.perf_counter() - start)
+                metrics.cache_requests_total.labels(namespace, "l2_hit").inc()
+                return value
+
+        self._record("miss", time.perf_counter() - start)
+        metrics.cache_requests_total.labels(namespace, "miss").inc()
+        return None
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        scope: Optional[str] = None,
+    ) -> None:
+        """Store a value in L1 and, when available, in L2."""
+        start = time.perf_counter()
+        ns = self._namespace(namespace)
+        ttl = ns.store.default_ttl if ttl is None else ttl
+        physical_key = await self._physical_key(ns, key, scope)
+        self._record_evictions(ns.store.set(physical_key, value, ttl=ttl))
+
+        if self._use_l2():
+            await self._l2_call(
+                self._region.set, physical_key, (time.time() + ttl, value)
+            )
+        self._record("set", time.perf_counter() - start)
+
+    async def delete(
+        self, namespace: str, key: str, scope: Optional[str] = None
+    ) -> None:
+        """Remove a single key from both tiers."""
+        ns = self._namespace(namespace)
+        physical_key = await self._physical_key(ns, key, scope)
+        ns.store.delete(physical_key)
+        if self._use_l2():
+            await self._l2_call(self._region.delete, physical_key)
+        if self._monitor is not None:
+            self._monitor.record_delete()
+
+    async def invalidate(self, namespace: str, scope: Optional[str] = None) -> None:
+        """Invalidate a whole namespace, or one scope inside it, in O(1).
+
+        Bumps the relevant generation token so that existing entries become
+        unreachable. Invalidating a whole namespace also releases its L1
+        memory immediately.
+        """
+        ns = self._namespace(namespace)
+        with self._lock:
+            if scope is None:
+                ns.generation += 1
+                ns.scope_generations.clear()
+            else:
+                ns.scope_generations[scope] = ns.scope_generations.get(scope, 0) + 1
+        ns.store.stats.invalidations += 1
+        if scope is None:
+            ns.store.clear()
+
+        if self._use_l2():
+            key, token = self._generation_key(namespace, scope), uuid.uuid4().hex
+            self._remember_generation(key, token)
+            await self._l2_call(self._region.set, key, token)
+
+    async def cleanup(self, namespace: Optional[str] = None) -> int:
+        """Drop expired L1 entries; return how many were removed."""
+        names = [namespace] if namespace is not None else list(self._namespaces)
+        return sum(self._namespace(name).store.cleanup() for name in names)
+
+    async def clear(self) -> None:
+        """Invalidate every registered namespace."""
+        for name in list(self._namespaces):
+            await self.invalidate(name)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-namespace counters and memory usage."""
+        namespaces = {}
+        for name, ns in list(self._namespaces.items()):
+            store = ns.store
+            namespaces[name] = {
+                **asdict(store.stats),
+                "hit_rate_percent": round(store.stats.hit_rate, 2),
+                "entries": len(store),
+                "bytes_used": store.bytes_used,
+                "max_bytes": store.max_bytes,
+                "default_ttl": store.default_ttl,
+            }
+        return {
+            "l2_enabled": self._use_l2(),
+            "namespaces": namespaces,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _use_l2(self) -> bool:
+        if not self._l2_enabled or self._region is None:
+            return False
+        if time.monotonic() < self._l2_disabled_until:
+            return False
+        try:
+            from dogpile.cache.backends.memory import MemoryBackend
+
+            # A process-memory region is not shared, so it adds nothing over L1.
+            return not isinstance(self._region.backend, MemoryBackend)
+        except Exception:
+            return False
+
+    async def _l2_call(self, fn: Any, *args: Any) -> Any:
+        """Run a blocking L2 operation off the event loop, failing soft."""
+        try:
+            result = await asyncio.to_thread(fn, *args)
+        except Exception as e:
+            logger.warning(
+                f"L2 cache unavailable, serving from L1 for "
+                f"{L2_RETRY_AFTER_SECONDS:.0f}s: {e}"
+            )
+            self._l2_disabled_until = time.monotonic() + L2_RETRY_AFTER_SECONDS
+            if self._monitor is not None:
+                self._monitor.record_error()
+            return None
+        if self._is_no_value(result):
+            return None
+        return result
+
+    @staticmethod
+    def _is_no_value(value: Any) -> bool:
+        try:
+            from dogpile.cache.api import NO_VALUE
+
+            return value is NO_VALUE
+        except Exception:
+            return False
+
+    @staticmethod
+    def _is_live_l2_value(cached: Any) -> bool:
+        return (
+            isinstance(cached, tuple)
+            and len(cached) == 2
+            and isinstance(cached[0], (int, float))
+            and cached[0] > time.time()
+        )
+
+    @staticmethod
+    def _generation_key(namespace: str, scope: Optional[str]) -> str:
+        return f"cache-gen:{namespace}:{scope if scope is not None else '*'}"
+
+    async def _physical_key(
+        self, ns: _Namespace, key: str, scope: Optional[str]
+    ) -> str:
+        scope_part = scope if scope is not None else "_"
+        token = await self._generation_token(ns, scope)
+        return f"{ns.name}:{scope_part}:{token}:{key}"
+
+    async def _generation_token(self, ns: _Namespace, scope: Optional[str]) -> str:
+        if self._use_l2():
+            # Generations live in L2 so invalidation is visible to every worker.
+            keys = [self._generation_key(ns.name, None)]
+            if scope is not None:
+                keys.append(self._generation_key(ns.name, scope))
+            tokens = await self._l2_generations(keys)
+            if tokens is not None:
+                return ".".join(tokens)
+        local: Tuple[int, ...] = (ns.generation,)
+        if scope is not None:
+            local += (ns.scope_generations.get(scope, 0),)
+        return "l" + ".".join(str(g) for g in local)
+
+    async def _l2_generations(self, keys: List[str]) -> Optional[List[str]]:
+        """Tokens for generation ``keys``, read from L2 at most once per refresh."""
+        now = time.monotonic()
+        with self._lock:
+            known = [self._generations.get(key) for key in keys]
+        if all(entry is not None and entry[0] > now for entry in known):
+            return [entry[1] for entry in known]
+
+        # Read tokens past the region's expiration time: if a token reset,
+        # entries written before an invalidation would be served again.
+        tokens = await self._l2_call(
+            functools.partial(self._region.get_multi, keys, ignore_expiration=True)
+        )
+        if tokens is None:
+            return None
+        result: List[str] = []
+        fresh: Dict[str, str] = {}
+        for key, token in zip(keys, tokens):
+            if self._is_no_value(token):
+                # Never set, or evicted by the backend's own TTL: start a new
+                # generation rather than reuse one older entries were keyed by.
+                token = fresh[key] = uuid.uuid4().hex
+            result.append(str(token))
+        if fresh:
+            await self._l2_call(self._region.set_multi, fresh)
+        for key, token in zip(keys, result):
+            self._remember_generation(key, token)
+        return result
+
+    def _remember_generation(self, key: str, token: str) -> None:
+        with self._lock:
+            self._generations[key] = (time.monotonic() + self._generation_refresh, token)
+            self._generations.move_to_end(key)
+            while len(self._generations) > GENERATION_CACHE_MAX_KEYS:
+                self._generations.popitem(last=False)
+
+    def _record(self, kind: str, duration: float) -> None:
+        if self._monitor is None:
+            return
+        if kind == "hit":
+            self._monitor.record_hit(duration)
+        elif kind == "miss":
+            self._monitor.record_miss(duration)
+        elif kind == "set":
+            self._monitor.record_set(duration)
+
+    def _record_evictions(self, count: int) -> None:
+        if count and self._monitor is not None:
+            self._monitor.record_eviction(count)
+
+
+# Process-wide cache manager shared by services and API routers.
+cache_manager = CacheManager(region=cache_region, monitor=performance_monitor)
@@ -20,6 +20,7 @@ class CachePerformanceMonitor:
             "misses": 0,
             "sets": 0,
             "deletes": 0,
+            "evictions": 0,
             "errors": 0,
             "total_get_time": 0.0,
             "total_set_time": 0.0,
@@ -45,6 +46,10 @@ class CachePerformanceMonitor:
         """Record a cache delete operation."""
         self.metrics["deletes"] += 1
     
+    def record_eviction(self, count: int = 1):
+        """Record entries evicted to stay within a cache budget."""
+        self.metrics["evictions"] += count
+    
     def record_error(self):
         """Record a cache error."""
         self.metrics["errors"] += 1
@@ -66,6 +71,7 @@ class CachePerformanceMonitor:
             "hit_rate_percent": round(hit_rate, 2),
             "cache_sets": self.metrics["sets"],
             "cache_deletes": self.metrics["deletes"],
+            "cache_evictions": self.metrics["evictions"],
             "cache_errors": self.metrics["errors"],
             "avg_get_time_ms": round(avg_get_time * 1000, 2),
             "avg_set_time_ms": round(avg_set_time * 1000, 2),
@@ -80,6 +86,7 @@ class CachePerformanceMonitor:
             "misses": 0,
             "sets": 0,
             "deletes": 0,
+            "evictions": 0,
             "errors": 0,
             "total_get_time": 0.0,
             "total_set_time": 0.0,
@@ -127,8 +134,12 @@ def get_performance_dashboard() -> Dict[str, Any]:
         logger.warning(f"Could not fetch backend info: {e}")
         backend_info = {"backend_type": "unknown", "configured": False}
     
+    # Imported lazily: the cache manager itself reports into this module.
+    from src.core.cache_manager import cache_manager
+
     return {
         "performance_metrics": stats,
         "backend_info": backend_info,
+        "tiered_cache": cache_manager.stats(),
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
@@ -0,0 +1,202 @@
+"""
+Per-provider circuit breakers.
+
+A breaker counts consecutive failures of one AI provider. At
+``failure_threshold`` it opens, and calls fail immediately with
+``CircuitOpenError`` instead of waiting for a timeout. After a cool-down it
+turns half-open and lets exactly one trial call through. Success closes the
+breaker. Failure opens it again with the cool-down doubled, up to
+``max_cooldown``.
+
+A breaker with a ``probe`` does not wait for user traffic to find out that a
+provider has recovered. Once the cool-down passes, a background task runs the
+probe (a cheap health request) as the trial call.
+
+Breakers are shared per provider name through ``get_breaker``, so the
+provider manager and the Gemini/G4F services report through one registry.
+"""
+
+import asyncio
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+from src.config import config
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose breaker is open."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker with exponential cool-down."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        cooldown: float = 10.0,
+        max_cooldown: float = 300.0,
+        probe: Optional[Callable[[], Awaitable[bool]]] = None,
+        probe_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.probe = probe
+        self.probe_timeout = probe_timeout
+        self._clock = clock
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0  # consecutive openings; drives the cool-down
+        self._open_until = 0.0
+        self._trial_in_flight = False
+        self._probe_task: Optional[asyncio.Task] = None
+
+    @property
+    def current_cooldown(self) -> float:
+        return min(self.max_cooldown, self.cooldown * 2 ** max(0, self.trips - 1))
+
+    def available(self) -> bool:
+        """Whether a call would be let through right now (without taking the trial)."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN:
+            return self._clock() >= self._open_until
+        return not self._trial_in_flight
+
+    def allow(self) -> bool:
+        """Admit one call; in half-open state only the first caller gets through."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN:
+            if self._clock() < self._open_until:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        if self.state is not CircuitState.CLOSED:
+            logger.info(f"Circuit for AI provider '{self.name}' closed")
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._trial_in_flight = False
+        if self.state is CircuitState.HALF_OPEN:
+            self._trip()
+        elif self.state is CircuitState.CLOSED:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_threshold:
+                self._trip()
+
+    def release(self) -> None:
+        """Give back a trial that ended without an outcome (e.g. cancelled)."""
+        self._trial_in_flight = False
+
+    def _trip(self) -> None:
+        self.trips += 1
+        self.state = CircuitState.OPEN
+        self.consecutive_failures = 0
+        self._open_until = self._clock() + self.current_cooldown
+        logger.warning(
+            f"Circuit for AI provider '{self.name}' opened for {self.current_cooldown:.1f}s"
+        )
+        self._schedule_probe()
+
+    def _schedule_probe(self) -> None:
+        if self.probe is None or (self._probe_task and not self._probe_task.done()):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._probe_task = loop.create_task(self._probe_loop())
+
+    async def _probe_loop(self) -> None:
+        while self.state is CircuitState.OPEN:
+            await asyncio.sleep(max(0.0, self._open_until - self._clock()))
+            if not self.allow():
+                continue
+            try:
+                healthy = await asyncio.wait_for(self.probe(), timeout=self.probe_timeout)
+            except asyncio.CancelledError:
+                self.release()
+                raise
+            except Exception as e:
+                logger.debug(f"Probe of AI provider '{self.name}' failed: {e}")
+                healthy = False
+            if healthy:
+                self.record_success()
+            else:
+                self.record_failure()
+
+    async def call(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Await ``func`` through the breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker does not admit the call
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit for AI provider '{self.name}' is open")
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            self.release()
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        snapshot = {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+        }
+        if self.state is CircuitState.OPEN:
+            snapshot["retry_in_seconds"] = round(max(0.0, self._open_until - self._clock()), 1)
+        return snapshot
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(
+    name: str, probe: Optional[Callable[[], Awaitable[bool]]] = None
+) -> CircuitBreaker:
+    """Shared breaker for provider ``name``; ``probe`` replaces any earlier one."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(
+            name,
+            failure_threshold=config.ai_breaker_failure_threshold,
+            cooldown=config.ai_breaker_cooldown,
+            max_cooldown=config.ai_breaker_max_cooldown,
+        )
+    if probe is not None:
+        breaker.probe = probe
+    return breaker
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every registered breaker, keyed by provider name."""
+    return {name: breaker.snapshot() for name, breaker in _breakers.items()}
@@ -0,0 +1,199 @@
+"""
+In-process Prometheus metrics.
+
+Counters, gauges and fixed-bucket histograms live in process memory and are
+served in the Prometheus text format at ``/metrics``. Nothing here touches the
+database, so observing a sample costs a lock and an addition.
+
+With several workers (gunicorn/uvicorn ``--workers``), point
+``PROMETHEUS_MULTIPROC_DIR`` at an empty, writable directory before the
+workers start. ``prometheus_client`` then keeps every value in mmap-backed
+files in that directory, and a scrape of any worker aggregates all of them.
+
+``prometheus_client`` is optional: without it every metric is a no-op and
+``/metrics`` reports that exposition is unavailable.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Tuple
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# Request and query latencies, in seconds.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+# Slow external work: AI completions and job board scrapes, in seconds.
+SLOW_CALL_BUCKETS: Tuple[float, ...] = (
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0,
+)
+
+
+class _NoopMetric:
+    """Stand-in used when prometheus_client is not installed."""
+
+    def labels(self, *args: Any, **kwargs: Any) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def dec(self, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def observe(self, amount: float) -> None:
+        pass
+
+
+def _counter(name: str, documentation: str, labels: Tuple[str, ...] = ()) -> Any:
+    if not PROMETHEUS_AVAILABLE:
+        return _NoopMetric()
+    return Counter(name, documentation, labels)
+
+
+def _gauge(name: str, documentation: str, labels: Tuple[str, ...] = ()) -> Any:
+    if not PROMETHEUS_AVAILABLE:
+        return _NoopMetric()
+    # Summed across workers when running in multiprocess mode.
+    return Gauge(name, documentation, labels, multiprocess_mode="livesum")
+
+
+def _histogram(
+    name: str,
+    documentation: str,
+    labels: Tuple[str, ...] = (),
+    buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+) -> Any:
+    if not PROMETHEUS_AVAILABLE:
+        return _NoopMetric()
+    return Histogram(name, documentation, labels, buckets=buckets)
+
+
+# HTTP
+http_requests_total = _counter(
+    "http_requests_total", "HTTP requests handled.", ("method", "route", "status")
+)
+http_request_duration_seconds = _histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency.",
+    ("method", "route"),
+)
+http_requests_in_progress = _gauge(
+    "http_requests_in_progress", "HTTP requests currently being handled."
+)
+
+# Database
+db_query_duration_seconds = _histogram(
+    "db_query_duration_seconds", "SQL statement latency.", ("operation",)
+)
+db_slow_queries_total = _counter(
+    "db_slow_queries_total", "SQL statements slower than 100ms.", ("operation",)
+)
+
+# AI providers
+ai_request_duration_seconds = _histogram(
+    "ai_request_duration_seconds",
+    "AI provider call latency.",
+    ("provider", "operation", "outcome"),
+    buckets=SLOW_CALL_BUCKETS,
+)
+
+# Job scraping
+job_scrape_duration_seconds = _histogram(
+    "job_scrape_duration_seconds",
+    "Job board scrape latency.",
+    ("source", "outcome"),
+    buckets=SLOW_CALL_BUCKETS,
+)
+job_scrape_jobs_total = _counter(
+    "job_scrape_jobs_total", "Jobs returned by job board scrapes.", ("source",)
+)
+
+# Cache
+cache_requests_total = _counter(
+    "cache_requests_total", "Cache lookups by outcome.", ("namespace", "result")
+)
+
+# Monitoring pipeline (see src.services.metrics_pipeline)
+monitoring_queue_depth = _gauge(
+    "monitoring_metrics_queue_depth",
+    "Samples buffered for persistence at the last flush.",
+)
+monitoring_dropped_total = _counter(
+    "monitoring_metrics_dropped_total",
+    "Samples discarded by the pipeline overflow policy.",
+    ("reason",),
+)
+
+
+@contextmanager
+def track_duration(histogram: Any, **labels: str) -> Iterator[dict]:
+    """Observe the duration of a block in ``histogram``.
+
+    Yields a mutable dict of labels so the block can fill in labels that are
+    only known at the end (e.g. ``outcome``). Exceptions are recorded with
+    ``outcome="error"`` unless the block set the outcome itself.
+    """
+    labels = dict(labels)
+    outcome = "success"
+    start = time.perf_counter()
+    try:
+        yield labels
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        if "outcome" in getattr(histogram, "_labelnames", ()):
+            labels.setdefault("outcome", outcome)
+        histogram.labels(**labels).observe(time.perf_counter() - start)
+
+
+def multiprocess_dir() -> str | None:
+    """Return the shared metrics directory when multiprocess mode is on."""
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or os.environ.get(
+        "prometheus_multiproc_dir"
+    )
+
+
+def render_latest() -> Tuple[bytes, str]:
+    """Render all metrics in the Prometheus text format.
+
+    Returns:
+        Body and content type for the ``/metrics`` response
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return b"# prometheus_client is not installed\n", CONTENT_TYPE_LATEST
+    if multiprocess_dir():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int | None = None) -> None:
+    """Drop a worker's live gauges from the shared directory on shutdown."""
+    if PROMETHEUS_AVAILABLE and multiprocess_dir():
+        multiprocess.mark_process_dead(pid or os.getpid())
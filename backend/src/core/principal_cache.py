@@ -0,0 +1,112 @@
+"""In-process cache of authenticated principals.
+
+Resolving a bearer token to a user normally costs a JWT decode plus a user
+lookup. ``PrincipalCache`` memoizes both: decoded claims per token (until the
+token expires) and the user profile per ``(sub, iat)`` for a short TTL. Each
+user has a generation number that is part of the profile key, so
+invalidating a user is O(1) and old entries simply age out of the LRU.
+Generations come from one cache-wide counter and are never reused, so a
+generation can be forgotten once it is older than the TTL without an old
+profile key ever becoming current again.
+"""
+
+import hashlib
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.cache_manager import LRUStore
+from src.models.user import UserProfile
+
+# Rough per-entry footprint; avoids pickling every value just to size it.
+_CLAIMS_ENTRY_BYTES = 512
+_PROFILE_ENTRY_BYTES = 1024
+
+
+class PrincipalCache:
+    """Bounded, short-TTL cache of decoded tokens and user profiles."""
+
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024, ttl: int = 60) -> None:
+        self.ttl = ttl
+        self._claims = LRUStore(max_bytes=max_bytes // 2, default_ttl=ttl)
+        self._profiles = LRUStore(max_bytes=max_bytes // 2, default_ttl=ttl)
+        # user id -> (generation, monotonic time of the last bump), oldest first
+        self._generations: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._next_generation = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get_claims(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return memoized claims for ``token`` if it has not expired."""
+        claims = self._claims.get(self._token_key(token))
+        if claims is None:
+            return None
+        exp = claims.get("exp")
+        if exp is not None and exp <= time.time():
+            self._claims.delete(self._token_key(token))
+            return None
+        return claims
+
+    def set_claims(self, token: str, claims: Dict[str, Any]) -> None:
+        """Memoize verified claims, never beyond the token's own expiry."""
+        ttl = self.ttl
+        exp = claims.get("exp")
+        if exp is not None:
+            ttl = min(ttl, int(exp - time.time()))
+        if ttl > 0:
+            self._claims.set(
+                self._token_key(token), claims, ttl=ttl, size=_CLAIMS_ENTRY_BYTES
+            )
+
+    def _profile_key(self, user_id: str, issued_at: Any) -> str:
+        generation, _ = self._generations.get(user_id, (0, 0.0))
+        return f"{user_id}:{generation}:{issued_at}"
+
+    def get_profile(self, user_id: str, issued_at: Any) -> Optional[UserProfile]:
+        return self._profiles.get(self._profile_key(user_id, issued_at))
+
+    def set_profile(
+        self, user_id: str, issued_at: Any, profile: UserProfile
+    ) -> None:
+        self._profiles.set(
+            self._profile_key(user_id, issued_at), profile, size=_PROFILE_ENTRY_BYTES
+        )
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached profile for ``user_id``."""
+        now = time.monotonic()
+        with self._lock:
+            self._generations.pop(user_id, None)
+            self._generations[user_id] = (next(self._next_generation), now)
+            # Profiles cached before an old bump have expired; key them as 0.
+            while self._generations:
+                oldest, (_, bumped_at) = next(iter(self._generations.items()))
+                if now - bumped_at <= self.ttl:
+                    break
+                del self._generations[oldest]
+
+    def clear(self) -> None:
+        self._claims.clear()
+        self._profiles.clear()
+        with self._lock:
+            self._generations.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "claims": {
+                "entries": len(self._claims),
+                "hits": self._claims.stats.hits,
+                "misses": self._claims.stats.misses,
+            },
+            "profiles": {
+                "entries": len(self._profiles),
+                "hits": self._profiles.stats.hits,
+                "misses": self._profiles.stats.misses,
+                "hit_rate": round(self._profiles.stats.hit_rate, 2),
+            },
+        }
@@ -0,0 +1,21 @@
+"""Events streamed to clients as Server-Sent Events or NDJSON."""
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class StreamEvent:
+    """One named event of a streamed response."""
+
+    event: str
+    data: Any
+
+    def to_sse(self) -> str:
+        """Encode as a Server-Sent Event frame."""
+        return f"event: {self.event}\ndata: {json.dumps(self.data, default=str)}\n\n"
+
+    def to_ndjson(self) -> str:
+        """Encode as one line of newline-delimited JSON."""
+        return json.dumps({"event": self.event, "data": self.data}, default=str) + "\n"
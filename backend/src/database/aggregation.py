@@ -0,0 +1,294 @@
+"""
+Push-down SQL aggregation for application analytics.
+
+Each analytics metric family compiles to one grouped statement with
+conditional aggregates, so the database returns a handful of numbers instead
+of every application row. Date arithmetic and week bucketing differ between
+databases; ``AggregationDialect`` subclasses provide them for SQLite,
+PostgreSQL and MySQL/MariaDB.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Integer, and_, case, cast, func, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import DBJobApplication
+from src.models.application import ApplicationStatus
+
+OFFER_STATUSES = (ApplicationStatus.OFFER_RECEIVED, ApplicationStatus.OFFER_ACCEPTED)
+INTERVIEW_STATUSES = (
+    ApplicationStatus.INTERVIEW_SCHEDULED,
+    ApplicationStatus.INTERVIEW_COMPLETED,
+) + OFFER_STATUSES
+
+
+class AggregationDialect(ABC):
+    """Dialect-specific SQL expressions used by ``AnalyticsAggregator``."""
+
+    name = "generic"
+
+    def count_if(self, condition) -> Any:
+        """Count rows matching ``condition``."""
+        return func.sum(case((condition, 1), else_=0))
+
+    @abstractmethod
+    def whole_days(self, start, end) -> Any:
+        """Whole days from ``start`` to ``end``, floored like ``timedelta.days``."""
+
+    @abstractmethod
+    def fractional_days(self, start, end) -> Any:
+        """Days from ``start`` to ``end`` including the fraction."""
+
+    @abstractmethod
+    def week_start(self, column) -> Any:
+        """Monday of ``column``'s week as ``YYYY-MM-DD`` text."""
+
+
+class SQLiteDialect(AggregationDialect):
+    name = "sqlite"
+
+    def count_if(self, condition) -> Any:
+        # FILTER is supported from SQLite 3.30.
+        return func.count().filter(condition)
+
+    def whole_days(self, start, end) -> Any:
+        # Integer seconds avoid julianday() rounding just under a day boundary.
+        seconds = cast(func.strftime("%s", end), Integer) - cast(func.strftime("%s", start), Integer)
+        return seconds // 86400
+
+    def fractional_days(self, start, end) -> Any:
+        return func.julianday(end) - func.julianday(start)
+
+    def week_start(self, column) -> Any:
+        # Forward to Sunday (or stay on it), then back six days to Monday.
+        return func.date(column, "weekday 0", "-6 days")
+
+
+class PostgresDialect(AggregationDialect):
+    name = "postgresql"
+
+    def count_if(self, condition) -> Any:
+        return func.count().filter(condition)
+
+    def whole_days(self, start, end) -> Any:
+        return cast(func.floor(self.fractional_days(start, end)), Integer)
+
+    def fractional_days(self, start, end) -> Any:
+        return func.extract("epoch", end - start) / 86400
+
+    def week_start(self, column) -> Any:
+        return func.to_char(func.date_trunc("week", column), "YYYY-MM-DD")
+
+
+class MySQLDialect(AggregationDialect):
+    name = "mysql"
+
+    def whole_days(self, start, end) -> Any:
+        return cast(func.floor(self.fractional_days(start, end)), Integer)
+
+    def fractional_days(self, start, end) -> Any:
+        return func.timestampdiff(literal_column("MICROSECOND"), start, end) / 86400000000
+
+    def week_start(self, column) -> Any:
+        # WEEKDAY() is 0 for Monday.
+        return func.date_format(func.subdate(column, func.weekday(column)), "%Y-%m-%d")
+
+
+_DIALECTS: Dict[str, AggregationDialect] = {
+    "sqlite": SQLiteDialect(),
+    "postgresql": PostgresDialect(),
+    "mysql": MySQLDialect(),
+    "mariadb": MySQLDialect(),
+}
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Application timestamps are stored as naive UTC."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def get_dialect(name: str) -> AggregationDialect:
+    """Return the aggregation dialect for a SQLAlchemy dialect name."""
+    try:
+        return _DIALECTS[name]
+    except KeyError:
+        raise ValueError(f"No analytics aggregation backend for dialect '{name}'") from None
+
+
+@dataclass
+class StatusSummary:
+    """Status counts and response-time aggregates over a set of applications."""
+
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    responses: int = 0
+    response_days_sum: int = 0
+    fastest_response_days: int = 0
+    slowest_response_days: int = 0
+    interviews: int = 0
+    interview_days_sum: int = 0
+
+
+class AnalyticsAggregator:
+    """Compiles analytics metrics into grouped SQL statements."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize aggregator with database session."""
+        self.session = session
+        self.dialect = get_dialect(session.get_bind().dialect.name)
+
+    def _user_filter(self, user_id: Optional[str]) -> List[Any]:
+        return [DBJobApplication.user_id == user_id] if user_id else []
+
+    async def status_summary(
+        self,
+        user_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> StatusSummary:
+        """Status counts and response times in one statement."""
+        app = DBJobApplication
+        count_if = self.dialect.count_if
+        days = self.dialect.whole_days(app.created_at, app.updated_at)
+        dated = and_(app.created_at.is_not(None), app.updated_at.is_not(None))
+        responded = and_(dated, app.status != ApplicationStatus.SUBMITTED)
+        interviewed = and_(dated, app.status.in_(INTERVIEW_STATUSES))
+
+        columns = [count_if(app.status == status).label(status.value) for status in ApplicationStatus]
+        columns += [
+            count_if(responded).label("responses"),
+            func.sum(case((responded, days), else_=0)).label("response_days_sum"),
+            func.min(case((responded, days))).label("fastest"),
+            func.max(case((responded, days))).label("slowest"),
+            count_if(interviewed).label("interviews"),
+            func.sum(case((interviewed, days), else_=0)).label("interview_days_sum"),
+        ]
+
+        conditions = self._user_filter(user_id)
+        if start_date:
+            conditions.append(app.created_at >= _naive_utc(start_date))
+        if end_date:
+            conditions.append(app.created_at <= _naive_utc(end_date))
+
+        stmt = select(*columns)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        row = (await self.session.execute(stmt)).one()._mapping
+
+        return StatusSummary(
+            status_counts={status.value: int(row[status.value] or 0) for status in ApplicationStatus},
+            responses=int(row["responses"] or 0),
+            response_days_sum=int(row["response_days_sum"] or 0),
+            fastest_response_days=int(row["fastest"] or 0),
+            slowest_response_days=int(row["slowest"] or 0),
+            interviews=int(row["interviews"] or 0),
+            interview_days_sum=int(row["interview_days_sum"] or 0),
+        )
+
+    async def weekly_counts(
+        self, user_id: Optional[str], since: datetime
+    ) -> List[Tuple[str, int, int, int]]:
+        """``(week, applications, interviews, offers)`` per week since ``since``, oldest first."""
+        app = DBJobApplication
+        week = self.dialect.week_start(app.created_at).label("week")
+        stmt = (
+            select(
+                week,
+                func.count().label("applications"),
+                self.dialect.count_if(app.status.in_(INTERVIEW_STATUSES)).label("interviews"),
+                self.dialect.count_if(app.status.in_(OFFER_STATUSES)).label("offers"),
+            )
+            .where(and_(app.created_at >= _naive_utc(since), *self._user_filter(user_id)))
+            .group_by(week)
+            .order_by(week)
+        )
+        result = await self.session.execute(stmt)
+        return [(str(w), int(a), int(i or 0), int(o or 0)) for w, a, i, o in result]
+
+    async def company_counts(
+        self, user_id: Optional[str], limit: int = 20
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Per-company counts for the ``limit`` busiest companies, and the company count."""
+        app = DBJobApplication
+        company = func.coalesce(app.company, literal("Unknown")).label("company")
+        total = func.count().label("total")
+        stmt = select(
+            company,
+            total,
+            self.dialect.count_if(app.status.in_(INTERVIEW_STATUSES)).label("interviews"),
+            self.dialect.count_if(app.status.in_(OFFER_STATUSES)).label("offers"),
+            self.dialect.count_if(app.status == ApplicationStatus.REJECTED).label("rejections"),
+            func.count().over().label("total_companies"),
+        ).group_by(company)
+        user_filter = self._user_filter(user_id)
+        if user_filter:
+            stmt = stmt.where(*user_filter)
+        # Ties go to the most recently active company, as row listings do.
+        stmt = stmt.order_by(total.desc(), func.max(app.created_at).desc()).limit(limit)
+
+        rows = (await self.session.execute(stmt)).all()
+        companies = [
+            {
+                "company": row.company,
+                "total": int(row.total),
+                "interviews": int(row.interviews or 0),
+                "offers": int(row.offers or 0),
+                "rejections": int(row.rejections or 0),
+            }
+            for row in rows
+        ]
+        return companies, int(rows[0].total_companies) if rows else 0
+
+    async def application_statistics(
+        self, user_id: Optional[str], recent_since: datetime
+    ) -> Dict[str, Any]:
+        """Counters behind ``ApplicationRepository.get_statistics`` in one statement."""
+        app = DBJobApplication
+        count_if = self.dialect.count_if
+        responded = and_(app.applied_date.is_not(None), app.status != ApplicationStatus.DRAFT)
+        columns = [func.count().label("total")]
+        columns += [count_if(app.status == status).label(status.value) for status in ApplicationStatus]
+        columns += [
+            count_if(app.created_at >= _naive_utc(recent_since)).label("recent"),
+            count_if(
+                app.status.in_(
+                    [
+                        ApplicationStatus.OFFER_RECEIVED,
+                        ApplicationStatus.OFFER_ACCEPTED,
+                        ApplicationStatus.INTERVIEW_COMPLETED,
+                    ]
+                )
+            ).label("successful"),
+            func.avg(
+                case((responded, self.dialect.fractional_days(app.created_at, app.applied_date)))
+            ).label("avg_response_days"),
+            count_if(
+                app.status.in_(
+                    [
+                        ApplicationStatus.SUBMITTED,
+                        ApplicationStatus.UNDER_REVIEW,
+                        ApplicationStatus.INTERVIEW_SCHEDULED,
+                        ApplicationStatus.INTERVIEW_COMPLETED,
+                    ]
+                )
+            ).label("active"),
+        ]
+        stmt = select(*columns)
+        user_filter = self._user_filter(user_id)
+        if user_filter:
+            stmt = stmt.where(*user_filter)
+        row = (await self.session.execute(stmt)).one()._mapping
+        return {
+            "total": int(row["total"] or 0),
+            "status_counts": {status.value: int(row[status.value] or 0) for status in ApplicationStatus},
+            "recent": int(row["recent"] or 0),
+            "successful": int(row["successful"] or 0),
+            "avg_response_days": float(row["avg_response_days"] or 0),
+            "pending_interviews": int(row[ApplicationStatus.INTERVIEW_SCHEDULED.value] or 0),
+            "active": int(row["active"] or 0),
+        }
@@ -2,12 +2,17 @@
 
 import os
 import warnings
-from typing import Optional
+from typing import Any, Dict, Optional
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool, StaticPool
 from sqlalchemy import exc as sa_exc
 from src.config import config
+from src.database.pool import (
+    build_engine_options,
+    install_sqlite_pragmas,
+    pool_status,
+    sqlite_pragmas,
+)
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -93,67 +98,49 @@ class DatabaseConfig:
                 database_url = self.get_database_url()
                 logger.info(f"Initializing database: {database_url}")
             
-            # Create async engine
             connect_args = {}
-            poolclass = None
+            engine_kwargs = {
+                "echo": config.DEBUG,  # Log SQL queries in debug mode
+                "connect_args": connect_args,
+                **build_engine_options(database_url, test_mode, config),
+            }
+            is_sqlite = database_url.startswith("sqlite")
+            in_memory = ":memory:" in database_url
 
-            if database_url.startswith("sqlite"):
+            if is_sqlite:
                 # For SQLite, we need to ensure the directory exists for file-based dbs
-                if not ":memory:" in database_url:
+                if not in_memory:
                     db_path = database_url.replace("sqlite+aiosqlite:///", "")
                     if "/" in db_path:
                         os.makedirs(os.path.dirname(db_path), exist_ok=True)
-                
-                # For SQLite with aiosqlite:
-                # - Use StaticPool for in-memory databases (shared cache)
-                # - Use NullPool for file-based databases (avoids connection pool issues)
-                poolclass = StaticPool if ":memory:" in database_url else NullPool
+
                 # aiosqlite requires check_same_thread=False for async operations
                 connect_args["check_same_thread"] = False
                 # Set timeout for SQLite operations
                 connect_args["timeout"] = 20.0
 
-            elif test_mode:
-                # For non-SQLite tests, still use NullPool
-                poolclass = NullPool
-
-            # Build engine kwargs
-            engine_kwargs = {
-                "echo": config.DEBUG,  # Log SQL queries in debug mode
-                "poolclass": poolclass,
-                "connect_args": connect_args,
-            }
-            
-            # For SQLite with aiosqlite, ensure proper async handling
-            if database_url.startswith("sqlite"):
-                # Ensure poolclass is set for SQLite
-                if poolclass is None:
-                    poolclass = NullPool
-                    engine_kwargs["poolclass"] = poolclass
-                # aiosqlite requires check_same_thread=False
-                if "check_same_thread" not in connect_args:
-                    connect_args["check_same_thread"] = False
-            
-            # Add pool settings only for non-NullPool (connection pooling enabled)
-            if poolclass is not None and poolclass != NullPool:
-                engine_kwargs["pool_pre_ping"] = True  # Verify connections before using
-                engine_kwargs["pool_recycle"] = 3600  # Recycle connections after 1 hour
-            
-            # Create async engine with proper configuration
-            # For SQLite, ensure we're using the correct driver
-            if database_url.startswith("sqlite"):
                 # Ensure aiosqlite is available
                 try:
                     import aiosqlite
                 except ImportError:
                     logger.error("aiosqlite is required for SQLite async operations. Install it with: pip install aiosqlite")
                     raise ImportError("aiosqlite is not installed. Please install it with: pip install aiosqlite")
-            
+
             self.engine = create_async_engine(
                 database_url,
                 **engine_kwargs
             )
-            
+
+            if is_sqlite:
+                install_sqlite_pragmas(
+                    self.engine.sync_engine, sqlite_pragmas(config), in_memory=in_memory
+                )
+            logger.info(
+                f"Database pool: {engine_kwargs['poolclass'].__name__} "
+                f"(size={engine_kwargs.get('pool_size', '-')}, "
+                f"max_overflow={engine_kwargs.get('max_overflow', '-')})"
+            )
+
             # Create async session maker
             self.async_session_maker = async_sessionmaker(
                 self.engine,
@@ -194,6 +181,10 @@ class DatabaseConfig:
         
         return self.async_session_maker()
     
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool occupancy and checkout wait metrics."""
+        return pool_status(self.engine.pool if self.engine else None)
+
     async def close(self) -> None:
         """Close database connections."""
         if self.engine:
@@ -203,6 +194,9 @@ class DatabaseConfig:
     
     async def create_tables(self) -> None:
         """Create all database tables."""
+        # Registers the full-text search index DDL on Base.metadata.
+        import src.database.search  # noqa: F401
+
         try:
             async with self.engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
@@ -21,6 +21,7 @@ from src.database.config import Base
 from src.models.application import ApplicationStatus, JobApplication
 from src.models.resume import Resume
 from src.models.cover_letter import CoverLetter
+from src.models.job import Job
 from src.models.user import User as UserModel
 
 # Keep an explicit reference so static analyzers see UUID as used.
@@ -72,6 +73,7 @@ class DBResume(Base):
     __table_args__ = (
         Index("idx_resume_created_at", "created_at"),
         Index("idx_resume_is_default", "is_default"),
+        Index("idx_resume_user_created_id", "user_id", "created_at", "id"),  # keyset pages
     )
 
     def to_model(self) -> Resume:
@@ -157,6 +159,11 @@ class DBCoverLetter(Base):
         "DBUser", back_populates="cover_letters", foreign_keys=[user_id]
     )
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("idx_cover_letter_user_created_id", "user_id", "created_at", "id"),  # keyset pages
+    )
+
     def to_model(self) -> CoverLetter:
         """Convert database model to domain model."""
         return CoverLetter(
@@ -248,6 +255,9 @@ class DBJobApplication(Base):
         Index(
             "idx_application_company_status", "company", "status"
         ),  # Composite index for common queries
+        Index(
+            "idx_application_user_created_id", "user_id", "created_at", "id"
+        ),  # keyset pages
     )
 
     def to_model(self) -> "JobApplication":
@@ -290,6 +300,25 @@ class DBJobApplication(Base):
         )
 
 
+class DBApplicationRollup(Base):
+    """Per-user application counters maintained alongside job_applications.
+
+    Each row counts a user's applications in one bucket of one dimension
+    (``status``, ``week``, ``company`` or ``response_days``), split by status.
+    The ``version`` row is bumped on every change and keys analytics caches.
+    """
+
+    __tablename__ = "application_rollups"
+
+    user_id: Mapped[str] = mapped_column(
+        String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    bucket: Mapped[str] = mapped_column(String(255), primary_key=True)
+    status: Mapped[str] = mapped_column(String(50), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
 class DBJobSearch(Base):
     """Database model for job search history."""
 
@@ -341,6 +370,111 @@ class DBJobSearch(Base):
         }
 
 
+class DBJobCatalogEntry(Base):
+    """Every job posting seen in a search, keyed by its canonical URL.
+
+    ``id`` is ``job_fingerprint(url)``, which is also the job id handed to
+    clients, so job details are a primary-key lookup.
+    """
+
+    __tablename__ = "job_catalog"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    canonical_url: Mapped[str] = mapped_column(String(2048), nullable=False, unique=True)
+    url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    portal: Mapped[str] = mapped_column(String(50), nullable=False)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    company: Mapped[str] = mapped_column(String(255), nullable=False)
+    location: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    salary: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    posted_date: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    experience_level: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    job_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    requirements: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
+    benefits: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
+    skills: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
+    application_method: Mapped[str] = mapped_column(String(50), default="unknown")
+    apply_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
+    contact_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    contact_phone: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    external_application: Mapped[bool] = mapped_column(Boolean, default=False)
+    application_deadline: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    first_seen_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+    last_seen_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+
+    # Indexes for performance
+    __table_args__ = (
+        Index("idx_job_catalog_last_seen_at", "last_seen_at"),
+    )
+
+    def to_model(self) -> Job:
+        """Convert database model to domain model."""
+        import json
+
+        return Job(
+            id=self.id,
+            title=self.title,
+            company=self.company,
+            location=self.location,
+            url=self.url,
+            portal=self.portal,
+            description=self.description,
+            salary=self.salary,
+            posted_date=self.posted_date,
+            experience_level=self.experience_level,
+            job_type=self.job_type,
+            requirements=json.loads(self.requirements) if self.requirements is not None else None,
+            benefits=json.loads(self.benefits) if self.benefits is not None else None,
+            skills=json.loads(self.skills) if self.skills is not None else None,
+            application_method=self.application_method,
+            apply_url=self.apply_url,
+            contact_email=self.contact_email,
+            contact_phone=self.contact_phone,
+            external_application=self.external_application,
+            application_deadline=self.application_deadline,
+            created_at=self.first_seen_at,
+            updated_at=self.last_seen_at,
+        )
+
+    @classmethod
+    def from_model(
+        cls, job: Job, canonical_url: str, fingerprint: str, seen_at: datetime
+    ) -> "DBJobCatalogEntry":
+        """Create database model from domain model."""
+        import json
+
+        return cls(
+            id=fingerprint,
+            canonical_url=canonical_url,
+            url=str(job.url),
+            portal=job.portal,
+            title=job.title,
+            company=job.company,
+            location=job.location,
+            description=job.description,
+            salary=job.salary,
+            posted_date=job.posted_date,
+            experience_level=job.experience_level,
+            job_type=job.job_type,
+            requirements=json.dumps(job.requirements) if job.requirements is not None else None,
+            benefits=json.dumps(job.benefits) if job.benefits is not None else None,
+            skills=json.dumps(job.skills) if job.skills is not None else None,
+            application_method=job.application_method,
+            apply_url=str(job.apply_url) if job.apply_url else None,
+            contact_email=job.contact_email,
+            contact_phone=job.contact_phone,
+            external_application=job.external_application,
+            application_deadline=job.application_deadline,
+            first_seen_at=seen_at,
+            last_seen_at=seen_at,
+        )
+
+
 class DBAIActivity(Base):
     """Database model for AI activity tracking."""
 
@@ -441,6 +575,9 @@ class DBFileMetadata(Base):
         Index("idx_file_metadata_is_active", "is_active"),
         Index("idx_file_metadata_md5", "md5_hash"),
         Index("idx_file_metadata_user_id", "user_id"),
+        Index(
+            "idx_file_metadata_user_uploaded_id", "user_id", "uploaded_at", "id"
+        ),  # keyset pages
     )
 
     def to_dict(self) -> dict:
@@ -656,6 +793,16 @@ class DBPerformanceMetric(Base):
     metric_value: Mapped[float] = mapped_column(Float, nullable=False)
     tags: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
     timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    # Rows written by the metrics pipeline summarise a whole window: metric_value
+    # is the mean and these columns hold the window's statistics. Single
+    # samples have sample_count=1 and no summary columns.
+    sample_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+    value_sum: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    value_min: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    value_max: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    histogram: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc)
     )
@@ -676,6 +823,11 @@ class DBPerformanceMetric(Base):
             "metric_value": self.metric_value,
             "tags": json.loads(self.tags) if self.tags else {},
             "timestamp": self.timestamp.isoformat(),
+            "sample_count": self.sample_count,
+            "value_sum": self.value_sum,
+            "value_min": self.value_min,
+            "value_max": self.value_max,
+            "histogram": json.loads(self.histogram) if self.histogram else None,
             "created_at": self.created_at.isoformat(),
         }
 
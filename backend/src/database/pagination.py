@@ -0,0 +1,176 @@
+"""
+Keyset (cursor) pagination.
+
+Lists are ordered newest first by ``(created_at, id)`` and scoped by
+``user_id``; composite ``(user_id, created_at, id)`` indexes back every
+paginated table. A page is fetched with a range predicate on the last key
+seen instead of ``OFFSET``, so page 1,000 costs the same index seek as page 1.
+
+Cursors are opaque to clients: URL-safe base64 of the last row's sort key.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results and the cursor for the next one."""
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """Encode a sort key as an opaque cursor."""
+    payload = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    """Return a page size within ``1..MAX_PAGE_SIZE``."""
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+async def fetch_page(
+    session: AsyncSession,
+    stmt: Select,
+    created_column: Any,
+    id_column: Any,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    row_mapper: Callable[[Any], T] = lambda row: row,
+    scalars: bool = False,
+) -> Page[T]:
+    """Fetch one keyset page of ``stmt``, newest first.
+
+    Args:
+        session: Session to execute on
+        stmt: Base select with any filters applied (no ordering or limit)
+        created_column: Timestamp column of the sort key
+        id_column: Primary key column, the tie-breaker of the sort key
+        limit: Page size, clamped to ``MAX_PAGE_SIZE``
+        cursor: Cursor returned with the previous page, if any
+        row_mapper: Converts each fetched row to a page item
+        scalars: Fetch ORM entities rather than column rows
+
+    Raises:
+        InvalidCursorError: If ``cursor`` is malformed
+    """
+    limit = clamp_page_size(limit)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                created_column < created_at,
+                and_(created_column == created_at, id_column < row_id),
+            )
+        )
+    # One extra row tells whether another page exists.
+    stmt = stmt.order_by(created_column.desc(), id_column.desc()).limit(limit + 1)
+
+    result = await session.execute(stmt)
+    rows = list(result.scalars() if scalars else result)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            getattr(last, created_column.key), getattr(last, id_column.key)
+        )
+    return Page(items=[row_mapper(row) for row in rows], next_cursor=next_cursor)
+
+
+async def iterate_pages(
+    fetch: Callable[[Optional[str]], Awaitable[Page[T]]],
+) -> AsyncIterator[T]:
+    """Stream every item by walking pages until the cursor runs out.
+
+    Args:
+        fetch: Called with the current cursor (``None`` first) to get a page
+    """
+    cursor: Optional[str] = None
+    while True:
+        page = await fetch(cursor)
+        for item in page.items:
+            yield item
+        if not page.has_more:
+            return
+        cursor = page.next_cursor
+
+
+def paginate_sequence(
+    items: List[T],
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    key: Callable[[T], Tuple[datetime, str]] = lambda item: (item.created_at, item.id),
+) -> Page[T]:
+    """Keyset-paginate an in-memory list with the same cursors as ``fetch_page``.
+
+    Used by services running without a database repository.
+    """
+    limit = clamp_page_size(limit)
+    ordered = sorted(items, key=lambda item: _sort_key(key(item)), reverse=True)
+    if cursor:
+        after = _sort_key(decode_cursor(cursor))
+        ordered = [item for item in ordered if _sort_key(key(item)) < after]
+    page = ordered[:limit]
+    next_cursor = None
+    if len(ordered) > limit and page:
+        next_cursor = encode_cursor(*key(page[-1]))
+    return Page(items=page, next_cursor=next_cursor)
+
+
+def _sort_key(value: Tuple[datetime, str]) -> Tuple[datetime, str]:
+    # Compare naive and aware timestamps consistently.
+    created_at, row_id = value
+    return created_at.replace(tzinfo=None), str(row_id)
@@ -0,0 +1,171 @@
+"""Connection pool profiles and pool metrics for the database engine.
+
+SQLite files get a small persistent pool with WAL-mode pragmas applied on
+connect; server databases (asyncpg, aiomysql) get a sized pool with overflow.
+Both use ``MonitoredAsyncQueuePool`` so checkout waits and timeouts are
+visible in health output.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, StaticPool
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+
+
+@dataclass
+class PoolMetrics:
+    """Checkout counters for one pool."""
+
+    checkouts: int = 0
+    waits: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record(self, elapsed: float, waited: bool) -> None:
+        self.checkouts += 1
+        if waited:
+            self.waits += 1
+            self.total_wait_seconds += elapsed
+            self.max_wait_seconds = max(self.max_wait_seconds, elapsed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        avg_wait = self.total_wait_seconds / self.waits if self.waits else 0.0
+        return {
+            "checkouts": self.checkouts,
+            "waits": self.waits,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(avg_wait * 1000, 3),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+
+class MonitoredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that records how long checkouts wait.
+
+    A checkout counts as a wait when no idle connection was available and
+    the overflow limit was already reached, i.e. the caller had to queue.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+        self._metrics_lock = threading.Lock()
+
+    def _do_get(self):
+        must_wait = self._pool.empty() and self._overflow >= self._max_overflow > -1
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self.metrics.timeouts += 1
+            logger.warning(f"Database pool exhausted: {self.status()}")
+            raise
+        with self._metrics_lock:
+            self.metrics.record(time.perf_counter() - start, must_wait)
+        return record
+
+
+# SQLAlchemy names pool loggers after the pool class; keep this one as quiet
+# as "sqlalchemy.pool" so checkouts and dispose don't log at INFO.
+logging.getLogger(f"{__name__}.{MonitoredAsyncQueuePool.__name__}").setLevel(
+    logging.WARNING
+)
+
+
+def sqlite_pragmas(db_config) -> Dict[str, Any]:
+    """Validated pragma values for SQLite connections."""
+    journal_mode = str(db_config.sqlite_journal_mode).upper()
+    synchronous = str(db_config.sqlite_synchronous).upper()
+    if journal_mode not in _JOURNAL_MODES:
+        raise ValueError(f"Invalid SQLITE_JOURNAL_MODE: {journal_mode}")
+    if synchronous not in _SYNCHRONOUS_MODES:
+        raise ValueError(f"Invalid SQLITE_SYNCHRONOUS: {synchronous}")
+    return {
+        "journal_mode": journal_mode,
+        "synchronous": synchronous,
+        "mmap_size": int(db_config.sqlite_mmap_size),
+        "cache_size": int(db_config.sqlite_cache_size),
+    }
+
+
+def install_sqlite_pragmas(
+    sync_engine: Engine, pragmas: Dict[str, Any], in_memory: bool = False
+) -> None:
+    """Apply ``pragmas`` to every new SQLite DBAPI connection."""
+    if in_memory:
+        # WAL and mmap have no effect on in-memory databases.
+        pragmas = {k: v for k, v in pragmas.items() if k == "cache_size"}
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def build_engine_options(
+    database_url: str, test_mode: bool, db_config
+) -> Dict[str, Any]:
+    """Pool-related ``create_async_engine`` keyword arguments for a URL."""
+    if database_url.startswith("sqlite"):
+        if ":memory:" in database_url:
+            # A single shared connection keeps the in-memory database alive.
+            return {"poolclass": StaticPool}
+        if test_mode:
+            return {"poolclass": NullPool}
+        return {
+            "poolclass": MonitoredAsyncQueuePool,
+            "pool_size": db_config.sqlite_pool_size,
+            "max_overflow": db_config.sqlite_max_overflow,
+            "pool_timeout": db_config.db_pool_timeout,
+            # Local files have no server-side idle timeout; no pre-ping needed.
+        }
+
+    if test_mode:
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": MonitoredAsyncQueuePool,
+        "pool_size": db_config.db_pool_size,
+        "max_overflow": db_config.db_max_overflow,
+        "pool_timeout": db_config.db_pool_timeout,
+        "pool_recycle": db_config.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+
+def pool_status(pool: Optional[Pool]) -> Dict[str, Any]:
+    """Current occupancy and checkout metrics for ``pool``."""
+    if pool is None:
+        return {"initialized": False}
+
+    status: Dict[str, Any] = {"initialized": True, "pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        )
+    metrics = getattr(pool, "metrics", None)
+    if isinstance(metrics, PoolMetrics):
+        status.update(metrics.to_dict())
+    return status
@@ -0,0 +1,75 @@
+"""
+Column projections for read-heavy listings.
+
+Listing queries select only the columns a ``JobApplication`` needs instead of
+whole ORM entities. Rows come back as ``ApplicationRow`` named tuples: no
+identity map, no relationship loading, no per-instance ``__dict__``, and
+resume / cover-letter bodies are never read from the database.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, NamedTuple, Optional
+
+from src.database.models import DBJobApplication
+from src.models.application import JobApplication
+
+
+class ApplicationRow(NamedTuple):
+    """One job application as selected by ``APPLICATION_COLUMNS``."""
+
+    id: str
+    job_id: str
+    job_title: str
+    company: str
+    status: Any
+    resume_path: Optional[str]
+    cover_letter_path: Optional[str]
+    applied_date: Optional[datetime]
+    interview_date: Optional[datetime]
+    follow_up_date: Optional[datetime]
+    notes: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    def to_model(self) -> JobApplication:
+        """Build the domain model without re-running validation.
+
+        Values come straight from typed columns, so they are already valid;
+        only the status enum is reduced to its value, as validation would.
+        """
+        values = self._asdict()
+        values["status"] = _enum_value(self.status)
+        return JobApplication.model_construct(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to JSON-ready primitives for API responses."""
+        return {
+            "id": self.id,
+            "job_id": self.job_id,
+            "job_title": self.job_title,
+            "company": self.company,
+            "status": _enum_value(self.status),
+            "resume_path": self.resume_path,
+            "cover_letter_path": self.cover_letter_path,
+            "applied_date": _isoformat(self.applied_date),
+            "interview_date": _isoformat(self.interview_date),
+            "follow_up_date": _isoformat(self.follow_up_date),
+            "notes": self.notes,
+            "created_at": _isoformat(self.created_at),
+            "updated_at": _isoformat(self.updated_at),
+        }
+
+
+# Selected in ApplicationRow field order.
+APPLICATION_COLUMNS = tuple(
+    getattr(DBJobApplication, name) for name in ApplicationRow._fields
+)
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
@@ -1,15 +1,19 @@
 """Repository implementations for database operations."""
 
 from src.database.repositories.application_repository import ApplicationRepository
+from src.database.repositories.application_rollup_repository import ApplicationRollupRepository
 from src.database.repositories.resume_repository import ResumeRepository
 from src.database.repositories.cover_letter_repository import CoverLetterRepository
 from src.database.repositories.file_repository import FileRepository
+from src.database.repositories.job_catalog_repository import JobCatalogRepository
 from src.database.repositories.monitoring_repository import MonitoringRepository
 
 __all__ = [
     "ApplicationRepository",
+    "ApplicationRollupRepository",
     "ResumeRepository", 
     "CoverLetterRepository",
     "FileRepository",
+    "JobCatalogRepository",
     "MonitoringRepository",
 ]
@@ -1,13 +1,19 @@
 """Application repository for database operations."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 from datetime import datetime, timedelta
 from collections import defaultdict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy import select, update, delete, func, and_
 from sqlalchemy.orm import selectinload
 
+from src.database.aggregation import AnalyticsAggregator
 from src.database.models import DBJobApplication, DBResume, DBCoverLetter
+from src.database.pagination import MAX_PAGE_SIZE, Page, fetch_page, iterate_pages
+from src.database.projections import APPLICATION_COLUMNS, ApplicationRow
+from src.database.repositories.application_rollup_repository import ApplicationRollupRepository
+from src.database.rollups import RollupState
+from src.database.search import APPLICATION_SEARCH
 from src.models.application import JobApplication, ApplicationUpdateRequest, ApplicationStatus
 from src.utils.logger import get_logger
 from src.core.cache import cache_region
@@ -20,8 +26,104 @@ class ApplicationRepository:
     def __init__(self, session: AsyncSession):
         """Initialize repository with database session."""
         self.session = session
+        self.rollups = ApplicationRollupRepository(session)
         self.logger = get_logger(__name__)
 
+    async def _fetch_rows(self, stmt) -> List[ApplicationRow]:
+        """Execute a projection over ``APPLICATION_COLUMNS``."""
+        result = await self.session.execute(stmt)
+        return [ApplicationRow(*row) for row in result]
+    
+    async def get_rows(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        user_id: Optional[str] = None,
+        status: Optional[ApplicationStatus] = None,
+    ) -> List[ApplicationRow]:
+        """Get lightweight application rows, newest first.
+        
+        Only the listed columns are read; related resumes and cover letters are
+        not loaded. Use ``get_with_documents`` when those are needed.
+        """
+        stmt = select(*APPLICATION_COLUMNS)
+        if user_id:
+            stmt = stmt.where(DBJobApplication.user_id == user_id)
+        if status is not None:
+            stmt = stmt.where(DBJobApplication.status == status)
+        # Same order as ``get_page``, so offset and keyset pages agree on ties.
+        stmt = stmt.order_by(DBJobApplication.created_at.desc(), DBJobApplication.id.desc())
+        if limit:
+            stmt = stmt.limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
+        return await self._fetch_rows(stmt)
+    
+    async def get_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status: Optional[ApplicationStatus] = None,
+    ) -> Page[ApplicationRow]:
+        """Get one keyset page of application rows, newest first.
+        
+        Raises:
+            InvalidCursorError: If ``cursor`` is malformed
+        """
+        stmt = select(*APPLICATION_COLUMNS)
+        if user_id:
+            stmt = stmt.where(DBJobApplication.user_id == user_id)
+        if status is not None:
+            stmt = stmt.where(DBJobApplication.status == status)
+        return await fetch_page(
+            self.session,
+            stmt,
+            DBJobApplication.created_at,
+            DBJobApplication.id,
+            limit=limit,
+            cursor=cursor,
+            row_mapper=lambda row: ApplicationRow(*row),
+        )
+    
+    def iter_rows(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[ApplicationStatus] = None,
+        batch_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[ApplicationRow]:
+        """Stream every matching application row, one keyset page at a time."""
+        return iterate_pages(
+            lambda cursor: self.get_page(
+                user_id=user_id, limit=batch_size, cursor=cursor, status=status
+            )
+        )
+    
+    async def count(
+        self, user_id: Optional[str] = None, status: Optional[ApplicationStatus] = None
+    ) -> int:
+        """Count applications, optionally filtered by user and status."""
+        stmt = select(func.count(DBJobApplication.id))
+        if user_id:
+            stmt = stmt.where(DBJobApplication.user_id == user_id)
+        if status is not None:
+            stmt = stmt.where(DBJobApplication.status == status)
+        result = await self.session.execute(stmt)
+        return int(result.scalar() or 0)
+    
+    async def get_with_documents(
+        self, application_id: str, user_id: Optional[str] = None
+    ) -> Optional[DBJobApplication]:
+        """Get the application entity with its resume and cover letter loaded."""
+        stmt = select(DBJobApplication).options(
+            selectinload(DBJobApplication.resume),
+            selectinload(DBJobApplication.cover_letter)
+        ).where(DBJobApplication.id == application_id)
+        if user_id:
+            stmt = stmt.where(DBJobApplication.user_id == user_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+    
     async def invalidate_statistics_cache(self, user_id: Optional[str] = None):
         """Invalidate the statistics cache."""
         try:
@@ -43,6 +145,8 @@ class ApplicationRepository:
             if user_id:
                 db_application.user_id = user_id
             self.session.add(db_application)
+            await self.session.flush()
+            await self.rollups.apply_changes([], [RollupState.of(db_application)])
             await self.session.commit()
             await self.session.refresh(db_application)
             
@@ -62,17 +166,14 @@ class ApplicationRepository:
         """Get application by ID, optionally filtered by user."""
         start_time = time.time()
         try:
-            stmt = select(DBJobApplication).options(
-                selectinload(DBJobApplication.resume),
-                selectinload(DBJobApplication.cover_letter)
-            ).where(DBJobApplication.id == application_id)
+            stmt = select(*APPLICATION_COLUMNS).where(DBJobApplication.id == application_id)
             
             # Filter by user_id if provided
             if user_id:
                 stmt = stmt.where(DBJobApplication.user_id == user_id)
             
-            result = await self.session.execute(stmt)
-            db_application = result.scalar_one_or_none()
+            rows = await self._fetch_rows(stmt)
+            db_application = rows[0] if rows else None
             
             elapsed_time = time.time() - start_time
             
@@ -97,26 +198,8 @@ class ApplicationRepository:
         """Get all applications with optional pagination and user filtering."""
         start_time = time.time()
         try:
-            stmt = select(DBJobApplication).options(
-                selectinload(DBJobApplication.resume),
-                selectinload(DBJobApplication.cover_letter)
-            )
-            
-            # Filter by user_id if provided
-            if user_id:
-                stmt = stmt.where(DBJobApplication.user_id == user_id)
-            
-            stmt = stmt.order_by(DBJobApplication.created_at.desc())
-            
-            if limit:
-                stmt = stmt.limit(limit)
-            if offset:
-                stmt = stmt.offset(offset)
-            
-            result = await self.session.execute(stmt)
-            db_applications = result.scalars().all()
-            
-            applications = [app.to_model() for app in db_applications]
+            rows = await self.get_rows(limit=limit, offset=offset, user_id=user_id)
+            applications = [row.to_model() for row in rows]
             elapsed_time = time.time() - start_time
             
             self.logger.debug(
@@ -143,24 +226,8 @@ class ApplicationRepository:
     async def get_by_status(self, status: ApplicationStatus, limit: Optional[int] = None, user_id: Optional[str] = None) -> List[JobApplication]:
         """Get applications by status, optionally filtered by user."""
         try:
-            stmt = select(DBJobApplication).options(
-                selectinload(DBJobApplication.resume),
-                selectinload(DBJobApplication.cover_letter)
-            ).where(DBJobApplication.status == status)
-            
-            # Filter by user_id if provided
-            if user_id:
-                stmt = stmt.where(DBJobApplication.user_id == user_id)
-            
-            stmt = stmt.order_by(DBJobApplication.created_at.desc())
-            
-            if limit:
-                stmt = stmt.limit(limit)
-            
-            result = await self.session.execute(stmt)
-            db_applications = result.scalars().all()
-            
-            applications = [app.to_model() for app in db_applications]
+            rows = await self.get_rows(limit=limit, user_id=user_id, status=status)
+            applications = [row.to_model() for row in rows]
             self.logger.debug(f"Retrieved {len(applications)} applications with status {status}")
             
             return applications
@@ -208,7 +275,9 @@ class ApplicationRepository:
             
             stmt = update(DBJobApplication).where(where_clause).values(**update_data)
             
+            before = await self.rollups.get_states(where_clause)
             await self.session.execute(stmt)
+            await self.rollups.apply_changes(before, await self.rollups.get_states(where_clause))
             await self.session.commit()
             
             # Invalidate cache
@@ -232,7 +301,9 @@ class ApplicationRepository:
                 where_clause = and_(where_clause, DBJobApplication.user_id == user_id)
             
             stmt = delete(DBJobApplication).where(where_clause)
+            before = await self.rollups.get_states(where_clause)
             result = await self.session.execute(stmt)
+            await self.rollups.apply_changes(before, [])
             await self.session.commit()
             
             if result.rowcount > 0:
@@ -253,20 +324,14 @@ class ApplicationRepository:
         """Get applications by company."""
         start_time = time.time()
         try:
-            stmt = select(DBJobApplication).options(
-                selectinload(DBJobApplication.resume),
-                selectinload(DBJobApplication.cover_letter)
-            ).where(
+            stmt = select(*APPLICATION_COLUMNS).where(
                 func.lower(DBJobApplication.company) == company.lower()
             ).order_by(DBJobApplication.created_at.desc())
             
             if limit:
                 stmt = stmt.limit(limit)
             
-            result = await self.session.execute(stmt)
-            db_applications = result.scalars().all()
-            
-            applications = [app.to_model() for app in db_applications]
+            applications = [row.to_model() for row in await self._fetch_rows(stmt)]
             elapsed_time = time.time() - start_time
             
             self.logger.debug(
@@ -290,35 +355,25 @@ class ApplicationRepository:
             return []
     
     async def search(self, query: str, limit: Optional[int] = None, user_id: Optional[str] = None) -> List[JobApplication]:
-        """Search applications by job title, company, or notes, optionally filtered by user."""
+        """Search applications by job title, company, or notes, optionally filtered by user.
+
+        Uses the full-text index (see ``src.database.search``): terms match
+        word prefixes and the best matches come first.
+        """
         start_time = time.time()
         try:
-            search_term = f"%{query.lower()}%"
-            
-            stmt = select(DBJobApplication).options(
-                selectinload(DBJobApplication.resume),
-                selectinload(DBJobApplication.cover_letter)
-            ).where(
-                or_(
-                    func.lower(DBJobApplication.job_title).like(search_term),
-                    func.lower(DBJobApplication.company).like(search_term),
-                    func.lower(DBJobApplication.notes).like(search_term)
-                )
+            stmt = await APPLICATION_SEARCH.apply(
+                self.session,
+                select(*APPLICATION_COLUMNS),
+                query,
+                user_id=user_id,
+                recency_column=DBJobApplication.created_at,
             )
             
-            # Filter by user_id if provided
-            if user_id:
-                stmt = stmt.where(DBJobApplication.user_id == user_id)
-            
-            stmt = stmt.order_by(DBJobApplication.created_at.desc())
-            
             if limit:
                 stmt = stmt.limit(limit)
             
-            result = await self.session.execute(stmt)
-            db_applications = result.scalars().all()
-            
-            applications = [app.to_model() for app in db_applications]
+            applications = [row.to_model() for row in await self._fetch_rows(stmt)]
             elapsed_time = time.time() - start_time
             
             self.logger.debug(
@@ -345,104 +400,22 @@ class ApplicationRepository:
         """Get application statistics, optionally filtered by user."""
         start_time = time.time()
         try:
-            # Base filter for user_id
-            user_filter = DBJobApplication.user_id == user_id if user_id else None
-            
-            # Get total count
-            total_stmt = select(func.count(DBJobApplication.id))
-            if user_filter:
-                total_stmt = total_stmt.where(user_filter)
-            total_result = await self.session.execute(total_stmt)
-            total_applications = total_result.scalar()
-            
-            # Get status breakdown
-            status_stmt = select(
-                DBJobApplication.status,
-                func.count(DBJobApplication.id)
-            ).group_by(DBJobApplication.status)
-            if user_filter:
-                status_stmt = status_stmt.where(user_filter)
-            
-            status_result = await self.session.execute(status_stmt)
-            status_breakdown = dict(status_result.all())
-            
-            # Ensure all statuses are represented
-            for status in ApplicationStatus:
-                if status not in status_breakdown:
-                    status_breakdown[status] = 0
-            
-            # Calculate recent activity (last 30 days)
-            recent_cutoff = datetime.utcnow() - timedelta(days=30)
-            recent_conditions = [DBJobApplication.created_at >= recent_cutoff]
-            if user_filter:
-                recent_conditions.append(user_filter)
-            recent_stmt = select(func.count(DBJobApplication.id)).where(and_(*recent_conditions))
-            recent_result = await self.session.execute(recent_stmt)
-            recent_applications = recent_result.scalar()
-            
-            # Calculate success metrics
-            successful_statuses = [
-                ApplicationStatus.OFFER_RECEIVED,
-                ApplicationStatus.OFFER_ACCEPTED,
-                ApplicationStatus.INTERVIEW_COMPLETED
-            ]
-            
-            successful_conditions = [DBJobApplication.status.in_(successful_statuses)]
-            if user_filter:
-                successful_conditions.append(user_filter)
-            successful_stmt = select(func.count(DBJobApplication.id)).where(and_(*successful_conditions))
-            successful_result = await self.session.execute(successful_stmt)
-            successful_apps = successful_result.scalar()
-            
-            # Calculate average response time
-            response_time_conditions = [
-                DBJobApplication.applied_date.is_not(None),
-                DBJobApplication.status != ApplicationStatus.DRAFT
-            ]
-            if user_filter:
-                response_time_conditions.append(user_filter)
-            response_time_stmt = select(
-                func.avg(
-                    func.extract('epoch', DBJobApplication.applied_date - DBJobApplication.created_at) / 86400
-                )
-            ).where(and_(*response_time_conditions))
-            
-            response_time_result = await self.session.execute(response_time_stmt)
-            avg_response_time = response_time_result.scalar() or 0
-            
-            # Count pending interviews
-            pending_conditions = [DBJobApplication.status == ApplicationStatus.INTERVIEW_SCHEDULED]
-            if user_filter:
-                pending_conditions.append(user_filter)
-            pending_interviews_stmt = select(func.count(DBJobApplication.id)).where(and_(*pending_conditions))
-            pending_result = await self.session.execute(pending_interviews_stmt)
-            pending_interviews = pending_result.scalar()
-            
-            # Count active applications
-            active_statuses = [
-                ApplicationStatus.SUBMITTED,
-                ApplicationStatus.UNDER_REVIEW,
-                ApplicationStatus.INTERVIEW_SCHEDULED,
-                ApplicationStatus.INTERVIEW_COMPLETED
-            ]
-            
-            active_conditions = [DBJobApplication.status.in_(active_statuses)]
-            if user_filter:
-                active_conditions.append(user_filter)
-            active_stmt = select(func.count(DBJobApplication.id)).where(and_(*active_conditions))
-            active_result = await self.session.execute(active_stmt)
-            active_applications = active_result.scalar()
-            
+            # Every counter comes from one statement with conditional aggregates.
+            counts = await AnalyticsAggregator(self.session).application_statistics(
+                user_id, recent_since=datetime.utcnow() - timedelta(days=30)
+            )
+            total_applications = counts["total"]
+
             elapsed_time = time.time() - start_time
             
             stats = {
                 "total_applications": total_applications,
-                "status_breakdown": {status.value: count for status, count in status_breakdown.items()},
-                "recent_activity": f"{recent_applications} applications in the last 30 days",
-                "success_rate": (successful_apps / total_applications * 100) if total_applications > 0 else 0,
-                "average_response_time_days": round(avg_response_time, 1),
-                "pending_interviews": pending_interviews,
-                "active_applications": active_applications,
+                "status_breakdown": counts["status_counts"],
+                "recent_activity": f"{counts['recent']} applications in the last 30 days",
+                "success_rate": (counts["successful"] / total_applications * 100) if total_applications > 0 else 0,
+                "average_response_time_days": round(counts["avg_response_days"], 1),
+                "pending_interviews": counts["pending_interviews"],
+                "active_applications": counts["active"],
             }
             
             self.logger.debug(
@@ -472,20 +445,14 @@ class ApplicationRepository:
         try:
             cutoff_date = datetime.utcnow() + timedelta(days=days_ahead)
             
-            stmt = select(DBJobApplication).options(
-                selectinload(DBJobApplication.resume),
-                selectinload(DBJobApplication.cover_letter)
-            ).where(
+            stmt = select(*APPLICATION_COLUMNS).where(
                 and_(
                     DBJobApplication.follow_up_date.is_not(None),
                     DBJobApplication.follow_up_date <= cutoff_date
                 )
             ).order_by(DBJobApplication.follow_up_date)
             
-            result = await self.session.execute(stmt)
-            db_applications = result.scalars().all()
-            
-            applications = [app.to_model() for app in db_applications]
+            applications = [row.to_model() for row in await self._fetch_rows(stmt)]
             elapsed_time = time.time() - start_time
             
             self.logger.debug(
@@ -515,6 +482,8 @@ class ApplicationRepository:
                 db_applications.append(db_app)
             
             self.session.add_all(db_applications)
+            await self.session.flush()
+            await self.rollups.apply_changes([], [RollupState.of(db_app) for db_app in db_applications])
             await self.session.commit()
             
             # Refresh all to get IDs and defaults
@@ -585,7 +554,9 @@ class ApplicationRepository:
                      applied_date=func.coalesce(DBJobApplication.applied_date, datetime.utcnow())
                  )
 
+            before = await self.rollups.get_states(where_clause)
             await self.session.execute(stmt)
+            await self.rollups.apply_changes(before, await self.rollups.get_states(where_clause))
             await self.session.commit()
             
             # Invalidate cache
@@ -612,7 +583,9 @@ class ApplicationRepository:
                 where_clause = and_(where_clause, DBJobApplication.user_id == user_id)
             
             stmt = delete(DBJobApplication).where(where_clause)
+            before = await self.rollups.get_states(where_clause)
             result = await self.session.execute(stmt)
+            await self.rollups.apply_changes(before, [])
             await self.session.commit()
             
             if result.rowcount > 0:
@@ -0,0 +1,184 @@
+"""Application rollup repository for incrementally maintained analytics counters."""
+
+from itertools import chain
+from typing import Dict, Iterable, List, Set
+
+from sqlalchemy import and_, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import DBApplicationRollup, DBJobApplication
+from src.database.rollups import (
+    ROLLUP_COLUMNS,
+    VERSION_KIND,
+    ApplicationRollups,
+    RollupKey,
+    RollupState,
+    rollup_counts,
+    rollup_delta,
+)
+from src.database.upsert import dialect_insert
+from src.utils.logger import get_logger
+
+# Rows per multi-row upsert, well under SQLite's bound-parameter limit.
+_UPSERT_CHUNK = 100
+
+
+class ApplicationRollupRepository:
+    """Repository for per-user application rollups (see ``src.database.rollups``)."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session."""
+        self.session = session
+        self.logger = get_logger(__name__)
+
+    async def get_states(self, where_clause) -> List[RollupState]:
+        """Select the rollup-relevant columns of the applications matching ``where_clause``."""
+        result = await self.session.execute(select(*ROLLUP_COLUMNS).where(where_clause))
+        return [RollupState(*row) for row in result]
+
+    async def apply_changes(
+        self, before: Iterable[RollupState], after: Iterable[RollupState]
+    ) -> None:
+        """Apply the counter changes between two sets of application states.
+
+        Runs in the caller's transaction and does not commit. Users whose
+        rollups have not been built yet are skipped; their first read
+        rebuilds them from scratch.
+        """
+        before, after = list(before), list(after)
+        user_ids = {state.user_id for state in chain(before, after) if state.user_id}
+        if not user_ids:
+            return
+
+        built = await self._bump_versions(user_ids)
+        delta = {
+            key: amount
+            for key, amount in rollup_delta(before, after).items()
+            if key[0] in built
+        }
+        if delta:
+            await self._increment(delta)
+            await self.session.execute(
+                delete(DBApplicationRollup).where(
+                    DBApplicationRollup.user_id.in_(built),
+                    DBApplicationRollup.kind != VERSION_KIND,
+                    DBApplicationRollup.count <= 0,
+                )
+            )
+
+    async def get(self, user_id: str) -> ApplicationRollups:
+        """Get a user's rollups, building them on first use."""
+        result = await self.session.execute(
+            select(
+                DBApplicationRollup.kind,
+                DBApplicationRollup.bucket,
+                DBApplicationRollup.status,
+                DBApplicationRollup.count,
+            ).where(DBApplicationRollup.user_id == user_id)
+        )
+        rows = result.all()
+        if not any(row.kind == VERSION_KIND for row in rows):
+            return await self.rebuild(user_id)
+        return ApplicationRollups.from_rows(rows)
+
+    async def get_version(self, user_id: str) -> int:
+        """Get the counter that changes whenever the user's applications change."""
+        result = await self.session.execute(
+            select(DBApplicationRollup.count).where(
+                DBApplicationRollup.user_id == user_id,
+                DBApplicationRollup.kind == VERSION_KIND,
+            )
+        )
+        version = result.scalar_one_or_none()
+        if version is None:
+            return (await self.rebuild(user_id)).version
+        return version
+
+    async def rebuild(self, user_id: str) -> ApplicationRollups:
+        """Recompute a user's rollups from ``job_applications`` and commit them."""
+        try:
+            result = await self.session.execute(
+                select(DBApplicationRollup.count).where(
+                    DBApplicationRollup.user_id == user_id,
+                    DBApplicationRollup.kind == VERSION_KIND,
+                )
+            )
+            version = (result.scalar_one_or_none() or 0) + 1
+
+            await self.session.execute(
+                delete(DBApplicationRollup).where(DBApplicationRollup.user_id == user_id)
+            )
+            states = await self.get_states(DBJobApplication.user_id == user_id)
+            counts = rollup_counts(states)
+            counts[(user_id, VERSION_KIND, "", "")] = version
+            await self.session.execute(
+                insert(DBApplicationRollup),
+                [
+                    {"user_id": uid, "kind": kind, "bucket": bucket, "status": status, "count": count}
+                    for (uid, kind, bucket, status), count in counts.items()
+                ],
+            )
+            await self.session.commit()
+
+            self.logger.info(f"Rebuilt application rollups for user {user_id} from {len(states)} applications")
+            return ApplicationRollups.from_rows(
+                (kind, bucket, status, count)
+                for (_, kind, bucket, status), count in counts.items()
+            )
+
+        except IntegrityError:
+            # A concurrent request rebuilt them first.
+            await self.session.rollback()
+            return await self.get(user_id)
+
+    async def _bump_versions(self, user_ids: Set[str]) -> Set[str]:
+        """Bump each user's version row and return the users that have one."""
+        built = set()
+        for user_id in user_ids:
+            result = await self.session.execute(
+                update(DBApplicationRollup)
+                .where(
+                    DBApplicationRollup.user_id == user_id,
+                    DBApplicationRollup.kind == VERSION_KIND,
+                )
+                .values(count=DBApplicationRollup.count + 1)
+            )
+            if result.rowcount:
+                built.add(user_id)
+        return built
+
+    async def _increment(self, delta: Dict[RollupKey, int]) -> None:
+        """Add ``delta`` to the counters, creating missing rows."""
+        upsert = dialect_insert(self.session.get_bind().dialect.name)
+        rows = [
+            {"user_id": user_id, "kind": kind, "bucket": bucket, "status": status, "count": amount}
+            for (user_id, kind, bucket, status), amount in delta.items()
+        ]
+
+        if upsert is None:
+            for row in rows:
+                result = await self.session.execute(
+                    update(DBApplicationRollup)
+                    .where(
+                        and_(
+                            DBApplicationRollup.user_id == row["user_id"],
+                            DBApplicationRollup.kind == row["kind"],
+                            DBApplicationRollup.bucket == row["bucket"],
+                            DBApplicationRollup.status == row["status"],
+                        )
+                    )
+                    .values(count=DBApplicationRollup.count + row["count"])
+                )
+                if not result.rowcount:
+                    await self.session.execute(insert(DBApplicationRollup).values(**row))
+            return
+
+        for start in range(0, len(rows), _UPSERT_CHUNK):
+            stmt = upsert(DBApplicationRollup).values(rows[start:start + _UPSERT_CHUNK])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "kind", "bucket", "status"],
+                set_={"count": DBApplicationRollup.count + stmt.excluded.count},
+            )
+            await self.session.execute(stmt)
+
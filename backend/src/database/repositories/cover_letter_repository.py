@@ -1,12 +1,14 @@
 """Cover letter repository for database operations."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 from datetime import datetime, timezone, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy import select, update, delete, func, and_
 from sqlalchemy.orm import selectinload
 
 from src.database.models import DBCoverLetter, DBJobApplication
+from src.database.pagination import MAX_PAGE_SIZE, Page, fetch_page, iterate_pages
+from src.database.search import COVER_LETTER_SEARCH
 from src.models.cover_letter import CoverLetter
 from src.utils.logger import get_logger
 
@@ -91,6 +93,39 @@ class CoverLetterRepository:
             self.logger.error(f"Error getting all cover letters: {e}", exc_info=True)
             return []
     
+    async def get_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[CoverLetter]:
+        """Get one keyset page of cover letters, newest first.
+        
+        Raises:
+            InvalidCursorError: If ``cursor`` is malformed
+        """
+        stmt = select(DBCoverLetter)
+        if user_id:
+            stmt = stmt.where(DBCoverLetter.user_id == user_id)
+        return await fetch_page(
+            self.session,
+            stmt,
+            DBCoverLetter.created_at,
+            DBCoverLetter.id,
+            limit=limit,
+            cursor=cursor,
+            row_mapper=lambda row: row.to_model(),
+            scalars=True,
+        )
+    
+    def iter_all(
+        self, user_id: Optional[str] = None, batch_size: int = MAX_PAGE_SIZE
+    ) -> AsyncIterator[CoverLetter]:
+        """Stream every cover letter, one keyset page at a time."""
+        return iterate_pages(
+            lambda cursor: self.get_page(user_id=user_id, limit=batch_size, cursor=cursor)
+        )
+    
     async def get_by_company(self, company_name: str, user_id: Optional[str] = None) -> List[CoverLetter]:
         """Get cover letters by company name, optionally filtered by user."""
         try:
@@ -218,24 +253,16 @@ class CoverLetterRepository:
             return False
     
     async def search(self, query: str, limit: Optional[int] = None, user_id: Optional[str] = None) -> List[CoverLetter]:
-        """Search cover letters by job title, company, or content, optionally filtered by user."""
+        """Search cover letters by job title, company, or content, best matches first, optionally filtered by user."""
         try:
-            search_term = f"%{query.lower()}%"
-            
-            where_clause = or_(
-                func.lower(DBCoverLetter.job_title).like(search_term),
-                func.lower(DBCoverLetter.company_name).like(search_term),
-                func.lower(DBCoverLetter.content).like(search_term)
+            stmt = await COVER_LETTER_SEARCH.apply(
+                self.session,
+                select(DBCoverLetter).options(selectinload(DBCoverLetter.applications)),
+                query,
+                user_id=user_id,
+                recency_column=DBCoverLetter.created_at,
             )
             
-            # Filter by user_id if provided
-            if user_id:
-                where_clause = and_(where_clause, DBCoverLetter.user_id == user_id)
-            
-            stmt = select(DBCoverLetter).options(
-                selectinload(DBCoverLetter.applications)
-            ).where(where_clause).order_by(DBCoverLetter.created_at.desc())
-            
             if limit:
                 stmt = stmt.limit(limit)
             
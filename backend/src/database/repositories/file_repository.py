@@ -1,12 +1,14 @@
 """File metadata repository for database operations."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy import select, update, delete, func, and_
 from pathlib import Path
 
 from src.database.models import DBFileMetadata
+from src.database.pagination import MAX_PAGE_SIZE, Page, fetch_page, iterate_pages
+from src.database.search import FILE_SEARCH
 from src.utils.logger import get_logger
 
 
@@ -124,6 +126,47 @@ class FileRepository:
             self.logger.error(f"Error getting all file metadata: {e}", exc_info=True)
             return []
     
+    async def get_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        active_only: bool = True,
+    ) -> Page[Dict[str, Any]]:
+        """Get one keyset page of file metadata, most recently uploaded first.
+        
+        Raises:
+            InvalidCursorError: If ``cursor`` is malformed
+        """
+        stmt = select(DBFileMetadata)
+        if user_id:
+            stmt = stmt.where(DBFileMetadata.user_id == user_id)
+        if active_only:
+            stmt = stmt.where(DBFileMetadata.is_active == True)
+        return await fetch_page(
+            self.session,
+            stmt,
+            DBFileMetadata.uploaded_at,
+            DBFileMetadata.id,
+            limit=limit,
+            cursor=cursor,
+            row_mapper=lambda row: row.to_dict(),
+            scalars=True,
+        )
+    
+    def iter_all(
+        self,
+        user_id: Optional[str] = None,
+        active_only: bool = True,
+        batch_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all file metadata, one keyset page at a time."""
+        return iterate_pages(
+            lambda cursor: self.get_page(
+                user_id=user_id, limit=batch_size, cursor=cursor, active_only=active_only
+            )
+        )
+    
     async def get_by_type(self, file_type: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get files by file type."""
         try:
@@ -264,22 +307,16 @@ class FileRepository:
             self.logger.error(f"Error hard deleting file metadata {file_id}: {e}", exc_info=True)
             return False
     
-    async def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Search files by name, path, or type."""
+    async def search(self, query: str, limit: Optional[int] = None, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Search active files by name, path, or type, best matches first, optionally filtered by user."""
         try:
-            search_term = f"%{query.lower()}%"
-            
-            stmt = select(DBFileMetadata).where(
-                and_(
-                    or_(
-                        func.lower(DBFileMetadata.file_name).like(search_term),
-                        func.lower(DBFileMetadata.file_path).like(search_term),
-                        func.lower(DBFileMetadata.file_type).like(search_term),
-                        func.lower(DBFileMetadata.mime_type).like(search_term)
-                    ),
-                    DBFileMetadata.is_active == True
-                )
-            ).order_by(DBFileMetadata.uploaded_at.desc())
+            stmt = await FILE_SEARCH.apply(
+                self.session,
+                select(DBFileMetadata).where(DBFileMetadata.is_active == True),
+                query,
+                user_id=user_id,
+                recency_column=DBFileMetadata.uploaded_at,
+            )
             
             if limit:
                 stmt = stmt.limit(limit)
@@ -0,0 +1,108 @@
+"""Job catalog repository for postings seen in searches."""
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import DBJobCatalogEntry
+from src.database.search import JOB_CATALOG_SEARCH
+from src.database.upsert import dialect_insert
+from src.models.job import Job
+from src.utils.job_urls import canonical_job_url, job_fingerprint
+from src.utils.logger import get_logger
+
+# Rows per multi-row upsert, well under SQLite's bound-parameter limit.
+_UPSERT_CHUNK = 25
+
+# Kept from the first sighting when a posting is seen again.
+_INSERT_ONLY_COLUMNS = {"id", "first_seen_at"}
+
+
+class JobCatalogRepository:
+    """Repository for the job catalog (see ``DBJobCatalogEntry``)."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session."""
+        self.session = session
+        self.logger = get_logger(__name__)
+
+    async def upsert_many(self, jobs: Iterable[Job], seen_at: datetime) -> int:
+        """Insert or refresh ``jobs`` and commit; returns the number stored.
+
+        Postings already in the catalog keep their ``first_seen_at`` and get
+        every other column replaced. Duplicates within ``jobs`` collapse to
+        the last one.
+        """
+        rows = {}
+        for job in jobs:
+            canonical_url = canonical_job_url(str(job.url))
+            fingerprint = job_fingerprint(canonical_url)
+            entry = DBJobCatalogEntry.from_model(job, canonical_url, fingerprint, seen_at)
+            rows[fingerprint] = {
+                column.key: getattr(entry, column.key)
+                for column in DBJobCatalogEntry.__table__.columns
+            }
+        if not rows:
+            return 0
+
+        upsert = dialect_insert(self.session.get_bind().dialect.name)
+        values = list(rows.values())
+        if upsert is None:
+            await self._merge(values)
+        else:
+            for start in range(0, len(values), _UPSERT_CHUNK):
+                stmt = upsert(DBJobCatalogEntry).values(values[start:start + _UPSERT_CHUNK])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={
+                        column.key: stmt.excluded[column.key]
+                        for column in DBJobCatalogEntry.__table__.columns
+                        if column.key not in _INSERT_ONLY_COLUMNS
+                    },
+                )
+                await self.session.execute(stmt)
+
+        await self.session.commit()
+        return len(values)
+
+    async def _merge(self, values: List[dict]) -> None:
+        """Upsert for dialects without ``ON CONFLICT``: update known ids, insert the rest."""
+        result = await self.session.execute(
+            select(DBJobCatalogEntry.id).where(
+                DBJobCatalogEntry.id.in_([row["id"] for row in values])
+            )
+        )
+        existing = set(result.scalars())
+        for row in values:
+            if row["id"] in existing:
+                await self.session.execute(
+                    update(DBJobCatalogEntry)
+                    .where(DBJobCatalogEntry.id == row["id"])
+                    .values({key: value for key, value in row.items() if key not in _INSERT_ONLY_COLUMNS})
+                )
+        new_rows = [row for row in values if row["id"] not in existing]
+        if new_rows:
+            await self.session.execute(insert(DBJobCatalogEntry), new_rows)
+
+    async def search(self, query: str, limit: int = 50) -> List[Job]:
+        """Full-text search over cataloged jobs, best matches first."""
+        stmt = await JOB_CATALOG_SEARCH.apply(
+            self.session,
+            select(DBJobCatalogEntry),
+            query,
+            recency_column=DBJobCatalogEntry.last_seen_at,
+        )
+        result = await self.session.execute(stmt.limit(limit))
+        return [entry.to_model() for entry in result.scalars()]
+
+    async def get(self, fingerprint: str) -> Optional[Tuple[Job, datetime]]:
+        """Get a cataloged job and when it was last seen."""
+        result = await self.session.execute(
+            select(DBJobCatalogEntry).where(DBJobCatalogEntry.id == fingerprint)
+        )
+        entry = result.scalar_one_or_none()
+        if entry is None:
+            return None
+        return entry.to_model(), entry.last_seen_at
@@ -3,7 +3,7 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, or_, desc
+from sqlalchemy import select, update, delete, insert, func, and_, or_, desc
 from sqlalchemy.orm import selectinload
 
 from src.database.models import (
@@ -55,6 +55,26 @@ class MonitoringRepository:
             self.logger.error(f"Error creating metric: {e}", exc_info=True)
             raise
     
+    async def bulk_insert_metrics(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert many metric rows with a single executemany statement.
+
+        Args:
+            rows: Column values per row (see ``MetricAggregate.to_row``)
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        try:
+            await self.session.execute(insert(DBPerformanceMetric), rows)
+            await self.session.commit()
+            return len(rows)
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Error bulk inserting metrics: {e}", exc_info=True)
+            raise
+
     async def get_metrics(
         self,
         metric_name: Optional[str] = None,
@@ -92,12 +112,15 @@ class MonitoringRepository:
     ) -> Dict[str, Any]:
         """Get aggregated statistics for a metric."""
         try:
+            # Aggregated rows stand for sample_count samples; weight them so
+            # statistics match what per-sample rows would give.
+            metric = DBPerformanceMetric
             stmt = select(
-                func.avg(DBPerformanceMetric.metric_value).label("avg"),
-                func.min(DBPerformanceMetric.metric_value).label("min"),
-                func.max(DBPerformanceMetric.metric_value).label("max"),
-                func.count(DBPerformanceMetric.id).label("count")
-            ).where(DBPerformanceMetric.metric_name == metric_name)
+                func.sum(func.coalesce(metric.value_sum, metric.metric_value)).label("total"),
+                func.min(func.coalesce(metric.value_min, metric.metric_value)).label("min"),
+                func.max(func.coalesce(metric.value_max, metric.metric_value)).label("max"),
+                func.sum(metric.sample_count).label("count")
+            ).where(metric.metric_name == metric_name)
             
             if start_time:
                 stmt = stmt.where(DBPerformanceMetric.timestamp >= start_time)
@@ -108,9 +131,9 @@ class MonitoringRepository:
             result = await self.session.execute(stmt)
             row = result.first()
             
-            if row and row.count > 0:
+            if row and row.count:
                 return {
-                    "avg": float(row.avg) if row.avg else 0.0,
+                    "avg": float(row.total) / int(row.count) if row.total else 0.0,
                     "min": float(row.min) if row.min else 0.0,
                     "max": float(row.max) if row.max else 0.0,
                     "count": int(row.count)
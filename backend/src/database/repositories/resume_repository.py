@@ -1,12 +1,14 @@
 """Resume repository for database operations."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy import select, update, delete, func, and_
 from sqlalchemy.orm import selectinload
 
 from src.database.models import DBResume, DBJobApplication
+from src.database.pagination import MAX_PAGE_SIZE, Page, fetch_page, iterate_pages
+from src.database.search import RESUME_SEARCH
 from src.models.resume import Resume
 from src.utils.logger import get_logger
 
@@ -91,6 +93,39 @@ class ResumeRepository:
             self.logger.error(f"Error getting all resumes: {e}", exc_info=True)
             return []
     
+    async def get_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Resume]:
+        """Get one keyset page of resumes, newest first.
+        
+        Raises:
+            InvalidCursorError: If ``cursor`` is malformed
+        """
+        stmt = select(DBResume)
+        if user_id:
+            stmt = stmt.where(DBResume.user_id == user_id)
+        return await fetch_page(
+            self.session,
+            stmt,
+            DBResume.created_at,
+            DBResume.id,
+            limit=limit,
+            cursor=cursor,
+            row_mapper=lambda row: row.to_model(),
+            scalars=True,
+        )
+    
+    def iter_all(
+        self, user_id: Optional[str] = None, batch_size: int = MAX_PAGE_SIZE
+    ) -> AsyncIterator[Resume]:
+        """Stream every resume, one keyset page at a time."""
+        return iterate_pages(
+            lambda cursor: self.get_page(user_id=user_id, limit=batch_size, cursor=cursor)
+        )
+    
     async def get_by_name(self, name: str, user_id: Optional[str] = None) -> Optional[Resume]:
         """Get resume by name, optionally filtered by user."""
         try:
@@ -243,26 +278,16 @@ class ResumeRepository:
             return False
     
     async def search(self, query: str, limit: Optional[int] = None, user_id: Optional[str] = None) -> List[Resume]:
-        """Search resumes by name, content, or skills."""
+        """Search resumes by name, content, or skills, best matches first."""
         try:
-            search_term = f"%{query.lower()}%"
-            
-            stmt = select(DBResume).options(
-                selectinload(DBResume.applications)
-            ).where(
-                or_(
-                    func.lower(DBResume.name).like(search_term),
-                    func.lower(DBResume.content).like(search_term),
-                    func.lower(DBResume.skills).like(search_term)
-                )
+            stmt = await RESUME_SEARCH.apply(
+                self.session,
+                select(DBResume).options(selectinload(DBResume.applications)),
+                query,
+                user_id=user_id,
+                recency_column=DBResume.created_at,
             )
             
-            # Filter by user_id if provided
-            if user_id:
-                stmt = stmt.where(DBResume.user_id == user_id)
-            
-            stmt = stmt.order_by(DBResume.created_at.desc())
-            
             if limit:
                 stmt = stmt.limit(limit)
             
@@ -0,0 +1,121 @@
+"""
+Per-user application rollups.
+
+``application_rollups`` holds counters per user, per dimension bucket and per
+status, so analytics read a handful of rows instead of a user's whole
+application history. ``ApplicationRepository`` keeps the counters in step with
+``job_applications`` inside the same transaction: every write selects the
+affected rows' ``RollupState`` before and after, and the difference is applied
+to the counters.
+
+Dimensions (``kind``):
+
+- ``status``: one bucket (``""``)
+- ``week``: Monday of the week the application was created (``YYYY-MM-DD``)
+- ``company``: company name
+- ``response_days``: whole days between ``created_at`` and ``updated_at``
+
+A ``version`` row per user is bumped on every change. Its absence means the
+user's rollups have not been built yet; they are then rebuilt from
+``job_applications`` on first read.
+"""
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from src.database.models import DBJobApplication
+
+VERSION_KIND = "version"
+
+# (user_id, kind, bucket, status)
+RollupKey = Tuple[str, str, str, str]
+
+
+class RollupState(NamedTuple):
+    """The columns of one application that its rollup contribution depends on."""
+
+    user_id: Optional[str]
+    status: Any
+    company: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    @classmethod
+    def of(cls, application: Any) -> "RollupState":
+        """Read the state from a ``DBJobApplication`` (or anything shaped like one)."""
+        return cls(*(getattr(application, name) for name in cls._fields))
+
+
+# Selected in RollupState field order.
+ROLLUP_COLUMNS = tuple(getattr(DBJobApplication, name) for name in RollupState._fields)
+
+
+def week_bucket(created_at: datetime) -> str:
+    """Monday of ``created_at``'s week, as analytics trends group it."""
+    return (created_at - timedelta(days=created_at.weekday())).strftime("%Y-%m-%d")
+
+
+def rollup_counts(states: Iterable[RollupState]) -> Counter:
+    """Count the rollup keys contributed by ``states``.
+
+    Applications without an owner are not rolled up.
+    """
+    counts: Counter = Counter()
+    for state in states:
+        if not state.user_id:
+            continue
+        status = state.status.value if isinstance(state.status, Enum) else str(state.status)
+        counts[(state.user_id, "status", "", status)] += 1
+        counts[(state.user_id, "company", state.company or "Unknown", status)] += 1
+        if state.created_at:
+            counts[(state.user_id, "week", week_bucket(state.created_at), status)] += 1
+        if state.created_at and state.updated_at:
+            days = (state.updated_at - state.created_at).days
+            counts[(state.user_id, "response_days", str(days), status)] += 1
+    return counts
+
+
+def rollup_delta(
+    before: Iterable[RollupState], after: Iterable[RollupState]
+) -> Dict[RollupKey, int]:
+    """Return the non-zero counter changes that turn ``before`` into ``after``."""
+    delta = rollup_counts(after)
+    delta.subtract(rollup_counts(before))
+    return {key: amount for key, amount in delta.items() if amount}
+
+
+@dataclass
+class ApplicationRollups:
+    """One user's rollup counters, keyed by bucket and then by status value."""
+
+    version: int = 0
+    by_status: Dict[str, int] = field(default_factory=dict)
+    by_week: Dict[str, Dict[str, int]] = field(default_factory=lambda: defaultdict(dict))
+    by_company: Dict[str, Dict[str, int]] = field(default_factory=lambda: defaultdict(dict))
+    response_days: Dict[int, Dict[str, int]] = field(default_factory=lambda: defaultdict(dict))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, str, str, int]]) -> "ApplicationRollups":
+        """Build from ``(kind, bucket, status, count)`` rows."""
+        rollups = cls()
+        for kind, bucket, status, count in rows:
+            if kind == VERSION_KIND:
+                rollups.version = count
+            elif count <= 0:
+                continue
+            elif kind == "status":
+                rollups.by_status[status] = count
+            elif kind == "week":
+                rollups.by_week[bucket][status] = count
+            elif kind == "company":
+                rollups.by_company[bucket][status] = count
+            elif kind == "response_days":
+                rollups.response_days[int(bucket)][status] = count
+        return rollups
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_status.values())
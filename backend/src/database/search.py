@@ -0,0 +1,251 @@
+"""Full-text search indexes for repository ``search`` methods.
+
+``func.lower(col).like('%term%')`` cannot use an index, so every search used
+to scan the whole table. Each ``SearchIndex`` below instead keeps a real
+full-text index over a table's searchable columns:
+
+- SQLite: an FTS5 external-content table ``<table>_fts`` kept in sync by
+  triggers. The owner's id is indexed too, so a per-user search intersects
+  posting lists inside FTS5 instead of filtering matches afterwards.
+- PostgreSQL: a GIN index over ``to_tsvector('simple', ...)`` of the
+  columns, which the planner combines with the ``user_id`` btree index.
+
+Query terms are matched as prefixes (``dock`` finds "Docker") and results
+come back best match first. On other dialects, or before the index exists,
+``SearchIndex.apply`` falls back to the old substring scan.
+
+The indexes are created with the tables (``Base.metadata.create_all``) and
+by migration ``d4e5f6a7b8c9``. FTS5 maps rows by SQLite's implicit rowid,
+so run ``rebuild_statements`` after an explicit ``VACUUM``.
+"""
+
+import re
+import weakref
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func, literal_column, or_, table, column, text
+from sqlalchemy.sql import Select
+
+from src.database.config import Base
+from src.database.models import (
+    DBCoverLetter,
+    DBFileMetadata,
+    DBJobApplication,
+    DBJobCatalogEntry,
+    DBResume,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Text search configuration without stemming or stop words, matching FTS5's
+# default tokenizer closely enough that both dialects find the same rows.
+_PG_CONFIG = "'simple'::regconfig"
+
+_TERM = re.compile(r"[^\W_]+", re.UNICODE)
+
+# Engines whose indexes are known to exist, per table.
+_ready: "weakref.WeakKeyDictionary[Any, Set[str]]" = weakref.WeakKeyDictionary()
+
+
+def search_terms(query: str) -> List[str]:
+    """Split a user query into the lowercase word terms that are matched."""
+    return _TERM.findall(query.lower())
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    """Full-text index over ``columns`` of ``model``'s table."""
+
+    model: Any
+    columns: Tuple[str, ...]
+    user_column: Optional[str] = "user_id"
+
+    @property
+    def table(self) -> str:
+        return self.model.__tablename__
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+    @property
+    def pg_index(self) -> str:
+        return f"idx_{self.table}_fulltext"
+
+    @property
+    def _fts_columns(self) -> Tuple[str, ...]:
+        return self.columns + ((self.user_column,) if self.user_column else ())
+
+    def _pg_vector(self) -> str:
+        document = " || ' ' || ".join(f"coalesce({name}, '')" for name in self.columns)
+        return f"to_tsvector({_PG_CONFIG}, {document})"
+
+    def create_statements(self, dialect_name: str) -> List[str]:
+        """DDL creating the index and keeping it in sync; idempotent."""
+        if dialect_name == "postgresql":
+            return [
+                f"CREATE INDEX IF NOT EXISTS {self.pg_index} "
+                f"ON {self.table} USING GIN ({self._pg_vector()})"
+            ]
+        if dialect_name != "sqlite":
+            return []
+
+        fts, cols = self.fts_table, self._fts_columns
+        names = ", ".join(cols)
+        new = ", ".join(f"new.{name}" for name in cols)
+        old = ", ".join(f"old.{name}" for name in cols)
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{names}, content='{self.table}', content_rowid='rowid')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {self.table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {self.table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.rowid, {old}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} ON {self.table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.rowid, {old}); "
+            f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new}); END",
+        ]
+
+    def rebuild_statements(self, dialect_name: str) -> List[str]:
+        """Statements re-indexing rows that already exist."""
+        if dialect_name == "sqlite":
+            return [f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('rebuild')"]
+        return []
+
+    def drop_statements(self, dialect_name: str) -> List[str]:
+        """DDL removing the index (triggers go with the table on SQLite)."""
+        if dialect_name == "postgresql":
+            return [f"DROP INDEX IF EXISTS {self.pg_index}"]
+        if dialect_name == "sqlite":
+            return [
+                *(f"DROP TRIGGER IF EXISTS {self.fts_table}_{suffix}" for suffix in ("ai", "ad", "au")),
+                f"DROP TABLE IF EXISTS {self.fts_table}",
+            ]
+        return []
+
+    def _exists_query(self, dialect_name: str):
+        if dialect_name == "sqlite":
+            return text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name").bindparams(
+                name=self.fts_table
+            )
+        if dialect_name == "postgresql":
+            return text("SELECT 1 FROM pg_indexes WHERE indexname = :name").bindparams(name=self.pg_index)
+        return None
+
+    async def _is_ready(self, session, dialect_name: str) -> bool:
+        engine = session.get_bind()
+        known = _ready.get(engine)
+        if known is not None and self.table in known:
+            return True
+        query = self._exists_query(dialect_name)
+        if query is None or (await session.execute(query)).first() is None:
+            return False
+        _ready.setdefault(engine, set()).add(self.table)
+        return True
+
+    async def apply(
+        self,
+        session,
+        stmt: Select,
+        query: str,
+        user_id: Optional[str] = None,
+        recency_column=None,
+    ) -> Select:
+        """Restrict ``stmt`` to rows matching ``query``, best match first.
+
+        ``stmt`` must select from this index's table. ``user_id`` limits the
+        results to one owner. The substring fallback orders by
+        ``recency_column`` (newest first) instead of relevance.
+        """
+        dialect_name = session.get_bind().dialect.name
+        terms = search_terms(query)
+        owner = getattr(self.model, self.user_column) if self.user_column else None
+
+        if terms and await self._is_ready(session, dialect_name):
+            if dialect_name == "sqlite":
+                fts = table(self.fts_table, column("rowid"), column("rank"))
+                text_columns = " ".join(self.columns)
+                match = "{%s} : (%s)" % (
+                    text_columns,
+                    " AND ".join(f'"{term}"*' for term in terms),
+                )
+                if user_id and owner is not None:
+                    # The phrase only narrows the FTS scan; tokenizing folds
+                    # case and punctuation, so ownership is checked exactly below.
+                    phrase = user_id.replace('"', '""')
+                    match = f'{self.user_column} : "{phrase}" AND {match}'
+                    stmt = stmt.where(owner == user_id)
+                return (
+                    stmt.join(fts, fts.c.rowid == literal_column(f"{self.table}.rowid"))
+                    .where(literal_column(self.fts_table).op("MATCH")(match))
+                    .order_by(fts.c.rank)
+                )
+
+            vector = literal_column(self._pg_vector())
+            tsquery = func.to_tsquery(
+                literal_column(_PG_CONFIG), " & ".join(f"{term}:*" for term in terms)
+            )
+            stmt = stmt.where(vector.op("@@")(tsquery))
+            if user_id and owner is not None:
+                stmt = stmt.where(owner == user_id)
+            return stmt.order_by(func.ts_rank(vector, tsquery).desc())
+
+        search_term = f"%{query.lower()}%"
+        stmt = stmt.where(
+            or_(*(func.lower(getattr(self.model, name)).like(search_term) for name in self.columns))
+        )
+        if user_id and owner is not None:
+            stmt = stmt.where(owner == user_id)
+        if recency_column is not None:
+            stmt = stmt.order_by(recency_column.desc())
+        return stmt
+
+
+APPLICATION_SEARCH = SearchIndex(DBJobApplication, ("job_title", "company", "notes"))
+RESUME_SEARCH = SearchIndex(DBResume, ("name", "content", "skills"))
+COVER_LETTER_SEARCH = SearchIndex(DBCoverLetter, ("job_title", "company_name", "content"))
+FILE_SEARCH = SearchIndex(DBFileMetadata, ("file_name", "file_path", "file_type", "mime_type"))
+JOB_CATALOG_SEARCH = SearchIndex(
+    DBJobCatalogEntry, ("title", "company", "location", "description", "skills"), user_column=None
+)
+
+SEARCH_INDEXES = [
+    APPLICATION_SEARCH,
+    RESUME_SEARCH,
+    COVER_LETTER_SEARCH,
+    FILE_SEARCH,
+    JOB_CATALOG_SEARCH,
+]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_indexes(target, connection, **kw) -> None:
+    """Create the full-text indexes whenever ``create_all`` creates tables."""
+    dialect_name = connection.dialect.name
+    for index in SEARCH_INDEXES:
+        exists = index._exists_query(dialect_name)
+        if exists is None:
+            continue
+        # A failed statement aborts the whole transaction on PostgreSQL.
+        savepoint = connection.begin_nested() if dialect_name == "postgresql" else nullcontext()
+        try:
+            with savepoint:
+                is_new = connection.execute(exists).first() is None
+                for statement in index.create_statements(dialect_name):
+                    connection.exec_driver_sql(statement)
+                if is_new:
+                    for statement in index.rebuild_statements(dialect_name):
+                        connection.exec_driver_sql(statement)
+        except Exception as e:
+            logger.warning(f"Full-text index for {index.table} unavailable, using substring search: {e}")
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_search_indexes(target, connection, **kw) -> None:
+    """Drop the FTS5 tables that ``drop_all`` does not know about."""
+    for index in SEARCH_INDEXES:
+        for statement in index.drop_statements(connection.dialect.name):
+            connection.exec_driver_sql(statement)
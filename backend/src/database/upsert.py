@@ -0,0 +1,12 @@
+"""Dialect-specific ``INSERT ... ON CONFLICT`` support for repositories."""
+
+
+def dialect_insert(dialect_name: str):
+    """Return the dialect's ``INSERT ... ON CONFLICT`` construct, if it has one."""
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+        return postgresql_insert
+    return None
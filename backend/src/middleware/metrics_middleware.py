@@ -1,24 +1,52 @@
 """Metrics middleware for FastAPI to track request performance."""
 
 import time
-from typing import Callable
+from typing import Callable, Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from src.config import config
+from src.core import metrics
 from src.services.monitoring_service import DatabaseMonitoringService
 from src.utils.logger import get_logger
 
 
+def _route_label(request: Request) -> str:
+    """Use the route template (``/jobs/{job_id}``) to keep label cardinality bounded."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
 class MetricsMiddleware(BaseHTTPMiddleware):
     """Middleware to collect request metrics."""
     
-    def __init__(self, app: ASGIApp, monitoring_service: DatabaseMonitoringService):
-        """Initialize metrics middleware."""
+    def __init__(
+        self,
+        app: ASGIApp,
+        monitoring_service: Optional[DatabaseMonitoringService] = None
+    ):
+        """Initialize metrics middleware.
+        
+        Args:
+            app: ASGI application
+            monitoring_service: Service that persists samples; resolved from the
+                service registry on first use when not given.
+        """
         super().__init__(app)
         self.monitoring_service = monitoring_service
         self.logger = get_logger(__name__)
     
+    def _get_monitoring_service(self) -> Optional[DatabaseMonitoringService]:
+        if self.monitoring_service is None:
+            try:
+                from src.services.service_registry import service_registry
+                
+                self.monitoring_service = service_registry.get_monitoring_service_sync()
+            except (RuntimeError, KeyError):
+                return None
+        return self.monitoring_service
+    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and collect metrics."""
         start_time = time.time()
@@ -27,16 +55,30 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         if request.url.path in ["/health", "/metrics", "/api/v1/monitoring/health"]:
             return await call_next(request)
         
+        metrics.http_requests_in_progress.inc()
         try:
             response = await call_next(request)
             
             # Calculate response time
             duration = time.time() - start_time
+            route = _route_label(request)
+            metrics.http_requests_total.labels(
+                request.method, route, str(response.status_code)
+            ).inc()
+            metrics.http_request_duration_seconds.labels(request.method, route).observe(duration)
+            
+            # Persist the samples too if enabled (the Prometheus metrics above
+            # are always updated)
+            if not config.metrics_persist_samples:
+                return response
+            monitoring_service = self._get_monitoring_service()
+            if monitoring_service is None:
+                return response
             
             # Record metrics asynchronously
             try:
                 # Request count
-                await self.monitoring_service.record_metric(
+                await monitoring_service.record_metric(
                     metric_name="api.request.count",
                     metric_value=1.0,
                     tags={
@@ -47,7 +89,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
                 )
                 
                 # Response time
-                await self.monitoring_service.record_metric(
+                await monitoring_service.record_metric(
                     metric_name="api.response_time",
                     metric_value=duration * 1000,  # Convert to milliseconds
                     tags={
@@ -59,7 +101,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
                 
                 # Error count if status code >= 400
                 if response.status_code >= 400:
-                    await self.monitoring_service.record_metric(
+                    await monitoring_service.record_metric(
                         metric_name="api.error.count",
                         metric_value=1.0,
                         tags={
@@ -78,9 +120,16 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             # Record error
             duration = time.time() - start_time
+            route = _route_label(request)
+            metrics.http_requests_total.labels(request.method, route, "500").inc()
+            metrics.http_request_duration_seconds.labels(request.method, route).observe(duration)
+            
+            monitoring_service = self._get_monitoring_service()
+            if monitoring_service is None:
+                raise
             
             try:
-                await self.monitoring_service.record_error(
+                await monitoring_service.record_error(
                     error_type=type(e).__name__,
                     error_message=str(e),
                     stack_trace=None,  # Can be enhanced to capture full traceback
@@ -93,3 +142,5 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             
             # Re-raise the original exception
             raise
+        finally:
+            metrics.http_requests_in_progress.dec()
@@ -5,6 +5,8 @@ from typing import Optional, Union
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncEngine
+from src.config import config
+from src.core import metrics
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -62,17 +64,30 @@ async def _record_query_metric(query_time: float, statement: str):
     except Exception as e:
         logger.error(f"Error recording query metric: {e}", exc_info=True)
 
+_QUERY_OPERATIONS = {"select", "insert", "update", "delete", "with", "pragma"}
+
+
+def _operation_label(statement: str) -> str:
+    """Leading SQL keyword, folded into a small fixed set for metric labels."""
+    words = statement.split(None, 1)
+    operation = words[0].lower() if words else ""
+    return operation if operation in _QUERY_OPERATIONS else "other"
+
 def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     """Event listener executed after a query."""
     total_time = time.time() - conn.info['query_start_time'].pop(-1)
+    operation = _operation_label(statement)
+    metrics.db_query_duration_seconds.labels(operation).observe(total_time)
     # Use DEBUG level for normal queries to reduce log noise
     logger.debug(f"Query executed in {total_time:.3f}s: {statement[:100]}")
     
     if total_time > 0.1:  # 100ms threshold
+        metrics.db_slow_queries_total.labels(operation).inc()
         logger.warning(f"Slow query detected ({total_time:.3f}s): {statement}")
     
-    # Record metric asynchronously if monitoring service is available
-    if _monitoring_service is not None:
+    # Persist the sample too if enabled (the Prometheus histogram above is
+    # always updated)
+    if _monitoring_service is not None and config.metrics_persist_samples:
         import asyncio
         try:
             # Try to get running event loop
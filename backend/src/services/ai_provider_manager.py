@@ -1,20 +1,30 @@
 """AI Provider Manager for handling multiple AI providers."""
 
-from typing import Dict, List, Optional, Type
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
+from src.config import config as app_config
 from src.core.ai_provider import AIProvider, AIProviderConfig, AIResponse
+from src.core.ai_result_cache import AIRoute, record_route
+from src.core.circuit_breaker import breaker_states, get_breaker
+from src.services.ai_router import ProviderRouter, RoutingStrategy
 from src.services.providers.openai_provider import OpenAIProvider
 from src.services.providers.local_ai_provider import LocalAIProvider
 from src.services.providers.openrouter_provider import OpenRouterProvider
 from src.services.providers.cursor_provider import CursorProvider
+from src.core import metrics
 from loguru import logger
 
 class AIProviderManager:
     """Manages multiple AI providers with fallback support."""
     
-    def __init__(self):
+    def __init__(self, router: Optional[ProviderRouter] = None):
         self.providers: Dict[str, AIProvider] = {}
         self.provider_order: List[str] = []
         self._initialized = False
+        self.router = router or ProviderRouter(
+            strategy=app_config.ai_routing_strategy,
+            hedge_delay=app_config.ai_hedge_delay,
+        )
     
     async def initialize(self, configs: List[AIProviderConfig]) -> bool:
         """Initialize all AI providers."""
@@ -23,6 +33,8 @@ class AIProviderManager:
                 provider = await self._create_provider(config)
                 if provider:
                     self.providers[config.provider_name] = provider
+                    # Re-initializing re-runs the provider's connection check.
+                    get_breaker(config.provider_name, probe=provider.initialize)
                     self.provider_order.append(config.provider_name)
                     logger.info(f"AI provider '{config.provider_name}' registered")
             
@@ -59,18 +71,22 @@ class AIProviderManager:
             logger.error(f"Failed to create provider '{config.provider_name}': {e}")
             return None
     
+    async def _is_available(self, provider: AIProvider) -> bool:
+        """Available and not short-circuited by its breaker."""
+        return get_breaker(provider.provider_name).available() and await provider.is_available()
+    
     async def get_available_provider(self) -> Optional[AIProvider]:
         """Get the first available provider."""
         for provider_name in self.provider_order:
             provider = self.providers.get(provider_name)
-            if provider and await provider.is_available():
+            if provider and await self._is_available(provider):
                 return provider
         return None
     
     async def get_provider(self, provider_name: str) -> Optional[AIProvider]:
         """Get a specific provider by name."""
         provider = self.providers.get(provider_name)
-        if provider and await provider.is_available():
+        if provider and await self._is_available(provider):
             return provider
         return None
     
@@ -82,82 +98,152 @@ class AIProviderManager:
         """Get status of all providers."""
         status = {}
         for name, provider in self.providers.items():
-            status[name] = await provider.is_available()
+            status[name] = await self._is_available(provider)
         return status
     
-    async def generate_text(self, prompt: str, preferred_provider: Optional[str] = None, **kwargs) -> AIResponse:
-        """Generate text using available provider."""
-        provider = None
-        
-        # Try preferred provider first
-        if preferred_provider:
-            provider = await self.get_provider(preferred_provider)
-        
-        # Fall back to first available provider
-        if not provider:
-            provider = await self.get_available_provider()
-        
-        if not provider:
-            raise RuntimeError("No AI providers available")
-        
-        return await provider.generate_text(prompt, **kwargs)
+    def get_breaker_states(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit breaker state of every AI provider."""
+        return breaker_states()
+    
+    def get_routing_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Rolling latency and error rates per provider."""
+        return self.router.get_stats()
+    
+    async def _candidates(self, preferred_provider: Optional[str] = None) -> List[AIProvider]:
+        """Available providers, the preferred one first, the rest ranked by the router."""
+        available = [
+            provider
+            for name in self.provider_order
+            if (provider := self.providers.get(name)) and await self._is_available(provider)
+        ]
+        preferred = [p for p in available if p.provider_name == preferred_provider]
+        others = [p for p in available if p.provider_name != preferred_provider]
+        return preferred + self.router.order(others)
+    
+    async def get_routed_provider(
+        self, preferred_provider: Optional[str] = None
+    ) -> Optional[AIProvider]:
+        """The provider routing would try first for a call made now."""
+        candidates = await self._candidates(preferred_provider)
+        return candidates[0] if candidates else None
+    
+    def primary_model(self, preferred_provider: Optional[str] = None) -> Optional[str]:
+        """Model of the provider routing tries first, for sizing prompts."""
+        registered = [self.providers[name] for name in self.provider_order if name in self.providers]
+        preferred = [p for p in registered if p.provider_name == preferred_provider]
+        others = [p for p in registered if p.provider_name != preferred_provider]
+        ranked = preferred + self.router.order(others)
+        return ranked[0].config.model if ranked else None
+    
+    async def _route(
+        self,
+        operation: str,
+        *args,
+        preferred_provider: Optional[str] = None,
+        strategy: Optional[RoutingStrategy] = None,
+        **kwargs,
+    ) -> AIResponse:
+        """Run a provider operation through the router.
+        
+        The provider that answered is recorded for the AI result cache.
+        """
+        async def call(provider: AIProvider):
+            return provider, await self._call(provider, operation, *args, **kwargs)
+        
+        provider, response = await self.router.run(
+            await self._candidates(preferred_provider), call, strategy=strategy
+        )
+        self._record_route(provider)
+        return response
+    
+    def _record_route(self, provider: AIProvider) -> None:
+        record_route(
+            AIRoute(provider.provider_name, provider.config.model, provider.config.temperature)
+        )
+    
+    async def _call(self, provider: AIProvider, operation: str, *args, **kwargs) -> AIResponse:
+        """Invoke a provider operation through its breaker and record its latency."""
+        with metrics.track_duration(
+            metrics.ai_request_duration_seconds,
+            provider=provider.provider_name,
+            operation=operation,
+        ):
+            return await get_breaker(provider.provider_name).call(
+                getattr(provider, operation), *args, **kwargs
+            )
+    
+    async def generate_text(
+        self,
+        prompt: str,
+        preferred_provider: Optional[str] = None,
+        strategy: Optional[RoutingStrategy] = None,
+        **kwargs,
+    ) -> AIResponse:
+        """Generate text using available providers.
+        
+        ``strategy`` overrides the configured routing strategy for this call.
+        """
+        return await self._route(
+            "generate_text", prompt, preferred_provider=preferred_provider, strategy=strategy, **kwargs
+        )
+    
+    async def stream_text(
+        self, prompt: str, preferred_provider: Optional[str] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream text deltas from the best available provider.
+        
+        Providers are tried in routing order until one produces its first
+        delta; after that the stream is committed to that provider and a
+        failure propagates to the caller. Hedging and racing do not apply.
+        """
+        errors = []
+        for provider in await self._candidates(preferred_provider):
+            breaker = get_breaker(provider.provider_name)
+            if not breaker.allow():
+                continue
+            started = False
+            try:
+                with metrics.track_duration(
+                    metrics.ai_request_duration_seconds,
+                    provider=provider.provider_name,
+                    operation="stream_text",
+                ):
+                    async for delta in provider.stream_text(prompt, **kwargs):
+                        started = True
+                        yield delta
+            except (asyncio.CancelledError, GeneratorExit):
+                breaker.release()
+                raise
+            except Exception as e:
+                breaker.record_failure()
+                if started:
+                    raise
+                logger.warning(f"Provider '{provider.provider_name}' failed to stream: {e}")
+                errors.append(f"{provider.provider_name}: {e}")
+                continue
+            breaker.record_success()
+            self._record_route(provider)
+            return
+        raise RuntimeError(f"All AI providers failed: {'; '.join(errors) or 'none available'}")
     
     async def optimize_resume(self, resume_content: str, job_description: str, preferred_provider: Optional[str] = None) -> AIResponse:
         """Optimize resume using available provider."""
-        provider = None
-        
-        if preferred_provider:
-            provider = await self.get_provider(preferred_provider)
-        
-        if not provider:
-            provider = await self.get_available_provider()
-        
-        if not provider:
-            raise RuntimeError("No AI providers available")
-        
-        return await provider.optimize_resume(resume_content, job_description)
+        return await self._route(
+            "optimize_resume", resume_content, job_description, preferred_provider=preferred_provider
+        )
     
     async def generate_cover_letter(self, resume_content: str, job_description: str, company: str, preferred_provider: Optional[str] = None) -> AIResponse:
         """Generate cover letter using available provider."""
-        provider = None
-        
-        if preferred_provider:
-            provider = await self.get_provider(preferred_provider)
-        
-        if not provider:
-            provider = await self.get_available_provider()
-        
-        if not provider:
-            raise RuntimeError("No AI providers available")
-        
-        return await provider.generate_cover_letter(resume_content, job_description, company)
+        return await self._route(
+            "generate_cover_letter", resume_content, job_description, company, preferred_provider=preferred_provider
+        )
     
     async def analyze_job_match(self, resume_content: str, job_description: str, preferred_provider: Optional[str] = None) -> AIResponse:
         """Analyze job match using available provider."""
-        provider = None
-        
-        if preferred_provider:
-            provider = await self.get_provider(preferred_provider)
-        
-        if not provider:
-            provider = await self.get_available_provider()
-        
-        if not provider:
-            raise RuntimeError("No AI providers available")
-        
-        return await provider.analyze_job_match(resume_content, job_description)
+        return await self._route(
+            "analyze_job_match", resume_content, job_description, preferred_provider=preferred_provider
+        )
     
     async def extract_skills(self, text: str, preferred_provider: Optional[str] = None) -> AIResponse:
         """Extract skills using available provider."""
-        provider = None
-        
-        if preferred_provider:
-            provider = await self.get_provider(preferred_provider)
-        
-        if not provider:
-            provider = await self.get_available_provider()
-        
-        if not provider:
-            raise RuntimeError("No AI providers available")
-        
-        return await provider.extract_skills(text)
+        return await self._route("extract_skills", text, preferred_provider=preferred_provider)
@@ -0,0 +1,202 @@
+"""
+Latency-aware routing of AI calls across providers.
+
+``ProviderRouter`` runs one call against an ordered list of providers with
+one of three strategies:
+
+- ``sequential``: try providers one at a time and fall back on failure.
+- ``hedged``: if the current provider has not answered by its p90 latency,
+  start the next one as well. The first success wins and the rest are
+  cancelled.
+- ``race``: start every provider at once. The first success wins.
+
+Each provider keeps a rolling window of latencies and outcomes. The window
+decides the order: providers are ranked by expected time to a successful
+answer, which is the median latency divided by the success rate.
+"""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+from src.core.ai_provider import AIProvider
+
+# Samples a provider needs before its own latencies replace the defaults.
+MIN_SAMPLES = 5
+
+
+class RoutingStrategy(str, Enum):
+    """How a call is spread over providers."""
+
+    SEQUENTIAL = "sequential"
+    HEDGED = "hedged"
+    RACE = "race"
+
+
+class ProviderStats:
+    """Rolling latency and error window for one provider."""
+
+    def __init__(self, window: int = 100):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+
+    def record_success(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.outcomes.append(True)
+
+    def record_failure(self) -> None:
+        self.outcomes.append(False)
+
+    @property
+    def scored(self) -> bool:
+        return len(self.latencies) >= MIN_SAMPLES
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def expected_latency(self) -> float:
+        """Median latency inflated by the retries failures would cost."""
+        return self.percentile(0.5) / max(0.05, 1.0 - self.error_rate)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "samples": len(self.outcomes),
+            "error_rate": round(self.error_rate, 3),
+            "p50_seconds": self.percentile(0.5),
+            "p90_seconds": self.percentile(0.9),
+        }
+
+
+class ProviderRouter:
+    """Orders providers by observed performance and runs calls across them."""
+
+    def __init__(
+        self,
+        strategy: RoutingStrategy = RoutingStrategy.SEQUENTIAL,
+        hedge_delay: float = 5.0,
+        window: int = 100,
+    ):
+        """
+        Args:
+            strategy: Default strategy for ``run``; an unknown value is
+                logged and replaced by ``sequential``
+            hedge_delay: Seconds before hedging a provider with too few
+                samples to have a p90 of its own
+            window: Calls remembered per provider
+        """
+        try:
+            self.strategy = RoutingStrategy(strategy)
+        except ValueError:
+            logger.warning(f"Unknown AI routing strategy {strategy!r}, using sequential")
+            self.strategy = RoutingStrategy.SEQUENTIAL
+        self.hedge_delay = hedge_delay
+        self.window = window
+        self.stats: Dict[str, ProviderStats] = {}
+
+    def _stats(self, name: str) -> ProviderStats:
+        if name not in self.stats:
+            self.stats[name] = ProviderStats(self.window)
+        return self.stats[name]
+
+    def order(self, providers: Sequence[AIProvider]) -> List[AIProvider]:
+        """Scored providers by expected latency, then the rest in given order."""
+        scored = [p for p in providers if self._stats(p.provider_name).scored]
+        unscored = [p for p in providers if not self._stats(p.provider_name).scored]
+        scored.sort(key=lambda p: self._stats(p.provider_name).expected_latency())
+        return scored + unscored
+
+    def hedge_after(self, provider: AIProvider) -> float:
+        """Seconds to wait on ``provider`` before starting the next one."""
+        stats = self._stats(provider.provider_name)
+        if not stats.scored:
+            return self.hedge_delay
+        return stats.percentile(0.9)
+
+    async def _timed(self, provider: AIProvider, call: Callable[[AIProvider], Awaitable[Any]]) -> Any:
+        stats = self._stats(provider.provider_name)
+        started = time.monotonic()
+        try:
+            result = await call(provider)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            stats.record_failure()
+            raise
+        stats.record_success(time.monotonic() - started)
+        return result
+
+    async def run(
+        self,
+        providers: Sequence[AIProvider],
+        call: Callable[[AIProvider], Awaitable[Any]],
+        strategy: Optional[RoutingStrategy] = None,
+    ) -> Any:
+        """Run ``call`` on ``providers`` (already ordered) and return the first success.
+
+        Raises:
+            RuntimeError: If no provider is given or every provider failed
+        """
+        if not providers:
+            raise RuntimeError("No AI providers available")
+        strategy = RoutingStrategy(strategy or self.strategy)
+
+        waiting = list(providers)
+        running: Dict[asyncio.Task, AIProvider] = {}
+        last_error: Optional[BaseException] = None
+
+        def launch() -> AIProvider:
+            provider = waiting.pop(0)
+            running[asyncio.create_task(self._timed(provider, call))] = provider
+            return provider
+
+        newest = launch()
+        try:
+            while running:
+                timeout = None
+                if waiting and strategy is RoutingStrategy.RACE:
+                    timeout = 0
+                elif waiting and strategy is RoutingStrategy.HEDGED:
+                    timeout = self.hedge_after(newest)
+
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if strategy is RoutingStrategy.HEDGED:
+                        logger.debug(
+                            f"Hedging slow AI provider '{newest.provider_name}' "
+                            f"with '{waiting[0].provider_name}'"
+                        )
+                    newest = launch()
+                    continue
+
+                for task in done:
+                    provider = running.pop(task)
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+                    logger.warning(f"AI provider '{provider.provider_name}' failed: {last_error}")
+
+                if not running and waiting:
+                    newest = launch()
+        finally:
+            for task in running:
+                task.cancel()
+
+        raise RuntimeError(f"All AI providers failed: {last_error}") from last_error
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.snapshot() for name, stats in self.stats.items()}
@@ -10,13 +10,16 @@ Provides comprehensive analytics including:
 - Company analysis
 """
 
-from typing import Dict, List, Any, Optional, Sequence
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 from loguru import logger
 
 from src.models.application import JobApplication, ApplicationStatus
+from src.database.aggregation import INTERVIEW_STATUSES, OFFER_STATUSES, AnalyticsAggregator
 from src.database.repositories.application_repository import ApplicationRepository
+from src.database.rollups import ApplicationRollups, week_bucket
+from src.utils.skill_matcher import get_skill_matcher
 
 
 class AnalyticsService:
@@ -26,15 +29,19 @@ class AnalyticsService:
         self,
         repository: Optional[ApplicationRepository] = None,
         ai_service: Optional[Any] = None,
+        aggregator: Optional[AnalyticsAggregator] = None,
     ):
         """Initialize analytics service.
 
         Args:
             repository: Application repository for data access
             ai_service: AI service for intelligent analysis (optional)
+            aggregator: Computes metrics in SQL when no applications are
+                passed in (optional; preferred over ``repository``)
         """
         self.repository = repository
         self.ai_service = ai_service
+        self.aggregator = aggregator
         self.logger = logger.bind(module="AnalyticsService")
 
     def _filter_by_date(
@@ -61,12 +68,16 @@ class AnalyticsService:
                 "applications list"
             )
 
+    def _push_down(self, applications: Optional[Sequence[JobApplication]]) -> bool:
+        return applications is None and self.aggregator is not None
+
     async def get_application_success_rate(
         self,
         user_id: str,
         applications: Optional[Sequence[JobApplication]] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        rollups: Optional[ApplicationRollups] = None,
     ) -> Dict[str, Any]:
         """
         Calculate application success rate metrics.
@@ -75,11 +86,18 @@ class AnalyticsService:
             user_id: User ID to analyze
             start_date: Start date for analysis
             end_date: End date for analysis
+            rollups: Precomputed counters, used when no date range is given
 
         Returns:
             Dictionary with success rate metrics
         """
         try:
+            if rollups is not None and not start_date and not end_date:
+                return self._success_metrics(rollups.by_status)
+            if self._push_down(applications):
+                summary = await self.aggregator.status_summary(user_id, start_date, end_date)
+                return self._success_metrics(summary.status_counts)
+
             self._require_applications_or_repository(applications)
             if applications is None:
                 assert self.repository is not None
@@ -87,67 +105,71 @@ class AnalyticsService:
 
             applications = self._filter_by_date(applications, start_date, end_date)
 
-            total = len(applications)
-            if total == 0:
-                return {"total_applications": 0, "success_rate": 0.0, "breakdown": {}}
-
             # Count by status
             status_counts = defaultdict(int)
             for app in applications:
                 status_counts[app.status] += 1
 
-            # Calculate success metrics
-            successful = status_counts.get(
-                ApplicationStatus.OFFER_RECEIVED, 0
-            ) + status_counts.get(ApplicationStatus.OFFER_ACCEPTED, 0)
-
-            interviews = (
-                status_counts.get(ApplicationStatus.INTERVIEW_SCHEDULED, 0)
-                + status_counts.get(ApplicationStatus.INTERVIEW_COMPLETED, 0)
-                + successful
-            )
-
-            rejected = status_counts.get(ApplicationStatus.REJECTED, 0)
-
-            return {
-                "total_applications": total,
-                "successful_applications": successful,
-                "success_rate": round((successful / total) * 100, 2),
-                "interview_rate": round((interviews / total) * 100, 2),
-                "rejection_rate": round((rejected / total) * 100, 2),
-                "breakdown": {
-                    "draft": status_counts.get(ApplicationStatus.DRAFT, 0),
-                    "submitted": status_counts.get(ApplicationStatus.SUBMITTED, 0),
-                    "under_review": status_counts.get(
-                        ApplicationStatus.UNDER_REVIEW, 0
-                    ),
-                    "interview_scheduled": status_counts.get(
-                        ApplicationStatus.INTERVIEW_SCHEDULED, 0
-                    ),
-                    "interview_completed": status_counts.get(
-                        ApplicationStatus.INTERVIEW_COMPLETED, 0
-                    ),
-                    "offer_received": status_counts.get(
-                        ApplicationStatus.OFFER_RECEIVED, 0
-                    ),
-                    "offer_accepted": status_counts.get(
-                        ApplicationStatus.OFFER_ACCEPTED, 0
-                    ),
-                    "rejected": rejected,
-                    "withdrawn": status_counts.get(ApplicationStatus.WITHDRAWN, 0),
-                },
-            }
+            return self._success_metrics(status_counts)
 
         except Exception as e:
             self.logger.error(f"Error calculating success rate: {e}", exc_info=True)
             raise
 
+    def _success_metrics(self, status_counts: Dict[str, int]) -> Dict[str, Any]:
+        total = sum(status_counts.values())
+        if total == 0:
+            return {"total_applications": 0, "success_rate": 0.0, "breakdown": {}}
+
+        # Calculate success metrics
+        successful = status_counts.get(
+            ApplicationStatus.OFFER_RECEIVED, 0
+        ) + status_counts.get(ApplicationStatus.OFFER_ACCEPTED, 0)
+
+        interviews = (
+            status_counts.get(ApplicationStatus.INTERVIEW_SCHEDULED, 0)
+            + status_counts.get(ApplicationStatus.INTERVIEW_COMPLETED, 0)
+            + successful
+        )
+
+        rejected = status_counts.get(ApplicationStatus.REJECTED, 0)
+
+        return {
+            "total_applications": total,
+            "successful_applications": successful,
+            "success_rate": round((successful / total) * 100, 2),
+            "interview_rate": round((interviews / total) * 100, 2),
+            "rejection_rate": round((rejected / total) * 100, 2),
+            "breakdown": {
+                "draft": status_counts.get(ApplicationStatus.DRAFT, 0),
+                "submitted": status_counts.get(ApplicationStatus.SUBMITTED, 0),
+                "under_review": status_counts.get(
+                    ApplicationStatus.UNDER_REVIEW, 0
+                ),
+                "interview_scheduled": status_counts.get(
+                    ApplicationStatus.INTERVIEW_SCHEDULED, 0
+                ),
+                "interview_completed": status_counts.get(
+                    ApplicationStatus.INTERVIEW_COMPLETED, 0
+                ),
+                "offer_received": status_counts.get(
+                    ApplicationStatus.OFFER_RECEIVED, 0
+                ),
+                "offer_accepted": status_counts.get(
+                    ApplicationStatus.OFFER_ACCEPTED, 0
+                ),
+                "rejected": rejected,
+                "withdrawn": status_counts.get(ApplicationStatus.WITHDRAWN, 0),
+            },
+        }
+
     async def get_response_time_analysis(
         self,
         user_id: str,
         applications: Optional[Sequence[JobApplication]] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        rollups: Optional[ApplicationRollups] = None,
     ) -> Dict[str, Any]:
         """
         Analyze response times from companies.
@@ -155,6 +177,19 @@ class AnalyticsService:
         Returns average time to hear back, time to interview, etc.
         """
         try:
+            if rollups is not None and not start_date and not end_date:
+                return self._response_time_from_rollups(rollups)
+            if self._push_down(applications):
+                summary = await self.aggregator.status_summary(user_id, start_date, end_date)
+                return self._response_time_metrics(
+                    summary.responses,
+                    summary.response_days_sum,
+                    summary.fastest_response_days,
+                    summary.slowest_response_days,
+                    summary.interviews,
+                    summary.interview_days_sum,
+                )
+
             self._require_applications_or_repository(applications)
             if applications is None:
                 assert self.repository is not None
@@ -203,17 +238,66 @@ class AnalyticsService:
             self.logger.error(f"Error analyzing response times: {e}", exc_info=True)
             raise
 
+    def _response_time_from_rollups(self, rollups: ApplicationRollups) -> Dict[str, Any]:
+        """Response times from the per-day histogram, matching the per-row path."""
+        responses: Dict[int, int] = defaultdict(int)
+        interviews: Dict[int, int] = defaultdict(int)
+        for days, by_status in rollups.response_days.items():
+            for status, count in by_status.items():
+                if status != ApplicationStatus.SUBMITTED:
+                    responses[days] += count
+                if status in INTERVIEW_STATUSES:
+                    interviews[days] += count
+
+        return self._response_time_metrics(
+            sum(responses.values()),
+            sum(days * n for days, n in responses.items()),
+            min(responses) if responses else 0,
+            max(responses) if responses else 0,
+            sum(interviews.values()),
+            sum(days * n for days, n in interviews.items()),
+        )
+
+    def _response_time_metrics(
+        self,
+        total_responses: int,
+        response_days: int,
+        fastest: int,
+        slowest: int,
+        total_interviews: int,
+        interview_days: int,
+    ) -> Dict[str, Any]:
+        return {
+            "avg_response_time_days": round(response_days / total_responses, 1)
+            if total_responses
+            else 0,
+            "avg_interview_time_days": round(interview_days / total_interviews, 1)
+            if total_interviews
+            else 0,
+            "fastest_response_days": fastest,
+            "slowest_response_days": slowest,
+            "total_responses": total_responses,
+            "total_interviews": total_interviews,
+        }
+
     async def get_interview_performance(
         self,
         user_id: str,
         applications: Optional[Sequence[JobApplication]] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        rollups: Optional[ApplicationRollups] = None,
     ) -> Dict[str, Any]:
         """
         Track interview performance metrics.
         """
         try:
+            if rollups is not None and not start_date and not end_date:
+                return self._interview_metrics(rollups.by_status)
+            if self._push_down(applications):
+                summary = await self.aggregator.status_summary(user_id, start_date, end_date)
+                return self._interview_metrics(summary.status_counts)
+
             self._require_applications_or_repository(applications)
             if applications is None:
                 assert self.repository is not None
@@ -270,11 +354,26 @@ class AnalyticsService:
             )
             raise
 
+    def _interview_metrics(self, status_counts: Dict[str, int]) -> Dict[str, Any]:
+        total_interviews = sum(status_counts.get(s, 0) for s in INTERVIEW_STATUSES)
+        offers = sum(status_counts.get(s, 0) for s in OFFER_STATUSES)
+        return {
+            "total_interviews": total_interviews,
+            "offers_received": offers,
+            # An application in an interview status is never REJECTED.
+            "rejections_after_interview": 0,
+            "interview_to_offer_rate": round((offers / total_interviews) * 100, 2)
+            if total_interviews > 0
+            else 0,
+            "pending_interviews": total_interviews - offers,
+        }
+
     async def get_trend_analysis(
         self,
         user_id: str,
         days: int = 30,
         applications: Optional[Sequence[JobApplication]] = None,
+        rollups: Optional[ApplicationRollups] = None,
     ) -> Dict[str, Any]:
         """
         Analyze trends over time (time series data).
@@ -282,11 +381,33 @@ class AnalyticsService:
         Args:
             user_id: User ID
             days: Number of days to analyze
+            rollups: Precomputed counters. These are bucketed by week, so the
+                week containing the start of the period is counted whole.
         """
         try:
             end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=days)
 
+            if rollups is not None:
+                first_week = week_bucket(start_date)
+                return self._trend_summary(
+                    days,
+                    [
+                        (
+                            week,
+                            sum(by_status.values()),
+                            sum(by_status.get(s, 0) for s in INTERVIEW_STATUSES),
+                            sum(by_status.get(s, 0) for s in OFFER_STATUSES),
+                        )
+                        for week, by_status in sorted(rollups.by_week.items())
+                        if week >= first_week
+                    ],
+                )
+            if self._push_down(applications):
+                return self._trend_summary(
+                    days, await self.aggregator.weekly_counts(user_id, start_date)
+                )
+
             self._require_applications_or_repository(applications)
             if applications is None:
                 assert self.repository is not None
@@ -337,6 +458,62 @@ class AnalyticsService:
             self.logger.error(f"Error analyzing trends: {e}", exc_info=True)
             raise
 
+    def _trend_summary(
+        self, days: int, weekly: Sequence[Tuple[str, int, int, int]]
+    ) -> Dict[str, Any]:
+        trends = [
+            {"week": week, "applications": apps, "interviews": interviews, "offers": offers}
+            for week, apps, interviews, offers in weekly
+        ]
+        total = sum(week["applications"] for week in trends)
+        return {
+            "period_days": days,
+            "total_applications": total,
+            "weekly_trends": trends,
+            "avg_applications_per_week": round(total / (days / 7), 1)
+            if days > 0
+            else 0,
+        }
+
+    async def get_dashboard_metrics(
+        self,
+        user_id: str,
+        days: int = 30,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compute success, response-time, interview, trend and company metrics
+        together in three SQL statements. Requires an aggregator.
+
+        Returns:
+            Dictionary keyed like the dashboard: ``success_metrics``,
+            ``response_time_metrics``, ``interview_metrics``, ``trends`` and
+            ``companies``
+        """
+        if self.aggregator is None:
+            raise RuntimeError("AnalyticsService.get_dashboard_metrics requires an aggregator")
+        try:
+            summary = await self.aggregator.status_summary(user_id, start_date, end_date)
+            return {
+                "success_metrics": self._success_metrics(summary.status_counts),
+                "response_time_metrics": self._response_time_metrics(
+                    summary.responses,
+                    summary.response_days_sum,
+                    summary.fastest_response_days,
+                    summary.slowest_response_days,
+                    summary.interviews,
+                    summary.interview_days_sum,
+                ),
+                "interview_metrics": self._interview_metrics(summary.status_counts),
+                "trends": await self.get_trend_analysis(user_id, days=days),
+                "companies": await self.get_company_analysis(user_id),
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error computing dashboard metrics: {e}", exc_info=True)
+            raise
+
     async def get_skills_gap_analysis(
         self,
         user_id: str,
@@ -413,38 +590,15 @@ class AnalyticsService:
     ) -> Dict[str, Any]:
         """Fallback skills analysis using keyword matching."""
         # Extract required skills from job descriptions
-        all_required_skills = []
-        for app in applications:
-            job_description = getattr(app, "job_description", None) or app.notes
-            if job_description:
-                # Simple keyword extraction
-                common_skills = [
-                    "Python",
-                    "JavaScript",
-                    "React",
-                    "Node.js",
-                    "SQL",
-                    "AWS",
-                    "Docker",
-                    "Kubernetes",
-                    "Git",
-                    "CI/CD",
-                    "Agile",
-                    "REST API",
-                    "TypeScript",
-                    "Java",
-                    "C++",
-                    "Go",
-                    "Rust",
-                    "MongoDB",
-                    "PostgreSQL",
-                    "Redis",
-                    "GraphQL",
-                    "Microservices",
-                ]
-                for skill in common_skills:
-                    if skill.lower() in str(job_description).lower():
-                        all_required_skills.append(skill)
+        descriptions = [
+            str(getattr(app, "job_description", None) or app.notes or "")
+            for app in applications
+        ]
+        all_required_skills = [
+            skill
+            for skills in get_skill_matcher().extract_many(descriptions)
+            for skill in skills
+        ]
 
         # Count skill frequency
         skill_counts = defaultdict(int)
@@ -476,11 +630,32 @@ class AnalyticsService:
         self,
         user_id: str,
         applications: Optional[Sequence[JobApplication]] = None,
+        rollups: Optional[ApplicationRollups] = None,
     ) -> Dict[str, Any]:
         """
         Analyze applications by company.
         """
         try:
+            if rollups is not None:
+                return self._company_summary(
+                    {
+                        company: {
+                            "total": sum(by_status.values()),
+                            "interviews": sum(by_status.get(s, 0) for s in INTERVIEW_STATUSES),
+                            "offers": sum(by_status.get(s, 0) for s in OFFER_STATUSES),
+                            "rejections": by_status.get(ApplicationStatus.REJECTED, 0),
+                        }
+                        for company, by_status in rollups.by_company.items()
+                    }
+                )
+            if self._push_down(applications):
+                companies, total_companies = await self.aggregator.company_counts(user_id)
+                summary = self._company_summary(
+                    {row.pop("company"): row for row in companies}
+                )
+                summary["total_companies"] = total_companies
+                return summary
+
             self._require_applications_or_repository(applications)
             if applications is None:
                 assert self.repository is not None
@@ -511,30 +686,33 @@ class AnalyticsService:
                 if app.status == ApplicationStatus.REJECTED:
                     company_stats[company]["rejections"] += 1
 
-            # Convert to list and calculate success rates
-            company_list = []
-            for company, stats in company_stats.items():
-                success_rate = (
-                    (stats["offers"] / stats["total"] * 100)
-                    if stats["total"] > 0
-                    else 0
-                )
-                company_list.append(
-                    {
-                        "company": company,
-                        **stats,
-                        "success_rate": round(success_rate, 1),
-                    }
-                )
-
-            # Sort by total applications
-            company_list.sort(key=lambda x: x["total"], reverse=True)
-
-            return {
-                "companies": company_list[:20],  # Top 20 companies
-                "total_companies": len(company_stats),
-            }
+            return self._company_summary(company_stats)
 
         except Exception as e:
             self.logger.error(f"Error analyzing companies: {e}", exc_info=True)
             raise
+
+    def _company_summary(self, company_stats: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
+        # Convert to list and calculate success rates
+        company_list = []
+        for company, stats in company_stats.items():
+            success_rate = (
+                (stats["offers"] / stats["total"] * 100)
+                if stats["total"] > 0
+                else 0
+            )
+            company_list.append(
+                {
+                    "company": company,
+                    **stats,
+                    "success_rate": round(success_rate, 1),
+                }
+            )
+
+        # Sort by total applications
+        company_list.sort(key=lambda x: x["total"], reverse=True)
+
+        return {
+            "companies": company_list[:20],  # Top 20 companies
+            "total_companies": len(company_stats),
+        }
@@ -1,13 +1,19 @@
 """Unified application service implementation for the AI Job Application Assistant."""
 
 import uuid
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 from datetime import datetime, timedelta
 from collections import defaultdict
 
 from src.core.application_service import ApplicationService
 from src.models.application import JobApplication, ApplicationUpdateRequest, ApplicationStatus
 from src.services.local_file_service import LocalFileService
+from src.database.pagination import (
+    MAX_PAGE_SIZE,
+    Page,
+    iterate_pages,
+    paginate_sequence,
+)
 from src.database.repositories.application_repository import ApplicationRepository
 from loguru import logger
 from src.core.cache import cache_region
@@ -145,7 +151,7 @@ class ApplicationService(ApplicationService):
             else:
                 applications = list(self.applications.values())
                 # Sort by creation date, most recent first
-                applications.sort(key=lambda app: app.created_at, reverse=True)
+                applications.sort(key=lambda app: (app.created_at, app.id), reverse=True)
             
             self.logger.debug(f"Retrieved {len(applications)} applications")
             
@@ -169,7 +175,7 @@ class ApplicationService(ApplicationService):
                     if app.status == status
                 ]
                 # Sort by creation date, most recent first
-                applications.sort(key=lambda app: app.created_at, reverse=True)
+                applications.sort(key=lambda app: (app.created_at, app.id), reverse=True)
             
             self.logger.debug(f"Retrieved {len(applications)} applications with status {status}")
             return applications
@@ -178,6 +184,62 @@ class ApplicationService(ApplicationService):
             self.logger.error(f"Error getting applications by status {status}: {e}", exc_info=True)
             return []
     
+    async def get_applications_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status: Optional[ApplicationStatus] = None,
+    ) -> Page[JobApplication]:
+        """Get one keyset page of applications, newest first.
+        
+        Database errors propagate: an empty page would read as the end of
+        the list to ``iter_applications`` and cut exports short.
+        
+        Raises:
+            InvalidCursorError: If ``cursor`` is malformed
+        """
+        if self.repository:
+            rows = await self.repository.get_page(
+                user_id=user_id, limit=limit, cursor=cursor, status=status
+            )
+            return Page(
+                items=[row.to_model() for row in rows.items],
+                next_cursor=rows.next_cursor,
+            )
+        
+        applications = [
+            app for app in self.applications.values()
+            if status is None or app.status == status
+        ]
+        return paginate_sequence(applications, limit=limit, cursor=cursor)
+    
+    async def count_applications(
+        self, user_id: Optional[str] = None, status: Optional[ApplicationStatus] = None
+    ) -> int:
+        """Count applications, optionally filtered by user and status."""
+        try:
+            if self.repository:
+                return await self.repository.count(user_id=user_id, status=status)
+            return sum(
+                1 for app in self.applications.values()
+                if status is None or app.status == status
+            )
+        except Exception as e:
+            self.logger.error(f"Error counting applications: {e}", exc_info=True)
+            return 0
+    
+    async def iter_applications(
+        self, user_id: Optional[str] = None, status: Optional[ApplicationStatus] = None
+    ) -> AsyncIterator[JobApplication]:
+        """Stream all applications page by page without loading them at once."""
+        async for application in iterate_pages(
+            lambda cursor: self.get_applications_page(
+                user_id=user_id, limit=MAX_PAGE_SIZE, cursor=cursor, status=status
+            )
+        ):
+            yield application
+    
     async def update_application(self, application_id: str, updates: ApplicationUpdateRequest) -> Optional[JobApplication]:
         """Update application status and information."""
         try:
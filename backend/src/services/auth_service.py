@@ -8,6 +8,7 @@ from contextlib import asynccontextmanager
 import bcrypt
 
 from src.core.auth_service import AuthService
+from src.core.principal_cache import PrincipalCache
 from src.models.user import (
     User,
     UserRegister,
@@ -35,6 +36,14 @@ class JWTAuthService(AuthService):
         self.logger = get_logger(__name__)
         self._repository_class = UserRepository
         self.email_service = email_service
+        self.principal_cache: Optional[PrincipalCache] = (
+            PrincipalCache(
+                max_bytes=config.auth_principal_cache_max_bytes,
+                ttl=config.auth_principal_cache_ttl,
+            )
+            if config.auth_principal_cache_ttl > 0
+            else None
+        )
 
     async def initialize(self) -> None:
         """Initialize the service."""
@@ -62,10 +71,15 @@ class JWTAuthService(AuthService):
 
     def _create_access_token(self, user_id: str, email: str) -> str:
         """Create a JWT access token."""
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=config.jwt_access_token_expire_minutes
-        )
-        payload = {"sub": user_id, "email": email, "exp": expire, "type": "access"}
+        now = datetime.now(timezone.utc)
+        expire = now + timedelta(minutes=config.jwt_access_token_expire_minutes)
+        payload = {
+            "sub": user_id,
+            "email": email,
+            "iat": now,
+            "exp": expire,
+            "type": "access",
+        }
         return jwt.encode(
             payload, config.jwt_secret_key, algorithm=config.jwt_algorithm
         )
@@ -338,6 +352,7 @@ class JWTAuthService(AuthService):
 
                 # Invalidate the session
                 await repository.invalidate_session(refresh_token)
+                self._invalidate_principal(session_obj.user_id)
                 self.logger.info(
                     f"User logged out: {session_obj.user_id or user_id or 'unknown'}"
                 )
@@ -345,6 +360,7 @@ class JWTAuthService(AuthService):
             elif user_id:
                 # Token not in database but we have user_id - try to invalidate all user sessions
                 await repository.invalidate_all_user_sessions(user_id)
+                self._invalidate_principal(user_id)
                 self.logger.info(f"Invalidated all sessions for user: {user_id}")
                 return True
 
@@ -386,6 +402,7 @@ class JWTAuthService(AuthService):
             if not updated_user:
                 raise ValueError("User not found")
 
+            self._invalidate_principal(user_id)
             self.logger.info(f"User profile updated: {user_id}")
 
             return UserProfile(
@@ -421,6 +438,7 @@ class JWTAuthService(AuthService):
             if success:
                 # Invalidate all sessions (force re-login)
                 await repository.invalidate_all_user_sessions(user_id)
+                self._invalidate_principal(user_id)
                 self.logger.info(f"Password changed for user: {user_id}")
 
             return success
@@ -436,26 +454,60 @@ class JWTAuthService(AuthService):
             # Delete user
             success = await repository.delete(user_id)
             if success:
+                self._invalidate_principal(user_id)
                 self.logger.info(f"User deleted: {user_id}")
 
             return success
 
-    async def verify_token(self, token: str) -> Optional[str]:
-        """Verify JWT token and return user ID."""
+    def _decode_access_token(self, token: str) -> Optional[dict]:
+        """Decode and validate an access token, memoized per token."""
+        if self.principal_cache is not None:
+            claims = self.principal_cache.get_claims(token)
+            if claims is not None:
+                return claims
+
         try:
             payload = jwt.decode(
                 token, config.jwt_secret_key, algorithms=[config.jwt_algorithm]
             )
+        except JWTError:
+            return None
 
-            if payload.get("type") != "access":
-                return None
+        if payload.get("type") != "access" or not payload.get("sub"):
+            return None
 
-            user_id = payload.get("sub")
-            return user_id
+        if self.principal_cache is not None:
+            self.principal_cache.set_claims(token, payload)
+        return payload
 
-        except JWTError:
+    def _invalidate_principal(self, user_id: Optional[str]) -> None:
+        """Drop cached profiles for a user after a logout or account change."""
+        if user_id and self.principal_cache is not None:
+            self.principal_cache.invalidate_user(user_id)
+
+    async def verify_token(self, token: str) -> Optional[str]:
+        """Verify JWT token and return user ID."""
+        payload = self._decode_access_token(token)
+        return payload.get("sub") if payload else None
+
+    async def get_principal(self, token: str) -> Optional[UserProfile]:
+        """Resolve an access token to a user profile, using the principal cache."""
+        payload = self._decode_access_token(token)
+        if not payload:
             return None
 
+        user_id = payload["sub"]
+        issued_at = payload.get("iat")
+        if self.principal_cache is not None:
+            profile = self.principal_cache.get_profile(user_id, issued_at)
+            if profile is not None:
+                return profile
+
+        profile = await self.get_user_profile(user_id)
+        if profile is not None and self.principal_cache is not None:
+            self.principal_cache.set_profile(user_id, issued_at, profile)
+        return profile
+
     async def request_password_reset(self, reset_request: PasswordResetRequest) -> bool:
         """Request a password reset by generating a reset token."""
         async with self._get_session_repo() as (session, repository):
@@ -558,6 +610,7 @@ class JWTAuthService(AuthService):
                 await repository.clear_password_reset_token(user_id)
                 # Invalidate all sessions (force re-login)
                 await repository.invalidate_all_user_sessions(user_id)
+                self._invalidate_principal(user_id)
                 self.logger.info(f"Password reset successful for user: {user_id}")
 
             return success
@@ -578,6 +631,7 @@ class JWTAuthService(AuthService):
             success = await repository.delete(user_id)
 
             if success:
+                self._invalidate_principal(user_id)
                 self.logger.info(f"Account deleted for user: {user_id}")
 
             return success
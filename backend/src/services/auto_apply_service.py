@@ -31,6 +31,7 @@ from src.models.automation import (
 from src.models.job import Job, JobSearchRequest
 from src.models.resume import Resume
 from src.services.failure_logger import FailureLoggerService
+from src.services.job_match_service import job_match_service
 from src.services.rate_limiter import RateLimiter
 from src.utils.logger import get_logger
 
@@ -308,12 +309,12 @@ class AutoApplyService:
                         response
                     )
                     jobs_searched = total_jobs
-                    jobs_matched = total_jobs
+                    candidates = self._rank_candidates(criteria, jobs_by_platform)
+                    jobs_matched = len(candidates)
 
                     applied_limit = config.max_applications
                     platform_limits_initialized: set[str] = set()
-                    for platform, jobs in jobs_by_platform.items():
-                        platform_key = platform or "unknown"
+                    for platform_key, job in candidates:
                         if platform_key not in platform_limits_initialized:
                             defaults = RateLimiter.PLATFORM_LIMITS.get(platform_key)
                             if defaults:
@@ -325,65 +326,64 @@ class AutoApplyService:
                                 )
                             platform_limits_initialized.add(platform_key)
 
-                        for job in jobs:
-                            if jobs_applied >= applied_limit:
-                                break
-
-                            can_apply = await rate_limiter.can_apply(platform_key)
-                            if not can_apply.allowed:
-                                await failure_logger.log_rate_limit_error(
-                                    platform_key,
-                                    "Rate limit reached",
+                        if jobs_applied >= applied_limit:
+                            break
+
+                        can_apply = await rate_limiter.can_apply(platform_key)
+                        if not can_apply.allowed:
+                            await failure_logger.log_rate_limit_error(
+                                platform_key,
+                                "Rate limit reached",
+                                job_id=self._job_identifier(job),
+                            )
+                            errors.append(
+                                {
+                                    "type": "rate_limit",
+                                    "platform": platform_key,
+                                    "job_id": self._job_identifier(job),
+                                }
+                            )
+                            continue
+
+                        if self._is_external_job(job):
+                            await queue_repo.add_to_queue(
+                                DBAutoApplyJobQueue(
+                                    user_id=config.user_id,
                                     job_id=self._job_identifier(job),
-                                )
-                                errors.append(
-                                    {
-                                        "type": "rate_limit",
-                                        "platform": platform_key,
-                                        "job_id": self._job_identifier(job),
-                                    }
-                                )
-                                continue
-
-                            if self._is_external_job(job):
-                                await queue_repo.add_to_queue(
-                                    DBAutoApplyJobQueue(
-                                        user_id=config.user_id,
-                                        job_id=self._job_identifier(job),
-                                        platform=platform_key,
-                                        status="queued",
-                                    )
-                                )
-                                continue
-
-                            result = await self._apply_to_job(job, platform_key)
-                            jobs_applied += 1
-                            if result.get("success"):
-                                applications_successful += 1
-                                await rate_limiter.record_application(platform_key)
-                                await rate_repo.update_count(
-                                    config.user_id, platform_key
-                                )
-                            else:
-                                applications_failed += 1
-                                error_message = result.get(
-                                    "error", "Application failed"
-                                )
-                                await failure_logger.log_error(
-                                    task_name="apply_to_job",
                                     platform=platform_key,
-                                    error_type="application_error",
-                                    error_message=error_message,
-                                    job_id=self._job_identifier(job),
-                                )
-                                errors.append(
-                                    {
-                                        "type": "application_error",
-                                        "platform": platform_key,
-                                        "job_id": self._job_identifier(job),
-                                        "message": error_message,
-                                    }
+                                    status="queued",
                                 )
+                            )
+                            continue
+
+                        result = await self._apply_to_job(job, platform_key)
+                        jobs_applied += 1
+                        if result.get("success"):
+                            applications_successful += 1
+                            await rate_limiter.record_application(platform_key)
+                            await rate_repo.update_count(
+                                config.user_id, platform_key
+                            )
+                        else:
+                            applications_failed += 1
+                            error_message = result.get(
+                                "error", "Application failed"
+                            )
+                            await failure_logger.log_error(
+                                task_name="apply_to_job",
+                                platform=platform_key,
+                                error_type="application_error",
+                                error_message=error_message,
+                                job_id=self._job_identifier(job),
+                            )
+                            errors.append(
+                                {
+                                    "type": "application_error",
+                                    "platform": platform_key,
+                                    "job_id": self._job_identifier(job),
+                                    "message": error_message,
+                                }
+                            )
 
                     await activity_repo.update_activity(
                         activity.id,
@@ -424,6 +424,17 @@ class AutoApplyService:
                         screenshots=json.dumps(screenshots) if screenshots else None,
                     )
 
+    async def saved_searches(self) -> List[JobSearchRequest]:
+        """The searches ``run_cycle`` will run, for the search prefetcher."""
+        async with self._get_session() as session:
+            configs = await AutoApplyConfigRepository(session).get_active_configs()
+        return [
+            self._build_search_request(
+                self._parse_search_criteria(config.search_criteria), config
+            )
+            for config in configs
+        ]
+
     async def _apply_to_job(self, job: Job, platform: str) -> Dict[str, Any]:
         resume = Resume(
             name="Auto Apply Resume",
@@ -443,6 +454,37 @@ class AutoApplyService:
             additional_data={"source": "auto_apply", "platform": platform},
         )
 
+    def _rank_candidates(
+        self, criteria: Dict[str, Any], jobs_by_platform: Dict[str, List[Any]]
+    ) -> List[tuple[str, Any]]:
+        """Order search results by local match score, dropping weak matches.
+
+        The user's keywords, skills and optional resume text form the profile.
+        Without a profile, jobs keep their search order.
+        """
+        candidates = [
+            (platform or "unknown", job)
+            for platform, jobs in jobs_by_platform.items()
+            for job in jobs
+        ]
+        profile_skills = [
+            *(criteria.get("keywords") or []),
+            *(criteria.get("skills") or []),
+        ]
+        profile_text = " ".join(
+            [*profile_skills, str(criteria.get("resume_content") or "")]
+        ).strip()
+        if not candidates or not profile_text:
+            return candidates
+
+        scores = job_match_service.rank_texts(
+            profile_text,
+            [job_match_service.job_text(job) for _, job in candidates],
+            resume_skills=profile_skills or None,
+            min_score=float(criteria.get("min_match_score") or 0.0),
+        )
+        return [candidates[score.index] for score in scores]
+
     def _normalize_search_response(
         self, response: Any
     ) -> tuple[int, Dict[str, List[Any]]]:
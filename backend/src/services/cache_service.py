@@ -1,60 +1,62 @@
-"""In-memory TTL cache used by analytics endpoints.
+"""TTL cache used by analytics endpoints.
 
-This cache is process-local (per backend worker). It intentionally does not
-persist across restarts and does not share state across multiple workers.
+A thin adapter over the unified cache manager: entries live in the bounded
+``analytics`` namespace (shared through L2 when Redis is configured), and each
+user's entries form their own scope so invalidation is O(1).
 """
 
 from __future__ import annotations
 
-import asyncio
-import time
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Optional, Tuple
 
+from src.core.cache_manager import CacheManager, cache_manager
 
-@dataclass
-class _CacheEntry:
-    value: Any
-    expires_at: float
-
-    def is_expired(self, now: float) -> bool:
-        return now >= self.expires_at
+ANALYTICS_NAMESPACE = "analytics"
+ANALYTICS_MAX_BYTES = 32 * 1024 * 1024
 
 
 class AnalyticsCacheService:
-    """Simple in-memory TTL cache for aggregated analytics results."""
-
-    def __init__(self) -> None:
-        self._cache: Dict[str, _CacheEntry] = {}
-        self._lock = asyncio.Lock()
+    """TTL cache for aggregated analytics results.
+
+    Keys follow ``analytics:{user_id}:{endpoint}``; the user id becomes the
+    cache scope.
+    """
+
+    def __init__(self, manager: Optional[CacheManager] = None) -> None:
+        self._manager = manager or cache_manager
+        self._manager.register_namespace(
+            ANALYTICS_NAMESPACE, max_bytes=ANALYTICS_MAX_BYTES, default_ttl=300
+        )
+
+    @staticmethod
+    def _split_key(key: str) -> Tuple[Optional[str], str]:
+        prefix = f"{ANALYTICS_NAMESPACE}:"
+        if key.startswith(prefix):
+            parts = key[len(prefix):].split(":", 1)
+            if len(parts) == 2:
+                return parts[0], parts[1]
+        return None, key
 
     async def get(self, key: str) -> Optional[Any]:
         """Get cached value if present and not expired."""
-        now = time.monotonic()
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
-            if entry.is_expired(now):
-                self._cache.pop(key, None)
-                return None
-            return entry.value
+        scope, subkey = self._split_key(key)
+        return await self._manager.get(ANALYTICS_NAMESPACE, subkey, scope=scope)
 
     async def set(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
         """Store value with TTL (seconds)."""
-        expires_at = time.monotonic() + max(ttl_seconds, 0)
-        async with self._lock:
-            self._cache[key] = _CacheEntry(value=value, expires_at=expires_at)
+        scope, subkey = self._split_key(key)
+        await self._manager.set(
+            ANALYTICS_NAMESPACE, subkey, value, ttl=ttl_seconds, scope=scope
+        )
 
     async def delete(self, key: str) -> None:
         """Remove a cached value."""
-        async with self._lock:
-            self._cache.pop(key, None)
+        scope, subkey = self._split_key(key)
+        await self._manager.delete(ANALYTICS_NAMESPACE, subkey, scope=scope)
 
     async def clear(self) -> None:
         """Clear all cached values."""
-        async with self._lock:
-            self._cache.clear()
+        await self._manager.invalidate(ANALYTICS_NAMESPACE)
 
     async def cleanup(self) -> int:
         """Remove expired entries.
@@ -62,25 +64,15 @@ class AnalyticsCacheService:
         Returns:
             Number of removed entries.
         """
-        now = time.monotonic()
-        async with self._lock:
-            expired_keys = [k for k, v in self._cache.items() if v.is_expired(now)]
-            for key in expired_keys:
-                self._cache.pop(key, None)
-            return len(expired_keys)
-
-    async def invalidate_user(self, user_id: str) -> int:
+        return await self._manager.cleanup(ANALYTICS_NAMESPACE)
+
+    async def invalidate_user(self, user_id: str) -> None:
         """Invalidate all analytics cache entries for a user.
 
-        Returns:
-            Number of removed entries.
+        Bumps the user's generation instead of scanning keys; stale entries
+        age out of the bounded L1 on their own.
         """
-        prefix = f"analytics:{user_id}:"
-        async with self._lock:
-            keys = [k for k in self._cache.keys() if k.startswith(prefix)]
-            for key in keys:
-                self._cache.pop(key, None)
-            return len(keys)
+        await self._manager.invalidate(ANALYTICS_NAMESPACE, scope=user_id)
 
 
 # Process-wide singleton used by API routers/services.
@@ -1,12 +1,14 @@
 """Unified cover letter service implementation for the AI Job Application Assistant."""
 
 import uuid
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from datetime import datetime, timezone
 
 from src.core.cover_letter_service import CoverLetterService
 from src.models.cover_letter import CoverLetter, CoverLetterCreate, CoverLetterUpdate
 from src.core.ai_service import AIService
+from src.core.ai_stream import AIStreamEvent
+from src.database.pagination import InvalidCursorError, Page, paginate_sequence
 from src.database.repositories.cover_letter_repository import CoverLetterRepository
 from loguru import logger
 
@@ -40,6 +42,29 @@ class CoverLetterService(CoverLetterService):
             self.logger.error(f"Error getting all cover letters: {e}", exc_info=True)
             return []
     
+    async def get_cover_letters_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[CoverLetter]:
+        """Get one keyset page of cover letters, newest first.
+        
+        Raises:
+            InvalidCursorError: If ``cursor`` is malformed
+        """
+        try:
+            if self.repository:
+                return await self.repository.get_page(user_id=user_id, limit=limit, cursor=cursor)
+            
+            return paginate_sequence(list(self.cover_letters.values()), limit=limit, cursor=cursor)
+            
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error getting cover letters page: {e}", exc_info=True)
+            return Page()
+    
     async def get_cover_letter(self, cover_letter_id: str, user_id: Optional[str] = None) -> Optional[CoverLetter]:
         """Get a specific cover letter by ID, optionally filtered by user."""
         try:
@@ -232,6 +257,56 @@ class CoverLetterService(CoverLetterService):
             self.logger.error(f"Error generating cover letter: {e}", exc_info=True)
             raise
     
+    async def stream_cover_letter(
+        self,
+        job_title: str,
+        company_name: str,
+        job_description: str,
+        resume_summary: str,
+        tone: str = "professional",
+        user_id: Optional[str] = None
+    ) -> AsyncIterator[AIStreamEvent]:
+        """Generate a cover letter as a stream of events.
+        
+        The letter text streams as ``delta`` events; once it is complete the
+        letter is saved and sent, with its id, as the ``done`` event. Without
+        an AI service the template letter is saved and sent as ``done``.
+        """
+        self.logger.info(f"Streaming cover letter for {job_title} at {company_name}")
+        
+        if await self.ai_service.is_available():
+            from src.models.cover_letter import CoverLetterRequest
+            
+            ai_request = CoverLetterRequest(
+                job_title=job_title,
+                company_name=company_name,
+                job_description=job_description,
+                resume_summary=resume_summary,
+                tone=tone
+            )
+            async for event in self.ai_service.stream_cover_letter(ai_request):
+                if event.event != "done":
+                    yield event
+                    continue
+                generated = CoverLetter.model_validate(event.data)
+                cover_letter = await self.create_cover_letter(
+                    CoverLetterCreate(
+                        job_title=job_title,
+                        company_name=company_name,
+                        content=generated.content,
+                        tone=tone,
+                        word_count=generated.word_count
+                    ),
+                    user_id=user_id
+                )
+                yield AIStreamEvent("done", cover_letter.model_dump(mode="json"))
+            return
+        
+        cover_letter = await self._generate_template_cover_letter(
+            job_title, company_name, job_description, resume_summary, tone, user_id=user_id
+        )
+        yield AIStreamEvent("done", cover_letter.model_dump(mode="json"))
+    
     async def _generate_template_cover_letter(
         self, 
         job_title: str, 
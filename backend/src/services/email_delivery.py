@@ -0,0 +1,241 @@
+"""Asynchronous email delivery queue.
+
+Messages are accepted into a bounded queue and sent by a small pool of worker
+tasks. Each provider can declare a sustained send rate, which a token bucket
+enforces instead of fixed sleeps between messages. Callers either await the
+delivery result or fire and forget.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class OutboundEmail:
+    """A message waiting to be delivered."""
+
+    to_email: str
+    subject: str
+    body_html: str
+    body_text: str
+    attachments: Optional[List[Dict[str, Any]]] = None
+
+
+@dataclass
+class DeliveryMetrics:
+    """Counters for the delivery queue."""
+
+    queued: int = 0
+    sent: int = 0
+    failed: int = 0
+    retried: int = 0
+    rejected: int = 0
+    total_latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+
+    def record_delivery(self, latency: float, success: bool) -> None:
+        if success:
+            self.sent += 1
+        else:
+            self.failed += 1
+        self.total_latency_seconds += latency
+        self.max_latency_seconds = max(self.max_latency_seconds, latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        delivered = self.sent + self.failed
+        avg_latency = self.total_latency_seconds / delivered if delivered else 0.0
+        return {
+            "queued": self.queued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "retried": self.retried,
+            "rejected": self.rejected,
+            "avg_latency_ms": round(avg_latency * 1000, 2),
+            "max_latency_ms": round(self.max_latency_seconds * 1000, 2),
+        }
+
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` sends per second with bursts of ``burst``.
+
+    A rate of ``None`` or ``0`` disables shaping.
+    """
+
+    def __init__(self, rate: Optional[float], burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self.rate:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
+@dataclass
+class _QueueItem:
+    email: OutboundEmail
+    future: "asyncio.Future[bool]"
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class EmailDeliveryQueue:
+    """Bounded outbound queue drained by a pool of delivery workers.
+
+    Workers start lazily on the first submission, so the queue can be created
+    outside a running event loop.
+    """
+
+    def __init__(
+        self,
+        provider,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        max_retries: int = 2,
+        retry_backoff: float = 1.0,
+    ) -> None:
+        self.workers = max(workers, 1)
+        self.max_queue_size = max_queue_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.metrics = DeliveryMetrics()
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.set_provider(provider)
+
+    def set_provider(self, provider) -> None:
+        """Switch provider; its ``rate_limit`` (messages/second) shapes sends."""
+        self.provider = provider
+        rate = getattr(provider, "rate_limit", None)
+        self._bucket = TokenBucket(rate, burst=getattr(provider, "rate_burst", 1))
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    async def start(self) -> None:
+        """Start the worker pool if it is not already running."""
+        loop = asyncio.get_running_loop()
+        if self.running and self._loop is loop:
+            return
+        self._loop = loop
+        # asyncio primitives belong to one loop; rebuild them for this one.
+        self._bucket = TokenBucket(self._bucket.rate, self._bucket.burst)
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"email-delivery-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Email delivery queue started with {self.workers} workers")
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop the workers, optionally waiting for queued messages first."""
+        if not self._tasks:
+            return
+        if drain and self._queue is not None:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._queue is not None:
+            # Anything still queued after a non-draining stop is reported failed.
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if not item.future.done():
+                    item.future.set_result(False)
+        logger.info("Email delivery queue stopped")
+
+    async def submit(
+        self, email: OutboundEmail, wait: bool = True
+    ) -> "asyncio.Future[bool]":
+        """Queue a message and return a future resolving to its delivery result.
+
+        With ``wait=True`` a full queue applies backpressure; otherwise a full
+        queue rejects the message immediately with a failed future.
+        """
+        await self.start()
+        future: "asyncio.Future[bool]" = asyncio.get_running_loop().create_future()
+        item = _QueueItem(email=email, future=future)
+        if wait:
+            await self._queue.put(item)
+        else:
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self.metrics.rejected += 1
+                logger.warning(f"Email queue full; dropped message to {email.to_email}")
+                future.set_result(False)
+                return future
+        self.metrics.queued += 1
+        return future
+
+    async def send(self, email: OutboundEmail) -> bool:
+        """Queue a message and wait until it has been delivered or has failed."""
+        future = await self.submit(email)
+        return await future
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.metrics.to_dict(),
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_size": self.max_queue_size,
+            "workers": self.workers,
+            "running": self.running,
+            "rate_limit": self._bucket.rate,
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                success = await self._deliver(item.email)
+                self.metrics.record_delivery(
+                    time.monotonic() - item.enqueued_at, success
+                )
+                if not item.future.done():
+                    item.future.set_result(success)
+            except asyncio.CancelledError:
+                if not item.future.done():
+                    item.future.set_result(False)
+                raise
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, email: OutboundEmail) -> bool:
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.metrics.retried += 1
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            await self._bucket.acquire()
+            try:
+                if await self.provider.send_email(
+                    to_email=email.to_email,
+                    subject=email.subject,
+                    body_html=email.body_html,
+                    body_text=email.body_text,
+                    attachments=email.attachments,
+                ):
+                    return True
+            except Exception as e:
+                logger.error(f"Email provider error for {email.to_email}: {e}")
+        return False
@@ -7,13 +7,36 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 from typing import List, Optional, Dict, Any
+from src.services.email_delivery import EmailDeliveryQueue, OutboundEmail
 from src.utils.logger import get_logger
 from src.config import config
 
 
+# Refusals of a single message; smtplib resets the session after them, so
+# the connection can send again.
+_REFUSED_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+)
+
+
+class _MessageRefused(Exception):
+    """The server refused one message; ``connection`` is still usable."""
+
+    def __init__(self, error: smtplib.SMTPException, connection: smtplib.SMTP):
+        super().__init__(str(error))
+        self.connection = connection
+
+
 class EmailProvider(abc.ABC):
     """Abstract base class for email providers."""
 
+    # Sustained messages per second the provider accepts (None = unlimited);
+    # the delivery queue shapes sends to this rate.
+    rate_limit: Optional[float] = None
+    rate_burst: int = 1
+
     @abc.abstractmethod
     async def send_email(
         self,
@@ -55,7 +78,12 @@ class ConsoleEmailProvider(EmailProvider):
 
 
 class SMTPEmailProvider(EmailProvider):
-    """Email provider that sends emails via SMTP server."""
+    """Email provider that sends emails via SMTP server.
+
+    Keeps a small pool of persistent SMTP connections and runs the blocking
+    ``smtplib`` calls in worker threads, so sending never stalls the event
+    loop and consecutive messages skip the connect/STARTTLS/login handshake.
+    """
 
     def __init__(
         self,
@@ -66,6 +94,8 @@ class SMTPEmailProvider(EmailProvider):
         use_tls: bool = True,
         from_email: str = None,
         from_name: str = None,
+        pool_size: int = None,
+        rate_limit: Optional[float] = None,
     ):
         """Initialize SMTP email provider.
 
@@ -77,6 +107,8 @@ class SMTPEmailProvider(EmailProvider):
             use_tls: Whether to use TLS/SSL
             from_email: Sender email address
             from_name: Sender name
+            pool_size: Maximum number of open SMTP connections
+            rate_limit: Maximum messages per second (None for the configured default)
         """
         self.logger = get_logger(__name__)
         self.smtp_host = smtp_host or getattr(config, "SMTP_HOST", "localhost")
@@ -92,54 +124,96 @@ class SMTPEmailProvider(EmailProvider):
         self.from_name = from_name or getattr(
             config, "FROM_NAME", "Job Application Assistant"
         )
+        self.pool_size = pool_size or config.smtp_pool_size
+        self.rate_limit = (
+            rate_limit if rate_limit is not None else config.smtp_rate_limit
+        )
+        self.rate_burst = self.pool_size
 
-        self._connection: Optional[smtplib.SMTP] = None
-        self._connected = False
-
-    async def _get_connection(self) -> smtplib.SMTP:
-        """Get or create SMTP connection."""
-        if self._connected and self._connection:
-            return self._connection
+        self._idle: List[smtplib.SMTP] = []
+        self._slots = asyncio.Semaphore(self.pool_size)
 
-        try:
-            # Create connection
-            if self.smtp_port == 465:
-                # SSL connection
-                self._connection = smtplib.SMTP_SSL(
-                    self.smtp_host, self.smtp_port, timeout=30
-                )
-            else:
-                # TLS connection
-                self._connection = smtplib.SMTP(
-                    self.smtp_host, self.smtp_port, timeout=30
-                )
-                if self.use_tls:
-                    self._connection.starttls()
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection (blocking)."""
+        if self.smtp_port == 465:
+            # SSL connection
+            connection = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, timeout=30)
+        else:
+            # TLS connection
+            connection = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30)
+            if self.use_tls:
+                connection.starttls()
 
-            # Login if credentials provided
-            if self.smtp_user and self.smtp_password:
-                self._connection.login(self.smtp_user, self.smtp_password)
+        # Login if credentials provided
+        if self.smtp_user and self.smtp_password:
+            connection.login(self.smtp_user, self.smtp_password)
 
-            self._connected = True
-            self.logger.info(
-                f"Connected to SMTP server {self.smtp_host}:{self.smtp_port}"
-            )
-            return self._connection
+        self.logger.info(f"Connected to SMTP server {self.smtp_host}:{self.smtp_port}")
+        return connection
 
-        except Exception as e:
-            self.logger.error(f"Failed to connect to SMTP server: {e}", exc_info=True)
+    @staticmethod
+    def _quit(connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except Exception:
+            connection.close()
+
+    def _deliver(
+        self, connection: Optional[smtplib.SMTP], msg: MIMEMultipart
+    ) -> smtplib.SMTP:
+        """Send ``msg`` on ``connection`` (blocking), reconnecting once if it went stale.
+
+        Returns the connection to put back into the pool. If the server
+        refuses the message, ``_MessageRefused`` carries the connection back
+        for reuse; after any other failure the connection is closed.
+        """
+        if connection is None:
+            connection = self._connect()
+        try:
+            try:
+                connection.send_message(msg)
+                return connection
+            except _REFUSED_ERRORS:
+                raise
+            except (smtplib.SMTPServerDisconnected, ConnectionError, OSError) as e:
+                # Idle connections are routinely dropped by the server.
+                self.logger.info(f"SMTP connection lost ({e}); reconnecting")
+                connection.close()
+            connection = self._connect()
+            connection.send_message(msg)
+            return connection
+        except _REFUSED_ERRORS as e:
+            raise _MessageRefused(e, connection) from e
+        except BaseException:
+            self._quit(connection)
             raise
 
-    async def _close_connection(self):
-        """Close SMTP connection."""
-        if self._connection and self._connected:
-            try:
-                self._connection.quit()
-            except Exception as e:
-                self.logger.warning(f"Error closing SMTP connection: {e}")
-            finally:
-                self._connection = None
-                self._connected = False
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        body_html: str,
+        body_text: str,
+        attachments: Optional[List[Dict[str, Any]]] = None,
+    ) -> MIMEMultipart:
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = f"{self.from_name} <{self.from_email}>"
+        msg["To"] = to_email
+
+        # Attach plain text and HTML versions
+        msg.attach(MIMEText(body_text, "plain"))
+        msg.attach(MIMEText(body_html, "html"))
+
+        # Add attachments
+        for attachment in attachments or []:
+            filename = attachment.get("filename", "attachment")
+            content = attachment.get("content", b"")
+
+            part = MIMEApplication(content, Name=filename)
+            part["Content-Disposition"] = f'attachment; filename="{filename}"'
+            msg.attach(part)
+        return msg
 
     async def send_email(
         self,
@@ -162,42 +236,37 @@ class SMTPEmailProvider(EmailProvider):
             True if email sent successfully, False otherwise
         """
         try:
-            # Create message
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = f"{self.from_name} <{self.from_email}>"
-            msg["To"] = to_email
-
-            # Attach plain text and HTML versions
-            part1 = MIMEText(body_text, "plain")
-            part2 = MIMEText(body_html, "html")
-            msg.attach(part1)
-            msg.attach(part2)
-
-            # Add attachments
-            if attachments:
-                for attachment in attachments:
-                    filename = attachment.get("filename", "attachment")
-                    content = attachment.get("content", b"")
-                    mime_type = attachment.get("mime_type", "application/octet-stream")
-
-                    part = MIMEApplication(content, Name=filename)
-                    part["Content-Disposition"] = f'attachment; filename="{filename}"'
-                    msg.attach(part)
-
-            # Get connection and send
-            connection = await self._get_connection()
-            connection.send_message(msg)
-
-            self.logger.info(f"Sent email to {to_email}: {subject}")
-            return True
-
+            msg = self._build_message(
+                to_email, subject, body_html, body_text, attachments
+            )
         except Exception as e:
-            self.logger.error(f"Failed to send email to {to_email}: {e}", exc_info=True)
-            # Try to reconnect on next attempt
-            await self._close_connection()
+            self.logger.error(f"Failed to build email to {to_email}: {e}", exc_info=True)
             return False
 
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else None
+            try:
+                connection = await asyncio.to_thread(self._deliver, connection, msg)
+            except _MessageRefused as e:
+                self._idle.append(e.connection)
+                self.logger.error(f"SMTP server refused email to {to_email}: {e}")
+                return False
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to send email to {to_email}: {e}", exc_info=True
+                )
+                return False
+            self._idle.append(connection)
+
+        self.logger.info(f"Sent email to {to_email}: {subject}")
+        return True
+
+    async def close(self) -> None:
+        """Close all pooled SMTP connections."""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await asyncio.to_thread(self._quit, connection)
+
     async def test_connection(self) -> bool:
         """Test SMTP connection.
 
@@ -205,7 +274,8 @@ class SMTPEmailProvider(EmailProvider):
             True if connection successful, False otherwise
         """
         try:
-            await self._get_connection()
+            connection = await asyncio.to_thread(self._connect)
+            self._idle.append(connection)
             self.logger.info("SMTP connection test successful")
             return True
         except Exception as e:
@@ -237,6 +307,13 @@ class EmailService:
                 self.provider = ConsoleEmailProvider()
                 self.logger.info("Using console email provider (development mode)")
 
+        self.delivery = EmailDeliveryQueue(
+            self.provider,
+            workers=config.email_delivery_workers,
+            max_queue_size=config.email_queue_max_size,
+            max_retries=config.email_max_retries,
+        )
+
     def set_provider(self, provider: EmailProvider):
         """Set email provider at runtime.
 
@@ -244,8 +321,53 @@ class EmailService:
             provider: Email provider instance
         """
         self.provider = provider
+        self.delivery.set_provider(provider)
         self.logger.info(f"Changed email provider to {type(provider).__name__}")
 
+    async def send_email(
+        self,
+        to_email: str,
+        subject: str,
+        body_html: str,
+        body_text: str,
+        attachments: Optional[List[Dict[str, Any]]] = None,
+    ) -> bool:
+        """Send an email through the delivery queue and wait for the result.
+
+        Returns:
+            True if the provider accepted the email, False otherwise
+        """
+        return await self.delivery.send(
+            OutboundEmail(to_email, subject, body_html, body_text, attachments)
+        )
+
+    async def enqueue_email(
+        self,
+        to_email: str,
+        subject: str,
+        body_html: str,
+        body_text: str,
+        attachments: Optional[List[Dict[str, Any]]] = None,
+    ) -> "asyncio.Future[bool]":
+        """Queue an email without waiting for delivery.
+
+        Returns:
+            Future resolving to the delivery result
+        """
+        return await self.delivery.submit(
+            OutboundEmail(to_email, subject, body_html, body_text, attachments)
+        )
+
+    def get_delivery_stats(self) -> Dict[str, Any]:
+        """Get delivery queue metrics."""
+        return {"provider": type(self.provider).__name__, **self.delivery.stats()}
+
+    async def cleanup(self) -> None:
+        """Flush queued emails and close provider connections."""
+        await self.delivery.stop()
+        if hasattr(self.provider, "close"):
+            await self.provider.close()
+
     async def send_password_reset_email(
         self, to_email: str, reset_token: str, user_name: Optional[str] = None
     ):
@@ -280,4 +402,4 @@ class EmailService:
         </html>
         """
 
-        return await self.provider.send_email(to_email, subject, body_html, body_text)
+        return await self.send_email(to_email, subject, body_html, body_text)
@@ -2,7 +2,7 @@
 
 import csv
 import io
-from typing import List, Optional, Dict, Any
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
 from loguru import logger
@@ -31,6 +31,12 @@ except ImportError:
 
 from src.core.export_service import ExportService
 
+APPLICATION_CSV_HEADER = [
+    'ID', 'Job Title', 'Company', 'Status', 'Applied Date', 'Follow Up Date', 'Interview Date', 'Notes'
+]
+# Streamed CSV exports are flushed in chunks of about this many characters.
+CSV_CHUNK_CHARS = 64 * 1024
+
 
 class MultiFormatExportService(ExportService):
     """Export service supporting PDF, CSV, and Excel formats."""
@@ -397,56 +403,60 @@ class MultiFormatExportService(ExportService):
         writer = csv.writer(buffer)
         
         # Header
-        writer.writerow(['ID', 'Job Title', 'Company', 'Status', 'Applied Date', 'Follow Up Date', 'Interview Date', 'Notes'])
+        writer.writerow(APPLICATION_CSV_HEADER)
         
         # Data rows
         for app in applications:
-            applied_date = ""
-            if app.get('applied_date'):
-                try:
-                    if isinstance(app['applied_date'], str):
-                        dt = datetime.fromisoformat(app['applied_date'].replace('Z', '+00:00'))
-                    else:
-                        dt = app['applied_date']
-                    applied_date = dt.strftime('%Y-%m-%d')
-                except:
-                    applied_date = str(app.get('applied_date', ''))
-            
-            follow_up = ""
-            if app.get('follow_up_date'):
-                try:
-                    if isinstance(app['follow_up_date'], str):
-                        dt = datetime.fromisoformat(app['follow_up_date'].replace('Z', '+00:00'))
-                    else:
-                        dt = app['follow_up_date']
-                    follow_up = dt.strftime('%Y-%m-%d')
-                except:
-                    follow_up = str(app.get('follow_up_date', ''))
-            
-            interview = ""
-            if app.get('interview_date'):
-                try:
-                    if isinstance(app['interview_date'], str):
-                        dt = datetime.fromisoformat(app['interview_date'].replace('Z', '+00:00'))
-                    else:
-                        dt = app['interview_date']
-                    interview = dt.strftime('%Y-%m-%d')
-                except:
-                    interview = str(app.get('interview_date', ''))
-            
-            writer.writerow([
-                app.get('id', ''),
-                app.get('job_title', ''),
-                app.get('company', ''),
-                app.get('status', ''),
-                applied_date,
-                follow_up,
-                interview,
-                app.get('notes', '')
-            ])
+            writer.writerow(self._application_csv_row(app))
         
         return buffer.getvalue().encode('utf-8-sig')  # UTF-8 with BOM for Excel compatibility
     
+    async def stream_applications_csv(
+        self, applications: AsyncIterable[Dict[str, Any]]
+    ) -> AsyncIterator[bytes]:
+        """Export applications to CSV chunk by chunk as they are read.
+        
+        Produces the same bytes as the CSV ``export_applications`` without
+        holding every application in memory.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(APPLICATION_CSV_HEADER)
+        first = True
+        async for app in applications:
+            writer.writerow(self._application_csv_row(app))
+            if buffer.tell() >= CSV_CHUNK_CHARS:
+                yield buffer.getvalue().encode('utf-8-sig' if first else 'utf-8')
+                first = False
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell() or first:
+            yield buffer.getvalue().encode('utf-8-sig' if first else 'utf-8')
+    
+    def _application_csv_row(self, app: Dict[str, Any]) -> List[Any]:
+        """One application as a CSV row matching ``APPLICATION_CSV_HEADER``."""
+        return [
+            app.get('id', ''),
+            app.get('job_title', ''),
+            app.get('company', ''),
+            app.get('status', ''),
+            self._csv_date(app.get('applied_date')),
+            self._csv_date(app.get('follow_up_date')),
+            self._csv_date(app.get('interview_date')),
+            app.get('notes', ''),
+        ]
+    
+    def _csv_date(self, value: Any) -> str:
+        """Format a date or ISO string as YYYY-MM-DD, or pass it through."""
+        if not value:
+            return ""
+        try:
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            return value.strftime('%Y-%m-%d')
+        except:
+            return str(value)
+    
     def _export_resumes_csv(self, resumes: List[Dict[str, Any]]) -> bytes:
         """Export resumes to CSV."""
         buffer = io.StringIO()
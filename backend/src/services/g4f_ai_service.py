@@ -5,7 +5,9 @@ import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
+from src.core.ai_result_cache import AIRoute, degraded_result, record_route
 from src.core.ai_service import AIService
+from src.core.circuit_breaker import CircuitOpenError, get_breaker
 from src.models.resume import (
     ResumeOptimizationRequest,
     ResumeOptimizationResponse,
@@ -14,6 +16,8 @@ from src.models.resume import (
 from src.models.cover_letter import CoverLetterRequest, CoverLetter
 from src.models.career_insights import CareerInsightsRequest, CareerInsightsResponse
 from src.config import config
+from src.utils.prompt_compaction import fit_prompt_inputs
+from src.utils.skill_matcher import get_skill_matcher
 from loguru import logger
 
 
@@ -42,6 +46,8 @@ class G4FAIService(AIService):
         self.requests_today = 0
         self.cost_today = 0.0
 
+        self.breaker = get_breaker("g4f", probe=self._probe)
+
         # Load configuration
         self._load_configuration()
 
@@ -263,15 +269,16 @@ class G4FAIService(AIService):
                 return self._mock_improvement_suggestions()
 
             # Create the improvement suggestions prompt
+            resume, job = fit_prompt_inputs(resume_content, job_description, self.model_name)
             prompt = f"""
             Analyze this resume against the job description and provide specific improvement suggestions.
             Return only a JSON array of actionable suggestions.
             
             Resume content:
-            {resume_content}
+            {resume}
             
             Job description:
-            {job_description}
+            {job}
             
             Response format: ["suggestion1", "suggestion2", "suggestion3"]
             """
@@ -333,6 +340,7 @@ class G4FAIService(AIService):
         job_title: Optional[str] = None,
     ) -> str:
         """Build prompt for interview preparation."""
+        resume, job = fit_prompt_inputs(resume_content, job_description, self.model_name)
         return f"""
 You are an expert interview coach. Based on the job description and candidate's resume, generate comprehensive interview preparation materials.
 
@@ -340,10 +348,10 @@ Job Title: {job_title or "Not specified"}
 Company: {company_name or "Not specified"}
 
 Job Description:
-{job_description}
+{job}
 
 Candidate Resume:
-{resume_content[:2000]}
+{resume}
 
 Please provide a JSON response with the following structure:
 {{
@@ -399,6 +407,7 @@ Please provide a JSON response with the following structure:
             )
             return self._mock_interview_prep(None, None)
 
+    @degraded_result
     def _mock_interview_prep(
         self, job_title: Optional[str] = None, company_name: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -454,23 +463,37 @@ Please provide a JSON response with the following structure:
 
     async def is_available(self) -> bool:
         """Check if the G4F AI service is available."""
-        return self.client is not None
+        return self.client is not None and self.breaker.available()
+
+    async def _probe(self) -> bool:
+        """Health request used by the circuit breaker."""
+        return await self._complete("ping") is not None
+
+    async def _complete(self, prompt: str) -> Optional[str]:
+        # G4F client is synchronous, so we run it in executor
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._sync_generate_content, prompt)
 
     async def _generate_content(self, prompt: str) -> Optional[str]:
         """Generate content using G4F AI."""
+
+        async def complete() -> str:
+            response = await self._complete(prompt)
+            if response is None:
+                # _sync_generate_content swallows errors; count them here.
+                raise RuntimeError("G4F returned no content")
+            return response
+
         try:
             if not self.client:
                 return None
 
-            # G4F client is synchronous, so we run it in executor
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                self._sync_generate_content,
-                prompt,
-            )
-            return response
+            content = await self.breaker.call(complete)
+            record_route(AIRoute("g4f", self.model_name, self.temperature))
+            return content
 
+        except CircuitOpenError:
+            return None
         except Exception as e:
             self.logger.error(f"Error generating content with G4F: {e}", exc_info=True)
             return None
@@ -502,8 +525,9 @@ Please provide a JSON response with the following structure:
     ) -> str:
         """Create a prompt for ATS-optimized resume optimization."""
         # Safely access resume_content using getattr to avoid AttributeError
-        resume_content = getattr(request, "resume_content", None)
-        resume_content_str = resume_content[:3000] if resume_content else "Not provided"
+        resume, job = fit_prompt_inputs(
+            getattr(request, "resume_content", None), request.job_description, self.model_name
+        )
 
         return f"""
         You are an expert resume optimizer specializing in ATS (Applicant Tracking System) optimization. 
@@ -511,8 +535,8 @@ Please provide a JSON response with the following structure:
         
         Target Role: {request.target_role}
         Company: {request.company_name or "Not specified"}
-        Job Description: {request.job_description}
-        Resume Content: {resume_content_str}
+        Job Description: {job}
+        Resume Content: {resume or "Not provided"}
         
         Please provide a JSON response with the following structure:
         {{
@@ -579,13 +603,16 @@ Please provide a JSON response with the following structure:
 
     def _build_cover_letter_prompt(self, request: CoverLetterRequest) -> str:
         """Create a prompt for cover letter generation."""
+        resume, job = fit_prompt_inputs(
+            request.resume_summary, request.job_description, self.model_name
+        )
         return f"""
         You are an expert cover letter writer. Generate a personalized cover letter for the following job application.
         
         Job Title: {request.job_title}
         Company: {request.company_name}
-        Job Description: {request.job_description}
-        Resume Summary: {request.resume_summary}
+        Job Description: {job}
+        Resume Summary: {resume}
         Tone: {request.tone}
         Focus Areas: {", ".join(request.focus_areas or [])}
         Custom Instructions: {request.custom_instructions or "None"}
@@ -608,11 +635,12 @@ Please provide a JSON response with the following structure:
         self, resume_content: str, job_description: str
     ) -> str:
         """Create a prompt for job match analysis."""
+        resume, job = fit_prompt_inputs(resume_content, job_description, self.model_name)
         return f"""
         Analyze how well this resume matches the job description. Provide a detailed analysis.
         
-        Resume Content: {resume_content}
-        Job Description: {job_description}
+        Resume Content: {resume}
+        Job Description: {job}
         
         Please provide a JSON response with the following structure:
         {{
@@ -708,20 +736,7 @@ Please provide a JSON response with the following structure:
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skills from text response."""
         # Simple skill extraction fallback
-        common_skills = [
-            "Python",
-            "JavaScript",
-            "Java",
-            "React",
-            "Node.js",
-            "SQL",
-            "Git",
-            "Docker",
-            "AWS",
-            "Machine Learning",
-            "Data Analysis",
-        ]
-        return [skill for skill in common_skills if skill.lower() in text.lower()]
+        return get_skill_matcher().extract(text)
 
     def _extract_suggestions_from_text(self, text: str) -> List[str]:
         """Extract suggestions from text response."""
@@ -745,6 +760,7 @@ Please provide a JSON response with the following structure:
         return suggestions[:5]  # Limit to 5 suggestions
 
     # Mock methods for fallback functionality
+    @degraded_result
     def _mock_resume_optimization(
         self, request: ResumeOptimizationRequest
     ) -> ResumeOptimizationResponse:
@@ -772,6 +788,7 @@ Please provide a JSON response with the following structure:
             confidence_score=0.85,
         )
 
+    @degraded_result
     def _mock_cover_letter_generation(self, request: CoverLetterRequest) -> CoverLetter:
         """Mock cover letter generation response."""
         content = f"""Dear Hiring Manager,
@@ -797,6 +814,7 @@ Best regards,
             word_count=len(content.split()),
         )
 
+    @degraded_result
     def _mock_job_match_analysis(self) -> Dict[str, Any]:
         """Mock job match analysis response."""
         return {
@@ -820,6 +838,7 @@ Best regards,
             "confidence": 0.82,
         }
 
+    @degraded_result
     def _mock_skills_extraction(self) -> List[str]:
         """Mock skills extraction response."""
         return [
@@ -833,6 +852,7 @@ Best regards,
             "Node.js",
         ]
 
+    @degraded_result
     def _mock_improvement_suggestions(self) -> List[str]:
         """Mock improvement suggestions response."""
         return [
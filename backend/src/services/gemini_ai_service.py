@@ -2,10 +2,12 @@
 
 import asyncio
 import json
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from datetime import datetime, timezone
 
+from src.core.ai_result_cache import AIRoute, degraded_result, record_route
 from src.core.ai_service import AIService
+from src.core.circuit_breaker import CircuitOpenError, get_breaker
 from src.models.resume import (
     ResumeOptimizationRequest,
     ResumeOptimizationResponse,
@@ -15,6 +17,8 @@ from src.models.cover_letter import CoverLetterRequest, CoverLetter
 from src.models.career_insights import CareerInsightsRequest, CareerInsightsResponse
 from src.services.gemini_client import GeminiClient
 from src.config import config
+from src.utils.prompt_compaction import fit_prompt_inputs
+from src.utils.skill_matcher import get_skill_matcher
 from loguru import logger
 
 
@@ -43,6 +47,8 @@ class GeminiAIService(AIService):
         self.requests_today = 0
         self.cost_today = 0.0
 
+        self.breaker = get_breaker("gemini", probe=self._probe)
+
         # Load configuration
         self._load_configuration()
 
@@ -348,15 +354,16 @@ class GeminiAIService(AIService):
                 return self._mock_improvement_suggestions()
 
             # Create the improvement suggestions prompt
+            resume, job = fit_prompt_inputs(resume_content, job_description, self.model_name)
             prompt = f"""
             Analyze this resume against the job description and provide specific improvement suggestions.
             Return only a JSON array of actionable suggestions.
             
             Resume content:
-            {resume_content}
+            {resume}
             
             Job description:
-            {job_description}
+            {job}
             
             Response format: ["suggestion1", "suggestion2", "suggestion3"]
             """
@@ -443,6 +450,7 @@ class GeminiAIService(AIService):
         job_title: Optional[str] = None,
     ) -> str:
         """Build prompt for interview preparation."""
+        resume, job = fit_prompt_inputs(resume_content, job_description, self.model_name)
         return f"""
 You are an expert interview coach. Based on the job description and candidate's resume, generate comprehensive interview preparation materials.
 
@@ -450,10 +458,10 @@ Job Title: {job_title or "Not specified"}
 Company: {company_name or "Not specified"}
 
 Job Description:
-{job_description}
+{job}
 
 Candidate Resume:
-{resume_content[:2000]}  # Limit resume content to avoid token limits
+{resume}
 
 Please provide a JSON response with the following structure:
 {{
@@ -509,6 +517,7 @@ Please provide a JSON response with the following structure:
             )
             return self._mock_interview_prep(None, None)
 
+    @degraded_result
     def _mock_interview_prep(
         self, job_title: Optional[str] = None, company_name: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -596,34 +605,79 @@ Please provide a JSON response with the following structure:
 
     async def is_available(self) -> bool:
         """Check if the Gemini AI service is available."""
-        return self.client is not None and self.api_key is not None
+        return (
+            self.client is not None
+            and self.api_key is not None
+            and self.breaker.available()
+        )
+
+    async def _probe(self) -> bool:
+        """Health request used by the circuit breaker."""
+        return bool(self.client and await self.client.generate_content("ping"))
 
     async def _generate_content(self, prompt: str) -> Optional[str]:
         """Generate content using Gemini AI."""
+
+        async def complete() -> str:
+            response = await self.client.generate_content(prompt)
+            if response is None:
+                # GeminiClient swallows errors; count them here.
+                raise RuntimeError("Gemini returned no content")
+            return response
+
         try:
             if not self.client:
                 return None
 
-            return await self.client.generate_content(prompt)
+            content = await self.breaker.call(complete)
+            record_route(AIRoute("gemini", self.model_name, self.temperature))
+            return content
 
+        except CircuitOpenError:
+            return None
         except Exception as e:
             self.logger.error(
                 f"Error generating content with Gemini: {e}", exc_info=True
             )
             return None
 
+    async def stream_content(self, prompt: str) -> AsyncIterator[str]:
+        """Stream content from Gemini AI through the circuit breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker does not admit the call
+        """
+        if not self.client:
+            raise RuntimeError("Gemini client not initialized")
+        if not self.breaker.allow():
+            raise CircuitOpenError("Circuit for AI provider 'gemini' is open")
+        try:
+            async for delta in self.client.generate_content_stream(prompt):
+                yield delta
+        except (asyncio.CancelledError, GeneratorExit):
+            self.breaker.release()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        record_route(AIRoute("gemini", self.model_name, self.temperature))
+
     def _build_resume_optimization_prompt(
         self, request: ResumeOptimizationRequest
     ) -> str:
         """Create a prompt for ATS-optimized resume optimization."""
+        resume, job = fit_prompt_inputs(
+            request.resume_content, request.job_description, self.model_name
+        )
         return f"""
         You are an expert resume optimizer specializing in ATS (Applicant Tracking System) optimization. 
         Optimize the following resume for the target role and company, ensuring maximum ATS compatibility.
         
         Target Role: {request.target_role}
         Company: {request.company_name or "Not specified"}
-        Job Description: {request.job_description}
-        Resume Content: {request.resume_content[:3000] if request.resume_content else "Not provided"}
+        Job Description: {job}
+        Resume Content: {resume or "Not provided"}
         
         Please provide a JSON response with the following structure:
         {{
@@ -690,13 +744,16 @@ Please provide a JSON response with the following structure:
 
     def _build_cover_letter_prompt(self, request: CoverLetterRequest) -> str:
         """Create a prompt for cover letter generation."""
+        resume, job = fit_prompt_inputs(
+            request.resume_summary, request.job_description, self.model_name
+        )
         return f"""
         You are an expert cover letter writer. Generate a personalized cover letter for the following job application.
         
         Job Title: {request.job_title}
         Company: {request.company_name}
-        Job Description: {request.job_description}
-        Resume Summary: {request.resume_summary}
+        Job Description: {job}
+        Resume Summary: {resume}
         Tone: {request.tone}
         Focus Areas: {", ".join(request.focus_areas or [])}
         Custom Instructions: {request.custom_instructions or "None"}
@@ -719,11 +776,12 @@ Please provide a JSON response with the following structure:
         self, resume_content: str, job_description: str
     ) -> str:
         """Create a prompt for job match analysis."""
+        resume, job = fit_prompt_inputs(resume_content, job_description, self.model_name)
         return f"""
         Analyze how well this resume matches the job description. Provide a detailed analysis.
         
-        Resume Content: {resume_content}
-        Job Description: {job_description}
+        Resume Content: {resume}
+        Job Description: {job}
         
         Please provide a JSON response with the following structure:
         {{
@@ -944,20 +1002,7 @@ Focus on:
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skills from text response."""
         # Simple skill extraction fallback
-        common_skills = [
-            "Python",
-            "JavaScript",
-            "Java",
-            "React",
-            "Node.js",
-            "SQL",
-            "Git",
-            "Docker",
-            "AWS",
-            "Machine Learning",
-            "Data Analysis",
-        ]
-        return [skill for skill in common_skills if skill.lower() in text.lower()]
+        return get_skill_matcher().extract(text)
 
     def _extract_suggestions_from_text(self, text: str) -> List[str]:
         """Extract suggestions from text response."""
@@ -981,6 +1026,7 @@ Focus on:
         return suggestions[:5]  # Limit to 5 suggestions
 
     # Mock methods for fallback functionality
+    @degraded_result
     def _mock_resume_optimization(
         self, request: ResumeOptimizationRequest
     ) -> ResumeOptimizationResponse:
@@ -1008,6 +1054,7 @@ Focus on:
             confidence_score=0.85,
         )
 
+    @degraded_result
     def _mock_cover_letter_generation(self, request: CoverLetterRequest) -> CoverLetter:
         """Mock cover letter generation response."""
         content = f"""Dear Hiring Manager,
@@ -1033,6 +1080,7 @@ Best regards,
             word_count=len(content.split()),
         )
 
+    @degraded_result
     def _mock_job_match_analysis(self) -> Dict[str, Any]:
         """Mock job match analysis response."""
         return {
@@ -1056,6 +1104,7 @@ Best regards,
             "confidence": 0.82,
         }
 
+    @degraded_result
     def _mock_skills_extraction(self) -> List[str]:
         """Mock skills extraction response."""
         return [
@@ -1069,6 +1118,7 @@ Best regards,
             "Node.js",
         ]
 
+    @degraded_result
     def _mock_improvement_suggestions(self) -> List[str]:
         """Mock improvement suggestions response."""
         return [
@@ -1079,6 +1129,7 @@ Best regards,
             "Add industry-specific keywords",
         ]
 
+    @degraded_result
     def _mock_career_insights(
         self, request: CareerInsightsRequest
     ) -> CareerInsightsResponse:
@@ -1105,6 +1156,7 @@ Best regards,
             confidence_score=0.85,
         )
 
+    @degraded_result
     def _mock_skills_gap_analysis(self) -> Dict[str, Any]:
         """Mock skills gap analysis response."""
         return {
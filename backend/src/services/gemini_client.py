@@ -1,7 +1,7 @@
 """Gemini API Client wrapper."""
 
 import os
-from typing import Optional, List, Dict, Any
+from typing import AsyncIterator, Optional, List, Dict, Any
 from google import genai
 from google.genai import types
 from loguru import logger
@@ -86,3 +86,30 @@ class GeminiClient:
         except Exception as e:
             self.logger.error(f"Error generating content: {e}", exc_info=True)
             return None
+
+    async def generate_content_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream generated text using Gemini's ``generate_content_stream``.
+
+        Unlike ``generate_content``, errors propagate so a stream that breaks
+        part-way is not mistaken for a complete answer.
+
+        Args:
+            prompt: Input prompt text
+
+        Yields:
+            Text deltas as the model produces them
+        """
+        if not self.client:
+            raise RuntimeError("Gemini client not initialized")
+
+        stream = await self.client.aio.models.generate_content_stream(
+            model=self.model_name,
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                temperature=self.temperature,
+                max_output_tokens=self.max_tokens,
+            ),
+        )
+        async for chunk in stream:
+            if chunk.text:
+                yield chunk.text
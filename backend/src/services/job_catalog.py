@@ -0,0 +1,111 @@
+"""Persistent catalog of job postings seen in searches.
+
+Searches record every posting they return, with its full description and
+extracted fields, so job details can be served without scraping the posting
+again. The catalog is best-effort: when the database is unavailable it
+records nothing and every lookup misses.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable, List, Optional
+
+from loguru import logger
+
+from src.config import config
+from src.database.config import database_config
+from src.database.repositories.job_catalog_repository import JobCatalogRepository
+from src.models.job import Job
+from src.utils.job_urls import job_fingerprint
+
+
+@dataclass
+class CatalogEntry:
+    """A cataloged job and when a search or scrape last saw it."""
+
+    job: Job
+    last_seen_at: datetime
+    refresh_after: int
+
+    @property
+    def stale(self) -> bool:
+        """Whether the posting should be re-scraped."""
+        last_seen = self.last_seen_at
+        if last_seen.tzinfo is None:
+            last_seen = last_seen.replace(tzinfo=timezone.utc)
+        age = (datetime.now(timezone.utc) - last_seen).total_seconds()
+        return age > self.refresh_after
+
+
+class JobCatalog:
+    """Records and looks up jobs by canonical URL fingerprint."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        refresh_after: Optional[int] = None,
+    ):
+        """
+        Args:
+            session_factory: Returns an ``AsyncSession`` context manager;
+                defaults to the application database when it is initialized
+            refresh_after: Seconds before an entry is stale; defaults to
+                ``config.job_catalog_refresh_after``
+        """
+        self._session_factory = session_factory
+        self.refresh_after = (
+            config.job_catalog_refresh_after if refresh_after is None else refresh_after
+        )
+        self.logger = logger.bind(module="JobCatalog")
+
+    def _sessions(self) -> Optional[Callable]:
+        if self._session_factory is not None:
+            return self._session_factory
+        if database_config._initialized:
+            return database_config.get_session
+        return None
+
+    async def record(self, jobs: Iterable[Job]) -> int:
+        """Upsert ``jobs``; returns how many were stored."""
+        sessions = self._sessions()
+        jobs = [job for job in jobs if job.url]
+        if sessions is None or not jobs:
+            return 0
+        try:
+            async with sessions() as session:
+                return await JobCatalogRepository(session).upsert_many(
+                    jobs, seen_at=datetime.now(timezone.utc)
+                )
+        except Exception as e:
+            self.logger.warning(f"Failed to record {len(jobs)} jobs in catalog: {e}")
+            return 0
+
+    async def search(self, query: str, limit: int = 50) -> List[Job]:
+        """Full-text search over every job seen so far."""
+        sessions = self._sessions()
+        if sessions is None:
+            return []
+        try:
+            async with sessions() as session:
+                return await JobCatalogRepository(session).search(query, limit)
+        except Exception as e:
+            self.logger.warning(f"Job catalog search failed for '{query}': {e}")
+            return []
+
+    async def lookup(self, job_id: str) -> Optional[CatalogEntry]:
+        """Find a job by its catalog id or by any URL of the posting."""
+        sessions = self._sessions()
+        if sessions is None:
+            return None
+        if job_id.startswith(("http://", "https://")):
+            job_id = job_fingerprint(job_id)
+        try:
+            async with sessions() as session:
+                found = await JobCatalogRepository(session).get(job_id)
+        except Exception as e:
+            self.logger.warning(f"Job catalog lookup failed for {job_id}: {e}")
+            return None
+        if found is None:
+            return None
+        job, last_seen_at = found
+        return CatalogEntry(job, last_seen_at, self.refresh_after)
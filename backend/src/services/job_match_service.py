@@ -0,0 +1,206 @@
+"""Local, deterministic resume-to-job match scoring.
+
+Scores combine BM25 relevance of each job description to the resume text with
+the overlap between the resume's skills and the skills the job asks for (from
+the shared skill matcher). Everything runs in-process with NumPy, so hundreds
+of jobs can be ranked in milliseconds and weak candidates dropped before any
+LLM is asked for a detailed analysis.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models.job import Job
+from src.utils.skill_matcher import SkillMatcher, get_skill_matcher
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+_STOP_WORDS = frozenset(
+    """
+    a an and are as at be been by for from has have in is it its of on or our
+    that the their this to was we were will with you your they them who what
+    which while about into over under than then there these those can all any
+    """.split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stop words removed.
+
+    Keeps ``+``, ``#`` and inner dots so "c++", "c#" and "node.js" survive.
+    """
+    if not text:
+        return []
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in _STOP_WORDS
+    ]
+
+
+@dataclass
+class JobMatchScore:
+    """Match score for one job against one resume."""
+
+    index: int
+    score: float
+    text_score: float
+    skill_score: float
+    matched_skills: List[str] = field(default_factory=list)
+    missing_skills: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "score": self.score,
+            "text_score": self.text_score,
+            "skill_score": self.skill_score,
+            "matched_skills": self.matched_skills,
+            "missing_skills": self.missing_skills,
+        }
+
+
+class JobMatchService:
+    """Rank job descriptions against a resume without calling an LLM."""
+
+    def __init__(
+        self,
+        skill_matcher: Optional[SkillMatcher] = None,
+        text_weight: float = 0.4,
+        skill_weight: float = 0.6,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> None:
+        self._skill_matcher = skill_matcher
+        self.text_weight = text_weight
+        self.skill_weight = skill_weight
+        self.k1 = k1
+        self.b = b
+
+    @property
+    def skill_matcher(self) -> SkillMatcher:
+        if self._skill_matcher is None:
+            self._skill_matcher = get_skill_matcher()
+        return self._skill_matcher
+
+    def bm25_scores(self, query: str, documents: Sequence[str]) -> np.ndarray:
+        """BM25 score of every document for ``query``.
+
+        Only the query's terms matter to BM25, so the document-term matrix is
+        built over that vocabulary alone and scored with one matrix-vector
+        product.
+        """
+        n_docs = len(documents)
+        if n_docs == 0:
+            return np.zeros(0)
+
+        query_terms: Dict[str, int] = {}
+        for token in tokenize(query):
+            query_terms.setdefault(token, len(query_terms))
+        if not query_terms:
+            return np.zeros(n_docs)
+
+        tf = np.zeros((n_docs, len(query_terms)), dtype=np.float64)
+        doc_lengths = np.zeros(n_docs, dtype=np.float64)
+        for row, document in enumerate(documents):
+            tokens = tokenize(document)
+            doc_lengths[row] = len(tokens)
+            columns = [query_terms[t] for t in tokens if t in query_terms]
+            if columns:
+                np.add.at(tf[row], columns, 1.0)
+
+        avg_length = doc_lengths.mean() or 1.0
+        doc_freq = (tf > 0).sum(axis=0)
+        idf = np.log1p((n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+        norm = self.k1 * (1 - self.b + self.b * doc_lengths / avg_length)
+        weights = tf * (self.k1 + 1) / (tf + norm[:, None])
+        return weights @ idf
+
+    def rank_texts(
+        self,
+        resume_text: str,
+        descriptions: Sequence[str],
+        resume_skills: Optional[Iterable[str]] = None,
+        top_k: Optional[int] = None,
+        min_score: float = 0.0,
+    ) -> List[JobMatchScore]:
+        """Score descriptions against a resume, best match first.
+
+        ``text_score`` is BM25 relevance relative to the best description in
+        the batch; ``skill_score`` is the share of a job's recognised skills
+        the resume covers. The final score is their weighted sum in [0, 1].
+        """
+        if not descriptions:
+            return []
+
+        skills = (
+            list(resume_skills)
+            if resume_skills
+            else self.skill_matcher.extract(resume_text)
+        )
+        overlaps = self.skill_matcher.score_many(skills, descriptions)
+
+        bm25 = self.bm25_scores(resume_text, descriptions)
+        best = bm25.max() if bm25.size else 0.0
+        text_scores = bm25 / best if best > 0 else np.zeros(len(descriptions))
+        skill_scores = np.array([o.score for o in overlaps], dtype=np.float64)
+        combined = self.text_weight * text_scores + self.skill_weight * skill_scores
+
+        # Stable sort keeps the input order among equal scores.
+        order = np.argsort(-combined, kind="stable")
+        results = []
+        for index in order:
+            score = float(combined[index])
+            if score < min_score:
+                break
+            results.append(
+                JobMatchScore(
+                    index=int(index),
+                    score=round(score, 4),
+                    text_score=round(float(text_scores[index]), 4),
+                    skill_score=round(float(skill_scores[index]), 4),
+                    matched_skills=overlaps[index].matched,
+                    missing_skills=overlaps[index].missing,
+                )
+            )
+            if top_k is not None and len(results) >= top_k:
+                break
+        return results
+
+    def rank_jobs(
+        self,
+        resume_text: str,
+        jobs: Sequence[Job],
+        resume_skills: Optional[Iterable[str]] = None,
+        top_k: Optional[int] = None,
+        min_score: float = 0.0,
+    ) -> List[Tuple[Job, JobMatchScore]]:
+        """Rank ``Job`` models against a resume, best match first."""
+        scores = self.rank_texts(
+            resume_text,
+            [self.job_text(job) for job in jobs],
+            resume_skills=resume_skills,
+            top_k=top_k,
+            min_score=min_score,
+        )
+        return [(jobs[score.index], score) for score in scores]
+
+    @staticmethod
+    def job_text(job: Job | Dict[str, Any]) -> str:
+        """Text used to match a job: title, description and listed skills."""
+        if isinstance(job, dict):
+            parts = [job.get("title"), job.get("description")]
+            skills = job.get("skills") or []
+        else:
+            parts = [job.title, job.description]
+            skills = job.skills or []
+        return " ".join(str(p) for p in [*parts, *skills] if p)
+
+
+# Process-wide instance; the service is stateless apart from the shared matcher.
+job_match_service = JobMatchService()
@@ -4,18 +4,129 @@ import asyncio
 import hashlib
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 from loguru import logger
 import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from html import unescape
 from urllib.parse import urlparse
 from urllib.request import Request, urlopen
 
-from dogpile.cache.api import NO_VALUE
-from src.core.cache import cache_region
+from src.config import config
+from src.core import metrics
+from src.core.cache_manager import cache_manager
+from src.core.streaming import StreamEvent
 from src.core.job_search import JobSearchService
 from src.models.job import Job, JobSearchRequest, JobSearchResponse, ExperienceLevel
+from src.services.job_catalog import JobCatalog
+from src.utils.job_urls import job_fingerprint
+from src.utils.skill_matcher import get_skill_matcher
+
+
+JOB_SEARCH_CACHE_NAMESPACE = "job_search"
+JOB_SEARCH_FRESH_TTL_SECONDS = 15 * 60
+FALLBACK_FRESH_TTL_SECONDS = 5 * 60
+# How long past freshness a result may still be served while it refreshes.
+JOB_SEARCH_STALE_TTL_SECONDS = 10 * 60
+# First retry delay of a site scrape; doubles per attempt.
+SITE_RETRY_DELAY_SECONDS = 1
+# Search results carry a description snippet; the catalog keeps the full text.
+DESCRIPTION_SNIPPET_CHARS = 500
+
+# URL fragment -> portal name, checked in priority order.
+PLATFORM_DOMAINS = [
+    ("linkedin.com", "linkedin"),
+    ("indeed.com", "indeed"),
+    ("glassdoor.com", "glassdoor"),
+    ("google.com", "google_jobs"),
+    ("ziprecruiter.com", "zip_recruiter"),
+]
+
+# Patterns are compiled once at import; conversion runs them for every row.
+APPLY_URL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r'apply[^"]*"([^"]*)"',
+        r'application[^"]*"([^"]*)"',
+        r'apply-now[^"]*"([^"]*)"',
+        r'apply-button[^"]*"([^"]*)"',
+        r'https?://[^\s<>"]*apply[^\s<>"]*',
+        r'https?://[^\s<>"]*application[^\s<>"]*',
+    ]
+]
+_EMAIL = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+EMAIL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        _EMAIL,
+        rf"email[^:]*:\s*({_EMAIL})",
+        rf"contact[^:]*:\s*({_EMAIL})",
+        rf"send[^:]*:\s*({_EMAIL})",
+    ]
+]
+PHONE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"\+?1?\s*\(?[0-9]{3}\)?[\s.-]?[0-9]{3}[\s.-]?[0-9]{4}",
+        r"phone[^:]*:\s*([0-9\s\(\)\-\+\.]+)",
+        r"tel[^:]*:\s*([0-9\s\(\)\-\+\.]+)",
+        r"call[^:]*:\s*([0-9\s\(\)\-\+\.]+)",
+    ]
+]
+PHONE_CLEANUP_PATTERN = re.compile(r"[^\d\+\-\(\)\s]")
+REQUIREMENT_SECTION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in [
+        r"requirements?[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
+        r"qualifications?[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
+        r"what you need[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
+        r"you should have[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
+    ]
+]
+REQUIREMENT_SPLIT_PATTERN = re.compile(r"[•\-\*]\s*|\d+\.\s*|\n")
+SKILL_SECTION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in [
+        r"skills?[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
+        r"technologies?[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
+        r"tools?[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
+    ]
+]
+SKILL_SPLIT_PATTERN = re.compile(r"[•\-\*]\s*|,\s*|\n")
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+@dataclass
+class SiteResult:
+    """Outcome of scraping one site: ``ok``, ``cached``, ``timeout`` or ``error``."""
+
+    site: str
+    status: str
+    jobs: List[Job] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("ok", "cached")
+
+    def status_info(self) -> Dict[str, Any]:
+        """Per-site entry of ``search_metadata["sites"]``."""
+        info: Dict[str, Any] = {
+            "status": self.status,
+            "jobs": len(self.jobs),
+            "elapsed": round(self.elapsed, 3),
+        }
+        if self.error:
+            info["error"] = self.error
+        return info
 
 
 class JobSearchService(JobSearchService):
@@ -26,6 +137,18 @@ class JobSearchService(JobSearchService):
         self.logger = logger.bind(module="JobSearchService")
         self._initialized = False
         self._jobspy_available = False
+        # Searches currently running, keyed by search cache key.
+        self._inflight: Dict[str, "asyncio.Task[JobSearchResponse]"] = {}
+        # Per-site scrapes of those searches, so streams can join them.
+        self._inflight_sites: Dict[str, Dict[str, "asyncio.Future[SiteResult]"]] = {}
+        # Every scraped job is kept here so details need no second scrape.
+        self.catalog = JobCatalog()
+        # Background re-scrapes of stale catalog entries, keyed by job URL.
+        self._refreshing: Dict[str, "asyncio.Task[Optional[Job]]"] = {}
+        # Bounded pool for blocking JobSpy scrapes, created on first use.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Scrapes still running past their deadline, counted per site.
+        self._stragglers: Dict[str, int] = {}
 
         # Map our experience levels to platform parameters
         self.experience_mapping = {
@@ -79,32 +202,72 @@ class JobSearchService(JobSearchService):
     async def close(self) -> None:
         """Close the service and cleanup resources."""
         self._initialized = False
+        if self._executor is not None:
+            # Scrapes that missed their deadline may still be running.
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         self.logger.info("Job search service closed")
 
     async def search_jobs(self, request: JobSearchRequest) -> JobSearchResponse:
         """
         Search for jobs using available platforms.
 
+        Identical concurrent searches share a single scrape, and a recently
+        expired result is served immediately while one background refresh
+        replaces it.
+
         Args:
             request: Job search request parameters
 
         Returns:
             Job search results grouped by platform
         """
-        import time
+        cache_key = self._generate_search_cache_key(request)
 
+        cached = await cache_manager.get(JOB_SEARCH_CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            age = time.time() - cached["fetched_at"]
+            if age < cached["fresh_ttl"]:
+                self.logger.info(f"Cache hit for job search: {request.keywords}")
+                return cached["response"]
+
+            self.logger.info(
+                f"Serving stale job search ({age:.0f}s old) while refreshing: "
+                f"{request.keywords}"
+            )
+            self._start_search(request, cache_key)
+            return cached["response"]
+
+        # Shield so a disconnecting caller does not cancel the shared scrape.
+        return await asyncio.shield(self._start_search(request, cache_key))
+
+    def _start_search(
+        self, request: JobSearchRequest, cache_key: str
+    ) -> "asyncio.Task[JobSearchResponse]":
+        """Return the in-flight search for ``cache_key``, starting one if needed."""
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            self.logger.debug(f"Joining in-flight job search: {cache_key}")
+            return task
+
+        task = asyncio.ensure_future(self._search_and_cache(request, cache_key))
+        self._inflight[cache_key] = task
+
+        def _forget(done: "asyncio.Task[JobSearchResponse]") -> None:
+            if self._inflight.get(cache_key) is done:
+                del self._inflight[cache_key]
+                self._inflight_sites.pop(cache_key, None)
+
+        task.add_done_callback(_forget)
+        return task
+
+    async def _search_and_cache(
+        self, request: JobSearchRequest, cache_key: str
+    ) -> JobSearchResponse:
+        """Run the search against the platforms and cache successful results."""
         start_time = time.time()
 
         try:
-            # Generate cache key from search parameters
-            cache_key = self._generate_search_cache_key(request)
-
-            # Try to get from cache first (15 min TTL for job search results)
-            cached_response = cache_region.get(cache_key)
-            if cached_response is not NO_VALUE:
-                self.logger.info(f"Cache hit for job search: {request.keywords}")
-                return cached_response
-
             await self.initialize()
 
             self.logger.info(
@@ -114,14 +277,15 @@ class JobSearchService(JobSearchService):
 
             if self._jobspy_available:
                 try:
-                    response = await self._search_with_jobspy(request)
+                    response = await self._search_with_jobspy(request, cache_key)
                     elapsed_time = time.time() - start_time
                     self.logger.info(
                         f"JobSpy search completed: {response.total_jobs} jobs found "
                         f"across {len(response.jobs)} platforms in {elapsed_time:.2f}s"
                     )
-                    # Cache successful response (15 min TTL)
-                    cache_region.set(cache_key, response)
+                    await self._cache_search_response(
+                        cache_key, response, self._fresh_ttl(response)
+                    )
                     return response
                 except Exception as e:
                     self.logger.warning(
@@ -131,13 +295,15 @@ class JobSearchService(JobSearchService):
                     response = await self._search_with_fallback(
                         request, fallback_reason=str(e)
                     )
-                    # Cache fallback results with shorter TTL (5 min)
-                    cache_region.set(cache_key, response)
+                    await self._cache_search_response(
+                        cache_key, response, FALLBACK_FRESH_TTL_SECONDS
+                    )
                     return response
             else:
                 response = await self._search_with_fallback(request)
-                # Cache fallback results (5 min TTL)
-                cache_region.set(cache_key, response)
+                await self._cache_search_response(
+                    cache_key, response, FALLBACK_FRESH_TTL_SECONDS
+                )
                 return response
 
         except Exception as e:
@@ -161,8 +327,25 @@ class JobSearchService(JobSearchService):
                 },
             )
 
-    def _generate_search_cache_key(self, request: JobSearchRequest) -> str:
-        """Generate a unique cache key for a job search request."""
+    async def _cache_search_response(
+        self, cache_key: str, response: JobSearchResponse, fresh_ttl: int
+    ) -> None:
+        """Cache a response, keeping it servable as stale past its fresh TTL."""
+        await cache_manager.set(
+            JOB_SEARCH_CACHE_NAMESPACE,
+            cache_key,
+            {"fetched_at": time.time(), "fresh_ttl": fresh_ttl, "response": response},
+            ttl=fresh_ttl + JOB_SEARCH_STALE_TTL_SECONDS,
+        )
+
+    def _generate_search_cache_key(
+        self, request: JobSearchRequest, per_site: bool = False
+    ) -> str:
+        """Generate a unique cache key for a job search request.
+
+        With ``per_site`` the requested sites are left out, giving the prefix
+        that per-site results are cached under.
+        """
         # Create a deterministic hash of search parameters
         params = {
             "keywords": request.keywords,
@@ -174,77 +357,429 @@ class JobSearchService(JobSearchService):
             "hours_old": getattr(request, "hours_old", None),
             "experience_level": getattr(request, "experience_level", None),
         }
+        if not per_site:
+            params["sites"] = sorted(self._requested_sites(request))
         # Sort keys for consistency
         params_str = json.dumps(params, sort_keys=True)
         params_hash = hashlib.md5(params_str.encode()).hexdigest()
-        return f"job_search:{params_hash}"
+        return f"job_search:{'site:' if per_site else ''}{params_hash}"
 
-    async def _search_with_jobspy(self, request: JobSearchRequest) -> JobSearchResponse:
-        """Search using JobSpy library with retry logic."""
-        max_retries = 3
-        retry_delay = 1  # seconds
+    async def _search_with_jobspy(
+        self, request: JobSearchRequest, cache_key: str
+    ) -> JobSearchResponse:
+        """Search every requested site concurrently and merge what arrives.
 
-        for attempt in range(max_retries):
-            try:
-                from jobspy import scrape_jobs
+        Each site is scraped on its own worker with its own deadline and
+        retry budget, so a slow or failing site only costs its own results.
+        Site results are cached separately, so toggling sites reuses the
+        others. Falls back to mock data only when no site produced results.
+        """
+        site_tasks = self._site_tasks(request, cache_key)
 
-                # Convert our request to JobSpy parameters
-                jobspy_params = self._build_jobspy_params(request)
+        try:
+            with metrics.track_duration(
+                metrics.job_scrape_duration_seconds, source="jobspy"
+            ):
+                results = await asyncio.gather(*site_tasks.values())
+        except ImportError as e:
+            self.logger.warning(f"JobSpy import failed, cannot search: {e}")
+            return await self._search_with_fallback(
+                request, fallback_reason=f"JobSpy not available: {str(e)}"
+            )
+
+        return await self._merge_site_results(request, results)
+
+    def _site_tasks(
+        self, request: JobSearchRequest, cache_key: str
+    ) -> Dict[str, "asyncio.Future[SiteResult]"]:
+        """The per-site scrapes of the search for ``cache_key``, started once."""
+        tasks = self._inflight_sites.get(cache_key)
+        if tasks is None:
+            base_key = self._generate_search_cache_key(request, per_site=True)
+            tasks = {
+                site: asyncio.ensure_future(self._collect_site(site, request, base_key))
+                for site in self._requested_sites(request)
+            }
+            self._inflight_sites[cache_key] = tasks
+        return tasks
+
+    async def stream_search(self, request: JobSearchRequest) -> AsyncIterator[StreamEvent]:
+        """
+        Search for jobs, yielding each site's jobs as soon as that site is done.
 
-                self.logger.debug(
-                    f"JobSpy search attempt {attempt + 1}/{max_retries} "
-                    f"with params: {jobspy_params}"
+        Yields a ``site`` event per site (``site``, ``status``, ``elapsed``,
+        ``jobs``) and a final ``done`` event with ``total_jobs`` and
+        ``search_metadata``. Cached searches, whole or per site, stream at
+        once. A stream shares its scrape with identical concurrent searches,
+        streamed or not, and the merged result is cached for ``search_jobs``.
+        Sites still running when the client goes away finish in the
+        background and fill their per-site cache entries.
+
+        Args:
+            request: Job search request parameters
+        """
+        cache_key = self._generate_search_cache_key(request)
+        cached = await cache_manager.get(JOB_SEARCH_CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            if time.time() - cached["fetched_at"] >= cached["fresh_ttl"]:
+                self._start_search(request, cache_key)
+            for event in await self._replay_events(request, cached["response"]):
+                yield event
+            return
+
+        await self.initialize()
+        # Join (or start) the same single-flight search as ``search_jobs``.
+        search = self._start_search(request, cache_key)
+        if not self._jobspy_available:
+            response = await asyncio.shield(search)
+            for event in self._response_events(response, "fallback"):
+                yield event
+            return
+
+        try:
+            for next_done in asyncio.as_completed(
+                list(self._site_tasks(request, cache_key).values())
+            ):
+                result = await next_done
+                yield StreamEvent(
+                    "site",
+                    {
+                        **result.status_info(),
+                        "site": result.site,
+                        "jobs": [job.model_dump(mode="json") for job in result.jobs],
+                    },
                 )
+        except ImportError as e:
+            self.logger.warning(f"JobSpy import failed, cannot search: {e}")
 
-                # Run JobSpy search in executor to avoid blocking
-                loop = asyncio.get_event_loop()
-                jobs_df = await loop.run_in_executor(
-                    None, lambda: scrape_jobs(**jobspy_params)
+        response = await asyncio.shield(search)
+        if response.search_metadata.get("fallback_used"):
+            for event in self._response_events(response, "fallback"):
+                yield event
+        else:
+            yield self._summary_event(response)
+
+    async def prefetch_site(self, request: JobSearchRequest, site: str) -> "SiteResult":
+        """Scrape one site for ``request`` now, replacing its cached results.
+
+        Used by the saved-search prefetcher. The jobs are cached per site and
+        cataloged like those of any other search; a failed scrape leaves the
+        cached results in place.
+        """
+        await self.initialize()
+        if not self._jobspy_available:
+            return SiteResult(site, "error", error="JobSpy not available")
+        base_key = self._generate_search_cache_key(request, per_site=True)
+        try:
+            return await self._collect_site(site, request, base_key, refresh=True)
+        except ImportError as e:
+            return SiteResult(site, "error", error=f"JobSpy not available: {e}")
+
+    async def seed_search(
+        self, request: JobSearchRequest, results: Dict[str, "SiteResult"]
+    ) -> Optional[JobSearchResponse]:
+        """Cache the response to ``request`` from sites scraped for a wider search.
+
+        ``results`` may come from a request covering more sites or more
+        results; each site is cut to ``request.results_wanted`` (a per-site
+        limit, as in JobSpy) and cached under ``request``'s own keys, so
+        ``search_jobs(request)`` becomes a cache hit. Nothing is cached, and
+        None is returned, when no requested site succeeded.
+        """
+        base_key = self._generate_search_cache_key(request, per_site=True)
+        site_results: List[SiteResult] = []
+        for site in self._requested_sites(request):
+            result = results.get(site) or SiteResult(site, "error", error="not scraped")
+            if result.ok:
+                result = replace(result, jobs=result.jobs[: request.results_wanted])
+                await cache_manager.set(
+                    JOB_SEARCH_CACHE_NAMESPACE, f"{base_key}:{site}", result.jobs,
+                    ttl=JOB_SEARCH_FRESH_TTL_SECONDS,
                 )
+            site_results.append(result)
+        if not any(result.ok for result in site_results):
+            return None
 
-                # Convert JobSpy results to our format
-                response = self._convert_jobspy_results(jobs_df, request)
-                self.logger.info(
-                    f"JobSpy search succeeded on attempt {attempt + 1}: "
-                    f"{response.total_jobs} jobs found"
+        response = await self._merge_site_results(request, site_results)
+        await self._cache_search_response(
+            self._generate_search_cache_key(request), response, self._fresh_ttl(response)
+        )
+        return response
+
+    async def _replay_events(
+        self, request: JobSearchRequest, response: JobSearchResponse
+    ) -> List[StreamEvent]:
+        """Stream events for a cached response, shaped like the live ones.
+
+        Sites are replayed from ``search_metadata["sites"]``, including those
+        that timed out or failed; successful sites report ``cached`` as a
+        per-site cache hit does.
+        """
+        sites = response.search_metadata.get("sites")
+        if not sites:
+            return self._response_events(response, "cached")
+        base_key = self._generate_search_cache_key(request, per_site=True)
+        events = []
+        for site, info in sites.items():
+            info = dict(info)
+            jobs: List[Job] = []
+            if info["status"] in ("ok", "cached"):
+                cached = await cache_manager.get(
+                    JOB_SEARCH_CACHE_NAMESPACE, f"{base_key}:{site}"
                 )
-                return response
+                jobs = list(cached) if cached is not None else response.jobs.get(site, [])
+                info.update(status="cached", elapsed=0.0)
+            events.append(
+                StreamEvent(
+                    "site",
+                    {
+                        **info,
+                        "site": site,
+                        "jobs": [job.model_dump(mode="json") for job in jobs],
+                    },
+                )
+            )
+        events.append(self._summary_event(response))
+        return events
+
+    def _response_events(
+        self, response: JobSearchResponse, status: str
+    ) -> List[StreamEvent]:
+        """Stream events for an already complete response, one per platform."""
+        events = [
+            StreamEvent(
+                "site",
+                {
+                    "site": platform,
+                    "status": status,
+                    "jobs": [job.model_dump(mode="json") for job in jobs],
+                },
+            )
+            for platform, jobs in response.jobs.items()
+        ]
+        events.append(self._summary_event(response))
+        return events
+
+    def _summary_event(self, response: JobSearchResponse) -> StreamEvent:
+        return StreamEvent("done", response.model_dump(mode="json", exclude={"jobs"}))
+
+    def _fresh_ttl(self, response: JobSearchResponse) -> int:
+        """Partial and mock results expire sooner so missing sites are retried."""
+        metadata = response.search_metadata
+        if metadata.get("partial") or metadata.get("fallback_used"):
+            return FALLBACK_FRESH_TTL_SECONDS
+        return JOB_SEARCH_FRESH_TTL_SECONDS
+
+    async def _collect_site(
+        self, site: str, request: JobSearchRequest, base_key: str, refresh: bool = False
+    ) -> "SiteResult":
+        """``_search_site``, reporting unexpected failures as an ``error`` result."""
+        try:
+            return await self._search_site(site, request, base_key, refresh=refresh)
+        except ImportError:
+            raise
+        except Exception as e:
+            self.logger.error(f"JobSpy search for {site} failed: {e}")
+            return SiteResult(site, "error", error=str(e))
+
+    async def _merge_site_results(
+        self, request: JobSearchRequest, results: List["SiteResult"]
+    ) -> JobSearchResponse:
+        """Merge per-site results, falling back to mock data if none succeeded."""
+        succeeded = [result for result in results if result.ok]
+        if not succeeded:
+            reasons = "; ".join(f"{r.site}: {r.error}" for r in results)
+            self.logger.error(f"JobSpy search failed on every site: {reasons}")
+            return await self._search_with_fallback(
+                request, fallback_reason=f"JobSpy search failed: {reasons}"
+            )
+
+        jobs_by_platform: Dict[str, List[Job]] = {}
+        for result in succeeded:
+            for job in result.jobs:
+                jobs_by_platform.setdefault(job.portal.lower(), []).append(job)
+        total_jobs = sum(len(jobs) for jobs in jobs_by_platform.values())
+        metrics.job_scrape_jobs_total.labels("jobspy").inc(total_jobs)
+
+        return JobSearchResponse(
+            jobs=jobs_by_platform,
+            total_jobs=total_jobs,
+            search_metadata={
+                "keywords": request.keywords,
+                "location": request.location,
+                "experience_level": request.experience_level,
+                "sources": list(jobs_by_platform.keys()),
+                "sites": {result.site: result.status_info() for result in results},
+                "partial": len(succeeded) < len(results),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "method": "jobspy",
+            },
+        )
 
-            except ImportError as e:
-                self.logger.warning(f"JobSpy import failed, cannot retry: {e}")
-                # Cannot retry import errors
-                return await self._search_with_fallback(
-                    request, fallback_reason=f"JobSpy not available: {str(e)}"
+    def _requested_sites(self, request: JobSearchRequest) -> List[str]:
+        """The supported sites named in the request, or all of them."""
+        if request.sites:
+            sites = [site for site in request.sites if site in self.supported_platforms]
+            if sites:
+                return sites
+        return self.supported_platforms.copy()
+
+    async def _search_site(
+        self, site: str, request: JobSearchRequest, base_key: str, refresh: bool = False
+    ) -> "SiteResult":
+        """Scrape one site within its deadline, retrying network errors.
+
+        Cached results are returned unless ``refresh`` is set; they are only
+        replaced by a successful scrape.
+        """
+        cache_key = f"{base_key}:{site}"
+        if not refresh:
+            cached = await cache_manager.get(JOB_SEARCH_CACHE_NAMESPACE, cache_key)
+            if cached is not None:
+                return SiteResult(site, "cached", jobs=list(cached))
+
+        loop = asyncio.get_running_loop()
+        params = self._build_jobspy_params(request)
+        params["site_name"] = [site]
+        # The deadline runs from when a worker picks up the first attempt,
+        # not from when it was queued.
+        started: Optional[float] = None
+        deadline = 0.0
+        attempts = config.job_search_site_retries + 1
+
+        for attempt in range(attempts):
+            if self._stragglers.get(site):
+                # Don't tie up another worker on a site that is still hanging.
+                return SiteResult(
+                    site, "timeout",
+                    error="an earlier scrape is still running past its deadline",
+                )
+            worker_started = loop.create_future()
+            scrape = self._scrape_executor().submit(
+                self._scrape_site_jobs, params, request, loop, worker_started
+            )
+            result = asyncio.wrap_future(scrape)
+            await asyncio.wait({worker_started, result}, return_when=asyncio.FIRST_COMPLETED)
+            if started is None:
+                started = loop.time()
+                deadline = started + config.job_search_site_timeout
+            try:
+                with metrics.track_duration(
+                    metrics.job_scrape_duration_seconds, source=site
+                ):
+                    rows, jobs = await asyncio.wait_for(
+                        result, timeout=max(deadline - loop.time(), 0)
+                    )
+            except asyncio.TimeoutError:
+                self._abandon_scrape(site, scrape, loop)
+                self.logger.warning(
+                    f"JobSpy search for {site} missed its "
+                    f"{config.job_search_site_timeout:.0f}s deadline"
                 )
+                return SiteResult(
+                    site, "timeout", elapsed=loop.time() - started,
+                    error=f"no response within {config.job_search_site_timeout:.0f}s",
+                )
+            except ImportError:
+                raise
             except Exception as e:
                 error_msg = str(e)
                 is_network_error = any(
                     keyword in error_msg.lower()
                     for keyword in ["network", "connection", "timeout", "dns", "http"]
                 )
-
-                if attempt < max_retries - 1 and is_network_error:
-                    wait_time = retry_delay * (2**attempt)  # Exponential backoff
+                wait_time = SITE_RETRY_DELAY_SECONDS * (2**attempt)  # Exponential backoff
+                if (
+                    attempt < attempts - 1
+                    and is_network_error
+                    and loop.time() + wait_time < deadline
+                ):
                     self.logger.warning(
-                        f"JobSpy search failed (network error) on attempt {attempt + 1}: {e}. "
-                        f"Retrying in {wait_time}s..."
+                        f"JobSpy search for {site} failed (network error) on attempt "
+                        f"{attempt + 1}: {e}. Retrying in {wait_time}s..."
                     )
                     await asyncio.sleep(wait_time)
                     continue
-                else:
-                    self.logger.error(
-                        f"JobSpy search failed after {attempt + 1} attempts: {e}",
-                        exc_info=True,
-                    )
-                    # Fallback to mock search
-                    return await self._search_with_fallback(
-                        request, fallback_reason=f"JobSpy search failed: {error_msg}"
-                    )
+                self.logger.error(
+                    f"JobSpy search for {site} failed after {attempt + 1} attempts: {e}"
+                )
+                return SiteResult(
+                    site, "error", elapsed=loop.time() - started, error=error_msg
+                )
 
-        # Should not reach here, but just in case
-        return await self._search_with_fallback(
-            request, fallback_reason="JobSpy search failed after all retries"
-        )
+            metrics.job_scrape_jobs_total.labels(site).inc(rows)
+            await self._catalog_and_snip(jobs)
+            await cache_manager.set(
+                JOB_SEARCH_CACHE_NAMESPACE, cache_key, jobs,
+                ttl=JOB_SEARCH_FRESH_TTL_SECONDS,
+            )
+            return SiteResult(site, "ok", jobs=jobs, elapsed=loop.time() - started)
+
+        return SiteResult(site, "error", error="retries exhausted")
+
+    def _scrape_site_jobs(
+        self,
+        params: Dict[str, Any],
+        request: JobSearchRequest,
+        loop: asyncio.AbstractEventLoop,
+        worker_started: "asyncio.Future[None]",
+    ) -> Tuple[int, List[Job]]:
+        """Scrape one site and convert its rows (called on a scrape worker).
+
+        Returns the number of rows scraped and the converted jobs.
+        """
+        loop.call_soon_threadsafe(_resolve, worker_started)
+        jobs_df = self._run_scrape(params)
+        if jobs_df is None:
+            return 0, []
+        jobs = [
+            job
+            for site_jobs in self._convert_jobspy_results(jobs_df, request).jobs.values()
+            for job in site_jobs
+        ]
+        return len(jobs_df), jobs
+
+    def _abandon_scrape(
+        self, site: str, scrape: Future, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Track a scrape left running past its deadline until it finishes."""
+        if scrape.cancel():
+            return
+        self._stragglers[site] = self._stragglers.get(site, 0) + 1
+
+        def _finished(_: Future) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._straggler_finished, site)
+
+        scrape.add_done_callback(_finished)
+
+    def _straggler_finished(self, site: str) -> None:
+        remaining = self._stragglers.get(site, 0) - 1
+        if remaining > 0:
+            self._stragglers[site] = remaining
+        else:
+            self._stragglers.pop(site, None)
+
+    def _run_scrape(self, params: Dict[str, Any]):
+        """Run one blocking JobSpy scrape (called on a scrape worker)."""
+        from jobspy import scrape_jobs
+
+        return scrape_jobs(**params)
+
+    def _scrape_executor(self) -> ThreadPoolExecutor:
+        """The bounded worker pool that scrapes run on.
+
+        Every site of a search gets a worker, with one more per site for a
+        scrape abandoned past its deadline (a site gets no new scrapes while
+        one is still running).
+        """
+        if self._executor is None:
+            sites = len(self.supported_platforms)
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(config.job_search_workers, sites) + sites,
+                thread_name_prefix="jobspy",
+            )
+        return self._executor
 
     async def _search_with_fallback(
         self, request: JobSearchRequest, fallback_reason: Optional[str] = None
@@ -358,20 +893,8 @@ class JobSearchService(JobSearchService):
     ) -> List[Job]:
         """Search specific site using JobSpy."""
         try:
-            from jobspy import scrape_jobs
-
-            # Build parameters for single site search
-            jobspy_params = self._build_jobspy_params(request)
-            jobspy_params["site_name"] = [site]
-
-            # Run JobSpy search
-            loop = asyncio.get_event_loop()
-            jobs_df = await loop.run_in_executor(
-                None, lambda: scrape_jobs(**jobspy_params)
-            )
-
-            # Convert results
-            return self._convert_jobspy_results(jobs_df, request)
+            base_key = self._generate_search_cache_key(request, per_site=True)
+            return (await self._search_site(site, request, base_key)).jobs
 
         except Exception as e:
             self.logger.error(f"JobSpy search for {site} failed: {e}")
@@ -399,26 +922,30 @@ class JobSearchService(JobSearchService):
         """
         Get detailed job information by ID and platform.
 
+        Jobs seen in a search are served from the job catalog. A catalog entry
+        older than ``job_catalog_refresh_after`` is still returned while one
+        background scrape refreshes it.
+
         Args:
-            job_id: Job identifier
+            job_id: Job identifier (catalog id or posting URL)
             platform: Platform name
 
         Returns:
             Detailed job information or None if not found
         """
         try:
+            entry = await self.catalog.lookup(job_id)
+            if entry is not None:
+                if entry.stale:
+                    self._refresh_job_details(str(entry.job.url), platform)
+                return entry.job
+
             await self.initialize()
 
             job_url = self._normalize_job_url(job_id)
-            job = None
-
-            if self._jobspy_available:
-                job = await self._get_job_details_with_jobspy(job_id, platform, job_url)
-
-            if not job and job_url:
-                job = await self._scrape_job_details_from_url(job_url, platform)
-
+            job = await self._fetch_job_details(job_id, platform, job_url)
             if job:
+                await self.catalog.record([job])
                 return job
 
             mock_job = self._build_mock_job_details(job_id, platform, job_url)
@@ -429,6 +956,49 @@ class JobSearchService(JobSearchService):
             self.logger.error(f"Error getting job details: {e}")
             return None
 
+    async def _fetch_job_details(
+        self, job_id: str, platform: str, job_url: Optional[str]
+    ) -> Optional[Job]:
+        """Scrape a job posting, via JobSpy first and then the page itself."""
+        job = None
+        if self._jobspy_available:
+            job = await self._get_job_details_with_jobspy(job_id, platform, job_url)
+        if not job and job_url:
+            job = await self._scrape_job_details_from_url(job_url, platform)
+        return job
+
+    def _refresh_job_details(self, job_url: str, platform: str) -> None:
+        """Re-scrape a cataloged job in the background, once per URL at a time."""
+        if job_url in self._refreshing:
+            return
+
+        async def _refresh() -> Optional[Job]:
+            await self.initialize()
+            job = await self._fetch_job_details(job_url, platform, job_url)
+            if job:
+                await self.catalog.record([job])
+            return job
+
+        task = asyncio.ensure_future(_refresh())
+        self._refreshing[job_url] = task
+
+        def _forget(done: "asyncio.Task[Optional[Job]]") -> None:
+            self._refreshing.pop(job_url, None)
+            if not done.cancelled() and done.exception() is not None:
+                self.logger.warning(
+                    f"Background refresh of {job_url} failed: {done.exception()}"
+                )
+
+        task.add_done_callback(_forget)
+
+    async def _catalog_and_snip(self, jobs) -> None:
+        """Record scraped jobs in full, then cut their descriptions to a snippet."""
+        jobs = list(jobs)
+        await self.catalog.record(jobs)
+        for job in jobs:
+            if job.description and len(job.description) > DESCRIPTION_SNIPPET_CHARS:
+                job.description = job.description[:DESCRIPTION_SNIPPET_CHARS] + "..."
+
     def get_available_sites(self) -> List[str]:
         """Get list of available job search sites."""
         return self.supported_platforms.copy()
@@ -514,10 +1084,13 @@ class JobSearchService(JobSearchService):
             jobspy_params = self._build_jobspy_detail_params(platform, search_term)
 
             loop = asyncio.get_event_loop()
-            jobs_df = await loop.run_in_executor(
-                None,
-                lambda: scrape_jobs(**jobspy_params),
-            )
+            with metrics.track_duration(
+                metrics.job_scrape_duration_seconds, source="jobspy_detail"
+            ):
+                jobs_df = await loop.run_in_executor(
+                    None,
+                    lambda: scrape_jobs(**jobspy_params),
+                )
 
             if jobs_df is None or getattr(jobs_df, "empty", True):
                 return None
@@ -664,6 +1237,7 @@ class JobSearchService(JobSearchService):
             contact_phone = self._extract_contact_phone(description or "")
 
             return Job(
+                id=job_fingerprint(job_url),
                 title=title,
                 company=company,
                 location=location or "Unknown",
@@ -804,17 +1378,22 @@ class JobSearchService(JobSearchService):
     def _convert_jobspy_results(
         self, jobs_df, request: JobSearchRequest
     ) -> JobSearchResponse:
-        """Convert JobSpy results to our format."""
+        """Convert JobSpy results to our format.
+
+        Platforms are classified column-wise over the whole frame and rows are
+        read as plain dicts, avoiding a ``Series`` allocation per row.
+        """
         try:
             jobs_by_platform = {}
+            platforms = self._classify_platforms(jobs_df)
+            timestamp = datetime.now(timezone.utc)
 
-            for _, row in jobs_df.iterrows():
-                job = self._convert_job_row(row, request)
+            for row, platform in zip(jobs_df.to_dict("records"), platforms):
+                job = self._convert_job_row(
+                    row, request, platform=platform, timestamp=timestamp
+                )
                 if job:
-                    platform = job.portal.lower()
-                    if platform not in jobs_by_platform:
-                        jobs_by_platform[platform] = []
-                    jobs_by_platform[platform].append(job)
+                    jobs_by_platform.setdefault(job.portal.lower(), []).append(job)
 
             total_jobs = sum(len(jobs) for jobs in jobs_by_platform.values())
 
@@ -835,7 +1414,35 @@ class JobSearchService(JobSearchService):
             self.logger.error(f"Error converting JobSpy results: {e}", exc_info=True)
             raise
 
-    def _convert_job_row(self, row, request: JobSearchRequest) -> Optional[Job]:
+    def _classify_platforms(self, jobs_df) -> List[str]:
+        """Map every row's job URL to a portal name in one vectorized pass."""
+        if "job_url" not in jobs_df.columns:
+            return ["unknown"] * len(jobs_df)
+
+        import pandas as pd
+
+        urls = jobs_df["job_url"].astype(str).str.lower()
+        platforms = pd.Series("unknown", index=urls.index)
+        # Apply lowest priority first so earlier domains overwrite later ones.
+        for domain, platform in reversed(PLATFORM_DOMAINS):
+            platforms = platforms.mask(urls.str.contains(domain, regex=False), platform)
+        return platforms.tolist()
+
+    def _detect_platform(self, job_url: str) -> str:
+        """Return the portal name for a single job URL."""
+        url = job_url.lower()
+        for domain, platform in PLATFORM_DOMAINS:
+            if domain in url:
+                return platform
+        return "unknown"
+
+    def _convert_job_row(
+        self,
+        row,
+        request: JobSearchRequest,
+        platform: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> Optional[Job]:
         """Convert a JobSpy row to our Job model."""
         try:
             # Extract basic information
@@ -847,18 +1454,10 @@ class JobSearchService(JobSearchService):
             salary = str(row.get("salary", "Not specified"))
             posted_date = str(row.get("posted_date", "Recently"))
 
-            # Determine platform from URL
-            platform = "unknown"
-            if "linkedin.com" in job_url.lower():
-                platform = "linkedin"
-            elif "indeed.com" in job_url.lower():
-                platform = "indeed"
-            elif "glassdoor.com" in job_url.lower():
-                platform = "glassdoor"
-            elif "google.com" in job_url.lower():
-                platform = "google_jobs"
-            elif "ziprecruiter.com" in job_url.lower():
-                platform = "zip_recruiter"
+            if platform is None:
+                platform = self._detect_platform(job_url)
+            if timestamp is None:
+                timestamp = datetime.now(timezone.utc)
 
             # Extract application information
             apply_url = self._extract_apply_url(job_url, description)
@@ -870,16 +1469,17 @@ class JobSearchService(JobSearchService):
             requirements = self._extract_requirements(description)
             skills = self._extract_skills(description)
 
-            # Create Job object with enhanced application info
+            # Create Job object with enhanced application info. The full
+            # description is kept here; search responses snip it after the
+            # job is cataloged.
             job = Job(
+                id=job_fingerprint(job_url) if job_url else None,
                 title=title,
                 company=company,
                 location=location,
                 url=job_url,
                 portal=platform,
-                description=description[:500] + "..."
-                if len(description) > 500
-                else description,
+                description=description,
                 salary=salary,
                 posted_date=posted_date,
                 experience_level=request.experience_level,
@@ -893,8 +1493,8 @@ class JobSearchService(JobSearchService):
                 application_method=self._determine_application_method(
                     apply_url, contact_email, platform
                 ),
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+                created_at=timestamp,
+                updated_at=timestamp,
             )
 
             return job
@@ -906,17 +1506,8 @@ class JobSearchService(JobSearchService):
     def _extract_apply_url(self, job_url: str, description: str) -> Optional[str]:
         """Extract application URL from job information."""
         # Look for common apply button patterns
-        apply_patterns = [
-            r'apply[^"]*"([^"]*)"',
-            r'application[^"]*"([^"]*)"',
-            r'apply-now[^"]*"([^"]*)"',
-            r'apply-button[^"]*"([^"]*)"',
-            r'https?://[^\s<>"]*apply[^\s<>"]*',
-            r'https?://[^\s<>"]*application[^\s<>"]*',
-        ]
-
-        for pattern in apply_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
+        for pattern in APPLY_URL_PATTERNS:
+            match = pattern.search(description)
             if match:
                 url = match.group(1) if match.groups() else match.group(0)
                 if url.startswith("http"):
@@ -931,15 +1522,11 @@ class JobSearchService(JobSearchService):
 
     def _extract_contact_email(self, description: str) -> Optional[str]:
         """Extract contact email from job description."""
-        email_patterns = [
-            r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-            r"email[^:]*:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-            r"contact[^:]*:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-            r"send[^:]*:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-        ]
+        if "@" not in description:
+            return None
 
-        for pattern in email_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
+        for pattern in EMAIL_PATTERNS:
+            match = pattern.search(description)
             if match:
                 email = match.group(1) if match.groups() else match.group(0)
                 if "@" in email and "." in email.split("@")[1]:
@@ -949,19 +1536,12 @@ class JobSearchService(JobSearchService):
 
     def _extract_contact_phone(self, description: str) -> Optional[str]:
         """Extract contact phone from job description."""
-        phone_patterns = [
-            r"\+?1?\s*\(?[0-9]{3}\)?[\s.-]?[0-9]{3}[\s.-]?[0-9]{4}",
-            r"phone[^:]*:\s*([0-9\s\(\)\-\+\.]+)",
-            r"tel[^:]*:\s*([0-9\s\(\)\-\+\.]+)",
-            r"call[^:]*:\s*([0-9\s\(\)\-\+\.]+)",
-        ]
-
-        for pattern in phone_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
+        for pattern in PHONE_PATTERNS:
+            match = pattern.search(description)
             if match:
                 phone = match.group(1) if match.groups() else match.group(0)
                 # Clean up phone number
-                phone = re.sub(r"[^\d\+\-\(\)\s]", "", phone).strip()
+                phone = PHONE_CLEANUP_PATTERN.sub("", phone).strip()
                 if len(phone) >= 10:  # Minimum valid phone length
                     return phone
 
@@ -972,19 +1552,12 @@ class JobSearchService(JobSearchService):
         requirements = []
 
         # Look for requirements sections
-        req_patterns = [
-            r"requirements?[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
-            r"qualifications?[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
-            r"what you need[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
-            r"you should have[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
-        ]
-
-        for pattern in req_patterns:
-            match = re.search(pattern, description, re.IGNORECASE | re.DOTALL)
+        for pattern in REQUIREMENT_SECTION_PATTERNS:
+            match = pattern.search(description)
             if match:
                 req_text = match.group(1).strip()
                 # Split by common list indicators
-                req_items = re.split(r"[•\-\*]\s*|\d+\.\s*|\n", req_text)
+                req_items = REQUIREMENT_SPLIT_PATTERN.split(req_text)
                 requirements.extend(
                     [
                         item.strip()
@@ -998,64 +1571,16 @@ class JobSearchService(JobSearchService):
 
     def _extract_skills(self, description: str) -> List[str]:
         """Extract required skills from description."""
-        skills = []
-
-        # Common technical skills
-        tech_skills = [
-            "python",
-            "javascript",
-            "java",
-            "c++",
-            "c#",
-            "php",
-            "ruby",
-            "go",
-            "rust",
-            "react",
-            "angular",
-            "vue",
-            "node.js",
-            "django",
-            "flask",
-            "spring",
-            "aws",
-            "azure",
-            "gcp",
-            "docker",
-            "kubernetes",
-            "jenkins",
-            "git",
-            "sql",
-            "mongodb",
-            "postgresql",
-            "mysql",
-            "redis",
-            "elasticsearch",
-            "machine learning",
-            "ai",
-            "data science",
-            "statistics",
-            "analytics",
-        ]
-
-        # Look for skills in description
-        for skill in tech_skills:
-            if re.search(rf"\b{re.escape(skill)}\b", description, re.IGNORECASE):
-                skills.append(skill.title())
+        # Known technical skills, matched in a single pass over the taxonomy
+        skills = get_skill_matcher().extract(description)
 
         # Look for skill sections
-        skill_patterns = [
-            r"skills?[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
-            r"technologies?[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
-            r"tools?[^:]*:\s*(.*?)(?=\n\n|\n[A-Z]|$)",
-        ]
-
-        for pattern in skill_patterns:
-            match = re.search(pattern, description, re.IGNORECASE | re.DOTALL)
+        for pattern in SKILL_SECTION_PATTERNS:
+            match = pattern.search(description)
             if match:
                 skill_text = match.group(1).strip()
                 # Extract individual skills
-                skill_items = re.split(r"[•\-\*]\s*|,\s*|\n", skill_text)
+                skill_items = SKILL_SPLIT_PATTERN.split(skill_text)
                 skills.extend(
                     [
                         item.strip().title()
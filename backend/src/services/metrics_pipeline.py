@@ -0,0 +1,223 @@
+"""Bounded ingestion and pre-aggregation for performance metrics.
+
+``record`` only appends to a fixed-size ring buffer, so recording a metric is
+O(1) and memory stays bounded no matter how far persistence falls behind.
+When the buffer is full the configured overflow policy drops or samples
+samples and counts what it discarded. ``drain`` folds buffered samples into
+per-window aggregates (count/sum/min/max/histogram per name and tags), which
+are what gets persisted: one row per series per window instead of one row per
+sample.
+"""
+
+import bisect
+import json
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.core.metrics import monitoring_dropped_total, monitoring_queue_depth
+
+# Upper bounds of histogram buckets; suits millisecond timings and small counts.
+DEFAULT_HISTOGRAM_BUCKETS: Tuple[float, ...] = (
+    1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "sample")
+
+TagsKey = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class MetricAggregate:
+    """Summary of one metric series (name + tags) over one time window."""
+
+    metric_name: str
+    tags: TagsKey
+    window_start: datetime
+    buckets: Tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS
+    count: float = 0
+    total: float = 0.0
+    minimum: float = float("inf")
+    maximum: float = float("-inf")
+    bucket_counts: List[float] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.bucket_counts:
+            # One extra slot for values above the last bound.
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def add(self, value: float, weight: float = 1) -> None:
+        self.count += weight
+        self.total += value * weight
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += weight
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_row(self) -> Dict[str, Any]:
+        """Column values for a ``DBPerformanceMetric`` row."""
+        return {
+            "metric_name": self.metric_name,
+            "metric_value": self.mean,
+            "tags": json.dumps(dict(self.tags)) if self.tags else None,
+            "timestamp": self.window_start,
+            "sample_count": int(round(self.count)),
+            "value_sum": self.total,
+            "value_min": self.minimum,
+            "value_max": self.maximum,
+            "histogram": json.dumps(
+                {"le": list(self.buckets), "counts": self.bucket_counts}
+            ),
+        }
+
+
+@dataclass
+class PipelineStats:
+    accepted: int = 0
+    dropped: int = 0
+    sampled_out: int = 0
+    aggregates_flushed: int = 0
+    samples_flushed: int = 0
+
+
+class MetricsPipeline:
+    """Ring-buffer ingestion with windowed pre-aggregation.
+
+    Args:
+        capacity: Maximum buffered samples.
+        window_seconds: Aggregation window length.
+        overflow_policy: ``drop_oldest`` (ring buffer), ``drop_newest``, or
+            ``sample``. ``sample`` keeps one in ``sample_every`` samples once the
+            buffer is half full and weights kept samples so counts and sums
+            stay unbiased; a full buffer still drops.
+        sample_every: Sampling ratio for the ``sample`` policy.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        window_seconds: int = 10,
+        overflow_policy: str = "drop_oldest",
+        sample_every: int = 10,
+        buckets: Tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS,
+    ) -> None:
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy {overflow_policy!r}; "
+                f"expected one of {OVERFLOW_POLICIES}"
+            )
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self.overflow_policy = overflow_policy
+        self.sample_every = max(sample_every, 1)
+        self.buckets = buckets
+        self.stats = PipelineStats()
+        maxlen = capacity if overflow_policy == "drop_oldest" else None
+        self._buffer: Deque[Tuple[str, float, TagsKey, datetime, float]] = deque(
+            maxlen=maxlen
+        )
+        self._open: Dict[Tuple[str, TagsKey, datetime], MetricAggregate] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        metric_name: str,
+        metric_value: float,
+        tags: Optional[Dict[str, str]] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> bool:
+        """Buffer one sample; return False if the overflow policy discarded it."""
+        tags_key: TagsKey = tuple(sorted((str(k), str(v)) for k, v in (tags or {}).items()))
+        weight = 1.0
+        with self._lock:
+            depth = len(self._buffer)
+            if self.overflow_policy == "drop_oldest":
+                if depth >= self.capacity:
+                    self.stats.dropped += 1  # deque(maxlen) evicts the oldest
+                    monitoring_dropped_total.labels(reason="overflow").inc()
+            elif depth >= self.capacity:
+                self.stats.dropped += 1
+                monitoring_dropped_total.labels(reason="overflow").inc()
+                return False
+            elif self.overflow_policy == "sample" and depth >= self.capacity // 2:
+                if random.random() * self.sample_every >= 1:
+                    self.stats.sampled_out += 1
+                    monitoring_dropped_total.labels(reason="sampled").inc()
+                    return False
+                weight = float(self.sample_every)
+
+            self._buffer.append(
+                (
+                    metric_name,
+                    float(metric_value),
+                    tags_key,
+                    timestamp or datetime.now(),
+                    weight,
+                )
+            )
+            self.stats.accepted += 1
+            return True
+
+    def _window_start(self, timestamp: datetime) -> datetime:
+        epoch = timestamp.timestamp()
+        start = epoch - (epoch % self.window_seconds)
+        return datetime.fromtimestamp(start, tz=timestamp.tzinfo)
+
+    def drain(
+        self, now: Optional[datetime] = None, force: bool = False
+    ) -> List[MetricAggregate]:
+        """Aggregate buffered samples and return windows that have closed.
+
+        With ``force`` every open window is returned, e.g. on shutdown.
+        """
+        with self._lock:
+            samples = list(self._buffer)
+            self._buffer.clear()
+        monitoring_queue_depth.set(len(samples))
+
+        for name, value, tags_key, timestamp, weight in samples:
+            window = self._window_start(timestamp)
+            key = (name, tags_key, window)
+            aggregate = self._open.get(key)
+            if aggregate is None:
+                aggregate = MetricAggregate(name, tags_key, window, self.buckets)
+                self._open[key] = aggregate
+            aggregate.add(value, weight)
+
+        now = now or datetime.now()
+        width = timedelta(seconds=self.window_seconds)
+        closed = [
+            key
+            for key, aggregate in self._open.items()
+            if force or self._window_end_passed(aggregate.window_start + width, now)
+        ]
+        aggregates = [self._open.pop(key) for key in closed]
+        self.stats.aggregates_flushed += len(aggregates)
+        self.stats.samples_flushed += int(sum(a.count for a in aggregates))
+        return aggregates
+
+    @staticmethod
+    def _window_end_passed(window_end: datetime, now: datetime) -> bool:
+        if (window_end.tzinfo is None) != (now.tzinfo is None):
+            now = now.replace(tzinfo=window_end.tzinfo)
+        return window_end <= now
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue depth and drop counters for export."""
+        return {
+            "queue_depth": len(self._buffer),
+            "capacity": self.capacity,
+            "overflow_policy": self.overflow_policy,
+            "open_series": len(self._open),
+            "accepted": self.stats.accepted,
+            "dropped": self.stats.dropped,
+            "sampled_out": self.stats.sampled_out,
+            "aggregates_flushed": self.stats.aggregates_flushed,
+            "samples_flushed": self.stats.samples_flushed,
+        }
@@ -16,7 +16,7 @@ except ImportError:
 from src.core.monitoring_service import MonitoringService
 from src.database.repositories.monitoring_repository import MonitoringRepository
 from src.database.config import get_database, database_config
-from src.database.models import DBPerformanceMetric
+from src.services.metrics_pipeline import MetricsPipeline
 from src.utils.logger import get_logger
 from src.config import config
 
@@ -29,9 +29,13 @@ class DatabaseMonitoringService(MonitoringService):
         self.session = session
         self.repository: Optional[MonitoringRepository] = None
         self.logger = get_logger(__name__)
-        self._metrics_queue: List[Dict[str, Any]] = []
-        self._batch_size = 100
-        self._batch_interval = 5  # seconds
+        self._metrics = MetricsPipeline(
+            capacity=config.metrics_buffer_size,
+            window_seconds=config.metrics_window_seconds,
+            overflow_policy=config.metrics_overflow_policy,
+            sample_every=config.metrics_sample_every,
+        )
+        self._batch_interval = config.metrics_flush_interval  # seconds
         
         # Start background task for batch processing
         self._background_task: Optional[asyncio.Task] = None
@@ -55,50 +59,47 @@ class DatabaseMonitoringService(MonitoringService):
             self._background_task = asyncio.create_task(self._process_metrics_batch())
     
     async def _process_metrics_batch(self):
-        """Process metrics in batches using a new session for each batch."""
+        """Periodically persist closed aggregation windows."""
         while True:
             try:
                 await asyncio.sleep(self._batch_interval)
-                
-                if not self._metrics_queue:
-                    continue
-                
-                # Get batch of metrics
-                batch = self._metrics_queue[:self._batch_size]
-                self._metrics_queue = self._metrics_queue[self._batch_size:]
-                
-                # Create a new session for this batch to avoid concurrency issues
-                # Use context manager to ensure proper cleanup
-                async with database_config.get_session() as session:
-                    # Process batch with new session - add all metrics first, then commit once
-                    import json
-                    
-                    for metric_data in batch:
-                        try:
-                            timestamp = metric_data.get("timestamp") or datetime.now()
-                            db_metric = DBPerformanceMetric(
-                                metric_name=metric_data["metric_name"],
-                                metric_value=metric_data["metric_value"],
-                                tags=json.dumps(metric_data.get("tags")) if metric_data.get("tags") else None,
-                                timestamp=timestamp
-                            )
-                            session.add(db_metric)
-                        except Exception as e:
-                            self.logger.error(f"Error adding metric to batch: {e}", exc_info=True)
-                    
-                    # Commit all metrics in the batch at once
-                    try:
-                        await session.commit()
-                        self.logger.debug(f"Committed batch of {len(batch)} metrics")
-                    except Exception as e:
-                        await session.rollback()
-                        self.logger.error(f"Error committing metrics batch: {e}", exc_info=True)
-                
+                await self.flush_metrics()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error(f"Error in metrics batch processing: {e}", exc_info=True)
     
+    async def flush_metrics(self, force: bool = False) -> int:
+        """Aggregate buffered metrics and bulk insert closed windows.
+        
+        Args:
+            force: Also flush windows that are still open (used on shutdown).
+        
+        Returns:
+            Number of aggregate rows written
+        """
+        aggregates = self._metrics.drain(force=force)
+        if not aggregates:
+            return 0
+        
+        rows = [aggregate.to_row() for aggregate in aggregates]
+        try:
+            # Create a new session for this batch to avoid concurrency issues
+            async with database_config.get_session() as session:
+                written = await MonitoringRepository(session).bulk_insert_metrics(rows)
+            self.logger.debug(
+                f"Persisted {written} metric aggregates "
+                f"({sum(a.count for a in aggregates):.0f} samples)"
+            )
+            return written
+        except Exception as e:
+            self.logger.error(f"Error persisting metrics batch: {e}", exc_info=True)
+            return 0
+    
+    def get_pipeline_stats(self) -> Dict[str, Any]:
+        """Get metrics pipeline queue depth and drop counters."""
+        return self._metrics.snapshot()
+    
     async def record_metric(
         self,
         metric_name: str,
@@ -108,13 +109,8 @@ class DatabaseMonitoringService(MonitoringService):
     ) -> None:
         """Record a performance metric asynchronously."""
         try:
-            # Add to queue for batch processing
-            self._metrics_queue.append({
-                "metric_name": metric_name,
-                "metric_value": metric_value,
-                "tags": tags,
-                "timestamp": timestamp or datetime.now()
-            })
+            # Buffer for windowed aggregation; bounded by the overflow policy
+            self._metrics.record(metric_name, metric_value, tags, timestamp)
             
             # Start background task if not running
             await self._start_background_task()
@@ -246,7 +242,7 @@ class DatabaseMonitoringService(MonitoringService):
                     limit=1000
                 )
                 
-                total_requests = len(recent_metrics)
+                total_requests = sum(m.sample_count or 1 for m in recent_metrics)
                 total_errors = len(recent_errors)
                 
                 if total_requests > 0:
@@ -655,17 +651,20 @@ class DatabaseMonitoringService(MonitoringService):
                         metric_name = metric.metric_name if hasattr(metric, 'metric_name') else metric.get("metric_name")
                         metric_value = metric.metric_value if hasattr(metric, 'metric_value') else metric.get("metric_value")
                         
+                        # Window rows from the metrics pipeline stand for several samples
+                        weight = getattr(metric, "sample_count", None) or 1
+                        
                         key = (metric_name, hour_key.isoformat())
                         
                         if key not in grouped:
                             grouped[key] = []
-                        grouped[key].append(metric_value)
+                        grouped[key].append((metric_value * weight, weight))
                     
                     # Create aggregated metrics
                     for (metric_name, hour_str), values in grouped.items():
                         await repo.create_metric(
                             metric_name=f"{metric_name}.hourly",
-                            metric_value=sum(values) / len(values),
+                            metric_value=sum(v for v, _ in values) / sum(w for _, w in values),
                             tags={"aggregation": "hourly", "hour": hour_str},
                             timestamp=datetime.fromisoformat(hour_str)
                         )
@@ -761,6 +760,9 @@ class DatabaseMonitoringService(MonitoringService):
                 except asyncio.CancelledError:
                     pass
             
+            # Persist whatever is still buffered, including open windows
+            await self.flush_metrics(force=True)
+            
             # Cancel all pending alert evaluation tasks
             for task in self._alert_tasks:
                 if not task.done():
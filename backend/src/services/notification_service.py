@@ -13,6 +13,10 @@ from src.models.push_subscription import PushMessage
 class NotificationService:
     """Service for sending various types of notifications."""
 
+    # Reminders prepared at once by send_bulk_reminders (template rendering
+    # and user lookups); delivery itself is bounded by the email queue.
+    BULK_CONCURRENCY = 50
+
     def __init__(
         self,
         email_service: Optional[EmailService] = None,
@@ -334,35 +338,31 @@ class NotificationService:
         Returns:
             Dictionary with success and failure counts
         """
-        success_count = 0
-        failure_count = 0
-
-        for reminder in reminders:
-            reminder_type = reminder.get("type", "follow_up")
-
-            if reminder_type == "follow_up":
-                success = await self.send_follow_up_reminder(**reminder)
-            elif reminder_type == "status_check":
-                success = await self.send_status_check_reminder(**reminder)
-            elif reminder_type == "interview_prep":
-                success = await self.send_interview_prep_reminder(**reminder)
-            else:
+        # Reminders are prepared concurrently; the email service's delivery
+        # queue bounds concurrent sends and shapes them to the provider's rate.
+        semaphore = asyncio.Semaphore(self.BULK_CONCURRENCY)
+
+        async def send_one(reminder: Dict[str, Any]) -> bool:
+            reminder = dict(reminder)
+            reminder_type = reminder.pop("type", "follow_up")
+            sender = {
+                "follow_up": self.send_follow_up_reminder,
+                "status_check": self.send_status_check_reminder,
+                "interview_prep": self.send_interview_prep_reminder,
+            }.get(reminder_type)
+            if sender is None:
                 self.logger.warning(f"Unknown reminder type: {reminder_type}")
-                failure_count += 1
-                continue
-
-            if success:
-                success_count += 1
-            else:
-                failure_count += 1
+                return False
+            async with semaphore:
+                return await sender(**reminder)
 
-            # Add delay between emails to avoid rate limiting
-            await asyncio.sleep(1)
+        results = await asyncio.gather(*(send_one(r) for r in reminders))
+        success_count = sum(1 for result in results if result)
 
         return {
             "total": len(reminders),
             "success": success_count,
-            "failed": failure_count,
+            "failed": len(reminders) - success_count,
         }
 
     async def _get_user_email(self, user_id: str) -> Optional[str]:
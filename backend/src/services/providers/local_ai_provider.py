@@ -3,7 +3,7 @@
 import asyncio
 import aiohttp
 import json
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional
 from src.core.ai_provider import AIProvider, AIProviderConfig, AIResponse
 from loguru import logger
 
@@ -93,6 +93,43 @@ class LocalAIProvider(AIProvider):
             logger.error(f"Local AI text generation failed: {e}")
             raise RuntimeError(f"Local AI text generation failed: {e}")
     
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Stream text deltas from the OpenAI-compatible completions endpoint."""
+        if not await self.is_available():
+            raise RuntimeError("Local AI provider not available")
+        
+        payload = {
+            "prompt": prompt,
+            "model": self.config.model,
+            "temperature": kwargs.get('temperature', self.config.temperature),
+            "max_tokens": kwargs.get('max_tokens', self.config.max_tokens),
+            "stream": True
+        }
+        
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                f"{self.config.base_url}/v1/completions",
+                json=payload,
+                timeout=self.config.timeout
+            ) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"Local AI request failed with status {response.status}")
+                
+                # Server-sent events: "data: {...}" lines, ended by "data: [DONE]"
+                async for line in response.content:
+                    line = line.decode("utf-8").strip()
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        text = json.loads(data).get("choices", [{}])[0].get("text", "")
+                    except (ValueError, IndexError, AttributeError):
+                        continue
+                    if text:
+                        yield text
+    
     async def optimize_resume(self, resume_content: str, job_description: str) -> AIResponse:
         """Optimize resume for a specific job."""
         prompt = f"""
@@ -1,7 +1,7 @@
 """OpenAI provider implementation."""
 
 import asyncio
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional
 from openai import AsyncOpenAI
 from src.core.ai_provider import AIProvider, AIProviderConfig, AIResponse
 from loguru import logger
@@ -76,6 +76,28 @@ class OpenAIProvider(AIProvider):
             logger.error(f"OpenAI text generation failed: {e}")
             raise RuntimeError(f"OpenAI text generation failed: {e}")
     
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Stream text deltas using OpenAI's ``stream=True`` completions."""
+        if not await self.is_available():
+            raise RuntimeError("OpenAI provider not available")
+        
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.config.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=kwargs.get('temperature', self.config.temperature),
+                max_tokens=kwargs.get('max_tokens', self.config.max_tokens),
+                timeout=kwargs.get('timeout', self.config.timeout),
+                stream=True
+            )
+        except Exception as e:
+            logger.error(f"OpenAI streaming failed: {e}")
+            raise RuntimeError(f"OpenAI streaming failed: {e}")
+        
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
     async def optimize_resume(self, resume_content: str, job_description: str) -> AIResponse:
         """Optimize resume for a specific job."""
         prompt = f"""
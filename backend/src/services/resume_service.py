@@ -13,9 +13,11 @@ from src.core.cache import cache_region
 from src.core.resume_service import ResumeService
 from src.models.resume import Resume
 from src.services.local_file_service import LocalFileService
+from src.database.pagination import InvalidCursorError, Page, paginate_sequence
 from src.database.repositories.resume_repository import ResumeRepository
 from src.config import config
 from loguru import logger
+from src.utils.prompt_compaction import compact_resume, input_token_budget
 from src.utils.text_processing import extract_skills, clean_text
 
 
@@ -96,8 +98,9 @@ class ResumeService(ResumeService):
                     ai_service = await service_registry.get_ai_service()
                     if await ai_service.is_available():
                         # Use AI to extract education and certifications more accurately
-                        education_prompt = f"Extract all education information (degrees, universities, graduation dates) from this resume. Return only a JSON array of education entries:\n\n{content[:2000]}"
-                        cert_prompt = f"Extract all certifications and professional credentials from this resume. Return only a JSON array of certification names:\n\n{content[:2000]}"
+                        compacted = compact_resume(content, input_token_budget())
+                        education_prompt = f"Extract all education information (degrees, universities, graduation dates) from this resume. Return only a JSON array of education entries:\n\n{compacted}"
+                        cert_prompt = f"Extract all certifications and professional credentials from this resume. Return only a JSON array of certification names:\n\n{compacted}"
                         
                         # Try to get education via AI (non-blocking - fallback to regex if fails)
                         try:
@@ -225,6 +228,29 @@ class ResumeService(ResumeService):
             self.logger.error(f"Error getting all resumes: {e}", exc_info=True)
             return []
     
+    async def get_resumes_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Resume]:
+        """Get one keyset page of resumes, newest first.
+        
+        Raises:
+            InvalidCursorError: If ``cursor`` is malformed
+        """
+        try:
+            if self.repository:
+                return await self.repository.get_page(user_id=user_id, limit=limit, cursor=cursor)
+            
+            return paginate_sequence(list(self.resumes.values()), limit=limit, cursor=cursor)
+            
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error getting resumes page: {e}", exc_info=True)
+            return Page()
+    
     async def get_default_resume(self, user_id: Optional[str] = None) -> Optional[Resume]:
         """Get the default resume, optionally filtered by user."""
         try:
@@ -0,0 +1,203 @@
+"""Background prefetch of saved job searches.
+
+Auto-apply users keep their search criteria on file, so the searches a cycle
+will run are known ahead of time. The prefetcher scrapes them on a schedule
+and caches the results where ``JobSearchService.search_jobs`` looks first,
+so cycles and interactive searches with the same criteria are served from
+warm data. Searches differing only in sites or result count share one
+scrape, and each site is scraped at a measured pace within a per-round
+budget.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from loguru import logger
+
+from src.config import config
+from src.models.job import JobSearchRequest
+from src.services.job_search_service import JobSearchService, SiteResult
+
+# Returns the saved searches to keep warm, e.g. ``AutoApplyService.saved_searches``.
+SavedSearchSource = Callable[[], Awaitable[Iterable[JobSearchRequest]]]
+
+
+@dataclass
+class PrefetchGroup:
+    """Saved searches answered by scraping ``request``'s sites once."""
+
+    request: JobSearchRequest
+    members: List[JobSearchRequest]
+    # How many saved searches asked for this group, duplicates included.
+    demand: int = 1
+    results: Dict[str, SiteResult] = field(default_factory=dict)
+    pending: Set[str] = field(default_factory=set)
+
+
+class SearchPrefetcher:
+    """Keeps the job search cache and catalog warm for saved searches."""
+
+    def __init__(
+        self,
+        job_search_service: JobSearchService,
+        source: SavedSearchSource,
+        interval: Optional[int] = None,
+        stagger: Optional[float] = None,
+        site_budget: Optional[int] = None,
+    ):
+        """
+        Args:
+            job_search_service: Service whose cache and catalog are filled
+            source: Returns the saved searches to prefetch
+            interval: Seconds between rounds; defaults to
+                ``config.search_prefetch_interval``
+            stagger: Seconds between scrapes of one site; defaults to
+                ``config.search_prefetch_stagger``
+            site_budget: Most scrapes per site per round; defaults to
+                ``config.search_prefetch_site_budget``
+        """
+        self.job_search_service = job_search_service
+        self.source = source
+        self.interval = config.search_prefetch_interval if interval is None else interval
+        self.stagger = config.search_prefetch_stagger if stagger is None else stagger
+        self.site_budget = (
+            config.search_prefetch_site_budget if site_budget is None else site_budget
+        )
+        self._task: Optional[asyncio.Task] = None
+        self.last_round: Optional[Dict[str, int]] = None
+        self.logger = logger.bind(module="SearchPrefetcher")
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start prefetching in the background if not already running."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._loop(), name="search-prefetch")
+        self.logger.info(f"Search prefetch started (every {self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop prefetching; a round in progress is abandoned."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self.logger.info("Search prefetch stopped")
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                self.last_round = await self.run_once()
+                self.logger.info(f"Search prefetch round finished: {self.last_round}")
+            except Exception as e:
+                self.logger.error(f"Search prefetch round failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Whether prefetching is running, with the last round's counts."""
+        return {
+            "status": "healthy" if self.running else "stopped",
+            "running": self.running,
+            "last_round": self.last_round,
+        }
+
+    def plan(self, searches: Iterable[JobSearchRequest]) -> List[PrefetchGroup]:
+        """Merge searches that differ only in sites or result count.
+
+        Each group's request covers all its members' sites and the largest
+        ``results_wanted`` among them. Groups are ordered by demand, so the
+        most shared searches are the last to be cut by the site budget.
+        """
+        supported = self.job_search_service.get_available_sites()
+        groups: Dict[str, PrefetchGroup] = {}
+        for search in searches:
+            sites = [site for site in search.sites or [] if site in supported]
+            search = search.model_copy(update={"sites": sites or supported})
+            key = json.dumps(
+                search.model_dump(mode="json", exclude={"sites", "results_wanted"}),
+                sort_keys=True,
+            )
+            group = groups.get(key)
+            if group is None:
+                groups[key] = PrefetchGroup(search, [search])
+                continue
+            group.demand += 1
+            if search in group.members:
+                continue
+            group.members.append(search)
+            group.request = group.request.model_copy(
+                update={
+                    "sites": group.request.sites
+                    + [site for site in search.sites if site not in group.request.sites],
+                    "results_wanted": max(
+                        group.request.results_wanted, search.results_wanted
+                    ),
+                }
+            )
+        return sorted(groups.values(), key=lambda group: group.demand, reverse=True)
+
+    async def run_once(self) -> Dict[str, int]:
+        """Prefetch every saved search once and report what was done.
+
+        Every site works through its groups one scrape at a time, ``stagger``
+        seconds apart, while different sites proceed in parallel. A group's
+        members are cached as soon as its last site is done; members needing
+        a site that was over budget are left to be searched live.
+        """
+        searches = list(await self.source())
+        groups = self.plan(searches)
+        lanes: Dict[str, List[PrefetchGroup]] = {}
+        skipped = 0
+        for group in groups:
+            for site in group.request.sites:
+                lane = lanes.setdefault(site, [])
+                if len(lane) < self.site_budget:
+                    lane.append(group)
+                    group.pending.add(site)
+                else:
+                    skipped += 1
+
+        seeded = await asyncio.gather(
+            *(self._run_lane(site, lane) for site, lane in lanes.items())
+        )
+        return {
+            "searches": len(searches),
+            "groups": len(groups),
+            "scrapes": sum(len(lane) for lane in lanes.values()),
+            "skipped": skipped,
+            "seeded": sum(seeded),
+        }
+
+    async def _run_lane(self, site: str, groups: List[PrefetchGroup]) -> int:
+        """Scrape ``site`` for each group in turn; returns searches cached."""
+        seeded = 0
+        for index, group in enumerate(groups):
+            if index:
+                await asyncio.sleep(self.stagger)
+            group.results[site] = await self.job_search_service.prefetch_site(
+                group.request, site
+            )
+            group.pending.discard(site)
+            if not group.pending:
+                seeded += await self._seed(group)
+        return seeded
+
+    async def _seed(self, group: PrefetchGroup) -> int:
+        """Cache the response of each member whose sites were all scraped."""
+        seeded = 0
+        for member in group.members:
+            if not set(member.sites) <= set(group.results):
+                continue
+            try:
+                response = await self.job_search_service.seed_search(member, group.results)
+            except Exception as e:
+                self.logger.warning(f"Failed to cache prefetched search {member.keywords}: {e}")
+                continue
+            if response is not None:
+                seeded += 1
+        return seeded
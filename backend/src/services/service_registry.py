@@ -243,6 +243,21 @@ class ServiceRegistry:
                 f"Failed to initialize scheduler service: {e}. Continuing without scheduling."
             )
 
+        # Saved-search prefetcher (depends on job search and auto apply)
+        if "auto_apply_service" in self._instances:
+            try:
+                prefetch_provider = SearchPrefetcherProvider(
+                    self._instances["job_search_service"],
+                    self._instances["auto_apply_service"],
+                )
+                self.register_service("search_prefetcher", prefetch_provider)
+                await prefetch_provider.initialize()
+                self._instances["search_prefetcher"] = prefetch_provider.get_service()
+            except Exception as e:
+                self._logger.warning(
+                    f"Failed to initialize search prefetcher: {e}. Continuing without prefetch."
+                )
+
         # Notification service (depends on email service)
         try:
             # Push service (optional, depends on database)
@@ -463,9 +478,12 @@ class UnifiedAIServiceProvider(ServiceProvider):
         return self._service
 
     async def initialize(self) -> None:
-        from src.services.unified_ai_service import UnifiedAIService
+        from src.services.unified_ai_service import (
+            UnifiedAIService,
+            default_result_cache,
+        )
 
-        self._service = UnifiedAIService()
+        self._service = UnifiedAIService(result_cache=default_result_cache())
         await self._service.initialize()
 
     async def cleanup(self) -> None:
@@ -749,7 +767,7 @@ class EmailServiceProvider(ServiceProvider):
         self._service = EmailService()
 
     async def cleanup(self) -> None:
-        pass
+        await self._service.cleanup()
 
 
 class SchedulerServiceProvider(ServiceProvider):
@@ -773,6 +791,30 @@ class SchedulerServiceProvider(ServiceProvider):
             await self._service.stop()
 
 
+class SearchPrefetcherProvider(ServiceProvider):
+    """Provider for the saved-search prefetcher."""
+
+    def __init__(self, job_search_service: JobSearchService, auto_apply_service: Any):
+        self.job_search_service = job_search_service
+        self.auto_apply_service = auto_apply_service
+
+    def get_service(self):
+        return self._service
+
+    async def initialize(self) -> None:
+        from src.config import config
+        from src.services.search_prefetcher import SearchPrefetcher
+
+        self._service = SearchPrefetcher(
+            self.job_search_service, self.auto_apply_service.saved_searches
+        )
+        if config.search_prefetch_enabled:
+            await self._service.start()
+
+    async def cleanup(self) -> None:
+        await self._service.stop()
+
+
 class NotificationServiceProvider(ServiceProvider):
     """Provider for notification service."""
 
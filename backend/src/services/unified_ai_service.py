@@ -1,10 +1,20 @@
 """Unified AI service that supports multiple providers with fallback."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, Callable, Awaitable
 from datetime import datetime, timezone
 import json
 
+from src.core.ai_result_cache import (
+    AIResultCache,
+    AIRoute,
+    answer_scope,
+    answered_route,
+    degraded_result,
+    mark_degraded,
+)
 from src.core.ai_service import AIService
+from src.core.ai_stream import AIStreamEvent, IncrementalJSONParser
+from src.core.circuit_breaker import breaker_states
 from src.models.resume import (
     ResumeOptimizationRequest,
     ResumeOptimizationResponse,
@@ -13,11 +23,23 @@ from src.models.resume import (
 from src.models.cover_letter import CoverLetterRequest, CoverLetter
 from src.models.career_insights import CareerInsightsRequest, CareerInsightsResponse
 from src.config import config
+from src.utils.prompt_compaction import fit_prompt_inputs
 from src.services.ai_provider_manager import AIProviderManager
 from src.services.gemini_ai_service import GeminiAIService
 from src.services.g4f_ai_service import G4FAIService
 from loguru import logger
 
+def default_result_cache() -> Optional[AIResultCache]:
+    """The AI result cache described by config, or None when it is disabled."""
+    if not config.ai_cache_enabled:
+        return None
+    return AIResultCache(
+        config.ai_cache_path,
+        ttl=config.ai_cache_ttl,
+        disabled_operations=config.ai_cache_disabled_operations,
+        near_duplicate_threshold=config.ai_cache_near_duplicate_threshold,
+    )
+
 
 class UnifiedAIService(AIService):
     """Unified AI service that supports multiple providers with intelligent fallback.
@@ -26,11 +48,20 @@ class UnifiedAIService(AIService):
     1. Modern providers (Cursor, OpenRouter, OpenAI) via AIProviderManager
     2. Gemini (legacy, but still supported)
     3. Mock responses if all fail
+
+    Results of the expensive operations are cached by content (see
+    ``src.core.ai_result_cache``); mock and fallback results never are.
     """
 
-    def __init__(self):
-        """Initialize the unified AI service."""
+    def __init__(self, result_cache: Optional[AIResultCache] = None):
+        """Initialize the unified AI service.
+
+        Args:
+            result_cache: AI result cache; results are not cached when
+                omitted (see ``default_result_cache``)
+        """
         self.logger = logger.bind(module="UnifiedAIService")
+        self.result_cache = result_cache
         self.provider_manager = AIProviderManager()
         self.gemini_service = GeminiAIService()
         self.g4f_service = G4FAIService()
@@ -173,9 +204,9 @@ class UnifiedAIService(AIService):
         else:
             return False
 
-    async def get_provider_status(self) -> Dict[str, bool]:
-        """Get status of all AI providers."""
-        status = {}
+    async def get_provider_status(self) -> Dict[str, Any]:
+        """Get status of all AI providers, including their circuit breakers."""
+        status: Dict[str, Any] = {}
 
         if self._use_modern_providers:
             status.update(await self.provider_manager.get_provider_status())
@@ -191,13 +222,228 @@ class UnifiedAIService(AIService):
             if self._use_g4f
             else "mock"
         )
+        status["circuit_breakers"] = breaker_states()
 
         return status
 
+    async def _current_route(self) -> Optional[AIRoute]:
+        """The provider, model and temperature the next call would most likely use.
+
+        Cache lookups use this route; results are stored under the route of
+        the provider that actually answered. Both follow the router's ranking,
+        so repeats look up the route their first answer was stored under.
+        """
+        if self._use_modern_providers:
+            provider = await self.provider_manager.get_routed_provider()
+            if provider is not None:
+                return AIRoute(
+                    provider.provider_name,
+                    provider.config.model,
+                    provider.config.temperature,
+                )
+        if self._use_gemini:
+            return AIRoute(
+                "gemini", self.gemini_service.model_name, self.gemini_service.temperature
+            )
+        if self._use_g4f:
+            return AIRoute(
+                "g4f", self.g4f_service.model_name, self.g4f_service.temperature
+            )
+        return None
+
+    async def _cached(
+        self,
+        operation: str,
+        inputs: Dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+        document: Optional[str] = None,
+        dump: Callable[[Any], Any] = lambda value: value,
+        load: Callable[[Any], Any] = lambda value: value,
+    ) -> Any:
+        """Serve ``operation`` from the result cache, or compute and store it.
+
+        ``document`` is the job description; near-duplicate descriptions with
+        otherwise identical ``inputs`` share a result.
+        """
+        cache = self.result_cache
+        route = None
+        if cache is not None and cache.enabled_for(operation):
+            route = await self._current_route()
+        if route is None:
+            return await compute()
+
+        cached = await cache.get(operation, route, inputs, document)
+        if cached is not None:
+            self.logger.debug(f"AI result cache hit for {operation}")
+            return load(cached)
+
+        with answer_scope() as answer:
+            result = await compute()
+            if answer.cacheable_route is not None:
+                await cache.set(
+                    operation, answer.cacheable_route, inputs, dump(result), document
+                )
+        return result
+
+    async def _stream_text(self, prompt: str) -> AsyncIterator[str]:
+        """Stream deltas from the active provider; yields nothing if none can stream."""
+        if (
+            self._use_modern_providers
+            and await self.provider_manager.is_any_available()
+        ):
+            async for delta in self.provider_manager.stream_text(prompt):
+                yield delta
+        elif self._use_gemini and await self.gemini_service.is_available():
+            async for delta in self.gemini_service.stream_content(prompt):
+                yield delta
+
+    async def _stream(
+        self,
+        operation: str,
+        inputs: Dict[str, Any],
+        document: Optional[str],
+        prompt: str,
+        finish: Callable[[str, Optional[IncrementalJSONParser]], Any],
+        fallback: Callable[[], Awaitable[Any]],
+        dump: Callable[[Any], Any] = lambda value: value,
+        structured: bool = True,
+    ) -> AsyncIterator[AIStreamEvent]:
+        """Stream ``operation`` as events, ending with the ``done`` artifact.
+
+        Cache hits are answered at once. If no provider can stream, or the
+        stream fails before its first delta, ``fallback`` (the non-streaming
+        operation) produces the artifact. ``finish`` builds the artifact from
+        the complete text and, for JSON answers, the incremental parser.
+        """
+        cache = self.result_cache
+        route = None
+        if cache is not None and cache.enabled_for(operation):
+            route = await self._current_route()
+        if route is not None:
+            cached = await cache.get(operation, route, inputs, document)
+            if cached is not None:
+                self.logger.debug(f"AI result cache hit for {operation}")
+                yield AIStreamEvent("done", cached)
+                return
+
+        parser = IncrementalJSONParser() if structured else None
+        deltas: List[str] = []
+        try:
+            async for delta in self._stream_text(prompt):
+                deltas.append(delta)
+                yield AIStreamEvent("delta", {"text": delta})
+                if parser is not None:
+                    for event, key, value in parser.feed(delta):
+                        yield AIStreamEvent(event, {"key": key, "value": value})
+        except Exception as e:
+            if deltas:
+                raise
+            self.logger.warning(f"Streaming {operation} failed, falling back: {e}")
+
+        if not deltas:
+            yield AIStreamEvent("done", dump(await fallback()))
+            return
+
+        # Whichever provider streamed recorded itself on completion.
+        streamed_by = answered_route()
+        with answer_scope() as answer:
+            result = dump(finish("".join(deltas), parser))
+            if route is not None and streamed_by is not None and not answer.degraded:
+                await cache.set(operation, streamed_by, inputs, result, document)
+        yield AIStreamEvent("done", result)
+
+    async def stream_resume_optimization(
+        self, request: ResumeOptimizationRequest
+    ) -> AsyncIterator[AIStreamEvent]:
+        """Optimize a resume, streaming fields as the provider produces them."""
+        events = self._stream(
+            "optimize_resume",
+            {
+                **request.model_dump(exclude={"job_description"}),
+                "resume_content": getattr(request, "resume_content", None),
+            },
+            request.job_description,
+            self._build_resume_optimization_prompt(request),
+            finish=lambda text, parser: self._resume_optimization_response(
+                request,
+                parser.result
+                if parser.done
+                else self._parse_resume_optimization_response(text),
+            ),
+            fallback=lambda: self.optimize_resume(request),
+            dump=lambda response: response.model_dump(mode="json"),
+        )
+        async for event in events:
+            yield event
+
+    async def stream_cover_letter(
+        self, request: CoverLetterRequest
+    ) -> AsyncIterator[AIStreamEvent]:
+        """Generate a cover letter, streaming its text as it is written."""
+        events = self._stream(
+            "generate_cover_letter",
+            {
+                **request.model_dump(exclude={"job_description"}),
+                "resume_content": getattr(request, "resume_content", None),
+            },
+            request.job_description,
+            self._build_cover_letter_prompt(request),
+            finish=lambda text, _: self._cover_letter(request, text),
+            fallback=lambda: self.generate_cover_letter(request),
+            dump=lambda letter: letter.model_dump(mode="json"),
+            structured=False,
+        )
+        async for event in events:
+            yield event
+
+    async def stream_interview_prep(
+        self,
+        job_description: str,
+        resume_content: str,
+        company_name: Optional[str] = None,
+        job_title: Optional[str] = None,
+    ) -> AsyncIterator[AIStreamEvent]:
+        """Prepare for an interview, streaming each question once it parses."""
+        events = self._stream(
+            "prepare_interview",
+            {
+                "resume_content": resume_content,
+                "company_name": company_name,
+                "job_title": job_title,
+            },
+            job_description,
+            self._build_interview_prep_prompt(
+                job_description, resume_content, company_name, job_title
+            ),
+            finish=lambda text, parser: self._interview_prep_from_data(parser.result)
+            if parser.done
+            else self._parse_interview_prep_response(text),
+            fallback=lambda: self.prepare_interview(
+                job_description, resume_content, company_name, job_title
+            ),
+        )
+        async for event in events:
+            yield event
+
     async def optimize_resume(
         self, request: ResumeOptimizationRequest
     ) -> ResumeOptimizationResponse:
         """Optimize resume for a specific job."""
+        return await self._cached(
+            "optimize_resume",
+            {
+                **request.model_dump(exclude={"job_description"}),
+                "resume_content": getattr(request, "resume_content", None),
+            },
+            lambda: self._optimize_resume(request),
+            document=request.job_description,
+            dump=lambda response: response.model_dump(mode="json"),
+            load=ResumeOptimizationResponse.model_validate,
+        )
+
+    async def _optimize_resume(
+        self, request: ResumeOptimizationRequest
+    ) -> ResumeOptimizationResponse:
         try:
             self.logger.info(
                 f"Optimizing resume for {request.target_role} at {request.company_name}"
@@ -212,30 +458,9 @@ class UnifiedAIService(AIService):
                     self.logger.debug("Using modern provider for resume optimization")
                     prompt = self._build_resume_optimization_prompt(request)
                     ai_response = await self.provider_manager.generate_text(prompt)
-                    optimization_data = self._parse_resume_optimization_response(
-                        ai_response.content
-                    )
-
-                    original_resume = Resume(
-                        name="Current Resume",
-                        file_path=f"./resumes/{request.resume_id}.pdf",
-                        file_type="pdf",
-                    )
-
-                    return ResumeOptimizationResponse(
-                        original_resume=original_resume,
-                        optimized_content=optimization_data.get(
-                            "optimized_content", ""
-                        ),
-                        suggestions=optimization_data.get("suggestions", []),
-                        skill_gaps=optimization_data.get("skill_gaps", []),
-                        improvements=optimization_data.get("improvements", []),
-                        confidence_score=optimization_data.get("confidence_score", 0.8),
-                        ats_score=optimization_data.get("ats_score"),
-                        ats_checks=optimization_data.get("ats_checks"),
-                        ats_recommendations=optimization_data.get(
-                            "ats_recommendations"
-                        ),
+                    return self._resume_optimization_response(
+                        request,
+                        self._parse_resume_optimization_response(ai_response.content),
                     )
                 except Exception as e:
                     self.logger.warning(f"Modern provider failed, falling back: {e}")
@@ -275,6 +500,19 @@ class UnifiedAIService(AIService):
 
     async def generate_cover_letter(self, request: CoverLetterRequest) -> CoverLetter:
         """Generate a personalized cover letter."""
+        return await self._cached(
+            "generate_cover_letter",
+            {
+                **request.model_dump(exclude={"job_description"}),
+                "resume_content": getattr(request, "resume_content", None),
+            },
+            lambda: self._generate_cover_letter(request),
+            document=request.job_description,
+            dump=lambda letter: letter.model_dump(mode="json"),
+            load=CoverLetter.model_validate,
+        )
+
+    async def _generate_cover_letter(self, request: CoverLetterRequest) -> CoverLetter:
         try:
             self.logger.info(
                 f"Generating cover letter for {request.job_title} at {request.company_name}"
@@ -291,16 +529,7 @@ class UnifiedAIService(AIService):
                     )
                     prompt = self._build_cover_letter_prompt(request)
                     ai_response = await self.provider_manager.generate_text(prompt)
-
-                    return CoverLetter(
-                        job_title=request.job_title,
-                        company_name=request.company_name,
-                        content=ai_response.content,
-                        tone=request.tone or "professional",
-                        word_count=len(ai_response.content.split()),
-                        file_path=f"./cover_letters/{request.job_title}_{request.company_name}.txt",
-                        generated_at=datetime.now(timezone.utc),
-                    )
+                    return self._cover_letter(request, ai_response.content)
                 except Exception as e:
                     self.logger.warning(f"Modern provider failed, falling back: {e}")
 
@@ -349,6 +578,16 @@ class UnifiedAIService(AIService):
         self, resume_content: str, job_description: str
     ) -> Dict[str, Any]:
         """Analyze how well a resume matches a job description."""
+        return await self._cached(
+            "analyze_job_match",
+            {"resume_content": resume_content},
+            lambda: self._analyze_job_match(resume_content, job_description),
+            document=job_description,
+        )
+
+    async def _analyze_job_match(
+        self, resume_content: str, job_description: str
+    ) -> Dict[str, Any]:
         try:
             self.logger.info("Analyzing job-resume match")
 
@@ -410,6 +649,13 @@ class UnifiedAIService(AIService):
 
     async def extract_resume_skills(self, resume_content: str) -> List[str]:
         """Extract skills from resume content."""
+        return await self._cached(
+            "extract_resume_skills",
+            {"resume_content": resume_content},
+            lambda: self._extract_resume_skills(resume_content),
+        )
+
+    async def _extract_resume_skills(self, resume_content: str) -> List[str]:
         try:
             self.logger.info("Extracting skills from resume")
 
@@ -490,7 +736,10 @@ class UnifiedAIService(AIService):
                     self.logger.debug(
                         "Using modern provider for improvement suggestions"
                     )
-                    prompt = f"Analyze this resume and job description, then provide specific improvement suggestions. Return a JSON array of improvement suggestions:\n\nResume:\n{resume_content}\n\nJob Description:\n{job_description}"
+                    resume, job = fit_prompt_inputs(
+                        resume_content, job_description, self._prompt_model()
+                    )
+                    prompt = f"Analyze this resume and job description, then provide specific improvement suggestions. Return a JSON array of improvement suggestions:\n\nResume:\n{resume}\n\nJob Description:\n{job}"
                     ai_response = await self.provider_manager.generate_text(prompt)
 
                     # Try to parse as JSON
@@ -558,18 +807,27 @@ class UnifiedAIService(AIService):
             self.logger.error(f"Error suggesting improvements: {e}", exc_info=True)
             return self._mock_improvements()
 
+    def _prompt_model(self) -> Optional[str]:
+        """Model the modern providers route to first; sizes prompt inputs."""
+        if not self._use_modern_providers:
+            return None
+        return self.provider_manager.primary_model()
+
     def _build_resume_optimization_prompt(
         self, request: ResumeOptimizationRequest
     ) -> str:
         """Build prompt for ATS-optimized resume optimization."""
+        resume, job = fit_prompt_inputs(
+            request.resume_content, request.job_description, self._prompt_model()
+        )
         return f"""You are an expert ATS (Applicant Tracking System) resume optimizer. 
 Optimize this resume for maximum ATS compatibility and job match.
 
 Job Title: {request.target_role}
 Company: {request.company_name}
-Job Description: {request.job_description}
+Job Description: {job}
 
-Resume Content: {request.resume_content[:3000] if request.resume_content else "Not provided"}
+Resume Content: {resume or "Not provided"}
 
 Provide a JSON response with:
 {{
@@ -602,25 +860,29 @@ ATS Optimization Focus:
 
     def _build_cover_letter_prompt(self, request: CoverLetterRequest) -> str:
         """Build prompt for cover letter generation."""
+        resume, job = fit_prompt_inputs(
+            request.resume_summary, request.job_description, self._prompt_model()
+        )
         return f"""Write a professional cover letter for:
 
 Job Title: {request.job_title}
 Company: {request.company_name}
 Tone: {request.tone or "professional"}
 
-Resume Summary: {request.resume_content[:500] if request.resume_content else "Not provided"}
+Resume Summary: {resume or "Not provided"}
 
-Job Description: {request.job_description}
+Job Description: {job}
 
 Write a compelling, personalized cover letter that highlights relevant experience and demonstrates enthusiasm for the role."""
 
     def _build_job_match_prompt(self, resume_content: str, job_description: str) -> str:
         """Build prompt for job match analysis."""
+        resume, job = fit_prompt_inputs(resume_content, job_description, self._prompt_model())
         return f"""Analyze how well this resume matches the job description:
 
-Resume: {resume_content[:1000]}
+Resume: {resume}
 
-Job Description: {job_description}
+Job Description: {job}
 
 Provide a JSON response with:
 - match_percentage (0-100)
@@ -645,6 +907,7 @@ Provide a JSON response with:
             }
         except:
             # Fallback parsing
+            mark_degraded()
             return {
                 "optimized_content": content,
                 "suggestions": ["Review formatting", "Add more keywords"],
@@ -665,6 +928,40 @@ Provide a JSON response with:
                 ],
             }
 
+    def _resume_optimization_response(
+        self, request: ResumeOptimizationRequest, optimization_data: Dict[str, Any]
+    ) -> ResumeOptimizationResponse:
+        """Build the optimization response from parsed provider output."""
+        original_resume = Resume(
+            name="Current Resume",
+            file_path=f"./resumes/{request.resume_id}.pdf",
+            file_type="pdf",
+        )
+
+        return ResumeOptimizationResponse(
+            original_resume=original_resume,
+            optimized_content=optimization_data.get("optimized_content", ""),
+            suggestions=optimization_data.get("suggestions", []),
+            skill_gaps=optimization_data.get("skill_gaps", []),
+            improvements=optimization_data.get("improvements", []),
+            confidence_score=optimization_data.get("confidence_score", 0.8),
+            ats_score=optimization_data.get("ats_score"),
+            ats_checks=optimization_data.get("ats_checks"),
+            ats_recommendations=optimization_data.get("ats_recommendations"),
+        )
+
+    def _cover_letter(self, request: CoverLetterRequest, content: str) -> CoverLetter:
+        """Wrap generated cover letter text."""
+        return CoverLetter(
+            job_title=request.job_title,
+            company_name=request.company_name,
+            content=content,
+            tone=request.tone or "professional",
+            word_count=len(content.split()),
+            file_path=f"./cover_letters/{request.job_title}_{request.company_name}.txt",
+            generated_at=datetime.now(timezone.utc),
+        )
+
     def _parse_job_match_response(self, content: str) -> Dict[str, Any]:
         """Parse AI response for job match analysis."""
         try:
@@ -676,6 +973,7 @@ Provide a JSON response with:
                 "recommendations": data.get("recommendations", []),
             }
         except:
+            mark_degraded()
             return {
                 "match_percentage": 70,
                 "strengths": ["Relevant experience"],
@@ -683,6 +981,7 @@ Provide a JSON response with:
                 "recommendations": ["Continue learning"],
             }
 
+    @degraded_result
     def _mock_resume_optimization(
         self, request: ResumeOptimizationRequest
     ) -> ResumeOptimizationResponse:
@@ -702,6 +1001,7 @@ Provide a JSON response with:
             confidence_score=0.5,
         )
 
+    @degraded_result
     def _mock_cover_letter_generation(self, request: CoverLetterRequest) -> CoverLetter:
         """Mock cover letter generation response."""
         return CoverLetter(
@@ -714,6 +1014,7 @@ Provide a JSON response with:
             generated_at=datetime.now(timezone.utc),
         )
 
+    @degraded_result
     def _mock_job_match_analysis(self) -> Dict[str, Any]:
         """Mock job match analysis response."""
         return {
@@ -723,10 +1024,12 @@ Provide a JSON response with:
             "recommendations": ["Continue learning relevant skills"],
         }
 
+    @degraded_result
     def _mock_skills_extraction(self) -> List[str]:
         """Mock skills extraction response."""
         return ["Python", "JavaScript", "Problem Solving"]
 
+    @degraded_result
     def _mock_improvements(self) -> List[str]:
         """Mock improvements response."""
         return ["Add more specific achievements", "Improve formatting"]
@@ -739,6 +1042,26 @@ Provide a JSON response with:
         job_title: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Prepare interview questions and tips based on job description and resume."""
+        return await self._cached(
+            "prepare_interview",
+            {
+                "resume_content": resume_content,
+                "company_name": company_name,
+                "job_title": job_title,
+            },
+            lambda: self._prepare_interview(
+                job_description, resume_content, company_name, job_title
+            ),
+            document=job_description,
+        )
+
+    async def _prepare_interview(
+        self,
+        job_description: str,
+        resume_content: str,
+        company_name: Optional[str] = None,
+        job_title: Optional[str] = None,
+    ) -> Dict[str, Any]:
         try:
             self.logger.info(
                 f"Preparing interview questions for {job_title} at {company_name}"
@@ -816,6 +1139,7 @@ Provide a JSON response with:
         job_title: Optional[str] = None,
     ) -> str:
         """Build prompt for interview preparation."""
+        resume, job = fit_prompt_inputs(resume_content, job_description, self._prompt_model())
         return f"""
 You are an expert interview coach. Based on the job description and candidate's resume, generate comprehensive interview preparation materials.
 
@@ -823,10 +1147,10 @@ Job Title: {job_title or "Not specified"}
 Company: {company_name or "Not specified"}
 
 Job Description:
-{job_description}
+{job}
 
 Candidate Resume:
-{resume_content[:2000]}  # Limit resume content to avoid token limits
+{resume}
 
 Please provide a JSON response with the following structure:
 {{
@@ -865,23 +1189,27 @@ Please provide a JSON response with the following structure:
     def _parse_interview_prep_response(self, content: str) -> Dict[str, Any]:
         """Parse AI response for interview preparation."""
         try:
-            data = json.loads(content)
-            return {
-                "questions": data.get("questions", []),
-                "technical_questions": data.get("technical_questions", []),
-                "preparation_tips": data.get("preparation_tips", []),
-                "key_topics": data.get("key_topics", []),
-                "strengths_to_highlight": data.get("strengths_to_highlight", []),
-                "weaknesses_to_address": data.get("weaknesses_to_address", []),
-                "company_research": data.get("company_research", ""),
-                "questions_to_ask": data.get("questions_to_ask", []),
-            }
+            return self._interview_prep_from_data(json.loads(content))
         except json.JSONDecodeError:
             self.logger.warning(
                 "Failed to parse interview prep response as JSON. Using fallback."
             )
             return self._mock_interview_prep(None, None)
 
+    def _interview_prep_from_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize parsed interview preparation data."""
+        return {
+            "questions": data.get("questions", []),
+            "technical_questions": data.get("technical_questions", []),
+            "preparation_tips": data.get("preparation_tips", []),
+            "key_topics": data.get("key_topics", []),
+            "strengths_to_highlight": data.get("strengths_to_highlight", []),
+            "weaknesses_to_address": data.get("weaknesses_to_address", []),
+            "company_research": data.get("company_research", ""),
+            "questions_to_ask": data.get("questions_to_ask", []),
+        }
+
+    @degraded_result
     def _mock_interview_prep(
         self, job_title: Optional[str] = None, company_name: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -1,24 +1,28 @@
 """Simple in-memory cache for query results."""
 
 from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
-from threading import Lock
 import hashlib
 import json
 
+from src.core.cache_manager import LRUStore
+
 
 class SimpleCache:
-    """Simple thread-safe in-memory cache with TTL support."""
+    """Simple thread-safe in-memory cache with TTL support.
+
+    Backed by the bounded L1 store from ``src.core.cache_manager`` so it shares
+    LRU eviction and statistics with the rest of the cache subsystem.
+    """
     
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self, default_ttl: int = 300, max_bytes: int = 16 * 1024 * 1024):
         """
         Initialize cache.
         
         Args:
             default_ttl: Default time-to-live in seconds (default: 5 minutes)
+            max_bytes: Memory budget before least recently used entries are evicted
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._lock = Lock()
+        self._store = LRUStore(max_bytes=max_bytes, default_ttl=default_ttl)
         self.default_ttl = default_ttl
     
     def _generate_key(self, prefix: str, *args, **kwargs) -> str:
@@ -41,19 +45,7 @@ class SimpleCache:
         Returns:
             Cached value or None if not found or expired
         """
-        with self._lock:
-            if key not in self._cache:
-                return None
-            
-            entry = self._cache[key]
-            expires_at = entry.get("expires_at")
-            
-            if expires_at and datetime.utcnow() > expires_at:
-                # Entry expired, remove it
-                del self._cache[key]
-                return None
-            
-            return entry.get("value")
+        return self._store.get(key)
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
@@ -64,26 +56,15 @@ class SimpleCache:
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if None)
         """
-        with self._lock:
-            ttl = ttl or self.default_ttl
-            expires_at = datetime.utcnow() + timedelta(seconds=ttl)
-            
-            self._cache[key] = {
-                "value": value,
-                "expires_at": expires_at,
-                "created_at": datetime.utcnow()
-            }
+        self._store.set(key, value, ttl=ttl or self.default_ttl)
     
     def delete(self, key: str) -> None:
         """Delete key from cache."""
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+        self._store.delete(key)
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        with self._lock:
-            self._cache.clear()
+        self._store.clear()
     
     def cleanup_expired(self) -> int:
         """
@@ -92,39 +73,29 @@ class SimpleCache:
         Returns:
             Number of entries removed
         """
-        with self._lock:
-            now = datetime.utcnow()
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.get("expires_at") and entry["expires_at"] < now
-            ]
-            
-            for key in expired_keys:
-                del self._cache[key]
-            
-            return len(expired_keys)
+        return self._store.cleanup()
     
     def size(self) -> int:
         """Get current cache size."""
-        with self._lock:
-            return len(self._cache)
+        return len(self._store)
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        with self._lock:
-            now = datetime.utcnow()
-            total = len(self._cache)
-            expired = sum(
-                1 for entry in self._cache.values()
-                if entry.get("expires_at") and entry["expires_at"] < now
-            )
-            
-            return {
-                "total_entries": total,
-                "expired_entries": expired,
-                "active_entries": total - expired,
-                "default_ttl": self.default_ttl
-            }
+        total = len(self._store)
+        expired = self._store.count_expired()
+        store_stats = self._store.stats
+        
+        return {
+            "total_entries": total,
+            "expired_entries": expired,
+            "active_entries": total - expired,
+            "default_ttl": self.default_ttl,
+            "hits": store_stats.hits,
+            "misses": store_stats.misses,
+            "evictions": store_stats.evictions,
+            "bytes_used": self._store.bytes_used,
+            "max_bytes": self._store.max_bytes,
+        }
 
 
 # Global cache instance
@@ -0,0 +1,88 @@
+"""Canonical job posting URLs.
+
+The same posting reaches us under many URLs: tracking parameters, ``www.``
+prefixes, trailing slashes and SEO slugs all vary between searches. The job
+catalog keys postings by the canonical form so they are stored once.
+"""
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track how the visitor arrived.
+_TRACKING_PARAMS = {
+    "trk",
+    "trkinfo",
+    "refid",
+    "trackingid",
+    "ref",
+    "src",
+    "from",
+    "source",
+    "gclid",
+    "fbclid",
+    "mc_cid",
+    "mc_eid",
+    "position",
+    "pagenum",
+    "tk",
+    "vjs",
+    "advn",
+    "adid",
+    "sjdu",
+    "acatk",
+    "pub",
+}
+_TRACKING_PREFIXES = ("utm_", "eboo")
+
+# Hosts whose posting identity is a single query parameter.
+_ID_PARAMS = {
+    "indeed.com": "jk",
+    "glassdoor.com": "jl",
+}
+
+_LINKEDIN_VIEW = re.compile(r"^/jobs/view/(?:[^/]*-)?(\d+)$")
+
+
+def canonical_job_url(url: str) -> str:
+    """Return ``url`` with its tracking noise removed.
+
+    Lowercases the scheme and host, drops ``www.``, the fragment, tracking
+    parameters and any trailing slash, and sorts the remaining parameters.
+    LinkedIn view URLs lose their title slug and Indeed/Glassdoor URLs keep
+    only the posting id parameter.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    netloc = host if parts.port is None else f"{host}:{parts.port}"
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+    params = parse_qsl(parts.query, keep_blank_values=False)
+
+    linkedin_view = _LINKEDIN_VIEW.match(path) if host.endswith("linkedin.com") else None
+    id_param = next(
+        (param for domain, param in _ID_PARAMS.items() if host.endswith(domain)), None
+    )
+    if linkedin_view:
+        host = netloc = "linkedin.com"
+        path = f"/jobs/view/{linkedin_view.group(1)}"
+        params = []
+    elif id_param and any(key == id_param for key, _ in params):
+        params = [(key, value) for key, value in params if key == id_param][:1]
+    else:
+        params = sorted(
+            (key, value)
+            for key, value in params
+            if key.lower() not in _TRACKING_PARAMS
+            and not key.lower().startswith(_TRACKING_PREFIXES)
+        )
+
+    return urlunsplit(
+        ((parts.scheme or "https").lower(), netloc, path, urlencode(params), "")
+    )
+
+
+def job_fingerprint(url: str) -> str:
+    """Return the stable job id for ``url``: a hash of its canonical form."""
+    return hashlib.sha1(canonical_job_url(url).encode("utf-8")).hexdigest()[:32]
@@ -0,0 +1,306 @@
+"""Token-budgeted compaction of resumes and job descriptions for AI prompts.
+
+Prompts used to inline whole inputs or cut them at an arbitrary character
+offset. Compaction instead:
+
+1. splits the text into headed sections and paragraphs,
+2. drops boilerplate (EEO statements, benefits lists, "references available
+   upon request") and repeated paragraphs,
+3. if the rest still exceeds the budget, keeps the most relevant sections
+   (requirements and responsibilities of a job; the experience and skills of
+   a resume that overlap the job's skills) in their original order, and
+4. measures every piece with the model's tokenizer (``tiktoken`` when
+   installed, otherwise a close local estimate).
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, Set, Tuple
+
+from src.config import config
+from src.utils.skill_matcher import get_skill_matcher
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+_PIECE = re.compile(r"\w+|[^\w\s]")
+_BLANK_LINES = re.compile(r"\n\s*\n")
+_HEADING = re.compile(r"^\s*(?:#+\s*)?([A-Za-z][A-Za-z0-9 &/',()-]{1,60}?)\s*:?\s*$")
+
+_BOILERPLATE = re.compile(
+    r"equal (?:employment )?opportunity|without regard to|regardless of (?:race|gender|age)"
+    r"|reasonable accommodations?|e-verify|protected veteran|affirmative action"
+    r"|references (?:are )?available|\b401\s*\(?k\)?|paid time off|dental(?:,| and) vision"
+    r"|privacy (?:notice|policy)",
+    re.IGNORECASE,
+)
+
+# Heading keywords -> priority. 0 drops the section outright.
+_JOB_SECTIONS: Sequence[Tuple[str, int]] = (
+    ("benefit", 0), ("perk", 0), ("equal opportunity", 0), ("eeo", 0),
+    ("accommodation", 0), ("how to apply", 0), ("privacy", 0),
+    ("requirement", 3), ("qualification", 3), ("responsibilit", 3), ("skill", 3),
+    ("must have", 3), ("what you", 3), ("you will", 3), ("you'll", 3),
+    ("duties", 3), ("experience", 3), ("the role", 3),
+    ("preferred", 2), ("nice to have", 2), ("bonus", 2),
+    ("about", 1), ("who we are", 1), ("culture", 1), ("compensation", 1), ("salary", 1),
+)
+_RESUME_SECTIONS: Sequence[Tuple[str, int]] = (
+    ("reference", 0), ("hobbies", 0), ("interests", 0),
+    ("experience", 3), ("employment", 3), ("work history", 3), ("skill", 3),
+    ("summary", 3), ("profile", 3), ("objective", 2), ("project", 3),
+    ("education", 2), ("certification", 2), ("award", 1), ("publication", 1),
+    ("volunteer", 1), ("language", 1),
+)
+_DEFAULT_PRIORITY = 2
+
+
+@lru_cache(maxsize=16)
+def _encoding(model: Optional[str]) -> Any:
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model or "")
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Tokens ``text`` costs for ``model``.
+
+    Without ``tiktoken``, each word counts one token per four characters and
+    each punctuation mark counts one, which tracks BPE tokenizers closely on
+    English prose.
+    """
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return sum(math.ceil(len(piece) / 4) for piece in _PIECE.findall(text))
+
+
+def truncate_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """Longest prefix of ``text`` that fits in ``max_tokens``."""
+    if max_tokens <= 0:
+        return ""
+    encoding = _encoding(model)
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+    used = 0
+    for match in _PIECE.finditer(text):
+        used += math.ceil(len(match.group()) / 4)
+        if used > max_tokens:
+            return text[: match.start()].rstrip()
+    return text
+
+
+def input_token_budget(model: Optional[str] = None) -> int:
+    """Tokens available for resume plus job text in one prompt to ``model``."""
+    return config.ai_prompt_input_tokens_by_model.get(model or "", config.ai_prompt_input_tokens)
+
+
+@dataclass
+class CompactedText:
+    """A compacted input and what compaction did to it."""
+
+    text: str
+    tokens: int
+    original_tokens: int
+    dropped_sections: List[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __bool__(self) -> bool:
+        return bool(self.text)
+
+
+@dataclass
+class _Section:
+    heading: str
+    paragraphs: List[str]
+    priority: int
+    relevance: float = 0.0
+
+    @property
+    def text(self) -> str:
+        body = "\n\n".join(self.paragraphs)
+        return f"{self.heading}\n{body}" if self.heading else body
+
+
+def _is_heading(line: str, table: Sequence[Tuple[str, int]]) -> bool:
+    stripped = line.strip()
+    if not _HEADING.match(stripped) or len(stripped.split()) > 6:
+        return False
+    if stripped.endswith(":") or stripped.isupper() or stripped.startswith("#"):
+        return True
+    # A bare title-case line ("Acme Corp - Senior Engineer") is only a heading
+    # if it names a known section.
+    lowered = stripped.lower()
+    return stripped.istitle() and any(keyword in lowered for keyword, _ in table)
+
+
+def _priority(heading: str, table: Sequence[Tuple[str, int]]) -> int:
+    lowered = heading.lower()
+    for keyword, priority in table:
+        if keyword in lowered:
+            return priority
+    return _DEFAULT_PRIORITY
+
+
+def _sections(text: str, table: Sequence[Tuple[str, int]]) -> List[_Section]:
+    sections = [_Section("", [], _DEFAULT_PRIORITY)]
+    for block in _BLANK_LINES.split(text.replace("\r\n", "\n")):
+        lines: List[str] = []
+        for line in block.split("\n"):
+            if _is_heading(line, table):
+                if lines:
+                    sections[-1].paragraphs.append("\n".join(lines))
+                    lines = []
+                heading = line.strip()
+                sections.append(_Section(heading, [], _priority(heading, table)))
+            elif line.strip():
+                lines.append(line.rstrip())
+        if lines:
+            sections[-1].paragraphs.append("\n".join(lines))
+    return [s for s in sections if s.paragraphs or s.heading]
+
+
+def _strip_boilerplate(sections: List[_Section]) -> Tuple[List[_Section], List[str]]:
+    seen: Set[str] = set()
+    kept, dropped = [], []
+    for section in sections:
+        if section.priority == 0:
+            dropped.append(section.heading)
+            continue
+        paragraphs = []
+        for paragraph in section.paragraphs:
+            key = " ".join(paragraph.lower().split())
+            if key in seen or _BOILERPLATE.search(paragraph):
+                continue
+            seen.add(key)
+            paragraphs.append(paragraph)
+        if paragraphs or not section.paragraphs:
+            section.paragraphs = paragraphs
+            kept.append(section)
+        else:
+            dropped.append(section.heading)
+    return kept, dropped
+
+
+def _compact(
+    text: Optional[str],
+    max_tokens: int,
+    model: Optional[str],
+    table: Sequence[Tuple[str, int]],
+    relevance: Optional[Callable[[str], float]] = None,
+) -> CompactedText:
+    text = text or ""
+    original_tokens = count_tokens(text, model)
+    sections, dropped = _strip_boilerplate(_sections(text, table))
+    if relevance is not None:
+        for section in sections:
+            section.relevance = relevance(section.text)
+
+    measured = [(section, count_tokens(section.text, model)) for section in sections]
+    # Sections are joined by a blank line, which costs about one token.
+    if sum(tokens + 1 for _, tokens in measured) > max_tokens:
+        ranked = sorted(
+            range(len(measured)),
+            key=lambda i: (-measured[i][0].priority, -measured[i][0].relevance, i),
+        )
+        keep: Set[int] = set()
+        remaining = max_tokens
+        partial: Optional[Tuple[int, str]] = None
+        for i in ranked:
+            section, tokens = measured[i]
+            if tokens + 1 <= remaining:
+                keep.add(i)
+                remaining -= tokens + 1
+            elif partial is None and remaining > 8:
+                partial = (i, _truncate_lines(section.text, remaining - 1, model))
+                remaining = 0
+            else:
+                dropped.append(section.heading or "(untitled)")
+        pieces = []
+        for i, (section, _) in enumerate(measured):
+            if i in keep:
+                pieces.append(section.text)
+            elif partial is not None and partial[0] == i:
+                pieces.append(partial[1])
+        compacted = "\n\n".join(pieces)
+    else:
+        compacted = "\n\n".join(section.text for section, _ in measured)
+
+    tokens = count_tokens(compacted, model)
+    if tokens > max_tokens:
+        compacted = truncate_tokens(compacted, max_tokens, model)
+        tokens = count_tokens(compacted, model)
+    return CompactedText(compacted, tokens, original_tokens, [d for d in dropped if d])
+
+
+def _truncate_lines(text: str, max_tokens: int, model: Optional[str]) -> str:
+    """Whole lines of ``text`` while they fit, then a cut at a token boundary."""
+    kept, used = [], 0
+    for line in text.split("\n"):
+        cost = count_tokens(line, model) + 1
+        if used + cost > max_tokens:
+            if not kept:
+                kept.append(truncate_tokens(line, max_tokens, model))
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept)
+
+
+def compact_job_description(
+    text: Optional[str], max_tokens: int, model: Optional[str] = None
+) -> CompactedText:
+    """Fit a job description into ``max_tokens``, keeping requirements first."""
+    return _compact(text, max_tokens, model, _JOB_SECTIONS)
+
+
+def compact_resume(
+    text: Optional[str],
+    max_tokens: int,
+    model: Optional[str] = None,
+    job_description: Optional[str] = None,
+) -> CompactedText:
+    """Fit a resume into ``max_tokens``.
+
+    With a ``job_description``, sections mentioning more of the job's skills
+    are kept first among sections of equal priority.
+    """
+    relevance = None
+    if job_description:
+        matcher = get_skill_matcher()
+        wanted = set(matcher.extract(job_description))
+        if wanted:
+            relevance = lambda section: len(wanted.intersection(matcher.extract(section))) / len(wanted)  # noqa: E731
+    return _compact(text, max_tokens, model, _RESUME_SECTIONS, relevance)
+
+
+def fit_prompt_inputs(
+    resume: Optional[str],
+    job_description: Optional[str],
+    model: Optional[str] = None,
+    budget: Optional[int] = None,
+) -> Tuple[CompactedText, CompactedText]:
+    """Compact a resume and a job description to share one token budget.
+
+    Each gets half; whatever one does not need goes to the other.
+    """
+    budget = budget if budget is not None else input_token_budget(model)
+    job = compact_job_description(job_description, budget // 2, model)
+    resume_text = compact_resume(resume, budget - job.tokens, model, job_description)
+    if resume_text.tokens < budget // 2 and job.tokens < job.original_tokens:
+        job = compact_job_description(job_description, budget - resume_text.tokens, model)
+    return resume_text, job
@@ -1,8 +1,12 @@
 """Response wrapper utility for consistent API responses."""
 
-from typing import TypeVar, Generic, Optional, Any, Dict
+from typing import AsyncIterator, TypeVar, Generic, Optional, Any, Dict
+from fastapi.responses import StreamingResponse
+from loguru import logger
 from pydantic import BaseModel
 
+from src.core.streaming import StreamEvent
+
 T = TypeVar('T')
 
 class ApiResponse(BaseModel, Generic[T]):
@@ -33,9 +37,14 @@ def paginated_response(
     page: int, 
     limit: int, 
     total: int,
-    message: Optional[str] = None
+    message: Optional[str] = None,
+    next_cursor: Optional[str] = None
 ) -> ApiResponse[Dict[str, Any]]:
-    """Create a paginated response."""
+    """Create a paginated response.
+    
+    ``next_cursor`` is included for keyset-paginated listings; pass it back as
+    ``cursor`` to fetch the following page.
+    """
     pagination_data = {
         "data": data,
         "pagination": {
@@ -45,9 +54,45 @@ def paginated_response(
             "total_pages": (total + limit - 1) // limit
         }
     }
+    if next_cursor is not None:
+        pagination_data["pagination"]["next_cursor"] = next_cursor
     
     return ApiResponse(
         success=True,
         data=pagination_data,
         message=message or "Data retrieved successfully"
     )
+
+
+def sse_response(events: AsyncIterator[StreamEvent]) -> StreamingResponse:
+    """Stream ``events`` as Server-Sent Events.
+
+    A failure after the response has started cannot change its status code,
+    so it is reported as a final ``error`` event instead.
+    """
+    return _event_stream(events, StreamEvent.to_sse, "text/event-stream")
+
+
+def ndjson_response(events: AsyncIterator[StreamEvent]) -> StreamingResponse:
+    """Stream ``events`` as newline-delimited JSON, one ``{"event", "data"}`` per line.
+
+    Failures are reported as a final ``error`` line, as in ``sse_response``.
+    """
+    return _event_stream(events, StreamEvent.to_ndjson, "application/x-ndjson")
+
+
+def _event_stream(events: AsyncIterator[StreamEvent], encode, media_type: str) -> StreamingResponse:
+    async def body() -> AsyncIterator[str]:
+        try:
+            async for event in events:
+                yield encode(event)
+        except Exception as e:
+            logger.error(f"Event stream failed: {e}", exc_info=True)
+            yield encode(StreamEvent("error", {"detail": str(e)}))
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        # Proxies must not buffer the stream, or the client gets it all at once.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
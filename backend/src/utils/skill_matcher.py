@@ -0,0 +1,310 @@
+"""Skill matching engine shared by resumes, job conversion and AI fallbacks.
+
+A taxonomy maps canonical skill names to their aliases (``"k8s"`` ->
+``"Kubernetes"``). It is compiled once into an Aho-Corasick automaton, so
+finding every skill in a text is a single linear pass regardless of how many
+skills the taxonomy holds.
+
+Matching ignores case, except for aliases of ``SHORT_ALIAS_MAX_LENGTH``
+characters or fewer: ``"ML"`` or ``"Go"`` only match as spelled in the
+taxonomy or in capitals, so "ml" in "500 ml" or "go" in "go-getter" do not.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+
+# Aliases this short are matched case-sensitively; see the module docstring.
+SHORT_ALIAS_MAX_LENGTH = 2
+
+# Canonical skill -> aliases. The canonical name is always matched as well.
+DEFAULT_SKILL_TAXONOMY: Dict[str, List[str]] = {
+    # Programming languages
+    "Python": ["python3"],
+    "JavaScript": ["JS", "ecmascript"],
+    "TypeScript": ["TS"],
+    "Java": [],
+    "C++": ["cpp"],
+    "C#": ["csharp", "c sharp"],
+    "Go": ["golang"],
+    "Rust": [],
+    "PHP": [],
+    "Ruby": [],
+    "Swift": [],
+    "Kotlin": [],
+    "Scala": [],
+    "R": [],
+    "MATLAB": [],
+    "Perl": [],
+    "Shell": [],
+    "Bash": [],
+    # Frameworks and libraries
+    "React": ["react.js", "reactjs"],
+    "Angular": ["angularjs"],
+    "Vue": ["vue.js", "vuejs"],
+    "Node.js": ["nodejs"],
+    "Express": ["express.js"],
+    "Django": [],
+    "Flask": [],
+    "Spring": ["spring boot"],
+    "Laravel": [],
+    "ASP.NET": [],
+    "FastAPI": [],
+    "TensorFlow": [],
+    "PyTorch": [],
+    "Scikit-learn": ["sklearn", "scikit learn"],
+    # Databases
+    "SQL": [],
+    "MySQL": [],
+    "PostgreSQL": ["postgres"],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "SQLite": [],
+    "Oracle": [],
+    "SQL Server": ["mssql"],
+    "Elasticsearch": ["elastic search"],
+    # Cloud platforms
+    "AWS": ["amazon web services"],
+    "Azure": ["microsoft azure"],
+    "Google Cloud": ["gcp", "google cloud platform"],
+    "Heroku": [],
+    "DigitalOcean": [],
+    "Vercel": [],
+    # Tools and technologies
+    "Git": [],
+    "Docker": [],
+    "Kubernetes": ["k8s"],
+    "Jenkins": [],
+    "CI/CD": ["ci cd", "continuous integration"],
+    "REST API": ["restful api", "rest apis"],
+    "GraphQL": [],
+    "Microservices": ["microservice"],
+    "Agile": [],
+    "Scrum": [],
+    "DevOps": [],
+    "Linux": [],
+    "Unix": [],
+    # Data
+    "Machine Learning": ["ML"],
+    "AI": ["artificial intelligence"],
+    "Data Science": [],
+    "Data Analysis": ["data analytics"],
+    "Statistics": [],
+    "Analytics": [],
+}
+
+
+@dataclass(frozen=True)
+class SkillMatch:
+    """One occurrence of a skill in a text."""
+
+    skill: str
+    alias: str
+    start: int
+    end: int
+
+
+@dataclass
+class SkillOverlap:
+    """How a job description's skills compare with a candidate's."""
+
+    required: List[str]
+    matched: List[str]
+    missing: List[str]
+    score: float
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over every alias in a skill taxonomy."""
+
+    def __init__(self, taxonomy: Mapping[str, Iterable[str]]) -> None:
+        self.taxonomy = {skill: list(aliases) for skill, aliases in taxonomy.items()}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # (lowered alias, skill, accepted spellings or None for any case)
+        self._output: List[List[Tuple[str, str, Optional[FrozenSet[str]]]]] = [[]]
+
+        for skill, aliases in self.taxonomy.items():
+            spellings: Dict[str, Set[str]] = {}
+            for alias in (skill, *aliases):
+                alias = alias.strip()
+                if alias:
+                    spellings.setdefault(alias.lower(), set()).update(
+                        {alias, alias.upper()}
+                    )
+            for alias, accepted in spellings.items():
+                exact = (
+                    frozenset(accepted) if len(alias) <= SHORT_ALIAS_MAX_LENGTH else None
+                )
+                self._add(alias, skill, exact)
+        self._build_failure_links()
+
+    @classmethod
+    def from_file(cls, path: str) -> "SkillMatcher":
+        """Load a taxonomy from a JSON or YAML mapping of skill -> aliases."""
+        file_path = Path(path)
+        content = file_path.read_text(encoding="utf-8")
+        if file_path.suffix.lower() in (".yaml", ".yml"):
+            import yaml
+
+            data = yaml.safe_load(content) or {}
+        else:
+            data = json.loads(content)
+        return cls({str(k): [str(a) for a in (v or [])] for k, v in data.items()})
+
+    def _add(
+        self, alias: str, skill: str, exact: Optional[FrozenSet[str]]
+    ) -> None:
+        node = 0
+        for char in alias:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append((alias, skill, exact))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = (
+                    self._output[child] + self._output[self._fail[child]]
+                )
+
+    def find(self, text: str) -> List[SkillMatch]:
+        """Return every whole-word skill occurrence in ``text`` with offsets."""
+        if not text:
+            return []
+
+        lowered = text.lower()
+        length = len(lowered)
+        # Lowercasing can change length for a few Unicode characters; offsets
+        # then refer to the lowered text.
+        source = text if len(text) == length else lowered
+        matches: List[SkillMatch] = []
+        node = 0
+        for index, char in enumerate(lowered):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for alias, skill, exact in self._output[node]:
+                start = index - len(alias) + 1
+                end = index + 1
+                if exact is not None and source[start:end] not in exact:
+                    continue
+                # Whole words only: "java" must not match inside "javascript".
+                if (
+                    start > 0
+                    and _is_word_char(lowered[start - 1])
+                    and _is_word_char(alias[0])
+                ):
+                    continue
+                if (
+                    end < length
+                    and _is_word_char(lowered[end])
+                    and _is_word_char(alias[-1])
+                ):
+                    continue
+                matches.append(SkillMatch(skill, source[start:end], start, end))
+        return matches
+
+    def extract(self, text: str) -> List[str]:
+        """Return the canonical skills found in ``text``, in order of appearance."""
+        return list(dict.fromkeys(match.skill for match in self.find(text)))
+
+    def extract_many(self, texts: Sequence[str]) -> List[List[str]]:
+        """Extract skills from many texts with the same compiled automaton."""
+        return [self.extract(text) for text in texts]
+
+    def canonicalize(self, skills: Iterable[str]) -> List[str]:
+        """Map free-form skill names (e.g. from a resume) to canonical names.
+
+        Names that are not in the taxonomy are kept as given.
+        """
+        result = []
+        for skill in skills:
+            found = self.extract(skill)
+            result.extend(found if found else [skill.strip()])
+        return list(dict.fromkeys(s for s in result if s))
+
+    def score_many(
+        self, candidate_skills: Iterable[str], descriptions: Sequence[str]
+    ) -> List[SkillOverlap]:
+        """Score many job descriptions against one candidate's skills.
+
+        The score is the fraction of skills required by a description that the
+        candidate has; descriptions with no recognised skills score 0.
+        """
+        have = {s.lower() for s in self.canonicalize(candidate_skills)}
+        overlaps = []
+        for required in self.extract_many(descriptions):
+            matched = [s for s in required if s.lower() in have]
+            missing = [s for s in required if s.lower() not in have]
+            score = len(matched) / len(required) if required else 0.0
+            overlaps.append(
+                SkillOverlap(
+                    required=required,
+                    matched=matched,
+                    missing=missing,
+                    score=round(score, 3),
+                )
+            )
+        return overlaps
+
+
+@lru_cache(maxsize=1)
+def get_skill_matcher() -> SkillMatcher:
+    """Return the process-wide matcher, compiled on first use.
+
+    Uses the taxonomy file from ``SKILL_TAXONOMY_PATH`` when configured,
+    otherwise the built-in taxonomy.
+    """
+    from src.config import config
+
+    if config.skill_taxonomy_path:
+        return SkillMatcher.from_file(config.skill_taxonomy_path)
+    return SkillMatcher(DEFAULT_SKILL_TAXONOMY)
+
+
+@lru_cache(maxsize=32)
+def _matcher_for_keywords(keywords: Tuple[str, ...]) -> SkillMatcher:
+    return SkillMatcher({keyword: [] for keyword in keywords})
+
+
+def extract_skills_from_keywords(
+    text: str, keywords: Optional[Sequence[str]]
+) -> List[str]:
+    """Extract skills using an ad-hoc keyword list instead of the taxonomy."""
+    if keywords is None:
+        return get_skill_matcher().extract(text)
+    return _matcher_for_keywords(tuple(keywords)).extract(text)
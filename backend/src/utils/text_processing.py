@@ -4,6 +4,8 @@ import re
 from typing import List, Dict, Any, Optional
 from difflib import SequenceMatcher
 
+from src.utils.skill_matcher import extract_skills_from_keywords
+
 
 def clean_text(text: str) -> str:
     """
@@ -39,7 +41,8 @@ def extract_skills(text: str, skill_keywords: Optional[List[str]] = None) -> Lis
     
     Args:
         text: Text to analyze
-        skill_keywords: Optional list of skill keywords to look for
+        skill_keywords: Optional list of skill keywords to look for; defaults to
+            the shared skill taxonomy (which also resolves aliases like "k8s")
         
     Returns:
         List of extracted skills
@@ -47,38 +50,7 @@ def extract_skills(text: str, skill_keywords: Optional[List[str]] = None) -> Lis
     if not text:
         return []
     
-    # Default skill keywords if none provided
-    if skill_keywords is None:
-        skill_keywords = [
-            # Programming languages
-            "Python", "JavaScript", "Java", "C++", "C#", "Go", "Rust", "PHP", "Ruby", "Swift",
-            "TypeScript", "Kotlin", "Scala", "R", "MATLAB", "Perl", "Shell", "Bash",
-            
-            # Frameworks and libraries
-            "React", "Angular", "Vue", "Node.js", "Express", "Django", "Flask", "Spring",
-            "Laravel", "ASP.NET", "FastAPI", "TensorFlow", "PyTorch", "Scikit-learn",
-            
-            # Databases
-            "MySQL", "PostgreSQL", "MongoDB", "Redis", "SQLite", "Oracle", "SQL Server",
-            
-            # Cloud platforms
-            "AWS", "Azure", "Google Cloud", "Heroku", "DigitalOcean", "Vercel",
-            
-            # Tools and technologies
-            "Git", "Docker", "Kubernetes", "Jenkins", "CI/CD", "REST API", "GraphQL",
-            "Microservices", "Agile", "Scrum", "DevOps", "Linux", "Unix"
-        ]
-    
-    # Clean text
-    cleaned_text = clean_text(text)
-    
-    # Find skills in text (case-insensitive)
-    found_skills = []
-    for skill in skill_keywords:
-        if re.search(rf'\b{re.escape(skill)}\b', cleaned_text, re.IGNORECASE):
-            found_skills.append(skill)
-    
-    return found_skills
+    return extract_skills_from_keywords(text, skill_keywords)
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
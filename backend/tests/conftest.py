@@ -111,6 +111,47 @@ def sample_cover_letter():
     return sample_cover_letter_data()
 
 
+@pytest.fixture
+def job_search_service_factory(monkeypatch):
+    """Build job search services with an isolated cache and a fake scraper.
+
+    Call it with the supported sites and a ``scrape(service, params)``
+    function standing in for JobSpy; ``service.scrapes`` starts empty for it
+    to record into.
+    """
+    from src.core.cache_manager import CacheManager
+    from src.services import job_search_service as job_search_module
+    from src.services.job_search_service import JobSearchService
+
+    monkeypatch.setattr(
+        job_search_module, "cache_manager", CacheManager(l2_enabled=False)
+    )
+    services = []
+
+    def build(sites, scrape):
+        svc = JobSearchService()
+        svc.supported_platforms = list(sites)
+        svc.scrapes = []
+
+        async def fake_initialize():
+            svc._initialized = True
+            svc._jobspy_available = True
+
+        async def no_catalog(jobs):
+            return 0
+
+        svc.initialize = fake_initialize
+        svc.catalog.record = no_catalog
+        svc._run_scrape = lambda params: scrape(svc, params)
+        services.append(svc)
+        return svc
+
+    yield build
+    for svc in services:
+        if svc._executor is not None:
+            svc._executor.shutdown(wait=True)
+
+
 @pytest.fixture
 async def mock_database():
     """Mock database for testing."""
@@ -0,0 +1,133 @@
+"""In-process SMTP server test double.
+
+Speaks just enough SMTP (EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT) for
+``smtplib`` to deliver messages, and records what it receives. It runs its
+own event loop in a background thread so blocking SMTP clients can talk to it
+from worker threads.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class ReceivedMessage:
+    mail_from: str
+    rcpt_tos: List[str]
+    data: str
+
+
+@dataclass
+class FakeSMTPServer:
+    """Threaded SMTP server for tests.
+
+    Args:
+        drop_after: Close each connection after this many messages, to
+            exercise client reconnects. ``None`` keeps connections open.
+        refuse: Recipient addresses rejected at RCPT with a 550.
+    """
+
+    host: str = "127.0.0.1"
+    drop_after: Optional[int] = None
+    refuse: List[str] = field(default_factory=list)
+    messages: List[ReceivedMessage] = field(default_factory=list)
+    connections: int = 0
+    port: int = 0
+
+    def __post_init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> "FakeSMTPServer":
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(self._start(), self._loop)
+        future.result(timeout=5)
+        return self
+
+    def stop(self) -> None:
+        async def _close():
+            self._server.close()
+            await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(_close(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    def __enter__(self) -> "FakeSMTPServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    async def _start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        with self._lock:
+            self.connections += 1
+        delivered = 0
+        mail_from, rcpt_tos = "", []
+
+        async def reply(line: str) -> None:
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        await reply("220 fake-smtp ready")
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                line = raw.decode().rstrip("\r\n")
+                command = line[:4].upper()
+
+                if command in ("EHLO", "HELO"):
+                    await reply("250-fake-smtp" if command == "EHLO" else "250 fake-smtp")
+                    if command == "EHLO":
+                        await reply("250-8BITMIME")
+                        await reply("250 PIPELINING")
+                elif command == "MAIL":
+                    mail_from, rcpt_tos = line.split(":", 1)[1].strip(), []
+                    await reply("250 OK")
+                elif command == "RCPT":
+                    rcpt = line.split(":", 1)[1].strip()
+                    if rcpt.strip("<>") in self.refuse:
+                        await reply("550 No such user")
+                        continue
+                    rcpt_tos.append(rcpt)
+                    await reply("250 OK")
+                elif command == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    lines = []
+                    while True:
+                        data_line = (await reader.readline()).decode()
+                        if data_line in (".\r\n", ".\n", ""):
+                            break
+                        lines.append(data_line)
+                    with self._lock:
+                        self.messages.append(
+                            ReceivedMessage(mail_from, rcpt_tos, "".join(lines))
+                        )
+                    delivered += 1
+                    await reply("250 OK queued")
+                    if self.drop_after is not None and delivered >= self.drop_after:
+                        break
+                elif command == "RSET":
+                    mail_from, rcpt_tos = "", []
+                    await reply("250 OK")
+                elif command == "NOOP":
+                    await reply("250 OK")
+                elif command == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        finally:
+            writer.close()
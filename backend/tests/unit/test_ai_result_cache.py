@@ -0,0 +1,167 @@
+"""Tests for the content-addressed AI result cache."""
+
+import pytest
+
+from src.core.ai_result_cache import AIResultCache, AIRoute, MinHasher
+
+ROUTE = AIRoute("openai", "gpt-4", 0.7)
+
+JOB = (
+    "We are hiring a senior Python engineer to build data pipelines on AWS. "
+    "You will design streaming ingestion with Kafka, own our Postgres schema, "
+    "mentor two junior developers and work closely with the analytics team. "
+    "Requirements: five years of Python, strong SQL, experience with Airflow, "
+    "Docker and Kubernetes, and excellent written communication. Remote friendly, "
+    "competitive salary, equity and a yearly learning budget are included."
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AIResultCache(str(tmp_path / "ai_cache.sqlite3"), ttl=3600)
+    yield cache
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_exact_hit_ignores_whitespace_and_survives_restart(cache):
+    inputs = {"resume_content": "Jane Doe\nPython developer"}
+    await cache.set("analyze_job_match", ROUTE, inputs, {"match_percentage": 88}, document=JOB)
+
+    respaced = {"resume_content": "  Jane Doe   Python developer "}
+    assert await cache.get("analyze_job_match", ROUTE, respaced, document=f"\n{JOB}  ") == {
+        "match_percentage": 88
+    }
+
+    reopened = AIResultCache(cache.path, ttl=3600)
+    try:
+        assert await reopened.get("analyze_job_match", ROUTE, inputs, document=JOB) == {
+            "match_percentage": 88
+        }
+    finally:
+        reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_key_covers_operation_route_and_inputs(cache):
+    inputs = {"resume_content": "Jane Doe"}
+    await cache.set("extract_resume_skills", ROUTE, inputs, ["Python"])
+
+    assert await cache.get("extract_resume_skills", ROUTE, inputs) == ["Python"]
+    assert await cache.get("extract_resume_skills", AIRoute("openai", "gpt-4", 0.2), inputs) is None
+    assert await cache.get("extract_resume_skills", AIRoute("gemini", "gpt-4", 0.7), inputs) is None
+    assert await cache.get("analyze_job_match", ROUTE, inputs) is None
+    assert await cache.get("extract_resume_skills", ROUTE, {"resume_content": "John Roe"}) is None
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_job_description_reuses_result(cache):
+    inputs = {"resume_content": "Jane Doe", "job_title": "Engineer"}
+    await cache.set("prepare_interview", ROUTE, inputs, {"questions": ["q1"]}, document=JOB)
+
+    reposted = f"Reposted. {JOB} Apply today."
+    assert await cache.get("prepare_interview", ROUTE, inputs, document=reposted) == {"questions": ["q1"]}
+    assert cache.stats()["near_hits"] == 1
+
+    # The rest of the request must still match exactly.
+    other = {**inputs, "job_title": "Manager"}
+    assert await cache.get("prepare_interview", ROUTE, other, document=reposted) is None
+    unrelated = "Registered nurse for night shifts in a busy emergency department, BLS required."
+    assert await cache.get("prepare_interview", ROUTE, inputs, document=unrelated) is None
+
+
+@pytest.mark.asyncio
+async def test_expired_and_disabled_entries_are_not_served(tmp_path):
+    expired = AIResultCache(str(tmp_path / "expired.sqlite3"), ttl=-1)
+    await expired.set("analyze_job_match", ROUTE, {}, {"match_percentage": 1}, document=JOB)
+    assert await expired.get("analyze_job_match", ROUTE, {}, document=JOB) is None
+    expired.close()
+
+    cache = AIResultCache(":memory:", disabled_operations=["generate_cover_letter"])
+    assert cache.enabled_for("analyze_job_match")
+    assert not cache.enabled_for("generate_cover_letter")
+    cache.close()
+
+
+def test_minhash_similarity_tracks_overlap():
+    hasher = MinHasher()
+    base = hasher.signature(JOB)
+
+    assert hasher.similarity(base, hasher.signature(JOB.upper())) == 1.0
+    assert hasher.similarity(base, hasher.signature(JOB + " Apply today.")) > 0.9
+    assert hasher.similarity(base, hasher.signature("Chef wanted for a seaside restaurant.")) < 0.2
+    assert hasher.signature("   ") is None
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_under_the_route_that_answered(cache):
+    from src.core.ai_result_cache import record_route
+    from src.services.unified_ai_service import UnifiedAIService
+
+    assert UnifiedAIService().result_cache is None
+    service = UnifiedAIService(result_cache=cache)
+
+    async def predicted_route():
+        return ROUTE
+
+    service._current_route = predicted_route
+    fallback = AIRoute("openrouter", "llama", 0.7)
+
+    async def answered_by_fallback():
+        record_route(fallback)
+        return ["Python"]
+
+    inputs = {"resume_content": "Jane Doe"}
+    assert await service._cached("extract_resume_skills", inputs, answered_by_fallback) == ["Python"]
+    assert await cache.get("extract_resume_skills", fallback, inputs) == ["Python"]
+    assert await cache.get("extract_resume_skills", ROUTE, inputs) is None
+
+    async def provider_mock():
+        record_route(AIRoute("gemini", "gemini-1.5-flash", 0.7))
+        return service.gemini_service._mock_job_match_analysis()
+
+    await service._cached("analyze_job_match", inputs, provider_mock)
+    assert await cache.get(
+        "analyze_job_match", AIRoute("gemini", "gemini-1.5-flash", 0.7), inputs
+    ) is None
+
+
+@pytest.mark.asyncio
+async def test_lookup_route_follows_the_router_ranking(cache, monkeypatch):
+    from types import SimpleNamespace
+
+    from src.core.ai_result_cache import record_route
+    from src.services.ai_router import MIN_SAMPLES
+    from src.services.unified_ai_service import UnifiedAIService
+
+    service = UnifiedAIService(result_cache=cache)
+    service._use_modern_providers = True
+    manager = service.provider_manager
+    first, fast = (
+        SimpleNamespace(
+            provider_name=name, config=SimpleNamespace(model=f"{name}-model", temperature=0.7)
+        )
+        for name in ("openai", "groq")
+    )
+    monkeypatch.setattr(manager, "providers", {"openai": first, "groq": fast})
+    monkeypatch.setattr(manager, "provider_order", ["openai", "groq"])
+
+    async def available(provider):
+        return True
+
+    monkeypatch.setattr(manager, "_is_available", available)
+    for _ in range(MIN_SAMPLES):
+        manager.router._stats("openai").record_success(2.0)
+        manager.router._stats("groq").record_success(0.5)
+
+    calls = []
+
+    async def answered_by_fast():
+        calls.append(1)
+        record_route(AIRoute("groq", "groq-model", 0.7))
+        return ["Python"]
+
+    inputs = {"resume_content": "Jane Doe"}
+    for _ in range(2):
+        assert await service._cached("extract_resume_skills", inputs, answered_by_fast) == ["Python"]
+    assert calls == [1]
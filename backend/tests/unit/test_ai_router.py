@@ -0,0 +1,95 @@
+"""Tests for latency-aware AI provider routing."""
+
+import asyncio
+import pytest
+
+from src.core.ai_provider import AIProviderConfig
+from src.services.ai_router import MIN_SAMPLES, ProviderRouter, RoutingStrategy
+
+
+class FakeProvider:
+    """Answers after ``delay`` seconds, or raises if ``fails``."""
+
+    def __init__(self, name: str, delay: float = 0.0, fails: bool = False):
+        self.config = AIProviderConfig(provider_name=name, model="test")
+        self.provider_name = name
+        self.delay = delay
+        self.fails = fails
+        self.started = 0
+        self.cancelled = 0
+
+    async def generate_text(self, prompt: str):
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fails:
+            raise RuntimeError(f"{self.provider_name} down")
+        return f"{self.provider_name}: {prompt}"
+
+
+def _call(provider):
+    return provider.generate_text("hi")
+
+
+@pytest.mark.asyncio
+async def test_sequential_falls_back_on_failure():
+    broken, healthy = FakeProvider("broken", fails=True), FakeProvider("healthy")
+    router = ProviderRouter(strategy=RoutingStrategy.SEQUENTIAL)
+
+    assert await router.run([broken, healthy], _call) == "healthy: hi"
+    assert router.stats["broken"].error_rate == 1.0
+
+    with pytest.raises(RuntimeError, match="All AI providers failed"):
+        await router.run([broken], _call)
+
+
+@pytest.mark.asyncio
+async def test_hedged_starts_backup_after_delay_and_cancels_loser():
+    slow, fast = FakeProvider("slow", delay=5.0), FakeProvider("fast", delay=0.01)
+    router = ProviderRouter(strategy=RoutingStrategy.HEDGED, hedge_delay=0.05)
+
+    assert await asyncio.wait_for(router.run([slow, fast], _call), timeout=1) == "fast: hi"
+    await asyncio.sleep(0)
+    assert slow.cancelled == 1
+
+    # A primary that answers before the hedge delay is never hedged.
+    quick, spare = FakeProvider("quick"), FakeProvider("spare")
+    assert await router.run([quick, spare], _call) == "quick: hi"
+    assert spare.started == 0
+
+
+@pytest.mark.asyncio
+async def test_race_starts_everything_and_first_success_wins():
+    providers = [FakeProvider("a", delay=0.2), FakeProvider("b", fails=True), FakeProvider("c", delay=0.01)]
+    router = ProviderRouter(strategy=RoutingStrategy.RACE)
+
+    assert await router.run(providers, _call) == "c: hi"
+    assert [p.started for p in providers] == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_order_ranks_scored_providers_by_expected_latency():
+    a, b, c = FakeProvider("a"), FakeProvider("b"), FakeProvider("c")
+    router = ProviderRouter()
+    assert router.order([a, b, c]) == [a, b, c]
+
+    for _ in range(MIN_SAMPLES):
+        router._stats("a").record_success(2.0)
+        router._stats("b").record_success(0.5)
+    assert router.order([a, b, c]) == [b, a, c]
+    assert router.hedge_after(b) == 0.5
+    assert router.hedge_after(c) == router.hedge_delay
+
+    # Frequent failures outweigh a fast median.
+    for _ in range(4 * MIN_SAMPLES):
+        router._stats("b").record_failure()
+    assert router.order([a, b, c]) == [a, b, c]
+
+
+def test_unknown_strategy_falls_back_to_sequential():
+    assert ProviderRouter().strategy is RoutingStrategy.SEQUENTIAL
+    assert ProviderRouter(strategy="hedge").strategy is RoutingStrategy.SEQUENTIAL
+    assert ProviderRouter(strategy="race").strategy is RoutingStrategy.RACE
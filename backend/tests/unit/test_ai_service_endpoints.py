@@ -917,6 +917,52 @@ class TestInterviewPrepEndpoint:
             assert isinstance(data["tips"], list)
 
 
+# =============================================================================
+# Tests for /rank-jobs endpoint
+# =============================================================================
+
+
+class TestRankJobsEndpoint:
+    """Test cases for POST /api/v1/ai/rank-jobs endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_rank_jobs_orders_by_match(self, client_authenticated):
+        """Jobs are ranked locally without touching the AI service."""
+        with patch(
+            "src.services.service_registry.service_registry.get_ai_service",
+            new_callable=AsyncMock,
+        ) as get_ai_service:
+            response = client_authenticated.post(
+                "/api/v1/ai/rank-jobs",
+                json={
+                    "resume_content": "Python developer with FastAPI, Docker and AWS",
+                    "jobs": [
+                        {"id": "sales", "title": "Account Executive",
+                         "description": "Quota-carrying B2B sales role"},
+                        {"id": "py", "title": "Backend Engineer",
+                         "description": "Python, FastAPI and Docker on AWS"},
+                    ],
+                    "top_k": 1,
+                },
+            )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total_jobs"] == 2
+            assert [r["job_id"] for r in data["rankings"]] == ["py"]
+            assert "Python" in data["rankings"][0]["matched_skills"]
+            get_ai_service.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rank_jobs_unauthorized(self, client_unauthenticated):
+        """Test job ranking without authentication returns 401."""
+        response = client_unauthenticated.post(
+            "/api/v1/ai/rank-jobs",
+            json={"resume_content": "Python", "jobs": []},
+        )
+        assert response.status_code == 401
+
+
 # =============================================================================
 # Tests for /health endpoint
 # =============================================================================
@@ -0,0 +1,94 @@
+"""Tests for streamed AI output."""
+
+import json
+import pytest
+
+from src.core.ai_stream import AIStreamEvent, IncrementalJSONParser
+from src.models.cover_letter import CoverLetter
+from src.services.cover_letter_service import CoverLetterService
+
+ANSWER = """```json
+{
+  "questions": [
+    {"question": "Tell me about yourself", "tips": ["Be concise, {really}"]},
+    {"question": "Why \\"us\\"?", "tips": []}
+  ],
+  "company_research": "Payments, EU, 200 people",
+  "confidence_score": 0.8,
+  "empty": []
+}
+```"""
+
+
+def _feed_in_chunks(parser, text, size):
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    return events
+
+
+@pytest.mark.parametrize("size", [1, 7, len(ANSWER)])
+def test_parser_emits_items_and_fields_as_they_complete(size):
+    parser = IncrementalJSONParser()
+    events = _feed_in_chunks(parser, ANSWER, size)
+
+    assert events == [
+        ("item", "questions", {"question": "Tell me about yourself", "tips": ["Be concise, {really}"]}),
+        ("item", "questions", {"question": 'Why "us"?', "tips": []}),
+        ("field", "company_research", "Payments, EU, 200 people"),
+        ("field", "confidence_score", 0.8),
+    ]
+    assert parser.done
+    start = ANSWER.index("{")
+    assert parser.result == json.loads(ANSWER[start:ANSWER.rindex("}") + 1])
+
+
+def test_parser_waits_for_the_delimiter_after_a_value():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"score": 12') == []
+    assert parser.feed("3, ") == [("field", "score", 123)]
+    assert not parser.done
+
+    plain = IncrementalJSONParser()
+    plain.feed("Dear hiring manager, thank you.")
+    assert not plain.done and plain.result == {}
+
+
+def test_event_encodes_as_sse_frame():
+    frame = AIStreamEvent("delta", {"text": "Hi\nthere"}).to_sse()
+    assert frame == 'event: delta\ndata: {"text": "Hi\\nthere"}\n\n'
+
+
+class StreamingAIService:
+    async def is_available(self):
+        return True
+
+    async def stream_cover_letter(self, request):
+        for text in ("Dear team, ", "I am excited."):
+            yield AIStreamEvent("delta", {"text": text})
+        letter = CoverLetter(
+            job_title=request.job_title,
+            company_name=request.company_name,
+            content="Dear team, I am excited.",
+            tone=request.tone,
+            word_count=5,
+        )
+        yield AIStreamEvent("done", letter.model_dump(mode="json"))
+
+
+@pytest.mark.asyncio
+async def test_cover_letter_stream_persists_letter_when_done():
+    service = CoverLetterService(ai_service=StreamingAIService())
+
+    events = [
+        event
+        async for event in service.stream_cover_letter(
+            "Engineer", "Acme", "Build things", "Python dev", user_id="user-1"
+        )
+    ]
+
+    assert [event.event for event in events] == ["delta", "delta", "done"]
+    saved = await service.get_all_cover_letters(user_id="user-1")
+    assert len(saved) == 1
+    assert saved[0].content == "Dear team, I am excited."
+    assert events[-1].data["id"] == saved[0].id
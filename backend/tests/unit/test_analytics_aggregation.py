@@ -0,0 +1,160 @@
+"""Tests for push-down SQL analytics aggregation."""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.aggregation import AggregationDialect, AnalyticsAggregator, get_dialect
+from src.database.models import Base, DBJobApplication
+from src.database.repositories.application_repository import ApplicationRepository
+from src.models.application import ApplicationStatus, JobApplication
+from src.services.analytics_service import AnalyticsService
+
+
+@pytest.fixture
+async def test_db_session():
+    """Create a test database session."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session_maker() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def repository(test_db_session):
+    return ApplicationRepository(test_db_session)
+
+
+def _application(i, company, status, age_days, response_days, applied_days=None):
+    now = datetime.utcnow()
+    # Odd hours keep rows clear of day and week boundaries.
+    created = now - timedelta(days=age_days, hours=5)
+    return JobApplication(
+        id=f"app-{i}",
+        job_id=f"job-{i}",
+        job_title="Engineer",
+        company=company,
+        status=status,
+        created_at=created,
+        updated_at=created + timedelta(days=response_days, hours=3),
+        applied_date=created + timedelta(days=applied_days) if applied_days is not None else None,
+    )
+
+
+@pytest.fixture
+async def applications(repository):
+    await repository.bulk_create(
+        [
+            _application(0, "Acme", ApplicationStatus.OFFER_RECEIVED, 12, 9, applied_days=1),
+            _application(1, "Acme", ApplicationStatus.INTERVIEW_SCHEDULED, 7, 4, applied_days=2),
+            _application(2, "Acme", ApplicationStatus.SUBMITTED, 3, 0),
+            _application(3, "Globex", ApplicationStatus.REJECTED, 30, 14, applied_days=3),
+            _application(4, "Globex", ApplicationStatus.UNDER_REVIEW, 45, 2),
+            _application(5, "Hooli", ApplicationStatus.OFFER_ACCEPTED, 60, 21, applied_days=0),
+            _application(6, "Initech", ApplicationStatus.DRAFT, 1, 0),
+        ],
+        user_id="user-1",
+    )
+    await repository.create(_application(9, "Acme", ApplicationStatus.REJECTED, 2, 1), user_id="user-2")
+    return await repository.get_all(user_id="user-1")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("window", [None, (40, 5)])
+async def test_push_down_matches_row_metrics(applications, test_db_session, window):
+    """Metrics aggregated in SQL equal the metrics computed from the rows."""
+    kwargs = {}
+    if window:
+        now = datetime.utcnow()
+        kwargs = {"start_date": now - timedelta(days=window[0]), "end_date": now - timedelta(days=window[1])}
+    rows = AnalyticsService()
+    pushed = AnalyticsService(aggregator=AnalyticsAggregator(test_db_session))
+
+    for name in ("get_application_success_rate", "get_response_time_analysis", "get_interview_performance"):
+        expected = await getattr(rows, name)(user_id="user-1", applications=applications, **kwargs)
+        assert await getattr(pushed, name)(user_id="user-1", **kwargs) == expected, name
+
+    assert await pushed.get_company_analysis(user_id="user-1") == await rows.get_company_analysis(
+        user_id="user-1", applications=applications
+    )
+    # Stored timestamps are naive UTC; the row path compares them with aware ones.
+    aware = [
+        app.model_copy(update={"created_at": app.created_at.replace(tzinfo=timezone.utc)})
+        for app in applications
+    ]
+    assert await pushed.get_trend_analysis(user_id="user-1") == await rows.get_trend_analysis(
+        user_id="user-1", applications=aware
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_statistics_on_sqlite(applications, repository):
+    """Statistics come back whole on SQLite, which has no EXTRACT(epoch)."""
+    stats = await repository.get_statistics(user_id="user-1")
+
+    assert stats["total_applications"] == 7
+    assert stats["status_breakdown"]["offer_received"] == 1
+    assert stats["status_breakdown"]["withdrawn"] == 0
+    assert stats["recent_activity"] == "4 applications in the last 30 days"
+    assert stats["success_rate"] == pytest.approx(2 / 7 * 100)
+    assert stats["average_response_time_days"] == 1.5
+    assert stats["pending_interviews"] == 1
+    assert stats["active_applications"] == 3
+
+
+@pytest.mark.asyncio
+async def test_sqlite_week_start_is_monday(test_db_session):
+    week = get_dialect("sqlite").week_start
+    days = [datetime(2024, 3, 18) + timedelta(days=i, hours=23) for i in range(7)]
+
+    for day in days:
+        assert (await test_db_session.execute(select(week(day)))).scalar() == "2024-03-18"
+
+
+@pytest.mark.parametrize(
+    "dialect, expected",
+    [
+        (postgresql.dialect(), ["FILTER (WHERE", "EXTRACT(epoch FROM", "date_trunc"]),
+        (mysql.dialect(), ["timestampdiff(MICROSECOND", "date_format", "weekday"]),
+    ],
+)
+def test_server_dialects_compile(dialect, expected):
+    """Postgres and MySQL expressions compile to their native date functions."""
+    backend = get_dialect(dialect.name)
+    app = DBJobApplication
+    stmt = select(
+        backend.count_if(app.status == ApplicationStatus.REJECTED),
+        backend.whole_days(app.created_at, app.updated_at),
+        backend.week_start(app.created_at),
+    )
+
+    sql = str(stmt.compile(dialect=dialect))
+
+    for fragment in expected:
+        assert fragment in sql
+
+
+def test_incomplete_dialect_fails_when_built():
+    class NoWeeks(AggregationDialect):
+        def whole_days(self, start, end):
+            return end - start
+
+        def fractional_days(self, start, end):
+            return end - start
+
+    with pytest.raises(TypeError):
+        NoWeeks()
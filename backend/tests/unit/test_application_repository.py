@@ -6,7 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from sqlalchemy.pool import StaticPool
 
 from src.database.repositories.application_repository import ApplicationRepository
-from src.database.models import DBJobApplication, Base
+from src.database.models import DBJobApplication, DBResume, Base
+from src.database.projections import ApplicationRow
 from src.models.application import JobApplication, ApplicationStatus
 
 
@@ -197,3 +198,38 @@ async def test_get_statistics(repository):
     assert ApplicationStatus.DRAFT in stats["status_breakdown"]
     assert ApplicationStatus.SUBMITTED in stats["status_breakdown"]
 
+
+
+@pytest.mark.asyncio
+async def test_listings_use_column_projection(repository, test_db_session):
+    """Listings return validated-equivalent models without loading documents."""
+    resume = DBResume(id="resume-1", name="CV", file_path="/cv.pdf", file_type="pdf", content="x" * 10000)
+    test_db_session.add(resume)
+    await test_db_session.commit()
+    application = JobApplication(
+        id="test-1",
+        job_id="job-1",
+        job_title="Developer 1",
+        company="Corp 1",
+        status=ApplicationStatus.SUBMITTED,
+        applied_date=datetime(2026, 1, 2, 3, 4, 5),
+    )
+    await repository.create(application)
+    db_app = await test_db_session.get(DBJobApplication, "test-1")
+    db_app.resume_id = "resume-1"
+    await test_db_session.commit()
+    test_db_session.expunge_all()
+
+    (listed,) = await repository.get_all()
+    assert listed == (await repository.get_by_id("test-1"))
+    assert listed.status == "submitted"
+    assert listed.model_dump() == JobApplication(**listed.model_dump()).model_dump()
+
+    (row,) = await repository.get_rows(status=ApplicationStatus.SUBMITTED)
+    assert isinstance(row, ApplicationRow)
+    assert row.to_dict()["applied_date"] == "2026-01-02T03:04:05"
+    assert row.to_dict()["status"] == "submitted"
+    assert await repository.get_rows(status=ApplicationStatus.DRAFT) == []
+
+    with_documents = await repository.get_with_documents("test-1")
+    assert with_documents.resume.content == "x" * 10000
@@ -0,0 +1,151 @@
+"""Tests for incrementally maintained application rollups."""
+
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.models import Base
+from src.database.repositories.application_repository import ApplicationRepository
+from src.database.repositories.application_rollup_repository import ApplicationRollupRepository
+from src.models.application import ApplicationStatus, ApplicationUpdateRequest, JobApplication
+from src.services.analytics_service import AnalyticsService
+
+
+@pytest.fixture
+async def test_db_session():
+    """Create a test database session."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session_maker() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def repository(test_db_session):
+    return ApplicationRepository(test_db_session)
+
+
+def _application(i: int, company: str, status: ApplicationStatus, age_days: int) -> JobApplication:
+    now = datetime(2024, 3, 20, 12, 0, 0)
+    return JobApplication(
+        id=f"app-{i}",
+        job_id=f"job-{i}",
+        job_title="Engineer",
+        company=company,
+        status=status,
+        created_at=now - timedelta(days=age_days),
+        updated_at=now,
+    )
+
+
+def _counters(rollups):
+    return (
+        dict(rollups.by_status),
+        {k: dict(v) for k, v in rollups.by_week.items()},
+        {k: dict(v) for k, v in rollups.by_company.items()},
+        {k: dict(v) for k, v in rollups.response_days.items()},
+    )
+
+
+@pytest.mark.asyncio
+async def test_writes_keep_rollups_in_step_with_a_rebuild(repository):
+    """Counters maintained by create/update/bulk/delete equal a from-scratch rebuild."""
+    rollups = repository.rollups
+    assert (await rollups.get("user-1")).total == 0
+    version = await rollups.get_version("user-1")
+
+    await repository.create(_application(0, "Acme", ApplicationStatus.SUBMITTED, 3), user_id="user-1")
+    await repository.bulk_create(
+        [
+            _application(1, "Acme", ApplicationStatus.DRAFT, 10),
+            _application(2, "Globex", ApplicationStatus.SUBMITTED, 20),
+            _application(3, "Initech", ApplicationStatus.UNDER_REVIEW, 5),
+        ],
+        user_id="user-1",
+    )
+    await repository.create(_application(9, "Acme", ApplicationStatus.DRAFT, 1), user_id="user-2")
+    await repository.update("app-0", ApplicationUpdateRequest(status=ApplicationStatus.OFFER_RECEIVED), user_id="user-1")
+    await repository.bulk_update(
+        ["app-1", "app-2"], ApplicationUpdateRequest(status=ApplicationStatus.REJECTED), user_id="user-1"
+    )
+    await repository.delete("app-3", user_id="user-1")
+
+    maintained = await rollups.get("user-1")
+    assert maintained.version == version + 5
+    assert maintained.by_status == {"offer_received": 1, "rejected": 2}
+    assert dict(maintained.by_company["Acme"]) == {"offer_received": 1, "rejected": 1}
+    assert "Initech" not in maintained.by_company
+
+    rebuilt = await rollups.rebuild("user-1")
+    assert _counters(rebuilt) == _counters(maintained)
+    assert rebuilt.version == maintained.version + 1
+
+
+@pytest.mark.asyncio
+async def test_rollup_metrics_match_row_metrics(repository, test_db_session):
+    """Analytics computed from rollups equal analytics computed from the rows."""
+    await repository.bulk_create(
+        [
+            _application(0, "Acme", ApplicationStatus.OFFER_RECEIVED, 12),
+            _application(1, "Acme", ApplicationStatus.INTERVIEW_SCHEDULED, 7),
+            _application(2, "Globex", ApplicationStatus.REJECTED, 30),
+            _application(3, "Globex", ApplicationStatus.SUBMITTED, 2),
+            _application(4, "Initech", ApplicationStatus.UNDER_REVIEW, 4),
+            _application(5, "Initech", ApplicationStatus.OFFER_ACCEPTED, 60),
+        ],
+        user_id="user-1",
+    )
+    applications = await repository.get_all(user_id="user-1")
+    rollups = await ApplicationRollupRepository(test_db_session).get("user-1")
+    service = AnalyticsService()
+
+    for method in (
+        service.get_application_success_rate,
+        service.get_response_time_analysis,
+        service.get_interview_performance,
+    ):
+        from_rows = await method(user_id="user-1", applications=applications)
+        assert await method(user_id="user-1", rollups=rollups) == from_rows
+
+    from_rows = await service.get_company_analysis(user_id="user-1", applications=applications)
+    from_rollups = await service.get_company_analysis(user_id="user-1", rollups=rollups)
+    assert sorted(from_rollups["companies"], key=lambda c: c["company"]) == sorted(
+        from_rows["companies"], key=lambda c: c["company"]
+    )
+    assert from_rollups["total_companies"] == from_rows["total_companies"] == 3
+
+
+@pytest.mark.asyncio
+async def test_date_range_falls_back_to_rows(repository, test_db_session):
+    """Rollups are not bucketed by exact date, so a date range reads the rows."""
+    await repository.bulk_create(
+        [
+            _application(0, "Acme", ApplicationStatus.OFFER_RECEIVED, 40),
+            _application(1, "Acme", ApplicationStatus.SUBMITTED, 1),
+        ],
+        user_id="user-1",
+    )
+    applications = await repository.get_all(user_id="user-1")
+    rollups = await ApplicationRollupRepository(test_db_session).get("user-1")
+
+    result = await AnalyticsService().get_application_success_rate(
+        user_id="user-1",
+        applications=applications,
+        rollups=rollups,
+        start_date=datetime(2024, 3, 10),
+    )
+
+    assert result["total_applications"] == 1
+    assert result["successful_applications"] == 0
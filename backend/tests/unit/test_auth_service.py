@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from jose import jwt
 
+from src.core.principal_cache import PrincipalCache
 from src.services.auth_service import JWTAuthService
 from src.models.user import UserRegister, UserLogin, UserProfileUpdate, PasswordChange
 from src.config import config
@@ -492,3 +493,93 @@ class TestDeleteUser:
         # Logout always returns True to allow frontend cleanup, even if session belongs to different user
         assert success is True
 
+
+
+class TestPrincipalCache:
+    """Test cached resolution of access tokens to user profiles."""
+
+    @pytest.mark.asyncio
+    async def test_get_principal_hits_database_once(self, auth_service, sample_user):
+        """Repeated requests with the same token reuse the cached profile."""
+        auth_service._repository.get_by_id.return_value = sample_user
+        token = auth_service._create_access_token(sample_user.id, sample_user.email)
+
+        first = await auth_service.get_principal(token)
+        second = await auth_service.get_principal(token)
+
+        assert first.id == sample_user.id
+        assert second == first
+        auth_service._repository.get_by_id.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_principal_rejects_invalid_tokens(self, auth_service, sample_user):
+        """Invalid and refresh tokens never reach the database."""
+        refresh_token = auth_service._create_refresh_token(sample_user.id)
+
+        assert await auth_service.get_principal("invalid.token.here") is None
+        assert await auth_service.get_principal(refresh_token) is None
+        auth_service._repository.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_profile_update_invalidates_principal(self, auth_service, sample_user):
+        """Updating a profile forces the next request to reload it."""
+        auth_service._repository.get_by_id.return_value = sample_user
+        auth_service._repository.get_by_email.return_value = None
+        updated_user = sample_user.model_copy()
+        updated_user.name = "Updated Name"
+        auth_service._repository.update.return_value = updated_user
+        token = auth_service._create_access_token(sample_user.id, sample_user.email)
+
+        await auth_service.get_principal(token)
+        await auth_service.update_user_profile(
+            sample_user.id, UserProfileUpdate(name="Updated Name")
+        )
+        auth_service._repository.get_by_id.return_value = updated_user
+        profile = await auth_service.get_principal(token)
+
+        assert profile.name == "Updated Name"
+        assert auth_service._repository.get_by_id.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_logout_invalidates_principal(self, auth_service, sample_user):
+        """Logging out drops the cached profile for the user."""
+        auth_service._repository.get_by_id.return_value = sample_user
+        mock_session = MagicMock()
+        mock_session.user_id = sample_user.id
+        auth_service._repository.get_session.return_value = mock_session
+        token = auth_service._create_access_token(sample_user.id, sample_user.email)
+
+        await auth_service.get_principal(token)
+        await auth_service.logout_user("refresh-token", sample_user.id)
+        auth_service._repository.get_by_id.return_value = None
+
+        assert await auth_service.get_principal(token) is None
+
+    def test_invalidation_generations_are_bounded_by_ttl(self):
+        """Generations older than the TTL are forgotten as users are invalidated."""
+        cache = PrincipalCache(ttl=60)
+        with patch("src.core.principal_cache.time.monotonic", return_value=1000.0):
+            for n in range(100):
+                cache.invalidate_user(f"user-{n}")
+        assert len(cache._generations) == 100
+
+        with patch("src.core.principal_cache.time.monotonic", return_value=1061.0):
+            cache.invalidate_user("user-0")
+
+        assert list(cache._generations) == ["user-0"]
+        assert cache._profile_key("user-0", 1) == "user-0:101:1"
+
+    def test_forgotten_generation_is_not_reused(self, sample_user):
+        """A profile cached before a forgotten generation never becomes current again."""
+        cache = PrincipalCache(ttl=60)
+        stale = sample_user.model_copy()
+        with patch("src.core.principal_cache.time.monotonic", return_value=1000.0):
+            cache.invalidate_user(sample_user.id)
+        cache._profiles.set(cache._profile_key(sample_user.id, 1), stale, ttl=3600)
+
+        with patch("src.core.principal_cache.time.monotonic", return_value=1061.0):
+            cache.invalidate_user("someone-else")
+            assert sample_user.id not in cache._generations
+            cache.invalidate_user(sample_user.id)
+
+        assert cache.get_profile(sample_user.id, 1) is None
@@ -0,0 +1,189 @@
+"""Tests for the unified multi-tier cache manager."""
+
+import pytest
+from dogpile.cache.api import NO_VALUE
+
+from src.core.cache_manager import CacheManager, LRUStore
+from src.core.cache_performance import CachePerformanceMonitor
+from src.services.cache_service import AnalyticsCacheService
+
+
+class FakeRegion:
+    """Minimal stand-in for a shared (non-memory) dogpile region."""
+
+    def __init__(self):
+        self.backend = object()
+        self.data = {}
+        self.generation_reads = 0
+
+    def get(self, key):
+        return self.data.get(key, NO_VALUE)
+
+    def get_multi(self, keys, ignore_expiration=False):
+        self.generation_reads += 1
+        return [self.data.get(k, NO_VALUE) for k in keys]
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def set_multi(self, mapping):
+        self.data.update(mapping)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def test_lru_store_evicts_least_recently_used_within_budget():
+    """Entries beyond the byte budget are evicted oldest-first."""
+    store = LRUStore(max_bytes=300)
+
+    store.set("a", "x", size=100)
+    store.set("b", "x", size=100)
+    store.set("c", "x", size=100)
+    assert store.get("a") == "x"  # refresh "a"
+
+    evicted = store.set("d", "x", size=100)
+
+    assert evicted == 1
+    assert store.get("b") is None
+    assert store.get("a") == "x"
+    assert store.bytes_used == 300
+    assert store.stats.evictions == 1
+
+
+def test_lru_store_skips_values_larger_than_budget():
+    """A single oversized value does not flush the store."""
+    store = LRUStore(max_bytes=100)
+    store.set("small", "x", size=50)
+
+    store.set("huge", "x", size=500)
+
+    assert store.get("huge") is None
+    assert store.get("small") == "x"
+
+
+@pytest.mark.asyncio
+async def test_manager_get_set_and_stats_feed_monitor():
+    """Hits, misses and evictions are counted and reported to the monitor."""
+    monitor = CachePerformanceMonitor()
+    manager = CacheManager(monitor=monitor, l2_enabled=False)
+    manager.register_namespace("jobs", max_bytes=10_000, default_ttl=60)
+
+    assert await manager.get("jobs", "k") is None
+    await manager.set("jobs", "k", {"title": "Engineer"})
+    assert await manager.get("jobs", "k") == {"title": "Engineer"}
+
+    ns_stats = manager.stats()["namespaces"]["jobs"]
+    assert ns_stats["hits"] == 1
+    assert ns_stats["misses"] == 1
+    assert ns_stats["entries"] == 1
+
+    perf = monitor.get_stats()
+    assert perf["cache_hits"] == 1
+    assert perf["cache_misses"] == 1
+    assert perf["cache_sets"] == 1
+
+
+@pytest.mark.asyncio
+async def test_manager_scope_invalidation_is_isolated():
+    """Invalidating one scope leaves other scopes untouched."""
+    manager = CacheManager(l2_enabled=False)
+
+    await manager.set("analytics", "dashboard", 1, scope="user-1")
+    await manager.set("analytics", "dashboard", 2, scope="user-2")
+
+    await manager.invalidate("analytics", scope="user-1")
+
+    assert await manager.get("analytics", "dashboard", scope="user-1") is None
+    assert await manager.get("analytics", "dashboard", scope="user-2") == 2
+
+
+@pytest.mark.asyncio
+async def test_manager_namespace_invalidation_releases_memory():
+    """Invalidating a namespace drops its L1 entries immediately."""
+    manager = CacheManager(l2_enabled=False)
+    await manager.set("resumes", "a", "value", scope="user-1")
+
+    await manager.invalidate("resumes")
+
+    assert await manager.get("resumes", "a", scope="user-1") is None
+    assert manager.stats()["namespaces"]["resumes"]["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_manager_shares_entries_and_invalidation_through_l2():
+    """Two workers sharing an L2 see each other's writes and invalidations."""
+    region = FakeRegion()
+    worker_a = CacheManager(region=region, l2_enabled=True)
+    worker_b = CacheManager(region=region, l2_enabled=True, generation_refresh=0)
+
+    await worker_a.set("analytics", "dashboard", {"total": 3}, scope="user-1")
+    assert await worker_b.get("analytics", "dashboard", scope="user-1") == {
+        "total": 3
+    }
+    assert worker_b.stats()["namespaces"]["analytics"]["l2_hits"] == 1
+
+    await worker_a.invalidate("analytics", scope="user-1")
+    assert await worker_b.get("analytics", "dashboard", scope="user-1") is None
+
+
+@pytest.mark.asyncio
+async def test_manager_reuses_generation_tokens_between_refreshes():
+    """L1 hits within the refresh period do not read generations from L2."""
+    region = FakeRegion()
+    manager = CacheManager(region=region, l2_enabled=True, generation_refresh=60)
+
+    await manager.set("analytics", "dashboard", {"total": 3}, scope="user-1")
+    for _ in range(3):
+        assert await manager.get("analytics", "dashboard", scope="user-1") == {"total": 3}
+
+    assert region.generation_reads == 1
+    await manager.invalidate("analytics", scope="user-1")
+    assert await manager.get("analytics", "dashboard", scope="user-1") is None
+
+
+@pytest.mark.asyncio
+async def test_manager_lost_generation_does_not_revive_invalidated_entries():
+    """A generation token evicted from L2 starts a new generation."""
+    region = FakeRegion()
+    worker_a = CacheManager(region=region, l2_enabled=True, generation_refresh=0)
+    worker_b = CacheManager(region=region, l2_enabled=True, generation_refresh=0)
+
+    await worker_a.set("analytics", "dashboard", {"total": 3}, scope="user-1")
+    await worker_a.invalidate("analytics", scope="user-1")
+    for key in [key for key in region.data if key.startswith("cache-gen:")]:
+        del region.data[key]
+
+    assert await worker_b.get("analytics", "dashboard", scope="user-1") is None
+
+
+@pytest.mark.asyncio
+async def test_manager_falls_back_to_l1_when_l2_fails():
+    """L2 errors are swallowed and the manager keeps serving from L1."""
+
+    class BrokenRegion(FakeRegion):
+        def get_multi(self, keys, ignore_expiration=False):
+            raise ConnectionError("redis down")
+
+    monitor = CachePerformanceMonitor()
+    manager = CacheManager(region=BrokenRegion(), monitor=monitor, l2_enabled=True)
+
+    await manager.set("jobs", "k", "v")
+
+    assert await manager.get("jobs", "k") == "v"
+    assert manager.stats()["l2_enabled"] is False
+    assert monitor.get_stats()["cache_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_analytics_cache_service_invalidate_user():
+    """Analytics keys are scoped by user id for O(1) invalidation."""
+    service = AnalyticsCacheService(manager=CacheManager(l2_enabled=False))
+
+    await service.set("analytics:user-1:dashboard", {"a": 1}, ttl_seconds=60)
+    await service.set("analytics:user-2:dashboard", {"a": 2}, ttl_seconds=60)
+
+    await service.invalidate_user("user-1")
+
+    assert await service.get("analytics:user-1:dashboard") is None
+    assert await service.get("analytics:user-2:dashboard") == {"a": 2}
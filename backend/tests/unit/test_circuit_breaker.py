@@ -0,0 +1,109 @@
+"""Tests for per-provider circuit breakers."""
+
+import asyncio
+import pytest
+
+from src.core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _fail():
+    raise RuntimeError("boom")
+
+
+async def _ok():
+    return "ok"
+
+
+@pytest.mark.asyncio
+async def test_opens_after_threshold_and_fails_fast():
+    clock = FakeClock()
+    breaker = CircuitBreaker("openai", failure_threshold=3, cooldown=10, clock=clock)
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError, match="boom"):
+            await breaker.call(_fail)
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.available()
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(_ok)
+    assert breaker.snapshot() == {
+        "state": "open",
+        "consecutive_failures": 0,
+        "trips": 1,
+        "retry_in_seconds": 10.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_half_open_admits_one_trial_and_backs_off_exponentially():
+    clock = FakeClock()
+    breaker = CircuitBreaker("gemini", failure_threshold=1, cooldown=10, max_cooldown=25, clock=clock)
+    with pytest.raises(RuntimeError):
+        await breaker.call(_fail)
+
+    clock.now = 10
+    assert breaker.allow()
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert not breaker.allow()  # only one trial at a time
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.current_cooldown == 20
+
+    clock.now = 29
+    assert not breaker.available()
+    clock.now = 30
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.current_cooldown == 25  # capped
+
+    clock.now = 55
+    assert await breaker.call(_ok) == "ok"
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.trips == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_is_released():
+    clock = FakeClock()
+    breaker = CircuitBreaker("g4f", failure_threshold=1, cooldown=1, clock=clock)
+    breaker.record_failure()
+    clock.now = 1
+
+    task = asyncio.create_task(breaker.call(asyncio.sleep, 10))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.available()
+
+
+@pytest.mark.asyncio
+async def test_background_probe_closes_recovered_provider():
+    results = iter([False, True])
+    probes = []
+
+    async def probe():
+        probes.append(1)
+        return next(results)
+
+    breaker = CircuitBreaker("cursor", failure_threshold=1, cooldown=0.01, probe=probe)
+    breaker.record_failure()
+
+    for _ in range(100):
+        if breaker.state is CircuitState.CLOSED:
+            break
+        await asyncio.sleep(0.01)
+
+    assert breaker.state is CircuitState.CLOSED
+    assert len(probes) == 2
@@ -0,0 +1,94 @@
+"""Tests for database connection pool profiles."""
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
+
+from src.config import config
+from src.database.config import DatabaseConfig
+from src.database.pool import (
+    MonitoredAsyncQueuePool,
+    build_engine_options,
+    install_sqlite_pragmas,
+    pool_status,
+    sqlite_pragmas,
+)
+
+
+def test_engine_options_per_database():
+    """Files and servers get sized pools; tests and :memory: keep their pools."""
+    sqlite = build_engine_options("sqlite+aiosqlite:///app.db", False, config)
+    assert sqlite["poolclass"] is MonitoredAsyncQueuePool
+    assert sqlite["pool_size"] == config.sqlite_pool_size
+
+    postgres = build_engine_options("postgresql+asyncpg://u@h/db", False, config)
+    assert postgres["poolclass"] is MonitoredAsyncQueuePool
+    assert postgres["pool_size"] == config.db_pool_size
+    assert postgres["max_overflow"] == config.db_max_overflow
+    assert postgres["pool_pre_ping"] is True
+
+    memory = build_engine_options("sqlite+aiosqlite:///:memory:", False, config)
+    assert memory == {"poolclass": StaticPool}
+    assert build_engine_options("sqlite+aiosqlite:///t.db", True, config) == {
+        "poolclass": NullPool
+    }
+
+
+def test_sqlite_pragmas_reject_invalid_modes(monkeypatch):
+    """Pragma values are interpolated into SQL, so modes are validated."""
+    monkeypatch.setattr(config, "sqlite_synchronous", "NORMAL; DROP TABLE x")
+    with pytest.raises(ValueError):
+        sqlite_pragmas(config)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_pool_reuses_connections_with_wal(tmp_path):
+    """Pooled SQLite connections are reused and configured on connect."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MonitoredAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    install_sqlite_pragmas(engine.sync_engine, sqlite_pragmas(config))
+    try:
+        for _ in range(3):
+            async with engine.connect() as conn:
+                mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+                sync = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+        assert mode == "wal"
+        assert sync == 1  # NORMAL
+
+        stats = pool_status(engine.pool)
+        assert stats["checkouts"] == 3
+        assert stats["size"] == 1
+        assert stats["checked_in"] == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_timeout_is_counted(tmp_path):
+    """Checkouts that time out on an exhausted pool are recorded."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MonitoredAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+        stats = pool_status(engine.pool)
+        assert stats["timeouts"] == 1
+    finally:
+        await engine.dispose()
+
+
+def test_pool_stats_before_initialize():
+    """Pool stats are safe to read before the engine exists."""
+    assert DatabaseConfig().get_pool_stats() == {"initialized": False}
@@ -0,0 +1,188 @@
+"""Tests for pooled SMTP delivery and the email delivery queue."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.services.email_delivery import EmailDeliveryQueue, OutboundEmail, TokenBucket
+from src.services.email_service import EmailProvider, EmailService, SMTPEmailProvider
+from src.services.notification_service import NotificationService
+from tests.fixtures.smtp_server import FakeSMTPServer
+
+
+class RecordingProvider(EmailProvider):
+    """Provider that records sends and can fail the first attempts."""
+
+    def __init__(self, fail_first: int = 0, rate_limit=None):
+        self.sent = []
+        self.fail_first = fail_first
+        self.rate_limit = rate_limit
+
+    async def send_email(self, to_email, subject, body_html, body_text, attachments=None):
+        if self.fail_first:
+            self.fail_first -= 1
+            return False
+        self.sent.append(to_email)
+        return True
+
+
+def _smtp_provider(server: FakeSMTPServer, pool_size: int = 2) -> SMTPEmailProvider:
+    return SMTPEmailProvider(
+        smtp_host=server.host,
+        smtp_port=server.port,
+        use_tls=False,
+        from_email="noreply@example.com",
+        from_name="Tests",
+        pool_size=pool_size,
+        rate_limit=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_smtp_provider_reuses_pooled_connections():
+    """Many messages go over at most ``pool_size`` connections."""
+    with FakeSMTPServer() as server:
+        provider = _smtp_provider(server, pool_size=2)
+
+        results = await asyncio.gather(
+            *(
+                provider.send_email(f"user{i}@example.com", "Hi", "<p>Hi</p>", "Hi")
+                for i in range(10)
+            )
+        )
+        await provider.close()
+
+    assert all(results)
+    assert len(server.messages) == 10
+    assert server.connections <= 2
+    assert "<user3@example.com>" in {r for m in server.messages for r in m.rcpt_tos}
+
+
+@pytest.mark.asyncio
+async def test_smtp_provider_reconnects_after_server_drop():
+    """A connection closed by the server is replaced transparently."""
+    with FakeSMTPServer(drop_after=1) as server:
+        provider = _smtp_provider(server, pool_size=1)
+
+        for i in range(3):
+            assert await provider.send_email(f"u{i}@example.com", "S", "<p>b</p>", "b")
+        await provider.close()
+
+    assert len(server.messages) == 3
+    assert server.connections == 3
+
+
+@pytest.mark.asyncio
+async def test_smtp_provider_keeps_connection_after_refused_recipient():
+    """A refused message fails alone; its connection goes back to the pool."""
+    with FakeSMTPServer(refuse=["nobody@example.com"]) as server:
+        provider = _smtp_provider(server, pool_size=1)
+
+        assert not await provider.send_email("nobody@example.com", "S", "<p>b</p>", "b")
+        assert await provider.send_email("u@example.com", "S", "<p>b</p>", "b")
+        await provider.close()
+
+    assert len(server.messages) == 1
+    assert server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_smtp_provider_send_does_not_block_event_loop():
+    """The event loop keeps running while SMTP I/O happens in threads."""
+    with FakeSMTPServer() as server:
+        provider = _smtp_provider(server, pool_size=1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await provider.send_email("u@example.com", "S", "<p>b</p>", "b")
+        task.cancel()
+        await provider.close()
+
+    assert ticks > 1
+
+
+@pytest.mark.asyncio
+async def test_queue_retries_and_records_metrics():
+    """Failed sends are retried and every outcome is counted."""
+    provider = RecordingProvider(fail_first=1)
+    queue = EmailDeliveryQueue(provider, workers=2, max_retries=1, retry_backoff=0)
+
+    results = await asyncio.gather(
+        *(queue.send(OutboundEmail(f"u{i}@example.com", "S", "h", "t")) for i in range(5))
+    )
+    await queue.stop()
+
+    assert all(results)
+    stats = queue.stats()
+    assert stats["queued"] == 5
+    assert stats["sent"] == 5
+    assert stats["retried"] == 1
+    assert stats["running"] is False
+
+
+@pytest.mark.asyncio
+async def test_queue_rejects_when_full_without_waiting():
+    """Non-blocking submissions fail fast once the queue is full."""
+
+    class SlowProvider(RecordingProvider):
+        async def send_email(self, *args, **kwargs):
+            await asyncio.sleep(0.2)
+            return True
+
+    queue = EmailDeliveryQueue(SlowProvider(), workers=1, max_queue_size=1)
+    email = OutboundEmail("u@example.com", "S", "h", "t")
+
+    first = await queue.submit(email, wait=False)
+    await asyncio.sleep(0)  # let the worker take the first message
+    second = await queue.submit(email, wait=False)
+    third = await queue.submit(email, wait=False)
+
+    assert await third is False
+    assert await first and await second
+    assert queue.stats()["rejected"] == 1
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_shapes_rate():
+    """Sends beyond the burst are spaced at the configured rate."""
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    # 5 sends beyond the first token at 50/s take at least ~0.1s.
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_bulk_reminders_send_concurrently():
+    """Bulk reminders no longer wait a fixed second between messages."""
+    provider = RecordingProvider()
+    notifications = NotificationService(email_service=EmailService(provider=provider))
+    reminders = [
+        {
+            "type": "follow_up",
+            "user_id": f"user-{i}",
+            "job_title": "Engineer",
+            "company": "Acme",
+            "application_date": "2024-01-01",
+            "user_email": f"user{i}@example.com",
+            "user_name": "Test",
+        }
+        for i in range(20)
+    ]
+
+    start = time.monotonic()
+    result = await notifications.send_bulk_reminders(reminders)
+
+    assert result == {"total": 20, "success": 20, "failed": 0}
+    assert time.monotonic() - start < 5
+    assert len(provider.sent) == 20
+    await notifications.email_service.cleanup()
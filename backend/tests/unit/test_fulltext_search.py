@@ -0,0 +1,118 @@
+"""Tests for the full-text search indexes behind repository search."""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.models import Base
+from src.database.repositories.cover_letter_repository import CoverLetterRepository
+from src.database.repositories.job_catalog_repository import JobCatalogRepository
+from src.database.search import COVER_LETTER_SEARCH, search_terms
+from src.models.cover_letter import CoverLetter
+from src.models.job import Job
+
+
+async def _session_maker(with_index=True):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if not with_index:
+            for statement in COVER_LETTER_SEARCH.drop_statements("sqlite"):
+                await conn.exec_driver_sql(statement)
+    return engine, async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def repository():
+    """Create a cover letter repository over an indexed database."""
+    engine, session_maker = await _session_maker()
+    async with session_maker() as session:
+        yield CoverLetterRepository(session)
+    await engine.dispose()
+
+
+def _letter(id, title, company, content):
+    return CoverLetter(
+        id=id, job_title=title, company_name=company, content=content, tone="professional", word_count=10
+    )
+
+
+def test_search_terms_drop_query_syntax():
+    assert search_terms('Python "OR" dev-ops* (AWS) user_id:1') == [
+        "python", "or", "dev", "ops", "aws", "user", "id", "1"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_prefix_match_ranked_and_filtered_by_user(repository):
+    await repository.create(
+        _letter("b", "Python Developer", "Globex", "Python, Python and more Python on Kubernetes."), user_id="user-1"
+    )
+    await repository.create(_letter("a", "Backend Engineer", "Acme", "I ship Python services."), user_id="user-1")
+    await repository.create(_letter("c", "Python Developer", "Initech", "Python everywhere."), user_id="user-2")
+
+    # Best match first, although "a" is newer.
+    results = await repository.search("pyth", user_id="user-1")
+    assert [letter.id for letter in results] == ["b", "a"]
+
+    assert [letter.id for letter in await repository.search("kube pyth", user_id="user-1")] == ["b"]
+    assert {letter.id for letter in await repository.search("python")} == {"a", "b", "c"}
+    assert await repository.search("python", user_id="user-3") == []
+
+
+@pytest.mark.asyncio
+async def test_user_filter_is_exact(repository):
+    await repository.create(_letter("a", "Python Developer", "Acme", "Python."), user_id="user-1")
+    await repository.create(_letter("b", "Python Developer", "Globex", "Python."), user_id="USER_1")
+    await repository.create(_letter("c", "Python Developer", "Initech", "Python."), user_id="old-user-1")
+
+    assert [letter.id for letter in await repository.search("python", user_id="user-1")] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_index_follows_updates_and_deletes(repository):
+    await repository.create(_letter("a", "Backend Engineer", "Acme", "Go services."), user_id="user-1")
+
+    await repository.update("a", {"content": "Rust services."})
+    assert await repository.search("go", user_id="user-1") == []
+    assert [letter.id for letter in await repository.search("rust", user_id="user-1")] == ["a"]
+
+    await repository.delete("a")
+    assert await repository.search("rust") == []
+
+
+@pytest.mark.asyncio
+async def test_substring_search_without_index():
+    engine, session_maker = await _session_maker(with_index=False)
+    async with session_maker() as session:
+        repository = CoverLetterRepository(session)
+        await repository.create(_letter("a", "Engineer", "TechCorp", "Hello."), user_id="user-1")
+
+        assert [letter.id for letter in await repository.search("echcor", user_id="user-1")] == ["a"]
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_job_catalog_search():
+    engine, session_maker = await _session_maker()
+    async with session_maker() as session:
+        repository = JobCatalogRepository(session)
+        await repository.upsert_many(
+            [
+                Job(title="Data Engineer", company="Acme", location="Berlin", url="https://acme.com/jobs/1",
+                    portal="indeed", description="Spark and Airflow pipelines."),
+                Job(title="Frontend Engineer", company="Globex", location="Remote", url="https://globex.com/jobs/2",
+                    portal="indeed", description="React and TypeScript."),
+            ],
+            seen_at=datetime.now(timezone.utc),
+        )
+
+        assert [job.company for job in await repository.search("airfl")] == ["Acme"]
+        assert [job.company for job in await repository.search("engineer remote")] == ["Globex"]
+    await engine.dispose()
@@ -0,0 +1,137 @@
+"""Tests for the persistent job catalog."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.models import Base, DBJobCatalogEntry
+from src.models.job import Job, JobSearchRequest
+from src.services.job_catalog import JobCatalog
+from src.services.job_search_service import JobSearchService
+from src.utils.job_urls import canonical_job_url, job_fingerprint
+
+DESCRIPTION = "Requirements:\n- Python\n" + "We build payment rails. " * 60
+
+
+@pytest.fixture
+async def session_maker():
+    """Create an in-memory database and return its session factory."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+def _job(url, title="Backend Engineer", description=DESCRIPTION):
+    return Job(
+        title=title,
+        company="Acme",
+        location="Remote",
+        url=url,
+        portal="linkedin",
+        description=description,
+        skills=["python"],
+    )
+
+
+def test_canonical_url_drops_tracking_and_slugs():
+    assert canonical_job_url(
+        "https://www.linkedin.com/jobs/view/backend-engineer-at-acme-3912345678/?trk=x&refId=y"
+    ) == "https://linkedin.com/jobs/view/3912345678"
+    assert canonical_job_url(
+        "https://WWW.Indeed.com/viewjob?from=serp&jk=abc123&vjs=3"
+    ) == "https://indeed.com/viewjob?jk=abc123"
+    assert canonical_job_url(
+        "https://careers.acme.com/jobs/42/?utm_source=x&b=2&a=1#apply"
+    ) == "https://careers.acme.com/jobs/42?a=1&b=2"
+    assert job_fingerprint("https://linkedin.com/jobs/view/3912345678") == job_fingerprint(
+        "https://www.linkedin.com/jobs/view/some-slug-3912345678?trk=abc"
+    )
+
+
+@pytest.mark.asyncio
+async def test_upsert_refreshes_fields_and_keeps_first_seen(session_maker):
+    catalog = JobCatalog(session_factory=session_maker)
+    url = "https://www.linkedin.com/jobs/view/engineer-3912345678/?trk=a"
+
+    assert await catalog.record([_job(url), _job(url + "&refId=b")]) == 1
+    first = await catalog.lookup(job_fingerprint(url))
+    assert first.job.description == DESCRIPTION
+    assert first.job.skills == ["python"]
+    assert first.job.id == job_fingerprint(url)
+
+    await catalog.record([_job("https://linkedin.com/jobs/view/3912345678", title="Staff Engineer")])
+    second = await catalog.lookup("https://linkedin.com/jobs/view/3912345678")
+    assert second.job.title == "Staff Engineer"
+    assert second.job.created_at == first.job.created_at
+    assert second.last_seen_at >= first.last_seen_at
+    assert not second.stale
+
+    assert await catalog.lookup("missing") is None
+    assert await JobCatalog().lookup("anything") is None
+
+
+@pytest.mark.asyncio
+async def test_search_catalogs_full_description_and_details_skip_scraping(session_maker):
+    pd = pytest.importorskip("pandas")
+    service = JobSearchService()
+    service.catalog = JobCatalog(session_factory=session_maker)
+    url = "https://www.linkedin.com/jobs/view/3912345678"
+    frame = pd.DataFrame(
+        [{"title": "Backend Engineer", "company": "Acme", "job_url": url, "description": DESCRIPTION}]
+    )
+
+    response = service._convert_jobspy_results(frame, JobSearchRequest(keywords=["python"]))
+    await service._catalog_and_snip(response.jobs["linkedin"])
+    listed = response.jobs["linkedin"][0]
+    assert listed.description.endswith("...") and len(listed.description) == 503
+
+    async def no_scrape(*args, **kwargs):
+        raise AssertionError("cataloged jobs must not be scraped")
+
+    service._fetch_job_details = no_scrape
+    detail = await service.get_job_details(listed.id, "linkedin")
+    assert detail.description == DESCRIPTION
+    assert detail.requirements == listed.requirements
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_and_refreshed_once(session_maker):
+    service = JobSearchService()
+    service.catalog = JobCatalog(session_factory=session_maker, refresh_after=60)
+    url = "https://careers.acme.com/jobs/42"
+    await service.catalog.record([_job(url, title="Old title")])
+    async with session_maker() as session:
+        entry = await session.get(DBJobCatalogEntry, job_fingerprint(url))
+        entry.last_seen_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        await session.commit()
+
+    scrapes = []
+    release = asyncio.Event()
+
+    async def fetch(job_id, platform, job_url):
+        scrapes.append(job_url)
+        await release.wait()
+        return _job(job_url, title="New title")
+
+    service._fetch_job_details = fetch
+    first = await service.get_job_details(job_fingerprint(url), "linkedin")
+    second = await service.get_job_details(url, "linkedin")
+    assert first.title == second.title == "Old title"
+
+    release.set()
+    await service._refreshing[url]
+    assert scrapes == [url]
+    refreshed = await service.get_job_details(url, "linkedin")
+    assert refreshed.title == "New title"
@@ -0,0 +1,68 @@
+"""Tests for local resume-to-job match scoring."""
+
+from src.models.job import Job
+from src.services.job_match_service import JobMatchService, tokenize
+
+
+RESUME = "Senior Python engineer: FastAPI, PostgreSQL, Docker, Kubernetes on AWS."
+
+
+def test_tokenize_keeps_symbolic_skill_names():
+    """Tokens like c++, c# and node.js survive tokenisation."""
+    assert tokenize("C++ and C# with Node.js, the best") == [
+        "c++",
+        "c#",
+        "node.js",
+        "best",
+    ]
+
+
+def test_bm25_prefers_documents_sharing_rare_terms():
+    """Documents containing the query's terms score higher."""
+    service = JobMatchService()
+
+    scores = service.bm25_scores(
+        "python fastapi",
+        ["java spring", "python fastapi services", "python scripting"],
+    )
+
+    assert scores.argmax() == 1
+    assert scores[0] == 0.0
+
+
+def test_rank_texts_orders_and_filters():
+    """Best matches come first and min_score drops weak candidates."""
+    service = JobMatchService()
+    descriptions = [
+        "Retail store associate, customer service",
+        "Backend engineer using Python, FastAPI and PostgreSQL",
+        "Platform engineer: Kubernetes, Docker, AWS, Go",
+    ]
+
+    ranked = service.rank_texts(RESUME, descriptions)
+    assert [r.index for r in ranked][:2] == [1, 2]
+    assert ranked[0].skill_score == 1.0
+    assert "Go" in ranked[1].missing_skills
+
+    filtered = service.rank_texts(RESUME, descriptions, min_score=0.3)
+    assert 0 not in [r.index for r in filtered]
+
+    assert len(service.rank_texts(RESUME, descriptions, top_k=1)) == 1
+    assert service.rank_texts(RESUME, []) == []
+
+
+def test_rank_jobs_returns_job_models():
+    """Job models are ranked using title, description and listed skills."""
+    service = JobMatchService()
+    jobs = [
+        Job(title="Barista", company="Cafe", location="Remote",
+            url="https://example.com/1", portal="indeed", description="Coffee"),
+        Job(title="Python Developer", company="Acme", location="Remote",
+            url="https://example.com/2", portal="indeed",
+            description="Build APIs", skills=["FastAPI", "Docker"]),
+    ]
+
+    ranked = service.rank_jobs(RESUME, jobs)
+
+    assert ranked[0][0].title == "Python Developer"
+    assert ranked[0][1].score > ranked[1][1].score
@@ -0,0 +1,76 @@
+"""Tests for single-flight and stale-while-revalidate job searches."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.cache_manager import CacheManager
+from src.models.job import JobSearchRequest, JobSearchResponse
+from src.services import job_search_service as job_search_module
+from src.services.job_search_service import (
+    JOB_SEARCH_CACHE_NAMESPACE,
+    JobSearchService,
+)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Job search service with an isolated cache and a slow fake scraper."""
+    monkeypatch.setattr(
+        job_search_module, "cache_manager", CacheManager(l2_enabled=False)
+    )
+    svc = JobSearchService()
+    svc.scrape_calls = 0
+
+    async def fake_initialize():
+        svc._initialized = True
+        svc._jobspy_available = False
+
+    async def fake_fallback(request, fallback_reason=None):
+        svc.scrape_calls += 1
+        await asyncio.sleep(0.05)
+        return JobSearchResponse(
+            jobs={}, total_jobs=svc.scrape_calls, search_metadata={}
+        )
+
+    svc.initialize = fake_initialize
+    svc._search_with_fallback = fake_fallback
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_scrape(service):
+    """N concurrent identical searches trigger a single scrape."""
+    request = JobSearchRequest(keywords=["Python"], location="Remote")
+
+    responses = await asyncio.gather(
+        *(service.search_jobs(request) for _ in range(5))
+    )
+
+    assert service.scrape_calls == 1
+    assert all(r is responses[0] for r in responses)
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_stale_result_served_while_refreshing(service):
+    """An expired-but-stale entry is returned at once and refreshed once."""
+    request = JobSearchRequest(keywords=["Python"], location="Remote")
+    first = await service.search_jobs(request)
+
+    cache_key = service._generate_search_cache_key(request)
+    entry = await job_search_module.cache_manager.get(
+        JOB_SEARCH_CACHE_NAMESPACE, cache_key
+    )
+    entry["fetched_at"] = time.time() - entry["fresh_ttl"] - 1
+
+    stale = await asyncio.gather(
+        service.search_jobs(request), service.search_jobs(request)
+    )
+    assert all(r is first for r in stale)
+
+    await asyncio.sleep(0.1)
+    assert service.scrape_calls == 2
+    refreshed = await service.search_jobs(request)
+    assert refreshed.total_jobs == 2
@@ -0,0 +1,176 @@
+"""Tests for concurrent per-site and streamed job searches."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.config import config
+from src.core.streaming import StreamEvent
+from src.models.job import JobSearchRequest
+
+pd = pytest.importorskip("pandas")
+
+SITE_URLS = {
+    "indeed": "https://www.indeed.com/viewjob?jk={n}",
+    "linkedin": "https://www.linkedin.com/jobs/view/{n}",
+    "glassdoor": "https://www.glassdoor.com/job-listing/x?jl={n}",
+}
+
+
+def fake_scrape(svc, params):
+    (site,) = params["site_name"]
+    svc.scrapes.append(site)
+    behaviour = svc.behaviour.get(site)
+    if behaviour == "slow":
+        time.sleep(1)
+    elif behaviour == "broken":
+        raise ValueError(f"{site} changed its markup")
+    return pd.DataFrame(
+        [
+            {"title": f"{site} engineer {n}", "company": "Acme", "job_url": SITE_URLS[site].format(n=n)}
+            for n in range(2)
+        ]
+    )
+
+
+@pytest.fixture
+def service(job_search_service_factory, monkeypatch):
+    """Job search service whose sites can be made slow or broken."""
+    monkeypatch.setattr(config, "job_search_site_timeout", 0.3)
+    svc = job_search_service_factory(SITE_URLS, fake_scrape)
+    svc.behaviour = {}
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_slow_and_broken_sites_do_not_hold_up_the_rest(service):
+    service.behaviour = {"glassdoor": "slow", "linkedin": "broken"}
+    request = JobSearchRequest(keywords=["Python"], location="Remote")
+
+    started = time.perf_counter()
+    response = await service.search_jobs(request)
+
+    assert time.perf_counter() - started < 0.9
+    assert list(response.jobs) == ["indeed"]
+    assert response.total_jobs == 2
+    sites = response.search_metadata["sites"]
+    assert sites["indeed"]["status"] == "ok"
+    assert sites["glassdoor"]["status"] == "timeout"
+    assert sites["linkedin"] == {
+        "status": "error", "jobs": 0, "elapsed": sites["linkedin"]["elapsed"],
+        "error": "linkedin changed its markup",
+    }
+    assert response.search_metadata["partial"] is True
+
+
+@pytest.mark.asyncio
+async def test_hanging_site_is_not_scraped_again_until_it_returns(service):
+    service.behaviour = {"glassdoor": "slow"}
+
+    sites = ["indeed", "glassdoor"]
+    first = await service.search_jobs(JobSearchRequest(keywords=["Python"], sites=sites))
+    second = await service.search_jobs(JobSearchRequest(keywords=["Go"], sites=sites))
+
+    assert service.scrapes.count("glassdoor") == 1
+    assert first.search_metadata["sites"]["glassdoor"]["status"] == "timeout"
+    assert "still running" in second.search_metadata["sites"]["glassdoor"]["error"]
+
+    await asyncio.sleep(1)
+    service.behaviour = {}
+    third = await service.search_jobs(JobSearchRequest(keywords=["Rust"], sites=sites))
+    assert third.search_metadata["sites"]["glassdoor"]["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_rows_are_converted_on_a_scrape_worker(service, monkeypatch):
+    threads = []
+    convert = service._convert_jobspy_results
+
+    def recording_convert(jobs_df, request):
+        threads.append(threading.current_thread().name)
+        return convert(jobs_df, request)
+
+    monkeypatch.setattr(service, "_convert_jobspy_results", recording_convert)
+
+    await service.search_jobs(JobSearchRequest(keywords=["Python"], sites=["indeed"]))
+
+    assert len(threads) == 1 and threads[0].startswith("jobspy")
+
+
+@pytest.mark.asyncio
+async def test_site_results_are_cached_per_site(service):
+    await service.search_jobs(JobSearchRequest(keywords=["Python"], sites=["indeed", "linkedin"]))
+    assert sorted(service.scrapes) == ["indeed", "linkedin"]
+
+    response = await service.search_jobs(
+        JobSearchRequest(keywords=["Python"], sites=["linkedin", "glassdoor"])
+    )
+
+    assert sorted(service.scrapes) == ["glassdoor", "indeed", "linkedin"]
+    sites = response.search_metadata["sites"]
+    assert sites["linkedin"]["status"] == "cached"
+    assert sites["glassdoor"]["status"] == "ok"
+    assert set(response.jobs) == {"linkedin", "glassdoor"}
+
+
+@pytest.mark.asyncio
+async def test_falls_back_only_when_every_site_fails(service):
+    service.behaviour = {site: "broken" for site in SITE_URLS}
+
+    response = await service.search_jobs(JobSearchRequest(keywords=["Python"]))
+
+    assert response.search_metadata["method"] == "fallback"
+    assert "indeed changed its markup" in response.search_metadata["fallback_reason"]
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_sites_as_they_finish_then_replays_from_cache(service):
+    service.behaviour = {"glassdoor": "slow"}
+    request = JobSearchRequest(keywords=["Python"])
+
+    events = [event async for event in service.stream_search(request)]
+
+    assert [event.event for event in events] == ["site", "site", "site", "done"]
+    assert events[2].data["site"] == "glassdoor"
+    assert events[2].data["status"] == "timeout"
+    assert {events[0].data["site"], events[1].data["site"]} == {"indeed", "linkedin"}
+    assert events[0].data["jobs"][0]["title"].startswith(events[0].data["site"])
+    summary = events[-1].data
+    assert summary["total_jobs"] == 4
+    assert summary["search_metadata"]["partial"] is True
+
+    scrapes = len(service.scrapes)
+    replay = [event async for event in service.stream_search(request)]
+    assert len(service.scrapes) == scrapes
+    # The replay has the same events, in request order, with hits as "cached".
+    assert [(e.data["site"], e.data["status"]) for e in replay[:-1]] == [
+        ("indeed", "cached"), ("linkedin", "cached"), ("glassdoor", "timeout"),
+    ]
+    live = {event.data["site"]: event.data for event in events[:-1]}
+    for event in replay[:-1]:
+        assert set(event.data) == set(live[event.data["site"]])
+        assert event.data["jobs"] == live[event.data["site"]]["jobs"]
+    assert replay[-1].data["total_jobs"] == 4
+    assert (await service.search_jobs(request)).total_jobs == 4
+
+
+@pytest.mark.asyncio
+async def test_stream_and_search_share_one_scrape(service):
+    request = JobSearchRequest(keywords=["Python"])
+
+    async def stream():
+        return [event async for event in service.stream_search(request)]
+
+    events, response = await asyncio.gather(stream(), service.search_jobs(request))
+
+    assert sorted(service.scrapes) == sorted(SITE_URLS)
+    assert events[-1].data["total_jobs"] == response.total_jobs == 6
+    assert service._inflight == {} and service._inflight_sites == {}
+
+
+def test_stream_event_encodings():
+    event = StreamEvent("done", {"total_jobs": 1})
+    assert event.to_ndjson() == '{"event": "done", "data": {"total_jobs": 1}}\n'
+    assert event.to_sse() == 'event: done\ndata: {"total_jobs": 1}\n\n'
@@ -0,0 +1,55 @@
+"""Tests for batched conversion of JobSpy result frames."""
+
+import pandas as pd
+
+from src.models.job import JobSearchRequest
+from src.services.job_search_service import JobSearchService
+
+
+def test_convert_jobspy_results_groups_by_platform():
+    """Rows are classified by URL and converted in bulk."""
+    service = JobSearchService()
+    jobs_df = pd.DataFrame(
+        [
+            {
+                "title": "Backend Engineer",
+                "company": "Acme",
+                "job_url": "https://www.LinkedIn.com/jobs/view/1",
+                "description": "We use Python, Docker and PostgreSQL. "
+                "Email: jobs@acme.com",
+            },
+            {
+                "title": "Data Scientist",
+                "company": "Initech",
+                "job_url": "https://indeed.com/viewjob?jk=2",
+                "description": "Machine learning and SQL",
+            },
+            {
+                "title": "Frontend Engineer",
+                "company": "Hooli",
+                "job_url": "https://careers.hooli.com/3",
+                "description": "React",
+            },
+        ]
+    )
+    request = JobSearchRequest(keywords=["engineer"], location="Remote")
+
+    response = service._convert_jobspy_results(jobs_df, request)
+
+    assert response.total_jobs == 3
+    assert set(response.jobs) == {"linkedin", "indeed", "unknown"}
+    backend_job = response.jobs["linkedin"][0]
+    assert {"Python", "Docker", "PostgreSQL"} <= set(backend_job.skills)
+    assert backend_job.contact_email == "jobs@acme.com"
+    assert "Machine Learning" in response.jobs["indeed"][0].skills
+
+
+def test_extract_skills_respects_word_boundaries():
+    """Skills match whole words only, with aliases resolved."""
+    service = JobSearchService()
+
+    skills = service._extract_skills("JavaScript and Golang developers")
+
+    assert "JavaScript" in skills
+    assert "Java" not in skills
+    assert "Go" in skills  # "Golang" is an alias
@@ -0,0 +1,110 @@
+"""Tests for the bounded, pre-aggregating metrics pipeline."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.database.models import Base
+from src.database.repositories.monitoring_repository import MonitoringRepository
+from src.services.metrics_pipeline import MetricsPipeline
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def test_samples_fold_into_one_row_per_series_and_window():
+    """Samples aggregate by name, tags and window."""
+    pipeline = MetricsPipeline(window_seconds=10)
+    for value in (10, 20, 30):
+        pipeline.record("api.response_time", value, {"path": "/a"}, T0)
+    pipeline.record("api.response_time", 500, {"path": "/b"}, T0)
+    pipeline.record("api.response_time", 40, {"path": "/a"}, T0 + timedelta(seconds=10))
+
+    aggregates = pipeline.drain(now=T0 + timedelta(seconds=30))
+    rows = {(r["tags"], r["timestamp"]): r for r in (a.to_row() for a in aggregates)}
+
+    assert len(rows) == 3
+    first = rows[(json.dumps({"path": "/a"}), T0)]
+    assert first["sample_count"] == 3
+    assert first["value_sum"] == 60
+    assert (first["value_min"], first["value_max"]) == (10, 30)
+    assert first["metric_value"] == 20
+    assert sum(json.loads(first["histogram"])["counts"]) == 3
+
+
+def test_open_windows_stay_buffered_until_closed_or_forced():
+    pipeline = MetricsPipeline(window_seconds=10)
+    pipeline.record("db.query", 5, timestamp=T0)
+
+    assert pipeline.drain(now=T0 + timedelta(seconds=5)) == []
+    assert pipeline.snapshot()["open_series"] == 1
+    assert len(pipeline.drain(now=T0 + timedelta(seconds=5), force=True)) == 1
+    assert pipeline.snapshot()["open_series"] == 0
+
+
+def test_drop_oldest_keeps_buffer_bounded():
+    pipeline = MetricsPipeline(capacity=100, overflow_policy="drop_oldest")
+    for i in range(1000):
+        pipeline.record("api.request.count", 1, timestamp=T0)
+
+    stats = pipeline.snapshot()
+    assert stats["queue_depth"] == 100
+    assert stats["dropped"] == 900
+
+
+def test_drop_newest_rejects_when_full():
+    pipeline = MetricsPipeline(capacity=2, overflow_policy="drop_newest")
+    assert pipeline.record("m", 1, timestamp=T0)
+    assert pipeline.record("m", 2, timestamp=T0)
+    assert not pipeline.record("m", 3, timestamp=T0)
+
+    (aggregate,) = pipeline.drain(force=True)
+    assert aggregate.maximum == 2
+    assert pipeline.snapshot()["dropped"] == 1
+
+
+def test_sample_policy_weights_kept_samples():
+    """Sampling past half capacity keeps counts approximately unbiased."""
+    pipeline = MetricsPipeline(capacity=10000, overflow_policy="sample", sample_every=10)
+    for _ in range(20000):
+        pipeline.record("api.request.count", 1, timestamp=T0)
+
+    stats = pipeline.snapshot()
+    assert stats["queue_depth"] <= 10000
+    assert stats["sampled_out"] > 0
+    (aggregate,) = pipeline.drain(force=True)
+    assert 15000 < aggregate.count < 25000
+
+
+def test_unknown_overflow_policy_is_rejected():
+    with pytest.raises(ValueError):
+        MetricsPipeline(overflow_policy="block")
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_and_weighted_statistics():
+    """Aggregated rows report the same statistics as per-sample rows would."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    pipeline = MetricsPipeline(window_seconds=10)
+    for value in (10, 20, 30):
+        pipeline.record("api.response_time", value, timestamp=T0)
+    pipeline.record("api.response_time", 100, timestamp=T0 + timedelta(seconds=10))
+    rows = [a.to_row() for a in pipeline.drain(force=True)]
+
+    try:
+        async with sessions() as session:
+            repo = MonitoringRepository(session)
+            await repo.create_metric("api.response_time", 60, timestamp=T0)
+            assert await repo.bulk_insert_metrics(rows) == 2
+            stats = await repo.get_metric_statistics("api.response_time")
+    finally:
+        await engine.dispose()
+
+    assert stats["count"] == 5
+    assert stats["avg"] == pytest.approx(44.0)
+    assert (stats["min"], stats["max"]) == (10.0, 100.0)
@@ -0,0 +1,190 @@
+"""Tests for keyset pagination."""
+
+import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.models import Base, DBJobApplication
+from src.database.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    paginate_sequence,
+)
+from src.database.repositories.application_repository import ApplicationRepository
+from src.models.application import ApplicationStatus
+from src.services import export_service as export_module
+from src.services.application_service import ApplicationService
+from src.services.export_service import MultiFormatExportService
+from src.services.local_file_service import LocalFileService
+
+
+@pytest.fixture
+async def test_db_session():
+    """Create a test database session."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session_maker() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def repository(test_db_session):
+    """Repository with 7 applications for user-1, three sharing a timestamp, and one for user-2."""
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    rows = [
+        DBJobApplication(
+            id=f"app-{i}",
+            job_id=f"job-{i}",
+            job_title="Engineer",
+            company="Acme",
+            status=ApplicationStatus.SUBMITTED if i % 2 else ApplicationStatus.DRAFT,
+            user_id="user-1",
+            created_at=base + timedelta(minutes=minutes),
+        )
+        # app-2..app-4 tie on created_at; the id breaks the tie.
+        for i, minutes in enumerate([0, 1, 2, 2, 2, 5, 6])
+    ]
+    rows.append(
+        DBJobApplication(
+            id="other",
+            job_id="job-x",
+            job_title="Engineer",
+            company="Acme",
+            status=ApplicationStatus.DRAFT,
+            user_id="user-2",
+            created_at=base,
+        )
+    )
+    test_db_session.add_all(rows)
+    await test_db_session.commit()
+    return ApplicationRepository(test_db_session)
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 6, 7, 8, 9, 123456)
+    cursor = encode_cursor(created_at, "abc")
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, "abc")
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", encode_cursor(datetime.now(), "x")[:-3]])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_pages_cover_every_row_once(repository):
+    """Walking pages returns each row exactly once, newest first, with ties ordered by id."""
+    seen = []
+    cursor = None
+    while True:
+        page = await repository.get_page(user_id="user-1", limit=3, cursor=cursor)
+        assert len(page.items) <= 3
+        seen.extend(row.id for row in page.items)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert seen == ["app-6", "app-5", "app-4", "app-3", "app-2", "app-1", "app-0"]
+
+
+@pytest.mark.asyncio
+async def test_offset_pages_order_ties_like_keyset_pages(repository):
+    """Numbered pages and status listings break created_at ties by id, as keyset pages do."""
+    pages = [
+        await repository.get_rows(user_id="user-1", limit=3, offset=offset)
+        for offset in (0, 3, 6)
+    ]
+    drafts = await repository.get_by_status(ApplicationStatus.DRAFT, user_id="user-1")
+
+    assert [row.id for page in pages for row in page] == [
+        "app-6", "app-5", "app-4", "app-3", "app-2", "app-1", "app-0"
+    ]
+    assert [app.id for app in drafts] == ["app-6", "app-4", "app-2", "app-0"]
+
+    service = ApplicationService(AsyncMock(spec=LocalFileService))
+    rows = sorted(await repository.get_rows(user_id="user-1"), key=lambda row: row.id)
+    service.applications = {row.id: row.to_model() for row in rows}
+    in_memory = await service.get_applications_by_status(ApplicationStatus.DRAFT)
+    assert [app.id for app in in_memory] == ["app-6", "app-4", "app-2", "app-0"]
+
+
+@pytest.mark.asyncio
+async def test_iter_rows_and_count_filter_status(repository):
+    rows = [row async for row in repository.iter_rows(user_id="user-1", status=ApplicationStatus.DRAFT, batch_size=2)]
+
+    assert [row.id for row in rows] == ["app-6", "app-4", "app-2", "app-0"]
+    assert await repository.count(user_id="user-1", status=ApplicationStatus.DRAFT) == 4
+    assert await repository.count(user_id="user-1") == 7
+
+
+@pytest.mark.asyncio
+async def test_get_page_rejects_bad_cursor(repository):
+    with pytest.raises(InvalidCursorError):
+        await repository.get_page(user_id="user-1", cursor="garbage")
+
+
+def test_paginate_sequence_matches_keyset_order():
+    base = datetime(2024, 1, 1)
+    items = [SimpleNamespace(id=str(i), created_at=base + timedelta(hours=i // 2)) for i in range(5)]
+
+    first = paginate_sequence(items, limit=2)
+    second = paginate_sequence(items, limit=2, cursor=first.next_cursor)
+    third = paginate_sequence(items, limit=2, cursor=second.next_cursor)
+
+    assert [i.id for i in first.items + second.items + third.items] == ["4", "3", "2", "1", "0"]
+    assert third.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_iteration_fails_loudly_when_a_page_fails(repository, monkeypatch):
+    service = ApplicationService(AsyncMock(spec=LocalFileService), repository)
+    get_page = repository.get_page
+    calls = []
+
+    async def flaky_get_page(**kwargs):
+        calls.append(kwargs["cursor"])
+        if len(calls) > 1:
+            raise RuntimeError("connection lost")
+        return await get_page(**{**kwargs, "limit": 3})
+
+    monkeypatch.setattr(repository, "get_page", flaky_get_page)
+
+    seen = []
+    with pytest.raises(RuntimeError, match="connection lost"):
+        async for application in service.iter_applications(user_id="user-1"):
+            seen.append(application.id)
+    assert seen == ["app-6", "app-5", "app-4"]
+
+
+@pytest.mark.asyncio
+async def test_streamed_csv_export_matches_whole_export(repository, monkeypatch):
+    service = ApplicationService(AsyncMock(spec=LocalFileService), repository)
+    exporter = MultiFormatExportService()
+    applications = [app.dict() async for app in service.iter_applications(user_id="user-1")]
+
+    async def rows():
+        for application in applications:
+            yield application
+
+    monkeypatch.setattr(export_module, "CSV_CHUNK_CHARS", 100)
+    chunks = [chunk async for chunk in exporter.stream_applications_csv(rows())]
+
+    assert len(chunks) > 1
+    assert b"".join(chunks) == exporter._export_applications_csv(applications)
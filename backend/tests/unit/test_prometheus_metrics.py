@@ -0,0 +1,114 @@
+"""Tests for in-process Prometheus metrics and the /metrics exposition."""
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.config import config
+from src.core import metrics
+from src.middleware.metrics_middleware import MetricsMiddleware
+from src.middleware.query_performance import _operation_label
+
+pytestmark = pytest.mark.skipif(
+    not metrics.PROMETHEUS_AVAILABLE, reason="prometheus_client not installed"
+)
+
+
+def _sample(name: str, labels: dict) -> float:
+    from prometheus_client import REGISTRY
+
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class _RecordingMonitor:
+    def __init__(self):
+        self.metrics = []
+
+    async def record_metric(self, metric_name, metric_value, tags=None, timestamp=None):
+        self.metrics.append(metric_name)
+
+    async def record_error(self, **kwargs):
+        pass
+
+
+def _app(monitor=None) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, monitoring_service=monitor or _RecordingMonitor())
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+
+    @app.get("/metrics")
+    async def prometheus_metrics():
+        body, content_type = metrics.render_latest()
+        return Response(content=body, media_type=content_type)
+
+    return app
+
+
+def test_http_metrics_use_route_templates():
+    """Path parameters are folded into the route template label."""
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    before = _sample("http_requests_total", labels)
+
+    client = TestClient(_app())
+    for item_id in ("a", "b", "c"):
+        assert client.get(f"/items/{item_id}").status_code == 200
+
+    assert _sample("http_requests_total", labels) == before + 3
+    body = client.get("/metrics").text
+    assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",route="/items/{item_id}"}' in body
+    assert "/items/a" not in body
+
+
+def test_persisting_samples_is_optional(monkeypatch):
+    """The DB pipeline is skipped when sample persistence is disabled."""
+    from src.services.monitoring_service import DatabaseMonitoringService
+
+    monkeypatch.setattr(config, "metrics_persist_samples", False)
+    service = DatabaseMonitoringService()
+    monkeypatch.setattr(service, "_evaluate_metric_alerts", _RecordingMonitor().record_metric)
+
+    client = TestClient(_app(service))
+    client.get("/items/x")
+
+    assert service.get_pipeline_stats()["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_recorded_metrics_are_buffered_when_sample_persistence_is_disabled(monkeypatch):
+    """Only request and query samples are gated; other metrics stay windowed."""
+    from src.services.monitoring_service import DatabaseMonitoringService
+
+    monkeypatch.setattr(config, "metrics_persist_samples", False)
+    service = DatabaseMonitoringService()
+    monkeypatch.setattr(service, "_evaluate_metric_alerts", _RecordingMonitor().record_metric)
+    monkeypatch.setattr(service, "_start_background_task", _RecordingMonitor().record_error)
+
+    await service.record_metric("ai.request.duration", 1.5)
+
+    assert service.get_pipeline_stats()["queue_depth"] == 1
+
+
+@pytest.mark.asyncio
+async def test_track_duration_records_outcome():
+    labels = {"provider": "test", "operation": "generate_text"}
+    ok_before = _sample("ai_request_duration_seconds_count", {**labels, "outcome": "success"})
+    err_before = _sample("ai_request_duration_seconds_count", {**labels, "outcome": "error"})
+
+    with metrics.track_duration(metrics.ai_request_duration_seconds, **labels):
+        pass
+    with pytest.raises(RuntimeError):
+        with metrics.track_duration(metrics.ai_request_duration_seconds, **labels):
+            raise RuntimeError("provider down")
+
+    assert _sample("ai_request_duration_seconds_count", {**labels, "outcome": "success"}) == ok_before + 1
+    assert _sample("ai_request_duration_seconds_count", {**labels, "outcome": "error"}) == err_before + 1
+
+
+def test_query_operation_label_is_bounded():
+    assert _operation_label("  SELECT * FROM jobs") == "select"
+    assert _operation_label("insert into jobs values (?)") == "insert"
+    assert _operation_label("VACUUM") == "other"
+    assert _operation_label("") == "other"
@@ -0,0 +1,112 @@
+"""Tests for token-budgeted prompt compaction."""
+
+from src.utils.prompt_compaction import (
+    compact_job_description,
+    compact_resume,
+    count_tokens,
+    fit_prompt_inputs,
+    truncate_tokens,
+)
+
+JOB = """Senior Backend Engineer
+
+About Us
+We are a fast-growing fintech startup building payments infrastructure for
+small businesses across three continents, backed by top-tier investors.
+
+Responsibilities
+- Design and operate Python services on AWS
+- Own PostgreSQL schemas and query performance
+
+Requirements:
+- 5+ years of Python
+- Experience with Docker and Kubernetes
+
+Benefits
+- Unlimited PTO, 401(k) matching, dental and vision
+
+We are an equal opportunity employer and value diversity. All applicants will
+be considered without regard to race, religion, gender or disability.
+"""
+
+RESUME = """Jane Doe
+jane@example.com
+
+Summary
+Backend engineer with eight years building Python services.
+
+Experience
+Acme Corp - Senior Engineer
+- Migrated monolith to Kubernetes and Docker on AWS
+- Tuned PostgreSQL queries, cutting p95 latency by 40%
+
+Volunteer
+Taught weekend painting classes at the community centre for five years,
+organised two exhibitions and ran the fundraising committee.
+
+Hobbies
+Chess, climbing
+
+References available upon request.
+"""
+
+
+def test_count_and_truncate_tokens():
+    assert count_tokens("") == 0
+    assert count_tokens("Python, Docker!") == count_tokens("Python , Docker !")
+    text = "word " * 100
+    cut = truncate_tokens(text, 10)
+    assert count_tokens(cut) <= 10
+    assert text.startswith(cut)
+    assert truncate_tokens("short", 10) == "short"
+
+
+def test_job_description_drops_boilerplate_and_keeps_requirements_within_budget():
+    full = compact_job_description(JOB, 10_000)
+    assert "equal opportunity" not in full.text
+    assert "401(k)" not in full.text
+    assert "Benefits" in full.dropped_sections
+    assert full.tokens == count_tokens(full.text) < full.original_tokens
+
+    tight = compact_job_description(JOB, 60)
+    assert tight.tokens <= 60
+    assert "5+ years of Python" in tight.text
+    assert "fintech startup" not in tight.text
+    # Kept sections stay in their original order.
+    assert tight.text.index("Responsibilities") < tight.text.index("Requirements")
+
+
+def test_resume_prefers_sections_relevant_to_the_job():
+    compacted = compact_resume(RESUME, 45, job_description=JOB)
+    assert compacted.tokens <= 45
+    assert "Kubernetes" in compacted.text
+    assert "painting" not in compacted.text
+    assert "Chess" not in compacted.text
+    assert "References" not in compacted.text
+
+
+def test_fit_prompt_inputs_shares_budget():
+    resume, job = fit_prompt_inputs("Python developer.", JOB, budget=120)
+    assert resume.text == "Python developer."
+    # The short resume leaves its unused half to the job description.
+    assert job.tokens > 60
+    assert resume.tokens + job.tokens <= 120
+
+    resume, job = fit_prompt_inputs(None, None, budget=100)
+    assert resume.text == job.text == ""
+    assert f"{resume or 'Not provided'}" == "Not provided"
+
+
+def test_unified_prompts_use_the_routed_models_budget(monkeypatch):
+    from src.config import config
+    from src.services.unified_ai_service import UnifiedAIService
+
+    monkeypatch.setattr(config, "ai_prompt_input_tokens_by_model", {"small-model": 40})
+    service = UnifiedAIService()
+    full = service._build_job_match_prompt("Python developer.", JOB)
+
+    service._use_modern_providers = True
+    monkeypatch.setattr(service.provider_manager, "primary_model", lambda: "small-model")
+    compact = service._build_job_match_prompt("Python developer.", JOB)
+
+    assert count_tokens(compact) < count_tokens(full)
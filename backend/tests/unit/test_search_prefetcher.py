@@ -0,0 +1,104 @@
+"""Tests for the saved-search prefetcher."""
+
+import pytest
+
+from src.models.job import JobSearchRequest
+from src.services import job_search_service as job_search_module
+from src.services.search_prefetcher import SearchPrefetcher
+
+pd = pytest.importorskip("pandas")
+
+SITE_URLS = {
+    "indeed": "https://www.indeed.com/viewjob?jk={term}-{n}",
+    "linkedin": "https://www.linkedin.com/jobs/view/{term}-{n}",
+}
+
+PYTHON_INDEED = JobSearchRequest(keywords=["Python"], sites=["indeed"], results_wanted=1)
+PYTHON_BOTH = JobSearchRequest(keywords=["Python"], sites=["linkedin", "indeed"], results_wanted=20)
+GO_ANYWHERE = JobSearchRequest(keywords=["Go"], results_wanted=20)
+
+
+def fake_scrape(svc, params):
+    (site,) = params["site_name"]
+    term = params["search_term"].split()[0]
+    svc.scrapes.append((term, site))
+    if getattr(svc, "broken", False):
+        raise ValueError(f"{site} changed its markup")
+    return pd.DataFrame(
+        [
+            {
+                "title": f"{term} engineer {n}",
+                "company": "Acme",
+                "job_url": SITE_URLS[site].format(term=term, n=n),
+            }
+            for n in range(2)
+        ]
+    )
+
+
+@pytest.fixture
+def service(job_search_service_factory):
+    return job_search_service_factory(SITE_URLS, fake_scrape)
+
+
+def _prefetcher(service, searches, site_budget=10):
+    async def source():
+        return searches
+
+    return SearchPrefetcher(service, source, stagger=0, site_budget=site_budget)
+
+
+def test_plan_merges_searches_differing_in_sites_and_result_count(service):
+    groups = _prefetcher(service, []).plan(
+        [GO_ANYWHERE, PYTHON_INDEED, PYTHON_BOTH, PYTHON_INDEED]
+    )
+
+    assert [group.demand for group in groups] == [3, 1]
+    python = groups[0]
+    assert python.request.keywords == ["Python"]
+    assert python.request.sites == ["indeed", "linkedin"]
+    assert python.request.results_wanted == 20
+    assert [member.sites for member in python.members] == [["indeed"], ["linkedin", "indeed"]]
+    assert groups[1].request.sites == ["indeed", "linkedin"]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_scrapes_each_site_once_and_warms_every_search(service):
+    summary = await _prefetcher(service, [PYTHON_INDEED, PYTHON_BOTH, PYTHON_INDEED]).run_once()
+
+    assert summary == {"searches": 3, "groups": 1, "scrapes": 2, "skipped": 0, "seeded": 2}
+    assert sorted(service.scrapes) == [("Python", "indeed"), ("Python", "linkedin")]
+
+    narrow = await service.search_jobs(PYTHON_INDEED)
+    wide = await service.search_jobs(PYTHON_BOTH)
+    assert len(service.scrapes) == 2
+    assert narrow.total_jobs == 1
+    assert wide.total_jobs == 4
+    assert set(wide.jobs) == {"indeed", "linkedin"}
+
+
+@pytest.mark.asyncio
+async def test_searches_over_the_site_budget_are_left_to_live_search(service):
+    prefetcher = _prefetcher(service, [GO_ANYWHERE, PYTHON_BOTH, PYTHON_BOTH], site_budget=1)
+
+    summary = await prefetcher.run_once()
+
+    assert summary["skipped"] == 2
+    assert {term for term, _ in service.scrapes} == {"Python"}
+    await service.search_jobs(GO_ANYWHERE)
+    assert {term for term, _ in service.scrapes} == {"Python", "Go"}
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_keeps_warm_results(service):
+    await service.prefetch_site(PYTHON_INDEED, "indeed")
+    service.broken = True
+
+    result = await service.prefetch_site(PYTHON_INDEED, "indeed")
+
+    assert result.status == "error"
+    base_key = service._generate_search_cache_key(PYTHON_INDEED, per_site=True)
+    cached = await job_search_module.cache_manager.get(
+        job_search_module.JOB_SEARCH_CACHE_NAMESPACE, f"{base_key}:indeed"
+    )
+    assert len(cached) == 2
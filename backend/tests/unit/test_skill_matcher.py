@@ -0,0 +1,75 @@
+"""Tests for the shared skill matching engine."""
+
+import json
+
+from src.utils.skill_matcher import SkillMatcher, get_skill_matcher
+from src.utils.text_processing import extract_skills
+
+
+def test_find_returns_canonical_skills_with_offsets():
+    """Aliases resolve to canonical names and carry their offsets."""
+    matcher = SkillMatcher({"Kubernetes": ["k8s"], "Go": ["golang"]})
+    text = "Run k8s clusters in Golang"
+
+    matches = matcher.find(text)
+
+    assert [(m.skill, text[m.start:m.end]) for m in matches] == [
+        ("Kubernetes", "k8s"),
+        ("Go", "Golang"),
+    ]
+
+
+def test_find_respects_word_boundaries_and_symbols():
+    """Whole words only, but symbol-terminated skills still match."""
+    matcher = get_skill_matcher()
+
+    skills = matcher.extract("JavaScript, C++ and C# on Node.js; no javabeans")
+
+    assert skills == ["JavaScript", "C++", "C#", "Node.js"]
+
+
+def test_extract_skills_uses_taxonomy_and_custom_keywords():
+    """The text_processing helper delegates to the shared matcher."""
+    assert extract_skills("Docker and k8s") == ["Docker", "Kubernetes"]
+    assert extract_skills("Docker and k8s", ["Docker"]) == ["Docker"]
+    assert extract_skills("") == []
+
+
+def test_score_many_scores_descriptions_against_resume():
+    """Batch scoring reports matched and missing skills per description."""
+    matcher = get_skill_matcher()
+
+    overlaps = matcher.score_many(
+        ["python", "Kubernetes"],
+        ["Python, k8s and Go required", "Sales role"],
+    )
+
+    assert overlaps[0].matched == ["Python", "Kubernetes"]
+    assert overlaps[0].missing == ["Go"]
+    assert overlaps[0].score == 0.667
+    assert overlaps[1].required == []
+    assert overlaps[1].score == 0.0
+
+
+def test_taxonomy_loads_from_file(tmp_path):
+    """A taxonomy file replaces the built-in skill list."""
+    path = tmp_path / "skills.json"
+    path.write_text(json.dumps({"Terraform": ["tf"]}))
+
+    matcher = SkillMatcher.from_file(str(path))
+
+    assert matcher.extract("IaC with tf and Python") == ["Terraform"]
+
+
+def test_short_aliases_match_case_sensitively():
+    """Two-letter aliases only match as spelled or capitalised, not in prose."""
+    matcher = get_skill_matcher()
+
+    assert matcher.extract("Add 500 ml, go ahead; it's ts and js free") == []
+    assert matcher.extract("ML in Go, JS and TS") == [
+        "Machine Learning",
+        "Go",
+        "JavaScript",
+        "TypeScript",
+    ]
+    assert matcher.canonicalize(["js", "GO"]) == ["js", "Go"]